@@ -0,0 +1,5 @@
+# agent.py
+from services.agent_service.service import main
+
+if __name__ == '__main__':
+    main()
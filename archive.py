@@ -0,0 +1,5 @@
+# archive.py
+from services.archive_service.service import main
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+# benchmarks/bench_attendees.py
+"""
+Compare reading every occurrence's Recipients with the per-series
+AttendeeCache on a recurring-heavy calendar, counting COM calls and property
+reads in the Outlook emulator.
+
+Run from the repository root:
+    python -m benchmarks.bench_attendees [weeks]
+"""
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+from services.outlook_service.attendees import AttendeeCache
+from services.outlook_service.emulator import FakeLatency, FakeOutlookApplication, make_appointment, make_recipient
+from services.outlook_service.enumeration import iter_records
+from services.outlook_service.projection import LazyMeeting, OL_OPTIONAL, OL_RESPONSE_ACCEPTED, SUMMARY_FIELDS
+from shared.logger import logger
+
+def make_application(weeks: int, series: int = 30, single_per_week: int = 10, seed: int = 0) -> FakeOutlookApplication:
+    """Weekly series with 5-40 invitees each, plus a few one-off meetings every week."""
+    rng = random.Random(seed)
+    origin = datetime(2025, 1, 6, 8, 0)
+    appointments = []
+    for number in range(series):
+        recipients = [
+            make_recipient(f"Person {rng.randrange(500)}", rng.choice((1, 1, OL_OPTIONAL)),
+                           rng.choice((0, OL_RESPONSE_ACCEPTED)))
+            for _ in range(rng.randrange(5, 41))
+        ]
+        start = origin + timedelta(days=rng.randrange(5), minutes=30 * rng.randrange(18))
+        appointments.extend(
+            make_appointment(f"Series {number}", start + timedelta(weeks=week), 30, RecurrenceState=3,
+                             ConversationID=f"series-{number}", Recipients=recipients)
+            for week in range(weeks)
+        )
+    for number in range(weeks * single_per_week):
+        start = origin + timedelta(days=rng.randrange(weeks * 7), minutes=30 * rng.randrange(18))
+        attendees = "; ".join(f"Person {rng.randrange(500)}" for _ in range(rng.randrange(2, 8)))
+        appointments.append(make_appointment(f"Meeting {number}", start, 30, RequiredAttendees=attendees,
+                                             GlobalAppointmentID=f"gid-{number}"))
+    return FakeOutlookApplication(appointments, FakeLatency(call=0.0002, property_read=0.00005))
+
+def read_all(application: FakeOutlookApplication, fields, record_type) -> tuple:
+    """Read every meeting with its attendees; returns (meetings, seconds, COM calls, property reads)."""
+    items = application.GetNamespace('MAPI').GetDefaultFolder(9).Items
+    items.Sort("[Start]")
+    calls, reads = application.calls, sum(application.property_reads.values())
+    started = time.perf_counter()
+    meetings = list(iter_records(items, fields, record_type))
+    return (meetings, time.perf_counter() - started,
+            application.calls - calls, sum(application.property_reads.values()) - reads)
+
+def main(weeks: int = 26) -> None:
+    application = make_application(weeks)
+    logger.start_section(f"Attendee benchmark ({len(application.appointments):,} appointments)")
+
+    expected, seconds, calls, reads = read_all(application, SUMMARY_FIELDS + ('attendees',), LazyMeeting)
+    logger.info(f"Recipients per occurrence: {seconds:.3f}s, {calls:,} COM calls, {reads:,} property reads")
+
+    cache = AttendeeCache()
+    meetings, cached_seconds, cached_calls, cached_reads = read_all(application, SUMMARY_FIELDS, cache.read)
+    logger.info(f"Recipients per series:     {cached_seconds:.3f}s, {cached_calls:,} COM calls, "
+                f"{cached_reads:,} property reads ({len(cache):,} recipient lists read)")
+    logger.success(f"{(calls + reads) / (cached_calls + cached_reads):.1f}x fewer COM round trips")
+
+    assert [m.attendees for m in meetings] == [m.attendees for m in expected]
+    logger.end_section("Attendee benchmark")
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 26)
@@ -0,0 +1,93 @@
+# benchmarks/bench_categorizer.py
+"""
+Compare the keyword rules (in-process and on worker processes) with the
+batched naive-Bayes categorizer.
+
+Run from the repository root:
+    python -m benchmarks.bench_categorizer [rows]
+"""
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import List, Tuple
+
+from services.outlook_service.models import Meeting
+from services.categorization_service.bayes import BayesCategorizationService
+from services.categorization_service.parallel import ParallelCategorizationService
+from services.categorization_service.services import CategorizationService, MeetingCategory
+from shared.logger import logger
+
+# Words typical of each category, most of them missing from the keyword lists
+VOCABULARY = {
+    MeetingCategory.COMPANY_WIDE: (["forum", "fireside", "offsite", "open house", "kudos", "strategy",
+                                    "update", "q3", "q4"], ["CEO, The", "Comms, Internal"]),
+    MeetingCategory.STAFF_TEAM: (["sync", "standup", "huddle", "pairing", "office hours", "update",
+                                  "coffee", "1:1"], ["Doe, Jane", "Smith, Bob", "Lee, Ann"]),
+    MeetingCategory.DEPARTMENT: (["grooming", "demo", "postmortem", "design review", "strategy",
+                                  "capacity", "incident", "platform"], ["Eng, Director", "Ops, Head"]),
+    MeetingCategory.ONBOARDING: (["setup", "laptop", "badge", "welcome lunch", "shadowing",
+                                  "payroll", "it access"], ["HR, Team", "People, Ops"]),
+}
+FILLER = ["meeting", "session", "discussion", "call", "prep", "follow up", "weekly", "notes"]
+
+def make_meetings(rows: int, seed: int = 0) -> Tuple[List[Meeting], List[MeetingCategory]]:
+    """Generate labeled synthetic meetings."""
+    rng = random.Random(seed)
+    origin = datetime(2025, 1, 6, 8, 0)
+    categories = list(VOCABULARY)
+    meetings, labels = [], []
+    for i in range(rows):
+        category = rng.choice(categories)
+        words, organizers = VOCABULARY[category]
+        subject = " ".join(rng.sample(words, 2) + rng.sample(FILLER, rng.randint(0, 2)))
+        # Some meetings are organized by someone outside the category
+        organizer = rng.choice(organizers if rng.random() < 0.8 else VOCABULARY[rng.choice(categories)][1])
+        start = origin + timedelta(minutes=30 * rng.randrange(365 * 20))
+        meetings.append(Meeting(
+            subject=subject.capitalize(),
+            start_time=start,
+            end_time=start + timedelta(minutes=30),
+            duration=30,
+            organizer=organizer,
+            is_recurring=False,
+            series_id="N/A",
+        ))
+        labels.append(category)
+    return meetings, labels
+
+def accuracy(predicted: List[MeetingCategory], labels: List[MeetingCategory]) -> str:
+    correct = sum(p == l for p, l in zip(predicted, labels))
+    uncategorized = sum(p == MeetingCategory.UNCATEGORIZED for p in predicted)
+    return f"{correct / len(labels):.1%} correct, {uncategorized / len(labels):.1%} uncategorized"
+
+def main(rows: int = 100_000) -> None:
+    logger.start_section(f"Categorizer benchmark ({rows:,} meetings)")
+    history, history_labels = make_meetings(20_000, seed=1)
+    meetings, labels = make_meetings(rows)
+
+    keywords = CategorizationService()
+    started = time.perf_counter()
+    predicted = [keywords.categorize_meeting(m) for m in meetings]
+    logger.info(f"Keyword rules, per meeting: {time.perf_counter() - started:.3f}s ({accuracy(predicted, labels)})")
+
+    with ParallelCategorizationService(min_parallel=0) as parallel:
+        workers = parallel.workers_for(len(meetings))
+        started = time.perf_counter()
+        parallel_predicted = parallel.categorize_batch(meetings)
+        logger.info(f"Keyword rules, {workers or 'no'} worker processes: {time.perf_counter() - started:.3f}s "
+                    f"(same results: {parallel_predicted == predicted})")
+
+    bayes = BayesCategorizationService()
+    started = time.perf_counter()
+    bayes.fit(history, history_labels)
+    logger.info(f"Naive Bayes training on {len(history):,} labeled meetings: {time.perf_counter() - started:.3f}s "
+                f"({len(bayes.vocabulary):,} tokens)")
+
+    started = time.perf_counter()
+    predicted = bayes.categorize_batch(meetings)
+    logger.info(f"Naive Bayes, one batch: {time.perf_counter() - started:.3f}s ({accuracy(predicted, labels)})")
+    logger.end_section(f"Categorizer benchmark ({rows:,} meetings)")
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
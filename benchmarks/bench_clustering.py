@@ -0,0 +1,68 @@
+# benchmarks/bench_clustering.py
+"""
+Time MinHash/LSH subject clustering as the number of subjects doubles, and
+check it against the known series of synthetic recreated meetings.
+
+Run from the repository root:
+    python -m benchmarks.bench_clustering [subjects]
+"""
+import random
+import sys
+import time
+from collections import defaultdict
+from typing import List, Tuple
+
+from services.summary_service.clustering import SubjectClusterer
+from shared.logger import logger
+
+TOPICS = ["sync", "standup", "planning", "review", "retro", "1:1", "office hours", "roadmap", "demo", "triage"]
+TEAMS = [f"team {word}" for word in ("atlas", "bravo", "cobalt", "delta", "ember", "falcon", "granite", "harbor")]
+STYLES = ["{name} {month}/{day}", "{name} - {mon} {day}", "RE: {name} ({mon} {day}th)", "{name}: week {week}", "{name}"]
+SYLLABLES = ["ka", "lo", "mi", "ne", "ru", "sa", "ti", "vo", "ze", "bra", "chi", "dro", "fen", "gul", "pix"]
+MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
+def make_subjects(count: int, seed: int = 0) -> Tuple[List[str], List[str], List[int]]:
+    """Subjects of recreated series (varying dates and styles), with their organizer and true series."""
+    rng = random.Random(seed)
+    subjects, organizers, series = [], [], []
+    number = 0
+    while len(subjects) < count:
+        number += 1
+        project = "".join(rng.choice(SYLLABLES) for _ in range(3))  # Numbers would be normalized away
+        name = f"{rng.choice(TEAMS)} {project} {rng.choice(TOPICS)}"
+        organizer = f"Organizer {rng.randrange(count // 20 + 1)}"
+        for _ in range(rng.randrange(1, 12)):
+            month = rng.randrange(12)
+            subjects.append(rng.choice(STYLES).format(name=name, month=month + 1, mon=MONTHS[month],
+                                                      day=rng.randrange(1, 29), week=rng.randrange(1, 53)))
+            organizers.append(organizer)
+            series.append(number)
+    return subjects[:count], organizers[:count], series[:count]
+
+def purity(clusters: List[str], series: List[int]) -> Tuple[float, float]:
+    """(share of clusters with one true series, share of true series in one cluster)."""
+    members, assigned = defaultdict(set), defaultdict(set)
+    for cluster, truth in zip(clusters, series):
+        members[cluster].add(truth)
+        assigned[truth].add(cluster)
+    return (sum(len(m) == 1 for m in members.values()) / len(members),
+            sum(len(a) == 1 for a in assigned.values()) / len(assigned))
+
+def main(subjects: int = 80_000) -> None:
+    logger.start_section(f"Subject clustering benchmark (up to {subjects:,} subjects)")
+    sizes = [subjects // 8, subjects // 4, subjects // 2, subjects]
+    previous = None
+    for size in sizes:
+        texts, organizers, series = make_subjects(size)
+        started = time.perf_counter()
+        clusters = SubjectClusterer().cluster(texts, organizers)
+        seconds = time.perf_counter() - started
+        pure, whole = purity(clusters, series)
+        growth = f", {seconds / previous:.1f}x the previous size's time" if previous else ""
+        logger.info(f"{size:>8,} subjects: {seconds:.3f}s{growth}; {len(set(clusters)):,} clusters for "
+                    f"{len(set(series)):,} series ({pure:.1%} pure, {whole:.1%} of series whole)")
+        previous = seconds
+    logger.end_section("Subject clustering benchmark")
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 80_000)
@@ -0,0 +1,78 @@
+# benchmarks/bench_heatmap.py
+"""
+Compare a per-meeting, per-slot loop with the bincount MeetingHeatmap on a
+year of meetings for many calendars.
+
+Run from the repository root:
+    python -m benchmarks.bench_heatmap [calendars]
+"""
+import sys
+import time
+from datetime import datetime
+from typing import List, Tuple
+
+import numpy as np
+
+from services.summary_service.heatmap import SLOT_MINUTES, SLOTS_PER_DAY, WEEK_MINUTES, MeetingHeatmap
+from services.summary_service.service import CATEGORIES
+from shared.logger import logger
+from shared.timezones import epoch_minutes
+
+Calendar = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+def make_calendars(calendars: int, meetings_per_day: int = 6, seed: int = 0) -> List[Calendar]:
+    """A year of working-day meetings per calendar, as (start minutes, durations, category codes)."""
+    rng = np.random.default_rng(seed)
+    origin = epoch_minutes(datetime(2025, 1, 6))
+    result = []
+    for _ in range(calendars):
+        count = 260 * meetings_per_day
+        days = rng.integers(0, 52, count) * 7 + rng.integers(0, 5, count)  # Monday to Friday
+        starts = origin + days * 1440 + rng.integers(16, 36, count) * 30 + rng.choice([0, 0, 0, 5, 10], count)
+        durations = rng.choice([15, 25, 30, 45, 50, 60, 90, 120], count)
+        result.append((starts, durations, rng.integers(0, len(CATEGORIES), count)))
+    return result
+
+def loop_heatmap(calendars: List[Calendar]) -> np.ndarray:
+    """Reference implementation: walk each meeting through the slots it touches."""
+    grid = np.zeros((len(CATEGORIES), 7, SLOTS_PER_DAY))
+    for starts, durations, codes in calendars:
+        for start, duration, code in zip(starts.tolist(), durations.tolist(), codes.tolist()):
+            minute, end = start, start + duration
+            while minute < end:
+                slot_end = (minute // SLOT_MINUTES + 1) * SLOT_MINUTES
+                of_week = (minute + 3 * 1440) % WEEK_MINUTES
+                grid[code, of_week // 1440, of_week % 1440 // SLOT_MINUTES] += min(slot_end, end) - minute
+                minute = slot_end
+    return grid
+
+def bincount_heatmap(calendars: List[Calendar]) -> MeetingHeatmap:
+    heatmap = MeetingHeatmap()
+    for starts, durations, codes in calendars:
+        heatmap.add_arrays(starts, durations, codes)
+    heatmap.minutes  # Accumulates every calendar in one pass
+    return heatmap
+
+def main(calendars: int = 200) -> None:
+    data = make_calendars(calendars)
+    meetings = sum(len(codes) for _, _, codes in data)
+    logger.start_section(f"Heatmap benchmark ({calendars} calendars, {meetings:,} meetings)")
+
+    started = time.perf_counter()
+    expected = loop_heatmap(data)
+    loop_seconds = time.perf_counter() - started
+    logger.info(f"Loop per meeting and slot: {loop_seconds:.3f}s")
+
+    started = time.perf_counter()
+    heatmap = bincount_heatmap(data)
+    bincount_seconds = time.perf_counter() - started
+    logger.info(f"Bincount:                  {bincount_seconds:.3f}s")
+    logger.success(f"{loop_seconds / bincount_seconds:.1f}x faster than the loop")
+
+    assert np.array_equal(heatmap.minutes, expected)
+    for line in heatmap.render(first_slot=14, last_slot=40):
+        logger.info(line)
+    logger.end_section("Heatmap benchmark")
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,65 @@
+# benchmarks/bench_heavy_hitters.py
+"""
+Compare exact per-organizer grouping with the bounded-memory HeavyHitters sketch.
+
+Run from the repository root:
+    python -m benchmarks.bench_heavy_hitters [rows]
+"""
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+
+import numpy as np
+
+from services.summary_service.heavy_hitters import HeavyHitters
+from shared.logger import logger
+
+def exact_top(keys, weights, n: int):
+    """Reference mirroring the defaultdict groupings in test_outlook_connection.py."""
+    groups = defaultdict(list)
+    for key, weight in zip(keys, weights):
+        groups[key].append(weight)
+    totals = {key: sum(values) for key, values in groups.items()}
+    return sorted(totals.items(), key=lambda item: item[1], reverse=True)[:n], len(groups)
+
+def main(rows: int = 2_000_000, n: int = 20) -> None:
+    logger.start_section(f"Heavy hitters benchmark ({rows:,} rows)")
+    rng = np.random.default_rng(0)
+    keys = [f"organizer-{k}" for k in rng.zipf(1.2, size=rows) % 200_000]
+    weights = rng.choice([15, 30, 45, 60, 90], size=rows).tolist()
+
+    started = time.perf_counter()
+    expected, distinct = exact_top(keys, weights, n)
+    logger.info(f"Exact grouping ({distinct:,} keys held): {time.perf_counter() - started:.3f}s")
+
+    hitters = HeavyHitters(capacity=512)
+    started = time.perf_counter()
+    for chunk in range(0, rows, 100_000):
+        hitters.add_batch(keys[chunk:chunk + 100_000], weights[chunk:chunk + 100_000])
+    top = hitters.top(n)
+    logger.info(f"HeavyHitters, 100k-row batches (512 keys held): {time.perf_counter() - started:.3f}s")
+
+    # Peak memory on a slice, as tracing slows everything down
+    sample = min(rows, 500_000)
+    tracemalloc.start()
+    exact_top(keys[:sample], weights[:sample], n)
+    exact_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.reset_peak()
+    sketch = HeavyHitters(capacity=512)
+    for chunk in range(0, sample, 100_000):
+        sketch.add_batch(keys[chunk:chunk + 100_000], weights[chunk:chunk + 100_000])
+    sketch_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    logger.info(f"Peak memory for {sample:,} rows: exact {exact_peak / 2**20:.1f} MiB, "
+                f"HeavyHitters {sketch_peak / 2**20:.1f} MiB")
+
+    truth = dict(expected)
+    recall = len({h.key for h in top} & set(truth)) / n
+    worst = max((h.weight - truth[h.key]) / truth[h.key] for h in top if h.key in truth)
+    logger.info(f"Top-{n} recall: {recall:.0%}, worst overestimate: {worst:.2%}, "
+                f"guaranteed bound: {hitters.error_bound:,.0f} minutes")
+    logger.end_section(f"Heavy hitters benchmark ({rows:,} rows)")
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000)
@@ -0,0 +1,65 @@
+# benchmarks/bench_replay.py
+"""
+Replay a recorded Outlook session and compare its timing with the recording.
+
+Without a trace, a session against the emulator (with COM-like latency) is
+recorded first. Pass a trace recorded on a real mailbox with
+OUTLOOK_AUTOMATION_RECORD to benchmark against production calendars:
+
+Run from the repository root:
+    python -m benchmarks.bench_replay [trace.gz START END]
+"""
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from services.outlook_service.emulator import FakeLatency, FakeOutlookApplication, make_appointment
+from services.outlook_service.replay import SessionRecorder, SessionReplay
+from services.outlook_service.service import OutlookService
+from shared.logger import logger
+from shared.metrics import metrics
+
+def record_emulator(path: Path, weeks: int = 8) -> None:
+    """Record a fetch of `weeks` of emulated meetings (with latency) to `path`."""
+    start = datetime(2025, 1, 6, 9, 0)
+    application = FakeOutlookApplication([
+        make_appointment(f"Meeting {n}", start + timedelta(days=n // 6 * 7 // 5, hours=n % 6), 30,
+                         Body="x" * (n % 7 * 1000))
+        for n in range(weeks * 30)
+    ], latency=FakeLatency(call=0.005, property_read=0.0002))
+    with SessionRecorder(path, anonymize=False) as recorder:
+        started = time.perf_counter()
+        service = OutlookService(application=recorder.wrap(application))
+        service.get_meetings(datetime(2025, 1, 6), datetime(2025, 1, 6) + timedelta(weeks=weeks), detached=True)
+        logger.info(f"Recorded {recorder.events:,} accesses in {time.perf_counter() - started:.3f}s")
+
+def replay(path: Path, start: datetime, end: datetime, speed: float) -> float:
+    session = SessionReplay.load(path, speed=speed)
+    started = time.perf_counter()
+    meetings = OutlookService(application=session.application()).get_meetings(start, end, detached=True)
+    seconds = time.perf_counter() - started
+    logger.info(f"speed {speed:g}: {len(meetings):,} meetings in {seconds:.3f}s "
+                f"(recorded COM time {session.recorded_seconds:.3f}s)")
+    return seconds
+
+def main(path: str = '', start: str = '2025-01-06', end: str = '2025-03-03') -> None:
+    logger.start_section("Session replay benchmark")
+    with tempfile.TemporaryDirectory() as directory:
+        trace = Path(path) if path else Path(directory) / "emulator.trace.gz"
+        if not path:
+            record_emulator(trace)
+        logger.info(f"Trace: {trace} ({trace.stat().st_size:,} bytes)")
+        start_date, end_date = datetime.fromisoformat(start), datetime.fromisoformat(end)
+        metrics.reset("replay.")
+        recorded = replay(trace, start_date, end_date, speed=1.0)
+        unthrottled = replay(trace, start_date, end_date, speed=0)
+        logger.success(f"Replay overhead without latency: {unthrottled:.3f}s "
+                       f"({unthrottled / recorded:.1%} of the latency-faithful replay)")
+        logger.info(f"Argument mismatches: {metrics.counter('replay.arg_mismatches')}, "
+                    f"repeats: {metrics.counter('replay.repeats')}")
+    logger.end_section("Session replay benchmark")
+
+if __name__ == '__main__':
+    main(*sys.argv[1:4])
@@ -0,0 +1,54 @@
+# benchmarks/bench_sharded_fetch.py
+"""
+Compare a single Restrict walk with time-sharded parallel fetching, using the
+Outlook emulator with injected COM latency.
+
+Run from the repository root:
+    python -m benchmarks.bench_sharded_fetch [workers]
+"""
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+from services.outlook_service.emulator import FakeLatency, FakeOutlookApplication, make_appointment
+from services.outlook_service.executor import ComExecutor
+from services.outlook_service.projection import SUMMARY_FIELDS
+from services.outlook_service.service import OutlookService
+from services.outlook_service.sharding import ShardedFetcher
+from shared.logger import logger
+
+def make_application(meetings_per_day: int = 8, seed: int = 0) -> FakeOutlookApplication:
+    """A year of working-day meetings behind a slow COM server."""
+    rng = random.Random(seed)
+    origin = datetime(2025, 1, 6, 8, 0)
+    appointments = []
+    for day in range(365):
+        if (origin + timedelta(days=day)).weekday() >= 5:
+            continue
+        for _ in range(meetings_per_day):
+            start = origin + timedelta(days=day, minutes=30 * rng.randrange(18))
+            appointments.append(make_appointment(f"Meeting {len(appointments)}", start, rng.choice((30, 60))))
+    return FakeOutlookApplication(appointments, FakeLatency(call=0.05, property_read=0.00005))
+
+def main(workers: int = 4) -> None:
+    application = make_application()
+    start, end = datetime(2025, 1, 6), datetime(2026, 1, 5)
+    logger.start_section(f"Sharded fetch benchmark ({len(application.appointments):,} appointments)")
+
+    started = time.perf_counter()
+    expected = OutlookService(application=application).get_meetings(start, end)
+    logger.info(f"Single Restrict: {time.perf_counter() - started:.3f}s")
+
+    for shard in ('month', 'week'):
+        with ComExecutor(service_factory=lambda: OutlookService(application=application), workers=workers) as executor:
+            started = time.perf_counter()
+            meetings = ShardedFetcher(executor, shard=shard).fetch_meetings(start, end)
+            logger.info(f"Sharded by {shard} on {workers} workers: {time.perf_counter() - started:.3f}s")
+        assert [[getattr(m, f) for f in SUMMARY_FIELDS] for m in meetings] == \
+            [[getattr(m, f) for f in SUMMARY_FIELDS] for m in expected]
+
+    logger.end_section("Sharded fetch benchmark")
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 4)
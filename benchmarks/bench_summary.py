@@ -0,0 +1,72 @@
+# benchmarks/bench_summary.py
+"""
+Compare the loop-based meeting summaries with the columnar SummaryService.
+
+Run from the repository root:
+    python -m benchmarks.bench_summary [rows]
+"""
+import random
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import List
+
+from services.outlook_service.models import Meeting
+from services.categorization_service.services import MeetingCategory
+from services.summary_service.service import SummaryService, CATEGORIES
+from shared.logger import logger
+
+def make_meetings(rows: int, seed: int = 0) -> List[Meeting]:
+    """Generate synthetic meetings spread over a year."""
+    rng = random.Random(seed)
+    origin = datetime(2025, 1, 6, 8, 0)
+    meetings = []
+    for i in range(rows):
+        start = origin + timedelta(minutes=30 * rng.randrange(365 * 20))
+        duration = rng.choice((15, 25, 30, 45, 50, 60, 90, 120))
+        meetings.append(Meeting(
+            subject=f"Meeting {i}",
+            start_time=start,
+            end_time=start + timedelta(minutes=duration),
+            duration=duration,
+            organizer="Doe, Jane",
+            is_recurring=False,
+            series_id="N/A",
+        ))
+    return meetings
+
+def loop_summary(meetings: List[Meeting], categories: List[MeetingCategory]):
+    """Reference implementation mirroring the per-meeting loops in the CLI."""
+    daily = defaultdict(lambda: defaultdict(int))
+    week = defaultdict(int)
+    for meeting, category in zip(meetings, categories):
+        daily[meeting.weekday][category.value] += meeting.rounded_duration
+        week[category] += meeting.rounded_duration
+    return daily, week, sum(m.rounded_duration for m in meetings)
+
+def timed(label: str, func, *args):
+    started = time.perf_counter()
+    result = func(*args)
+    logger.info(f"{label}: {time.perf_counter() - started:.3f}s")
+    return result
+
+def main(rows: int = 1_000_000) -> None:
+    logger.start_section(f"Summary benchmark ({rows:,} meetings)")
+    meetings = make_meetings(rows)
+    rng = random.Random(1)
+    categories = [rng.choice(CATEGORIES) for _ in meetings]
+    summary = SummaryService()
+
+    _, loop_week, loop_total = timed("Loop summary", loop_summary, meetings, categories)
+    frame = timed("Build frame", summary.build_frame, meetings, categories)
+    timed("Vectorized daily totals", summary.get_daily_category_totals, frame)
+    week = timed("Vectorized week totals", summary.get_week_category_totals, frame)
+    total = timed("Vectorized total", summary.get_total_minutes, frame)
+
+    assert total == loop_total
+    assert week == dict(loop_week)
+    logger.end_section("Summary benchmark")
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
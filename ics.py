@@ -0,0 +1,5 @@
+# ics.py
+from services.ics_service.service import main
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,297 @@
+# services/agent_service/service.py
+import getpass
+import os
+import secrets
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, datetime, timedelta
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Connection, Listener
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from services.outlook_service.models import Meeting
+from services.outlook_service.projection import ANALYTICS_FIELDS
+from services.outlook_service.scheduler import BULK, INTERACTIVE, FetchScheduler
+from services.outlook_service.service import OutlookService
+from services.outlook_service.sharding import ShardedFetcher
+from services.categorization_service.services import CategorizationService, MeetingCategory, configured_categorizer
+from services.summary_service.cache import CACHE_PATH, MeetingCache
+from services.summary_service.clustering import SubjectClusterer
+from services.summary_service.heavy_hitters import MeetingHeavyHitters
+from services.summary_service.rollup import DailyRollup
+from services.summary_service.search import (
+    INDEX_PATH, MeetingIndex, search_meetings, search_result
+)
+from services.summary_service.service import SummaryService
+from services.summary_service.shared_store import AGGREGATE_PATH, SharedAggregateStore
+from shared.logger import logger
+
+AUTHKEY_PATH = Path.home() / ".outlook_automation" / "agent.key"
+
+def default_address() -> str:
+    """Named pipe on Windows, Unix socket elsewhere."""
+    if sys.platform == 'win32':
+        return r'\\.\pipe\outlook-automation-agent'
+    return os.path.join(tempfile.gettempdir(), f"outlook-automation-agent-{os.getuid()}.sock")
+
+def load_authkey(create: bool = False) -> Optional[bytes]:
+    """Shared secret authenticating CLI clients to the agent."""
+    if AUTHKEY_PATH.exists():
+        return AUTHKEY_PATH.read_bytes()
+    if not create:
+        return None
+    AUTHKEY_PATH.parent.mkdir(parents=True, exist_ok=True)
+    AUTHKEY_PATH.touch(mode=0o600)
+    AUTHKEY_PATH.write_bytes(secrets.token_bytes(32))
+    return AUTHKEY_PATH.read_bytes()
+
+# Ranges longer than this are fetched as bulk work, a week per job
+BULK_RANGE = timedelta(days=31)
+
+def _fetch_meetings(service: OutlookService, start: datetime, end: datetime,
+                    fields: Tuple[str, ...] = ANALYTICS_FIELDS) -> list:
+    # Results leave the COM worker, so they must not keep COM items alive
+    return service.get_meetings(start, end, fields, detached=True)
+
+class AgentService:
+    """
+    Long-running agent holding the Outlook session, the meeting cache and
+    precomputed aggregates, so CLI invocations can be answered without
+    connecting to Outlook or walking the calendar.
+
+    Requests are dictionaries with an `op` and its parameters; responses are
+    dictionaries with `ok`, `data` (or `error`) and `source`, which is
+    "cache" when the answer came straight from memory and "outlook" when the
+    range had to be (re)fetched first.
+
+    The meeting cache and its search index are saved after every fetch and
+    loaded on start, so searches cover previously fetched ranges across restarts.
+
+    Outlook is reached through a `FetchScheduler`: short ranges are fetched
+    as interactive jobs, long ones (trends over a year) as bulk jobs of a week
+    each. Every connection is served on its own thread and fetches run outside
+    the agent's lock, so a quick request arriving during a long one is queued
+    next to its bulk jobs and waits only for the week being fetched.
+
+    The agent is also the single writer of the shared aggregate store: the
+    daily rollup is published there after every change, for other processes
+    (e.g. API workers) to read without a meeting cache of their own.
+    """
+
+    def __init__(self, outlook_factory: Callable[[], Any] = OutlookService, ttl: float = 300.0,
+                 cache_path: Path = CACHE_PATH, index_path: Path = INDEX_PATH,
+                 categorization: Optional[CategorizationService] = None,
+                 aggregate_path: Optional[Path] = AGGREGATE_PATH):
+        self.categorization = categorization or configured_categorizer()
+        # Labels are fetched too when the categorizer learns from them
+        self.fields = ANALYTICS_FIELDS + self.categorization.label_fields
+        self.executor = FetchScheduler(service_factory=lambda mailbox: outlook_factory())
+        self.bulk = ShardedFetcher(self.executor.client(BULK, user='agent'), shard='week', fields=self.fields)
+        self.summary = SummaryService(self.categorization)
+        self.cache_path = cache_path
+        self.index_path = index_path
+        self.ttl = ttl
+        # Guards the meeting cache, its index, the rollup and the summaries;
+        # never held while waiting for Outlook
+        self._lock = threading.RLock()
+        self._fetched: Dict[Tuple[datetime, datetime], float] = {}
+        self._summaries: Dict[Tuple[datetime, datetime], Dict] = {}
+        self.meeting_cache = MeetingCache.load(cache_path, self.categorization)
+        self._rules_digest = self.categorization.rules.digest
+        self.rollup = DailyRollup()
+        self.meeting_cache.add_listener(self.rollup)
+        self.meeting_cache.add_listener(self)
+        self.index = MeetingIndex.load(index_path)
+        self.index.attach(self.meeting_cache)
+        self.meeting_cache.learn()
+        self.clusterer = SubjectClusterer()
+        self.user = getpass.getuser()
+        self.aggregates = SharedAggregateStore.create(aggregate_path) if aggregate_path else None
+        self._publish_aggregates()
+        self.handlers: Dict[str, Callable[..., Tuple[Any, bool]]] = {
+            'ping': self.ping,
+            'summary': self.get_summary,
+            'category_trends': self.get_category_trends,
+            'search': self.search,
+            'top_meetings': self.get_top_meetings,
+        }
+
+    def meeting_added(self, meeting: Meeting, category: MeetingCategory) -> None:
+        self._invalidate(meeting)
+
+    def meeting_removed(self, meeting: Meeting, category: MeetingCategory) -> None:
+        self._invalidate(meeting)
+
+    def _invalidate(self, meeting: Meeting) -> None:
+        start = meeting.start_time.replace(tzinfo=None)
+        for key in [k for k in self._summaries if k[0] <= start <= k[1]]:
+            del self._summaries[key]
+
+    def _ensure_range(self, start: datetime, end: datetime) -> bool:
+        """
+        Fetch meetings starting within [start, end] unless fetched within the TTL.
+        Returns True if Outlook was queried.
+        """
+        with self._lock:
+            fetched_at = self._fetched.get((start, end))
+        if fetched_at is not None and time.monotonic() - fetched_at < self.ttl:
+            return False
+        if end - start > BULK_RANGE:
+            meetings = self.bulk.fetch_meetings(start, end + timedelta(microseconds=1))
+        else:
+            client = self.executor.client(INTERACTIVE, user='agent')
+            meetings = client.submit(_fetch_meetings, start, end + timedelta(microseconds=1), self.fields).result()
+        meetings = [m for m in meetings if start <= m.start_time.replace(tzinfo=None) <= end]
+        with self._lock:
+            if self.meeting_cache.refresh(meetings, start, end):
+                self.meeting_cache.learn()
+                self.meeting_cache.save(self.cache_path)
+                self.index.save(self.index_path)
+                self._publish_aggregates()
+            self._fetched[(start, end)] = time.monotonic()
+        return True
+
+    def _check_rules(self) -> None:
+        """Recategorize the cache if the categorization rules file was edited."""
+        self.categorization.rules.reload()
+        if self.categorization.rules.digest == self._rules_digest:
+            return
+        self._rules_digest = self.categorization.rules.digest
+        changed = self.meeting_cache.recategorize()
+        logger.info(f"Categorization rules reloaded; {changed} cached meetings changed category")
+        if changed:
+            self.meeting_cache.save(self.cache_path)
+            self._publish_aggregates()
+
+    def _publish_aggregates(self) -> None:
+        """Publish the daily rollup to the shared aggregate store."""
+        if self.aggregates is not None and self.rollup.origin is not None:
+            self.aggregates.publish(self.rollup.origin, self.rollup.table, [self.user])
+
+    def ping(self) -> Tuple[Any, bool]:
+        with self._lock:
+            return {"meetings": len(self.meeting_cache)}, False
+
+    def get_summary(self, start: datetime, end: datetime) -> Tuple[Dict, bool]:
+        """Daily and week category totals for meetings starting within [start, end]."""
+        fetched = self._ensure_range(start, end)
+        with self._lock:
+            if (start, end) not in self._summaries:
+                pairs = self.meeting_cache.items(start, end)
+                frame = self.summary.build_frame([m for m, _ in pairs], [c for _, c in pairs])
+                self._summaries[(start, end)] = self.summary.summarize(frame)
+            return self._summaries[(start, end)], fetched
+
+    def get_category_trends(self, start_of_week: date, weeks: int = 52) -> Tuple[Dict, bool]:
+        """Weekly category totals and rolling averages from the daily rollup."""
+        # Three extra weeks so the first rolling averages are complete
+        fetch_start = datetime.combine(start_of_week - timedelta(weeks=3), datetime.min.time())
+        fetch_end = datetime.combine(start_of_week + timedelta(weeks=weeks, days=-1), datetime.max.time())
+        fetched = self._ensure_range(fetch_start, fetch_end)
+        with self._lock:
+            return self.rollup.weekly_trends(start_of_week, weeks), fetched
+
+    def search(self, query: str, start: datetime, end: datetime) -> Tuple[List[Dict], bool]:
+        """Meetings starting within [start, end] matching a search query."""
+        fetched = self._ensure_range(start, end)
+        with self._lock:
+            results = [
+                search_result(meeting, category)
+                for meeting, category in search_meetings(self.meeting_cache, self.index, query, start, end)
+            ]
+        return results, fetched
+
+    def get_top_meetings(self, start: datetime, end: datetime, n: int = 20) -> Tuple[Dict, bool]:
+        """
+        Top organizers, subjects and recurring series for meetings starting within
+        [start, end]; series include meetings recreated under near-identical subjects.
+        """
+        fetched = self._ensure_range(start, end)
+        with self._lock:
+            heavy_hitters = MeetingHeavyHitters(clusterer=self.clusterer)
+            heavy_hitters.consume(self.meeting_cache.meetings(start, end))
+            return heavy_hitters.report(n), fetched
+
+    def handle(self, request: Dict) -> Dict:
+        """Answer a single request."""
+        params = dict(request)
+        handler = self.handlers.get(params.pop('op', None))
+        if handler is None:
+            return {"ok": False, "error": f"Unknown operation: {request.get('op')}"}
+        try:
+            with self._lock:
+                self._check_rules()
+            data, fetched = handler(**params)
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
+        return {"ok": True, "data": data, "source": "outlook" if fetched else "cache"}
+
+    def serve(self, address: Optional[str] = None) -> None:
+        """Accept requests until interrupted, serving each connection on its own thread."""
+        address = address or default_address()
+        if sys.platform != 'win32' and os.path.exists(address):
+            os.unlink(address)  # Stale socket from a previous run
+        with Listener(address, authkey=load_authkey(create=True)) as listener:
+            logger.success(f"Agent listening on {address}", "start")
+            while True:
+                try:
+                    connection = listener.accept()
+                except (OSError, AuthenticationError) as e:
+                    logger.warn(f"Dropped agent connection: {str(e)}")
+                    continue
+                threading.Thread(target=self._serve_connection, args=(connection,),
+                                 name="agent-connection", daemon=True).start()
+
+    def _serve_connection(self, connection: Connection) -> None:
+        try:
+            with connection:
+                request = connection.recv()
+                started = time.perf_counter()
+                response = self.handle(request)
+                response["elapsed"] = time.perf_counter() - started
+                connection.send(response)
+        except (EOFError, OSError) as e:
+            logger.warn(f"Dropped agent connection: {str(e)}")
+
+    def close(self) -> None:
+        self.executor.shutdown()
+        if self.aggregates is not None:
+            self.aggregates.close()
+
+class AgentClient:
+    """Thin client for the agent; `request` returns None when no agent is running or it drops the connection."""
+
+    def __init__(self, address: Optional[str] = None, timeout: float = 60.0):
+        self.address = address or default_address()
+        self.timeout = timeout
+
+    def request(self, request: Dict) -> Optional[Dict]:
+        authkey = load_authkey()
+        if authkey is None:
+            return None
+        try:
+            connection = Client(self.address, authkey=authkey)
+        except (OSError, AuthenticationError):
+            return None
+        try:
+            with connection:
+                connection.send(request)
+                if not connection.poll(self.timeout):
+                    return {"ok": False, "error": f"Agent did not answer within {self.timeout:.0f}s"}
+                return connection.recv()
+        except (EOFError, OSError) as e:
+            # The agent stopped or dropped the connection mid-request
+            logger.warn(f"Lost connection to the agent ({str(e) or type(e).__name__}), falling back to in-process")
+            return None
+
+def main():
+    agent = AgentService()
+    try:
+        agent.serve()
+    except KeyboardInterrupt:
+        logger.info("\nAgent stopped", "end")
+    finally:
+        agent.close()
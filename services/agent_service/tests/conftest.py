@@ -0,0 +1,27 @@
+from datetime import datetime, timedelta
+import pytest
+
+from services.outlook_service.emulator import FakeOutlookApplication, make_appointment
+
+@pytest.fixture
+def application() -> FakeOutlookApplication:
+    """Fixture for an emulated Outlook with two weeks of meetings"""
+    monday = datetime(2025, 3, 3, 9, 0)
+    return FakeOutlookApplication([
+        make_appointment(subject, monday + timedelta(days=day), duration)
+        for day, subject, duration in [
+            (0, "Team standup", 15),
+            (1, "Company all hands", 60),
+            (2, "Engineering sprint planning", 90),
+            (7, "Team standup", 15),
+            (8, "New hire orientation", 45),
+        ]
+    ])
+
+@pytest.fixture
+def authkey_path(tmp_path, monkeypatch):
+    """Fixture isolating the agent's shared secret"""
+    from services.agent_service import service
+    path = tmp_path / "agent.key"
+    monkeypatch.setattr(service, "AUTHKEY_PATH", path)
+    return path
@@ -0,0 +1,226 @@
+import json
+import sys
+import threading
+import pytest
+from multiprocessing.connection import Listener
+from datetime import date, datetime, timedelta
+
+from services.agent_service.service import AgentClient, AgentService, load_authkey
+from services.categorization_service.rules import RuleSet
+from services.categorization_service.services import CategorizationService
+from services.outlook_service.emulator import FakeAppointment, FakeOutlookApplication, make_appointment
+from services.outlook_service.scheduler import INTERACTIVE
+from services.outlook_service.service import OutlookService
+from services.summary_service.shared_store import SharedAggregateStore
+from shared.metrics import metrics
+
+WEEK = {'start': datetime(2025, 3, 3), 'end': datetime(2025, 3, 9, 23, 59, 59, 999999)}
+MONTH = {'start': datetime(2025, 3, 1), 'end': datetime(2025, 3, 31, 23, 59, 59, 999999)}
+
+@pytest.fixture
+def agent(application, tmp_path):
+    agent = AgentService(outlook_factory=lambda: OutlookService(application=application),
+                         cache_path=tmp_path / "cache.pkl", index_path=tmp_path / "index.pkl",
+                         aggregate_path=tmp_path / "aggregates.bin")
+    yield agent
+    agent.close()
+
+def test_summary_is_served_from_cache_after_first_fetch(agent, application):
+    first = agent.handle({'op': 'summary', **WEEK})
+    assert first['ok'] and first['source'] == 'outlook'
+    assert first['data']['count'] == 3
+    assert first['data']['total'] == 30 + 60 + 90
+    assert first['data']['daily']['Monday'] == {'Team/Staff': 30}
+
+    reads = dict(application.property_reads)
+    second = agent.handle({'op': 'summary', **WEEK})
+    assert second['source'] == 'cache'
+    assert second['data'] == first['data']
+    assert application.property_reads == reads
+
+def test_refresh_after_ttl_updates_aggregates(agent, application):
+    agent.handle({'op': 'summary', **WEEK})
+    retro = make_appointment("Team retro", datetime(2025, 3, 4, 15, 0), 30)
+    application.appointments.append(FakeAppointment(application, **retro))
+    agent.ttl = 0
+    refreshed = agent.handle({'op': 'summary', **WEEK})
+    assert refreshed['source'] == 'outlook'
+    assert refreshed['data']['count'] == 4
+
+def test_category_trends(agent):
+    bulk_jobs = metrics.counter("scheduler.jobs.bulk")
+    response = agent.handle({'op': 'category_trends', 'start_of_week': date(2025, 3, 3), 'weeks': 2})
+    assert response['ok']
+    trends = response['data']
+    assert trends['weeks'] == [date(2025, 3, 3), date(2025, 3, 10)]
+    assert sum(trends['weekly'][0]) == 180
+    assert sum(trends['weekly'][1]) == 30 + 60
+    # Five weeks, including the three for rolling averages, fetched as a bulk job each
+    assert metrics.counter("scheduler.jobs.bulk") == bulk_jobs + 5
+
+def test_aggregates_are_shared_with_other_processes(agent, tmp_path):
+    agent.handle({'op': 'summary', **WEEK})
+    store = SharedAggregateStore.open(tmp_path / "aggregates.bin")
+    try:
+        totals = store.range_total(date(2025, 3, 3), date(2025, 3, 10), user=agent.user)
+        assert sum(totals.values()) == 30 + 60 + 90
+        generation = store.generation
+
+        agent.handle({'op': 'summary', 'start': datetime(2025, 3, 10), 'end': datetime(2025, 3, 16, 23, 59)})
+        assert store.generation > generation
+        assert sum(store.range_total(date(2025, 3, 10), date(2025, 3, 17)).values()) == 30 + 60
+    finally:
+        store.close()
+
+def test_unknown_operation_and_errors(agent):
+    assert not agent.handle({'op': 'nope'})['ok']
+    assert not agent.handle({'op': 'summary'})['ok']
+
+def test_categorizer_learns_from_outlook_categories(tmp_path, monkeypatch):
+    monkeypatch.setenv("OUTLOOK_AUTOMATION_CATEGORIZER", "bayes")
+    monday = datetime(2025, 3, 3, 9, 0)
+    application = FakeOutlookApplication([
+        make_appointment("Backlog grooming", monday, 60, Categories="Department"),
+        make_appointment("Grooming and estimation", monday + timedelta(days=1), 60, Categories="Department"),
+        make_appointment("Grooming", monday + timedelta(days=2), 30),
+    ])
+    agent = AgentService(outlook_factory=lambda: OutlookService(application=application),
+                         cache_path=tmp_path / "cache.pkl", index_path=tmp_path / "index.pkl",
+                         aggregate_path=None)
+    try:
+        response = agent.handle({'op': 'summary', **WEEK})
+        # No keyword matches "Grooming"; the model learned it from the labeled meetings
+        assert response['data']['daily']['Wednesday'] == {'Department': 30}
+    finally:
+        agent.close()
+
+def test_client_returns_none_without_agent(authkey_path, tmp_path):
+    assert AgentClient(address=str(tmp_path / "missing.sock")).request({'op': 'ping'}) is None
+
+@pytest.mark.skipif(sys.platform == 'win32', reason="Unix socket address")
+def test_client_server_round_trip(agent, authkey_path, tmp_path):
+    address = str(tmp_path / "agent.sock")
+    threading.Thread(target=agent.serve, args=(address,), daemon=True).start()
+    client = AgentClient(address=address)
+    for _ in range(100):
+        # The socket file and the authkey appear before the agent accepts connections
+        if client.request({'op': 'ping'}) is not None:
+            break
+        threading.Event().wait(0.02)
+
+    response = client.request({'op': 'summary', **WEEK})
+    assert response['ok'] and response['data']['count'] == 3
+    assert oct(authkey_path.stat().st_mode & 0o777) == oct(0o600)
+    assert load_authkey() == authkey_path.read_bytes()
+
+@pytest.mark.skipif(sys.platform == 'win32', reason="Unix socket address")
+def test_client_returns_none_when_agent_drops_the_connection(authkey_path, tmp_path):
+    address = str(tmp_path / "agent.sock")
+    with Listener(address, authkey=load_authkey(create=True)) as listener:
+        def accept_and_close():
+            with listener.accept() as connection:
+                connection.recv()
+
+        server = threading.Thread(target=accept_and_close, daemon=True)
+        server.start()
+        assert AgentClient(address=address, timeout=5).request({'op': 'ping'}) is None
+        server.join(5)
+
+class GatedService(OutlookService):
+    """Records the ranges fetched; the first fetch waits until `gate` is set."""
+
+    def __init__(self, application, fetches, gate):
+        super().__init__(application=application)
+        self.fetches, self.gate = fetches, gate
+
+    def get_meetings(self, start, end, *args, **kwargs):
+        self.fetches.append(start)
+        if len(self.fetches) == 1:
+            self.gate.wait(10)
+        return super().get_meetings(start, end, *args, **kwargs)
+
+def wait_for(condition):
+    for _ in range(500):
+        if condition():
+            return True
+        threading.Event().wait(0.01)
+    return False
+
+@pytest.mark.skipif(sys.platform == 'win32', reason="Unix socket address")
+def test_short_request_runs_between_shards_of_a_long_one(application, authkey_path, tmp_path):
+    fetches, gate = [], threading.Event()
+    agent = AgentService(outlook_factory=lambda: GatedService(application, fetches, gate),
+                         cache_path=tmp_path / "cache.pkl", index_path=tmp_path / "index.pkl",
+                         aggregate_path=tmp_path / "aggregates.bin")
+    address = str(tmp_path / "agent.sock")
+    threading.Thread(target=agent.serve, args=(address,), daemon=True).start()
+    client = AgentClient(address=address)
+    try:
+        assert wait_for(lambda: client.request({'op': 'ping'}) is not None)
+        responses = {}
+
+        def request(name, payload):
+            responses[name] = client.request(payload)
+
+        long = threading.Thread(target=request, args=('trends', {
+            'op': 'category_trends', 'start_of_week': date(2025, 3, 3), 'weeks': 8}))
+        long.start()
+        assert wait_for(lambda: len(fetches) == 1)  # The first weekly shard is running
+
+        short = threading.Thread(target=request, args=('summary', {
+            'op': 'summary', 'start': datetime(2025, 3, 4), 'end': datetime(2025, 3, 5, 23, 59)}))
+        short.start()
+        # Accepted while the long request is still fetching, and queued ahead of its shards
+        assert wait_for(lambda: agent.executor.queue_depth(INTERACTIVE) == 1)
+        gate.set()
+        long.join(10)
+        short.join(10)
+
+        assert responses['summary']['ok'] and responses['summary']['data']['count'] == 2
+        assert responses['trends']['ok']
+        # The short fetch ran right after the shard that was running, before the other ten
+        shards = [datetime(2025, 2, 10) + timedelta(weeks=week) for week in range(11)]
+        assert fetches == [shards[0], datetime(2025, 3, 4)] + shards[1:]
+    finally:
+        gate.set()
+        agent.close()
+
+def test_search_is_persisted_across_restarts(agent, application, tmp_path):
+    response = agent.handle({'op': 'search', 'query': 'standup OR orientation', **MONTH})
+    assert response['ok'] and response['source'] == 'outlook'
+    assert [hit['subject'] for hit in response['data']] == ["Team standup", "Team standup", "New hire orientation"]
+    assert response['data'][0]['category'] == 'Team/Staff'
+
+    restarted = AgentService(outlook_factory=lambda: OutlookService(application=application),
+                             cache_path=tmp_path / "cache.pkl", index_path=tmp_path / "index.pkl",
+                             aggregate_path=tmp_path / "aggregates.bin")
+    try:
+        assert len(restarted.index) == 5
+        assert [m.subject for m, _ in restarted.meeting_cache.items()][:1] == ["Team standup"]
+    finally:
+        restarted.close()
+
+def test_top_meetings(agent):
+    response = agent.handle({'op': 'top_meetings', **MONTH, 'n': 2})
+    assert response['ok']
+    assert response['data']['exact']
+    assert response['data']['organizers'] == [("Doe, Jane", 15 + 60 + 90 + 15 + 45, 0)]
+    assert response['data']['subjects'][0] == ("Engineering sprint planning", 90, 0)
+
+def test_rules_edits_recategorize_the_cache(application, tmp_path):
+    rules_path = tmp_path / "rules.json"
+    rules_path.write_text(json.dumps({"version": 1, "categories": {"Team/Staff": ["standup"]}}))
+    rules = RuleSet(rules_path, artifact_dir=tmp_path / "artifacts", check_interval=0)
+    agent = AgentService(outlook_factory=lambda: OutlookService(application=application),
+                         cache_path=tmp_path / "cache.pkl", index_path=tmp_path / "index.pkl",
+                         categorization=CategorizationService(rules), aggregate_path=tmp_path / "aggregates.bin")
+    try:
+        assert agent.handle({'op': 'summary', **WEEK})['data']['week'] == {'Team/Staff': 30, 'Uncategorized': 60 + 90}
+
+        rules_path.write_text(json.dumps({"version": 1, "categories": {
+            "Team/Staff": ["standup"], "Department": ["sprint planning"]}}))
+        response = agent.handle({'op': 'summary', **WEEK})
+        assert response['source'] == 'cache'
+        assert response['data']['week'] == {'Team/Staff': 30, 'Department': 90, 'Uncategorized': 60}
+    finally:
+        agent.close()
@@ -0,0 +1,267 @@
+# services/archive_service/service.py
+"""
+Columnar archive of historical meetings.
+
+Meetings are stored as uncompressed Arrow IPC files partitioned by start
+month (`<root>/month=2025-03/meetings.arrow`), so history Outlook no longer
+returns stays available and multi-year reports never touch COM. Reads
+memory-map the files and push date and category predicates down to the
+dataset scan: months outside the range are never opened and only matching
+rows are materialized.
+"""
+import os
+from datetime import date, datetime
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence
+
+import click
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+from pyarrow import fs
+
+from services.outlook_service.executor import ComExecutor
+from services.outlook_service.models import Meeting
+from services.outlook_service.projection import ANALYTICS_FIELDS
+from services.outlook_service.sharding import ShardedFetcher
+from services.categorization_service.services import CategorizationService, MeetingCategory, configured_categorizer
+from services.ics_service.service import IcsCalendarSource
+from services.summary_service.cache import DATA_DIR
+from services.summary_service.service import CATEGORIES, CATEGORY_CODES, SummaryService, frame_from_arrays
+from shared.logger import logger
+
+ARCHIVE_DIR = DATA_DIR / "archive"
+PARTITION_FILE = "meetings.arrow"
+KEY_COLUMNS = ['organizer', 'subject', 'start_time']
+
+def _schema() -> pa.Schema:
+    return pa.schema([
+        ('subject', pa.string()),
+        ('organizer', pa.string()),
+        ('start_time', pa.timestamp('us')),
+        ('end_time', pa.timestamp('us')),
+        ('duration', pa.int32()),
+        ('is_recurring', pa.bool_()),
+        ('series_id', pa.string()),
+        ('location', pa.string()),
+        ('attendee_count', pa.int32()),
+        ('category', pa.string()),
+    ])
+
+def month_key(value: date) -> str:
+    """Partition holding meetings starting in value's month."""
+    return f"{value.year:04d}-{value.month:02d}"
+
+def normalize(meeting: Meeting, category: MeetingCategory) -> dict:
+    """A meeting as an archive row; times are stored as naive wall-clock times."""
+    return {
+        'subject': meeting.subject,
+        'organizer': meeting.organizer,
+        'start_time': meeting.start_time.replace(tzinfo=None),
+        'end_time': meeting.end_time.replace(tzinfo=None),
+        'duration': meeting.duration,
+        # Meetings fetched with a narrow projection may not have these loaded
+        'is_recurring': getattr(meeting, 'is_recurring', None),
+        'series_id': getattr(meeting, 'series_id', None),
+        'location': getattr(meeting, 'location', None),
+        'attendee_count': getattr(meeting, 'attendee_count', None),
+        'category': category.value,
+    }
+
+class MeetingArchive:
+    """Date-partitioned Arrow archive of categorized meetings."""
+
+    def __init__(self, root: Path = ARCHIVE_DIR, categorization: Optional[CategorizationService] = None):
+        self.root = Path(root)
+        self.categorization = categorization or configured_categorizer()
+        self.schema = _schema()
+
+    def partitions(self) -> List[str]:
+        """Archived months, oldest first."""
+        if not self.root.exists():
+            return []
+        return sorted(
+            path.name.split('=', 1)[1] for path in self.root.glob('month=*')
+            if (path / PARTITION_FILE).exists()
+        )
+
+    def _partition_path(self, month: str) -> Path:
+        return self.root / f"month={month}" / PARTITION_FILE
+
+    def append(self, meetings: Iterable[Meeting],
+               categories: Optional[Iterable[MeetingCategory]] = None) -> int:
+        """
+        Add meetings to the archive. A meeting already archived (same
+        organizer, subject and start time) is replaced, so re-archiving an
+        overlapping range does not create duplicates. Without `categories`
+        the meetings are categorized, after the categorizer learns from the
+        ones labeled in Outlook (see `CategorizationService.learn`).
+
+        Returns:
+            Number of rows written
+        """
+        meetings = list(meetings)
+        if categories is None:
+            self.categorization.learn(meetings)
+            categories = self.categorization.categorize_batch(meetings)
+        rows = pd.DataFrame([normalize(m, c) for m, c in zip(meetings, categories)],
+                            columns=self.schema.names)
+        if rows.empty:
+            return 0
+
+        months = rows['start_time'].dt.strftime('%Y-%m')
+        for month, fresh in rows.groupby(months):
+            self._write_partition(month, fresh)
+        return len(rows)
+
+    def _write_partition(self, month: str, fresh: pd.DataFrame) -> None:
+        path = self._partition_path(month)
+        if path.exists():
+            with pa.memory_map(str(path)) as source:
+                existing = pa.ipc.open_file(source).read_all().to_pandas()
+            fresh = pd.concat([existing, fresh], ignore_index=True)
+        fresh = fresh.drop_duplicates(subset=KEY_COLUMNS, keep='last').sort_values('start_time', kind='stable')
+        table = pa.Table.from_pandas(fresh, schema=self.schema, preserve_index=False)
+
+        # Replace atomically; uncompressed so readers can memory-map without decoding
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_name(path.name + ".tmp")
+        with pa.OSFile(str(temporary), 'wb') as sink:
+            with pa.ipc.new_file(sink, self.schema) as writer:
+                writer.write_table(table)
+        os.replace(temporary, path)
+
+    def _dataset(self, months: Sequence[str]) -> ds.Dataset:
+        # Only the selected partitions are opened; nothing else is listed or inspected
+        return ds.dataset(
+            [str(self._partition_path(month)) for month in months],
+            format='ipc',
+            schema=self.schema,
+            partitioning=ds.partitioning(pa.schema([('month', pa.string())]), flavor='hive'),
+            partition_base_dir=str(self.root),
+            filesystem=fs.LocalFileSystem(use_mmap=True),
+        )
+
+    def read(self, start: Optional[datetime] = None, end: Optional[datetime] = None,
+             categories: Optional[Sequence[MeetingCategory]] = None,
+             columns: Optional[Sequence[str]] = None) -> pa.Table:
+        """
+        Archived meetings starting within [start, end], optionally limited to some categories.
+
+        Args:
+            start: Earliest start time (inclusive)
+            end: Latest start time (inclusive)
+            categories: Categories to include (all when omitted)
+            columns: Columns to read (all archive columns when omitted)
+
+        Returns:
+            Arrow table sorted by start time
+        """
+        months = self.partitions()
+        if start is not None:
+            months = [m for m in months if m >= month_key(start)]
+        if end is not None:
+            months = [m for m in months if m <= month_key(end)]
+        columns = list(columns or self.schema.names)
+        if not months:
+            return self.schema.empty_table().select(columns)
+
+        predicate = ds.scalar(True)
+        if start is not None:
+            predicate &= ds.field('start_time') >= pa.scalar(start.replace(tzinfo=None), pa.timestamp('us'))
+        if end is not None:
+            predicate &= ds.field('start_time') <= pa.scalar(end.replace(tzinfo=None), pa.timestamp('us'))
+        if categories is not None:
+            predicate &= ds.field('category').isin([c.value for c in categories])
+
+        scan_columns = columns if 'start_time' in columns else columns + ['start_time']
+        table = self._dataset(months).to_table(columns=scan_columns, filter=predicate)
+        return table.sort_by('start_time').select(columns)
+
+    def summary_frame(self, start: Optional[datetime] = None, end: Optional[datetime] = None,
+                      categories: Optional[Sequence[MeetingCategory]] = None) -> pd.DataFrame:
+        """
+        Archived meetings as a `SummaryService` frame, built directly from the
+        Arrow columns without creating Meeting objects.
+        """
+        table = self.read(start, end, categories, columns=['start_time', 'duration', 'category'])
+        minutes = table['start_time'].to_numpy().astype('datetime64[m]').astype(np.int64)
+        durations = table['duration'].to_numpy().astype(np.int64)
+        names = pd.Categorical(table['category'].to_numpy(zero_copy_only=False),
+                               categories=[c.value for c in CATEGORIES])
+        # Categories unknown to this version count as uncategorized
+        codes = np.where(names.codes < 0, CATEGORY_CODES[MeetingCategory.UNCATEGORIZED], names.codes)
+        return frame_from_arrays(minutes, durations, codes.astype(np.int8))
+
+    def meetings(self, start: Optional[datetime] = None, end: Optional[datetime] = None,
+                 categories: Optional[Sequence[MeetingCategory]] = None) -> List[Meeting]:
+        """Archived meetings as Meeting objects, for code that works on meeting lists."""
+        fields = [name for name in self.schema.names if name != 'category']
+        return [Meeting(**row) for row in self.read(start, end, categories, fields).to_pylist()]
+
+def _append_by_month(archive: MeetingArchive, meetings: Iterable[Meeting]) -> int:
+    """Append meetings sorted by start time to the archive, one month at a time."""
+    batch, month, total = [], None, 0
+    for meeting in meetings:
+        if batch and month_key(meeting.start_time) != month:
+            total += archive.append(batch)
+            batch = []
+        month = month_key(meeting.start_time)
+        batch.append(meeting)
+    return total + archive.append(batch)
+
+def _parse_categories(values: Sequence[str]) -> Optional[List[MeetingCategory]]:
+    return [MeetingCategory(value) for value in values] if values else None
+
+@click.group()
+@click.option('--root', type=click.Path(path_type=Path), default=ARCHIVE_DIR, show_default=True,
+              help="Archive directory")
+@click.pass_context
+def main(context: click.Context, root: Path):
+    """Archive meetings and report on archived history without Outlook."""
+    context.obj = MeetingArchive(root)
+
+@main.command()
+@click.option('--start', type=click.DateTime(['%Y-%m-%d']), required=True, help="First day to archive")
+@click.option('--end', type=click.DateTime(['%Y-%m-%d']), required=True, help="Day after the last day to archive")
+@click.option('--workers', default=2, show_default=True, help="Outlook COM workers")
+@click.option('--ics', type=click.Path(exists=True, dir_okay=False, path_type=Path), default=None,
+              help="Read meetings from an .ics export instead of Outlook")
+@click.pass_obj
+def export(archive: MeetingArchive, start: datetime, end: datetime, workers: int, ics: Optional[Path]):
+    """Fetch meetings from Outlook (or an .ics export) and add them to the archive, one month at a time."""
+    logger.start_section(f"Archiving {start:%Y-%m-%d} to {end:%Y-%m-%d}")
+    if ics is not None:
+        total = _append_by_month(archive, IcsCalendarSource(ics).iter_meetings(start, end))
+    else:
+        with ComExecutor(workers=workers) as executor:
+            fetcher = ShardedFetcher(executor, shard='month',
+                                     fields=ANALYTICS_FIELDS + archive.categorization.label_fields)
+            total = _append_by_month(archive, fetcher.iter_meetings(start, end))
+    logger.success(f"Archived {total} meetings in {archive.root}")
+    logger.end_section(f"Archiving {start:%Y-%m-%d} to {end:%Y-%m-%d}")
+
+@main.command()
+@click.option('--start', type=click.DateTime(['%Y-%m-%d']), default=None, help="First day to include")
+@click.option('--end', type=click.DateTime(['%Y-%m-%d']), default=None, help="Last day to include")
+@click.option('--category', 'categories', multiple=True,
+              type=click.Choice([c.value for c in CATEGORIES]), help="Only these categories (repeatable)")
+@click.pass_obj
+def report(archive: MeetingArchive, start: Optional[datetime], end: Optional[datetime], categories: Sequence[str]):
+    """Print meeting hours per year and category from the archive."""
+    if end is not None:
+        end = end.replace(hour=23, minute=59, second=59)
+    frame = archive.summary_frame(start, end, _parse_categories(categories))
+    if frame.empty:
+        logger.warn("No archived meetings match")
+        return
+
+    summary_service = SummaryService()
+    logger.start_section("Archived meeting hours by year")
+    for year, totals in summary_service.get_yearly_category_totals(frame).items():
+        ranked = sorted(totals.items(), key=lambda item: item[1], reverse=True)
+        logger.list(f"{year}: {sum(totals.values()) / 60:.1f} hours",
+                    [f"{category}: {minutes / 60:.1f} hours" for category, minutes in ranked])
+    logger.info(f"Total: {summary_service.get_total_minutes(frame) / 60:.1f} hours over {len(frame)} meetings")
+    logger.end_section("Archived meeting hours by year")
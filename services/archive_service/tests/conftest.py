@@ -0,0 +1,26 @@
+from datetime import datetime, timedelta
+import pytest
+from typing import List
+
+from services.outlook_service.models import Meeting
+
+@pytest.fixture
+def history() -> List[Meeting]:
+    """Fixture for a weekly standup and a monthly review over two years"""
+    meetings = []
+    monday = datetime(2024, 1, 1, 9, 0)
+    for week in range(104):
+        start = monday + timedelta(weeks=week)
+        meetings.append(Meeting(
+            subject="Team standup", organizer="Doe, Jane",
+            start_time=start, end_time=start + timedelta(minutes=15), duration=15,
+            is_recurring=True, series_id="standup", location="Room 1", attendee_count=6,
+        ))
+    for month in range(24):
+        start = datetime(2024 + month // 12, month % 12 + 1, 10, 14, 0)
+        meetings.append(Meeting(
+            subject="Product roadmap review", organizer="Lee, Ann",
+            start_time=start, end_time=start + timedelta(minutes=60), duration=60,
+            is_recurring=False, series_id="N/A",
+        ))
+    return meetings
@@ -0,0 +1,74 @@
+import pytest
+from dataclasses import replace
+from datetime import datetime
+
+from click.testing import CliRunner
+
+from services.categorization_service.services import CategorizationService, MeetingCategory
+from services.summary_service.service import SummaryService
+from services.archive_service.service import MeetingArchive, main
+
+@pytest.fixture
+def archive(tmp_path, history):
+    archive = MeetingArchive(tmp_path / "archive")
+    archive.append(history)
+    return archive
+
+def test_partitions_by_month(archive, history):
+    assert archive.partitions()[0] == "2024-01"
+    assert len(archive.partitions()) == 24
+    assert archive.read().num_rows == len(history)
+    assert archive.meetings()[0] == history[0]
+
+def test_append_replaces_archived_meetings(archive, history):
+    moved = replace(history[0], location="Room 2")
+    assert archive.append([moved, history[1]]) == 2
+    assert archive.read().num_rows == len(history)
+    assert archive.meetings(end=history[0].start_time) == [moved]
+
+def test_reads_only_the_requested_range(archive, history):
+    # A damaged partition outside the range is never opened
+    (archive.root / "month=2024-01" / "meetings.arrow").write_bytes(b"not arrow")
+    table = archive.read(datetime(2025, 3, 1), datetime(2025, 3, 31, 23, 59), columns=['subject'])
+    assert table.column_names == ['subject']
+    assert table.num_rows == 5 + 1  # Five standups and a review
+    with pytest.raises(Exception):
+        archive.read(datetime(2024, 1, 1), datetime(2024, 1, 31))
+
+def test_category_filter(archive, history):
+    category = CategorizationService().categorize_meeting(history[-1])
+    meetings = archive.meetings(categories=[category])
+    assert {m.subject for m in meetings} == {"Product roadmap review"}
+    assert archive.read(categories=[MeetingCategory.ONBOARDING]).num_rows == 0
+
+def test_summary_frame_matches_meetings(archive, history):
+    summary_service = SummaryService()
+    frame = archive.summary_frame()
+    expected = summary_service.build_frame(history)
+    assert summary_service.summarize(frame) == summary_service.summarize(expected)
+
+    yearly = summary_service.get_yearly_category_totals(frame)
+    assert sorted(yearly) == [2024, 2025]
+    assert sum(yearly[2024].values()) == 53 * 30 + 12 * 60  # 2024 has 53 Mondays
+
+def test_report_command(archive):
+    runner = CliRunner()
+    result = runner.invoke(main, ['--root', str(archive.root), 'report', '--start', '2025-01-01'])
+    assert result.exit_code == 0, result.output
+    assert "2025" in result.output
+    assert "2024:" not in result.output
+
+def test_export_from_ics(tmp_path):
+    calendar = tmp_path / "calendar.ics"
+    calendar.write_text("BEGIN:VCALENDAR\nBEGIN:VEVENT\nUID:sync\nSUMMARY:Team sync\n"
+                        "DTSTART:20250127T090000\nDTEND:20250127T093000\nRRULE:FREQ=WEEKLY;COUNT=3\n"
+                        "END:VEVENT\nEND:VCALENDAR\n")
+    root = tmp_path / "from-ics"
+    result = CliRunner().invoke(main, ['--root', str(root), 'export', '--start', '2025-01-01',
+                                       '--end', '2025-03-01', '--ics', str(calendar)])
+    assert result.exit_code == 0, result.output
+    archive = MeetingArchive(root)
+    assert archive.partitions() == ['2025-01', '2025-02']
+    assert [m.start_time for m in archive.meetings()] == [
+        datetime(2025, 1, 27, 9), datetime(2025, 2, 3, 9), datetime(2025, 2, 10, 9),
+    ]
@@ -0,0 +1,184 @@
+# services/categorization_service/bayes.py
+"""
+Naive-Bayes categorizer learned from meetings the user already labeled.
+
+Labels come from Outlook categories named after a `MeetingCategory`
+(e.g. a meeting filed under "Team/Staff"). Meetings are tokenized into
+lower-cased words and adjacent word pairs of the same text the keyword
+rules match against, and token weights per category are learned with
+Laplace smoothing.
+
+Batches are scored without per-meeting loops over categories: the batch is
+encoded once as a sparse document x token matrix (CSR-style row and column
+index arrays), and each category's scores are one sparse matrix-vector
+product with its log-weight vector. Meetings whose best category is not
+confident enough, or which contain no known token, fall back to the
+keyword rules.
+"""
+import re
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from services.outlook_service.models import Meeting
+from services.categorization_service.services import CategorizationService, MeetingCategory, meeting_text
+
+WORD = re.compile(r'\w+')
+
+LABELS: Dict[str, MeetingCategory] = {category.value.casefold(): category for category in MeetingCategory}
+
+def meeting_tokens(meeting: Meeting) -> List[str]:
+    """Distinct words and adjacent word pairs of a meeting's categorization text."""
+    words = WORD.findall(meeting_text(meeting).casefold())
+    return list(dict.fromkeys(words + [f"{a} {b}" for a, b in zip(words, words[1:])]))
+
+def outlook_label(meeting: Meeting) -> Optional[MeetingCategory]:
+    """The category a meeting was filed under in Outlook, if it names a MeetingCategory."""
+    for name in getattr(meeting, 'categories', None) or ():
+        category = LABELS.get(name.strip().casefold())
+        if category is not None and category is not MeetingCategory.UNCATEGORIZED:
+            return category
+    return None
+
+class BayesCategorizationService(CategorizationService):
+    """
+    Categorization by a naive-Bayes model, with the keyword rules as fallback.
+
+    A drop-in replacement for `CategorizationService`, selected with
+    OUTLOOK_AUTOMATION_CATEGORIZER=bayes (see `configured_categorizer`); call
+    `fit` or `learn` with labeled meetings first (until then every meeting
+    uses the keyword rules).
+    """
+
+    label_fields = ('categories',)
+
+    def __init__(self, alpha: float = 1.0, threshold: float = 0.8, min_count: int = 1):
+        """
+        Args:
+            alpha: Laplace smoothing added to every token count
+            threshold: Minimum posterior probability to trust the model
+            min_count: Tokens seen in fewer labeled meetings are ignored
+        """
+        super().__init__()
+        self.alpha = alpha
+        self.threshold = threshold
+        self.min_count = min_count
+        self.classes: List[MeetingCategory] = []
+        self.vocabulary: Dict[str, int] = {}
+        self.log_priors = np.zeros(0)
+        self.log_weights = np.zeros((0, 0))  # (classes, vocabulary)
+
+    @property
+    def trained(self) -> bool:
+        return bool(self.classes)
+
+    def _encode(self, documents: Iterable[List[str]]) -> Tuple[np.ndarray, np.ndarray]:
+        """Known tokens of a batch as (row, column) indices of a sparse document x token matrix."""
+        rows: List[int] = []
+        columns: List[int] = []
+        vocabulary = self.vocabulary
+        for row, tokens in enumerate(documents):
+            for token in tokens:
+                column = vocabulary.get(token)
+                if column is not None:
+                    rows.append(row)
+                    columns.append(column)
+        return np.asarray(rows, dtype=np.int64), np.asarray(columns, dtype=np.int64)
+
+    def fit(self, meetings: Iterable[Meeting],
+            labels: Optional[Iterable[Optional[MeetingCategory]]] = None) -> 'BayesCategorizationService':
+        """
+        Learn token weights from labeled meetings.
+
+        Args:
+            meetings: Training meetings
+            labels: Category of each meeting (None for unlabeled); when omitted
+                labels are read from the meetings' Outlook categories
+
+        Returns:
+            self
+
+        Raises:
+            ValueError: If no meeting is labeled
+        """
+        meetings = list(meetings)
+        labels = [outlook_label(m) for m in meetings] if labels is None else list(labels)
+        labeled = [(m, label) for m, label in zip(meetings, labels) if label is not None]
+        if not labeled:
+            raise ValueError("No labeled meetings to learn from")
+
+        self.classes = sorted({label for _, label in labeled}, key=lambda c: c.priority)
+        class_codes = {category: code for code, category in enumerate(self.classes)}
+        documents = [meeting_tokens(m) for m, _ in labeled]
+
+        document_frequency: Dict[str, int] = {}
+        for tokens in documents:
+            for token in tokens:
+                document_frequency[token] = document_frequency.get(token, 0) + 1
+        self.vocabulary = {}
+        for token, count in document_frequency.items():
+            if count >= self.min_count:
+                self.vocabulary[token] = len(self.vocabulary)
+
+        rows, columns = self._encode(documents)
+        codes = np.fromiter((class_codes[label] for _, label in labeled), dtype=np.int64, count=len(labeled))
+        counts = np.zeros((len(self.classes), len(self.vocabulary)))
+        np.add.at(counts, (codes[rows], columns), 1)
+
+        class_sizes = np.bincount(codes, minlength=len(self.classes))
+        self.log_priors = np.log(class_sizes / class_sizes.sum())
+        totals = counts.sum(axis=1, keepdims=True)
+        self.log_weights = np.log(counts + self.alpha) - np.log(totals + self.alpha * len(self.vocabulary))
+        return self
+
+    def learn(self, meetings: Iterable[Meeting]) -> bool:
+        """
+        Refit on the meetings labeled in Outlook; without any, the current
+        model (or the keyword rules) is kept.
+        Returns True if the model was refit.
+        """
+        try:
+            self.fit(meetings)
+        except ValueError:
+            return False
+        return True
+
+    def predict_proba(self, meetings: Sequence[Meeting]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Posterior probabilities for a batch.
+
+        Returns:
+            Tuple of an array of shape (len(meetings), len(classes)) and a
+            boolean array marking meetings with at least one known token
+        """
+        count = len(meetings)
+        rows, columns = self._encode(meeting_tokens(m) for m in meetings)
+        scores = np.empty((count, len(self.classes)))
+        for code in range(len(self.classes)):
+            # Sparse (documents x tokens) @ log-weights of this class
+            scores[:, code] = self.log_priors[code] + np.bincount(
+                rows, weights=self.log_weights[code, columns], minlength=count)
+        scores -= scores.max(axis=1, keepdims=True)
+        probabilities = np.exp(scores)
+        probabilities /= probabilities.sum(axis=1, keepdims=True)
+        return probabilities, np.bincount(rows, minlength=count) > 0
+
+    def keyword_category(self, meeting: Meeting) -> MeetingCategory:
+        """Category from the keyword rules alone."""
+        return super().categorize_meeting(meeting)
+
+    def categorize_batch(self, meetings: Sequence[Meeting]) -> List[MeetingCategory]:
+        """Categorize a batch with the model, using the keyword rules where it is unsure."""
+        meetings = list(meetings)
+        if not self.trained or not meetings:
+            return [self.keyword_category(meeting) for meeting in meetings]
+        probabilities, known = self.predict_proba(meetings)
+        best = probabilities.argmax(axis=1)
+        confident = known & (probabilities[np.arange(len(meetings)), best] >= self.threshold)
+        return [
+            self.classes[code] if sure else self.keyword_category(meeting)
+            for meeting, code, sure in zip(meetings, best.tolist(), confident.tolist())
+        ]
+
+    def categorize_meeting(self, meeting: Meeting) -> MeetingCategory:
+        return self.categorize_batch([meeting])[0]
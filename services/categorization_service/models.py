@@ -0,0 +1,21 @@
+# services/categorization_service/models.py
+from enum import Enum
+
+class MeetingCategory(str, Enum):
+    COMPANY_WIDE = "Company-Wide"
+    STAFF_TEAM = "Team/Staff"
+    DEPARTMENT = "Department"
+    ONBOARDING = "Onboarding"
+    UNCATEGORIZED = "Uncategorized"
+
+    @property
+    def priority(self) -> int:
+        """Return priority for tie-breaking (lower number = higher priority)"""
+        priorities = {
+            MeetingCategory.STAFF_TEAM: 1,
+            MeetingCategory.DEPARTMENT: 2,
+            MeetingCategory.COMPANY_WIDE: 3,
+            MeetingCategory.ONBOARDING: 4,
+            MeetingCategory.UNCATEGORIZED: 5
+        }
+        return priorities[self]
@@ -0,0 +1,120 @@
+# services/categorization_service/parallel.py
+"""
+Multiprocess keyword categorization for bulk datasets (archives, team calendars).
+
+Meetings are split into chunks of their categorization fields only
+(`TEXT_FIELDS`, i.e. subject and organizer), which are cheap to pickle,
+and each worker process answers with one byte per meeting (the index of
+its category). Workers load the compiled rule set once, from the artifact
+cache (see `rules.py`), when they start. Chunks carry their position, so
+results are merged in input order no matter which worker finishes first.
+
+Small inputs are categorized in-process: the worker count grows with the
+input size and stays at zero below `min_parallel` meetings.
+"""
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from services.outlook_service.models import Meeting
+from services.categorization_service.models import MeetingCategory
+from services.categorization_service.rules import RuleSet
+from services.categorization_service.services import CategorizationService, TEXT_FIELDS
+
+CATEGORIES: List[MeetingCategory] = list(MeetingCategory)
+CATEGORY_CODES = {category: code for code, category in enumerate(CATEGORIES)}
+
+Chunk = Tuple[int, List[Tuple[str, ...]]]  # (chunk id, text fields of each meeting)
+
+_worker_service: Optional[CategorizationService] = None
+
+def _init_worker(path: Path, team: Optional[str], artifact_dir: Path) -> None:
+    global _worker_service
+    _worker_service = CategorizationService(RuleSet(path, team, artifact_dir))
+
+def _categorize_chunk(chunk: Chunk) -> Tuple[int, bytes]:
+    chunk_id, rows = chunk
+    # Same text as meeting_text(): the TEXT_FIELDS values joined by spaces
+    codes = bytes(CATEGORY_CODES[_worker_service.categorize_text(" ".join(f"{value}" for value in row))]
+                  for row in rows)
+    return chunk_id, codes
+
+def available_cpus() -> int:
+    """CPUs this process may run on."""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+class ParallelCategorizationService(CategorizationService):
+    """
+    Keyword categorization spread over worker processes for large batches.
+
+    A drop-in replacement for `CategorizationService`: single meetings and
+    small batches are categorized in-process. The pool is started on the
+    first large batch and kept until `close`.
+    """
+
+    def __init__(self, rules: Optional[RuleSet] = None, max_workers: Optional[int] = None,
+                 chunk_size: int = 20_000, min_parallel: int = 50_000):
+        """
+        Args:
+            rules: Keyword rules (the process-wide rules by default); workers
+                load the same file and team
+            max_workers: Upper bound on worker processes (available CPUs by default)
+            chunk_size: Meetings per chunk sent to a worker
+            min_parallel: Batches smaller than this are categorized in-process
+        """
+        super().__init__(rules)
+        self.max_workers = max_workers or available_cpus()
+        self.chunk_size = chunk_size
+        self.min_parallel = min_parallel
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_workers = 0
+
+    def workers_for(self, count: int) -> int:
+        """Worker processes to use for a batch of `count` meetings (0: in-process)."""
+        if count < self.min_parallel:
+            return 0
+        workers = min(self.max_workers, math.ceil(count / self.chunk_size))
+        return workers if workers > 1 else 0
+
+    def _get_pool(self, workers: int) -> ProcessPoolExecutor:
+        if self._pool is not None and self._pool_workers < workers:
+            self.close()
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(self.rules.path, self.rules.team, self.rules.artifact_dir),
+            )
+            self._pool_workers = workers
+        return self._pool
+
+    def categorize_batch(self, meetings: Sequence[Meeting]) -> List[MeetingCategory]:
+        workers = self.workers_for(len(meetings))
+        if not workers:
+            return super().categorize_batch(meetings)
+
+        rows = [tuple(getattr(meeting, name) for name in TEXT_FIELDS) for meeting in meetings]
+        chunks = [(start, rows[start:start + self.chunk_size]) for start in range(0, len(rows), self.chunk_size)]
+        codes = np.empty(len(rows), dtype=np.uint8)
+        for start, chunk_codes in self._get_pool(workers).map(_categorize_chunk, chunks):
+            codes[start:start + len(chunk_codes)] = np.frombuffer(chunk_codes, dtype=np.uint8)
+        return [CATEGORIES[code] for code in codes.tolist()]
+
+    def close(self) -> None:
+        """Stop the worker processes."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+            self._pool_workers = 0
+
+    def __enter__(self) -> 'ParallelCategorizationService':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
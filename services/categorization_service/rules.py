@@ -0,0 +1,214 @@
+# services/categorization_service/rules.py
+"""
+Externally configured categorization rules.
+
+Keywords per category are read from a versioned JSON file (`rules.json`
+next to this module by default, or the file named by
+`OUTLOOK_AUTOMATION_RULES`). A team can add or remove keywords under
+`teams`; the team is chosen with `OUTLOOK_AUTOMATION_TEAM`:
+
+    {
+        "version": 1,
+        "categories": {"Team/Staff": ["standup", "sync", ...], ...},
+        "teams": {
+            "platform": {
+                "add": {"Department": ["on-call"]},
+                "remove": {"Company-Wide": ["update"]}
+            }
+        }
+    }
+
+The rules are compiled into a `KeywordMatcher` and pickled to an artifact
+named after the hash of the file contents, the team and the matcher
+version, so later processes load the compiled form instead of compiling
+again. Long-running processes share one `RuleSet` per file and team, which
+picks up edits to the file (see `RuleSet.reload`).
+"""
+import hashlib
+import json
+import os
+import pickle
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+from services.categorization_service.models import MeetingCategory
+from shared.logger import logger
+
+RULES_PATH = Path(os.environ.get("OUTLOOK_AUTOMATION_RULES", Path(__file__).with_name("rules.json")))
+ARTIFACT_DIR = Path.home() / ".outlook_automation" / "rules"
+DEFAULT_TEAM = os.environ.get("OUTLOOK_AUTOMATION_TEAM") or None
+
+RULES_VERSION = 1      # Config file format this code reads
+MATCHER_VERSION = 1    # Bump when the compiled form changes
+
+# Words and runs of punctuation, so keywords such as "1:1", "<>" and "check-in" keep their punctuation
+TOKEN = re.compile(r'\w+|[^\w\s]+')
+
+def tokenize(text: str) -> Tuple[str, ...]:
+    return tuple(TOKEN.findall(text.casefold()))
+
+def load_rules(text: str, team: Optional[str] = None) -> Dict[MeetingCategory, List[str]]:
+    """
+    Parse a rules file and apply a team's overrides.
+
+    Raises:
+        ValueError: If the file is malformed, has an unsupported version or
+            names an unknown category or team
+    """
+    try:
+        config = json.loads(text)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid rules file: {str(e)}") from None
+    if config.get("version") != RULES_VERSION:
+        raise ValueError(f"Unsupported rules version: {config.get('version')} (expected {RULES_VERSION})")
+
+    def category(name: str) -> MeetingCategory:
+        try:
+            return MeetingCategory(name)
+        except ValueError:
+            raise ValueError(f"Unknown category in rules file: {name}") from None
+
+    rules = {category(name): list(keywords) for name, keywords in config.get("categories", {}).items()}
+    if team is not None:
+        overrides = config.get("teams", {}).get(team)
+        if overrides is None:
+            raise ValueError(f"No rules for team: {team}")
+        for name, keywords in overrides.get("add", {}).items():
+            rules.setdefault(category(name), []).extend(k for k in keywords if k not in rules.get(category(name), []))
+        for name, keywords in overrides.get("remove", {}).items():
+            removed = set(keywords)
+            rules[category(name)] = [k for k in rules.get(category(name), []) if k not in removed]
+    return rules
+
+class KeywordMatcher:
+    """
+    Compiled keyword rules: every keyword is a token sequence, indexed by its
+    first token, so a text is matched in one pass over its tokens.
+    Plain data only, so it pickles and loads without recompiling anything.
+    """
+
+    def __init__(self, rules: Dict[MeetingCategory, List[str]]):
+        self.keywords: Dict[MeetingCategory, FrozenSet[str]] = {
+            category: frozenset(keywords) for category, keywords in rules.items()
+        }
+        phrases: Dict[Tuple[str, ...], List[MeetingCategory]] = {}
+        for category, keywords in self.keywords.items():
+            for keyword in keywords:
+                tokens = tokenize(keyword)
+                if tokens:
+                    phrases.setdefault(tokens, []).append(category)
+        # first token -> [(phrase, categories it counts for)]
+        self.index: Dict[str, List[Tuple[Tuple[str, ...], Tuple[MeetingCategory, ...]]]] = {}
+        for tokens, categories in phrases.items():
+            self.index.setdefault(tokens[0], []).append((tokens, tuple(categories)))
+
+    def match_counts(self, text: str) -> Dict[MeetingCategory, int]:
+        """Number of distinct keywords of each category found in a text."""
+        tokens = tokenize(text)
+        found = set()
+        for position, token in enumerate(tokens):
+            for phrase, categories in self.index.get(token, ()):
+                if tokens[position:position + len(phrase)] == phrase:
+                    found.add((phrase, categories))
+        counts = {category: 0 for category in MeetingCategory}
+        for _, categories in found:
+            for category in categories:
+                counts[category] += 1
+        return counts
+
+def compile_rules(text: str, team: Optional[str] = None,
+                  artifact_dir: Path = ARTIFACT_DIR) -> Tuple[KeywordMatcher, str]:
+    """
+    Compiled matcher for a rules file, loaded from its artifact when one exists.
+
+    Returns:
+        Tuple of the matcher and the content hash identifying it
+    """
+    digest = hashlib.blake2b(f"{MATCHER_VERSION}\0{team or ''}\0{text}".encode(), digest_size=16).hexdigest()
+    artifact = Path(artifact_dir) / f"{digest}.pkl"
+    try:
+        with open(artifact, 'rb') as f:
+            return pickle.load(f), digest
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        pass  # Missing or unreadable: compile again
+
+    matcher = KeywordMatcher(load_rules(text, team))
+    try:
+        artifact.parent.mkdir(parents=True, exist_ok=True)
+        temporary = artifact.with_name(f"{artifact.name}.{os.getpid()}.tmp")
+        with open(temporary, 'wb') as f:
+            pickle.dump(matcher, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, artifact)
+    except OSError:
+        pass  # The cache is an optimization; a read-only home directory is fine
+    return matcher, digest
+
+class RuleSet:
+    """
+    Compiled rules for one file and team, reloaded when the file changes.
+
+    The file is checked (one stat call) at most every `check_interval`
+    seconds; when its contents change the new rules are compiled and
+    swapped in. An invalid edit keeps the previous rules.
+    """
+
+    def __init__(self, path: Path = RULES_PATH, team: Optional[str] = DEFAULT_TEAM,
+                 artifact_dir: Path = ARTIFACT_DIR, check_interval: float = 2.0):
+        self.path = Path(path)
+        self.team = team
+        self.artifact_dir = artifact_dir
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._stat: Optional[Tuple[int, int]] = None
+        self.matcher, self.digest = self._load()
+        self._checked = time.monotonic()
+
+    def _load(self) -> Tuple[KeywordMatcher, str]:
+        stat = self.path.stat()
+        text = self.path.read_text(encoding='utf-8')
+        self._stat = (stat.st_mtime_ns, stat.st_size)
+        return compile_rules(text, self.team, self.artifact_dir)
+
+    def reload(self, force: bool = False) -> bool:
+        """
+        Reload the rules if the file changed.
+
+        Args:
+            force: Check now, even if checked within `check_interval`
+
+        Returns:
+            True if different rules are now in effect
+        """
+        now = time.monotonic()
+        if not force and now - self._checked < self.check_interval:
+            return False
+        with self._lock:
+            self._checked = now
+            try:
+                stat = self.path.stat()
+                if (stat.st_mtime_ns, stat.st_size) == self._stat:
+                    return False
+                previous = self.digest
+                self.matcher, self.digest = self._load()
+            except (OSError, ValueError) as e:
+                logger.warn(f"Keeping previous categorization rules: {str(e)}")
+                return False
+            return self.digest != previous
+
+    def match_counts(self, text: str) -> Dict[MeetingCategory, int]:
+        self.reload()
+        return self.matcher.match_counts(text)
+
+_rule_sets: Dict[Tuple[Path, Optional[str]], RuleSet] = {}
+_rule_sets_lock = threading.Lock()
+
+def get_rule_set(path: Path = RULES_PATH, team: Optional[str] = DEFAULT_TEAM) -> RuleSet:
+    """The process-wide RuleSet for a rules file and team, compiled on first use."""
+    key = (Path(path).resolve(), team)
+    with _rule_sets_lock:
+        if key not in _rule_sets:
+            _rule_sets[key] = RuleSet(path, team)
+        return _rule_sets[key]
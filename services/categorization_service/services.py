@@ -1,127 +1,48 @@
 # services/categorization_service/service.py
-from enum import Enum
-from typing import List, Dict, Set
-import re
+import os
+from typing import Iterable, List, Dict, Optional, Set, Tuple
 from services.outlook_service.models import Meeting
+from services.categorization_service.models import MeetingCategory
+from services.categorization_service.rules import RuleSet, get_rule_set
 
-class MeetingCategory(str, Enum):
-    COMPANY_WIDE = "Company-Wide"
-    STAFF_TEAM = "Team/Staff"
-    DEPARTMENT = "Department"
-    ONBOARDING = "Onboarding"
-    UNCATEGORIZED = "Uncategorized"
+# Meeting fields whose text is matched against category keywords
+TEXT_FIELDS = ('subject', 'organizer')
 
-    @property
-    def priority(self) -> int:
-        """Return priority for tie-breaking (lower number = higher priority)"""
-        priorities = {
-            MeetingCategory.STAFF_TEAM: 1,
-            MeetingCategory.DEPARTMENT: 2,
-            MeetingCategory.COMPANY_WIDE: 3,
-            MeetingCategory.ONBOARDING: 4,
-            MeetingCategory.UNCATEGORIZED: 5
-        }
-        return priorities[self]
+# Selects the categorizer: "rules" (keyword rules, the default) or "bayes"
+CATEGORIZER_ENV = "OUTLOOK_AUTOMATION_CATEGORIZER"
+
+def meeting_text(meeting: Meeting) -> str:
+    """The text categorization matches keywords against."""
+    return " ".join(f"{getattr(meeting, name)}" for name in TEXT_FIELDS)
 
 class CategorizationService:
-    def __init__(self):
-        self.category_keywords: Dict[MeetingCategory, Set[str]] = {
-            MeetingCategory.COMPANY_WIDE: {
-                # Direct company indicators
-                "company", "corporate", "organization", "enterprise",
-                # Large meetings
-                "all hands", "all-hands", "town hall", "townhall",
-                "summit", "quarterly", "annual", "yearly",
-                # Company-wide events
-                "announcement", "update", "briefing", "showcase",
-                "celebration", "awards", "recognition",
-                # Executive terms
-                "executive", "leadership", "ceo", "cfo", "cto",
-                # Company culture
-                "culture", "values", "mission", "vision",
-                # Company performance
-                "earnings", "results", "performance", "strategy"
-            },
-            
-            MeetingCategory.STAFF_TEAM: {
-                # Team indicators
-                "team", "staff", "squad", "crew", "group",
-                # Regular meetings
-                "standup", "sync", "check-in", "touchbase", "touch-base",
-                "daily", "weekly", "biweekly", "monthly",
-                # Small group indicators
-                "1:1", "one on one", "one-on-one", "<>", 
-                "catchup", "catch-up", "chat",
-                # Team activities
-                "huddle", "scrum", "alignment", "coordination",
-                "status", "update", "sync", "collaboration",
-                # Team roles
-                "lead", "manager", "supervisor", "coordinator",
-                "peer"
-            },
-            
-            MeetingCategory.DEPARTMENT: {
-                # Department names
-                "engineering", "software", "development", "devops",
-                "sales", "marketing", "finance", "accounting",
-                "hr", "human resources", "support", "customer service",
-                "operations", "it", "infrastructure", "security",
-                "product", "design", "research", "qa",
-                # Department activities
-                "retrospective", "retro", "planning", "review",
-                "sprint", "backlog", "roadmap", "strategy",
-                "architecture", "deployment", "release",
-                # Department-wide terms
-                "department", "division", "unit", "branch",
-                "initiative", "project", "program", "workflow",
-                # Review/Planning terms
-                "debrief", "analysis", "assessment", "evaluation",
-                "quarterly review", "milestone", "objectives",
-                "goals", "metrics", "kpi"
-            },
-            
-            MeetingCategory.ONBOARDING: {
-                # Direct indicators
-                "onboarding", "orientation", "introduction", "intro",
-                "new hire", "new-hire", "first day", "first week",
-                # Common onboarding activities
-                "training", "welcome", "overview", "setup",
-                "documentation", "paperwork", "benefits",
-                "getting started", "kickoff", "kick-off",
-                # Onboarding related terms
-                "mentor", "buddy", "guide", "tour",
-                "handbook", "manual", "policies", "procedures",
-                "system access", "credentials", "setup",
-                # HR related
-                "hr meeting", "employee", "policies", "i9",
-                "direct deposit", "benefits", "enrollment"
-            }
-        }
-        
-        # Compile regex patterns for each category
-        self.category_patterns: Dict[MeetingCategory, List[re.Pattern]] = {
-            category: [
-                re.compile(rf'\b{keyword}\b', re.IGNORECASE)
-                for keyword in keywords
-            ]
-            for category, keywords in self.category_keywords.items()
-        }
+    # Meeting fields `learn` needs loaded, for callers to add to their projection
+    label_fields: Tuple[str, ...] = ()
+
+    def __init__(self, rules: Optional[RuleSet] = None):
+        """
+        Args:
+            rules: Keyword rules to match; by default the process-wide rules
+                from the configured rules file, compiled once and hot-reloaded
+        """
+        self.rules = rules or get_rule_set()
+
+    @property
+    def category_keywords(self) -> Dict[MeetingCategory, Set[str]]:
+        """Keywords currently in effect for each category."""
+        return {category: set(keywords) for category, keywords in self.rules.matcher.keywords.items()}
 
     def categorize_meeting(self, meeting: Meeting) -> MeetingCategory:
         """
         Categorize a single meeting based on its subject and other properties.
         Returns the most appropriate category based on keyword matches and priority.
         """
-        search_text = f"{meeting.subject} {meeting.organizer}"
-        
-        # Track matches for each category
-        matches = {category: 0 for category in MeetingCategory}
-        
-        # Count matches for each category
-        for category, patterns in self.category_patterns.items():
-            for pattern in patterns:
-                if pattern.search(search_text):
-                    matches[category] += 1
+        return self.categorize_text(meeting_text(meeting))
+
+    def categorize_text(self, text: str) -> MeetingCategory:
+        """Categorize a meeting's categorization text (see `meeting_text`)."""
+        # Count distinct keyword matches for each category
+        matches = self.rules.match_counts(text)
         
         # Find categories with the most matches
         max_matches = max(matches.values())
@@ -140,6 +61,21 @@ class CategorizationService:
         
         return top_categories[0]
 
+    def categorize_batch(self, meetings: List[Meeting]) -> List[MeetingCategory]:
+        """
+        Categorize many meetings at once, returning one category per meeting.
+        Subclasses with a vectorized model override this.
+        """
+        return [self.categorize_meeting(meeting) for meeting in meetings]
+
+    def learn(self, meetings: Iterable[Meeting]) -> bool:
+        """
+        Learn from meetings the user already categorized in Outlook.
+        The keyword rules have nothing to learn; statistical subclasses override this.
+        Returns True if the categorizer changed.
+        """
+        return False
+
     def categorize_meetings(self, meetings: List[Meeting]) -> Dict[MeetingCategory, List[Meeting]]:
         """
         Categorize a list of meetings and return them grouped by category.
@@ -148,8 +84,7 @@ class CategorizationService:
             category: [] for category in MeetingCategory
         }
         
-        for meeting in meetings:
-            category = self.categorize_meeting(meeting)
+        for meeting, category in zip(meetings, self.categorize_batch(meetings)):
             categorized[category].append(meeting)
         
         return categorized
@@ -163,4 +98,21 @@ class CategorizationService:
         for category, meetings in categorized_meetings.items():
             total_minutes = sum(meeting.rounded_duration for meeting in meetings)
             summary[category] = total_minutes / 60  # Convert to hours
-        return summary
\ No newline at end of file
+        return summary
+
+def configured_categorizer() -> CategorizationService:
+    """
+    The categorizer selected by OUTLOOK_AUTOMATION_CATEGORIZER: the keyword
+    rules, or with "bayes" a naive-Bayes model that callers fit with `learn`
+    on the meetings they fetch (the keyword rules until then).
+
+    Raises:
+        ValueError: If the setting names an unknown categorizer
+    """
+    name = (os.environ.get(CATEGORIZER_ENV) or 'rules').strip().lower()
+    if name == 'rules':
+        return CategorizationService()
+    if name == 'bayes':
+        from services.categorization_service.bayes import BayesCategorizationService
+        return BayesCategorizationService()
+    raise ValueError(f"Unknown categorizer: {name}")
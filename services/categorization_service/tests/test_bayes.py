@@ -0,0 +1,87 @@
+import pytest
+from datetime import datetime, timedelta
+
+from services.outlook_service.emulator import FakeAppointment, FakeOutlookApplication, make_appointment
+from services.outlook_service.models import Meeting
+from services.outlook_service.projection import LazyMeeting, SUMMARY_FIELDS
+from services.categorization_service.bayes import BayesCategorizationService, meeting_tokens, outlook_label
+from services.categorization_service.services import CategorizationService, MeetingCategory, configured_categorizer
+
+def meeting(subject: str, organizer: str = "Doe, Jane", categories=None) -> Meeting:
+    start = datetime(2025, 3, 3, 9, 0)
+    return Meeting(subject=subject, start_time=start, end_time=start + timedelta(minutes=30), duration=30,
+                   organizer=organizer, is_recurring=False, series_id="N/A", categories=categories)
+
+@pytest.fixture
+def history():
+    """Labeled meetings whose subjects the keyword rules mostly miss"""
+    return [
+        meeting("Backlog grooming", "Eng, Director", ["Department"]),
+        meeting("Grooming and estimation", "Eng, Director", ["Department"]),
+        meeting("Incident postmortem", "Ops, Head", ["Department"]),
+        meeting("Pairing session", categories=["Team/Staff"]),
+        meeting("Coffee and pairing", categories=["Team/Staff", "Blue"]),
+        meeting("Laptop and badge", "HR, Team", ["Onboarding"]),
+        meeting("Badge pickup", "HR, Team", ["onboarding"]),
+        meeting("Fireside chat", "CEO, The", ["Company-Wide"]),
+        meeting("Unlabeled", categories=["Green"]),
+    ]
+
+def test_labels_and_tokens():
+    assert outlook_label(meeting("x", categories=["Blue", " team/staff "])) == MeetingCategory.STAFF_TEAM
+    assert outlook_label(meeting("x", categories=["Uncategorized"])) is None
+    assert outlook_label(meeting("x")) is None
+    assert meeting_tokens(meeting("All hands all hands", "CEO, The")) == [
+        "all", "hands", "ceo", "the", "all hands", "hands all", "hands ceo", "ceo the"]
+
+def test_learns_from_outlook_categories(history):
+    bayes = BayesCategorizationService().fit(history)
+    assert len(bayes.classes) == 4
+    assert CategorizationService().categorize_meeting(meeting("Grooming", "Eng, Director")) == MeetingCategory.UNCATEGORIZED
+    assert bayes.categorize_batch([
+        meeting("Grooming", "Eng, Director"),
+        meeting("Pairing"),
+        meeting("Badge", "HR, Team"),
+    ]) == [MeetingCategory.DEPARTMENT, MeetingCategory.STAFF_TEAM, MeetingCategory.ONBOARDING]
+
+def test_falls_back_to_keywords(history):
+    bayes = BayesCategorizationService().fit(history)
+    # No known token, and an ambiguous one: the keyword rules decide
+    assert bayes.categorize_meeting(meeting("Company all hands", "Someone, New")) == MeetingCategory.COMPANY_WIDE
+    unsure = meeting("Pairing postmortem", "Someone, New")
+    probabilities, known = bayes.predict_proba([unsure])
+    assert known[0] and probabilities.max() < bayes.threshold
+    assert bayes.categorize_meeting(unsure) == CategorizationService().categorize_meeting(unsure)
+
+def test_untrained_matches_keyword_rules(history):
+    meetings = [m for m in history]
+    assert BayesCategorizationService().categorize_batch(meetings) == \
+        [CategorizationService().categorize_meeting(m) for m in meetings]
+    with pytest.raises(ValueError):
+        BayesCategorizationService().fit(meetings, [None] * len(meetings))
+
+def test_reads_labels_through_projection():
+    application = FakeOutlookApplication([])
+    start = datetime(2025, 3, 3, 9, 0)
+    items = [
+        FakeAppointment(application, **make_appointment("Grooming", start, 30, Categories="Department")),
+        FakeAppointment(application, **make_appointment("Pairing", start, 30, Categories="Team/Staff,Red")),
+    ]
+    meetings = [LazyMeeting(item, fields=SUMMARY_FIELDS) for item in items]
+    bayes = BayesCategorizationService().fit(meetings)
+    assert bayes.classes == [MeetingCategory.STAFF_TEAM, MeetingCategory.DEPARTMENT]
+
+def test_configured_categorizer(monkeypatch, history):
+    monkeypatch.delenv("OUTLOOK_AUTOMATION_CATEGORIZER", raising=False)
+    rules = configured_categorizer()
+    assert type(rules) is CategorizationService and not rules.learn(history)
+
+    monkeypatch.setenv("OUTLOOK_AUTOMATION_CATEGORIZER", "Bayes")
+    bayes = configured_categorizer()
+    assert isinstance(bayes, BayesCategorizationService) and bayes.label_fields == ('categories',)
+    assert not bayes.learn([meeting("Unlabeled")]) and not bayes.trained
+    assert bayes.learn(history) and bayes.categorize_meeting(meeting("Grooming", "Eng, Director")) == MeetingCategory.DEPARTMENT
+
+    monkeypatch.setenv("OUTLOOK_AUTOMATION_CATEGORIZER", "neural")
+    with pytest.raises(ValueError):
+        configured_categorizer()
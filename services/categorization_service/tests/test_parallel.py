@@ -0,0 +1,37 @@
+from datetime import datetime, timedelta
+
+from services.outlook_service.models import Meeting
+from services.categorization_service.parallel import ParallelCategorizationService
+from services.categorization_service.services import CategorizationService
+
+SUBJECTS = ["Team standup", "Company all hands", "Sprint planning", "New hire orientation", "Lunch", "Weekly 1:1"]
+
+def meetings(count: int):
+    start = datetime(2025, 3, 3, 9, 0)
+    return [
+        Meeting(subject=f"{SUBJECTS[i % len(SUBJECTS)]} {i}", start_time=start + timedelta(hours=i),
+                end_time=start + timedelta(hours=i, minutes=30), duration=30,
+                organizer="CEO, The" if i % 7 == 0 else "Doe, Jane", is_recurring=False, series_id="N/A")
+        for i in range(count)
+    ]
+
+def test_worker_count_follows_input_size():
+    service = ParallelCategorizationService(max_workers=4, chunk_size=100, min_parallel=250)
+    assert service.workers_for(249) == 0
+    assert service.workers_for(250) == 3
+    assert service.workers_for(10_000) == 4
+    assert ParallelCategorizationService(max_workers=1, min_parallel=0).workers_for(10_000) == 0
+
+def test_small_batches_stay_in_process():
+    service = ParallelCategorizationService(max_workers=2, min_parallel=1_000)
+    batch = meetings(50)
+    assert service.categorize_batch(batch) == CategorizationService().categorize_batch(batch)
+    assert service._pool is None
+
+def test_parallel_results_match_in_order():
+    batch = meetings(500)
+    with ParallelCategorizationService(max_workers=2, chunk_size=37, min_parallel=100) as service:
+        assert service.categorize_batch(batch) == CategorizationService().categorize_batch(batch)
+        grouped = service.categorize_meetings(batch)
+    assert sum(len(group) for group in grouped.values()) == len(batch)
+    assert service._pool is None
@@ -0,0 +1,90 @@
+import json
+import pytest
+from datetime import datetime, timedelta
+
+from services.outlook_service.models import Meeting
+from services.categorization_service.models import MeetingCategory
+from services.categorization_service.rules import KeywordMatcher, RuleSet, compile_rules, load_rules, RULES_PATH
+from services.categorization_service.services import CategorizationService
+
+CONFIG = {
+    "version": 1,
+    "categories": {
+        "Team/Staff": ["standup", "1:1", "<>", "check-in"],
+        "Department": ["sprint planning", "update"],
+        "Company-Wide": ["update", "all hands"],
+    },
+    "teams": {
+        "platform": {"add": {"Department": ["on-call"]}, "remove": {"Company-Wide": ["update"]}},
+    },
+}
+
+def meeting(subject: str, organizer: str = "Doe, Jane") -> Meeting:
+    start = datetime(2025, 3, 3, 9, 0)
+    return Meeting(subject=subject, start_time=start, end_time=start + timedelta(minutes=30), duration=30,
+                   organizer=organizer, is_recurring=False, series_id="N/A")
+
+@pytest.fixture
+def rules_path(tmp_path):
+    path = tmp_path / "rules.json"
+    path.write_text(json.dumps(CONFIG))
+    return path
+
+def categorize(rules, subject):
+    return CategorizationService(rules).categorize_meeting(meeting(subject))
+
+def test_matches_keywords_on_token_boundaries(rules_path, tmp_path):
+    rules = RuleSet(rules_path, artifact_dir=tmp_path)
+    assert categorize(rules, "Daily standup") == MeetingCategory.STAFF_TEAM
+    assert categorize(rules, "Standups") == MeetingCategory.UNCATEGORIZED
+    assert categorize(rules, "Weekly 1:1") == MeetingCategory.STAFF_TEAM
+    assert categorize(rules, "Doe <> Smith") == MeetingCategory.STAFF_TEAM
+    assert categorize(rules, "Check in") == MeetingCategory.UNCATEGORIZED
+    assert categorize(rules, "Sprint planning") == MeetingCategory.DEPARTMENT
+    # "update" counts for both; the tie goes to the higher priority category
+    assert categorize(rules, "All hands update") == MeetingCategory.COMPANY_WIDE
+    assert categorize(rules, "Update") == MeetingCategory.DEPARTMENT
+
+def test_team_overrides(rules_path):
+    rules = load_rules(rules_path.read_text(), team="platform")
+    assert "update" not in rules[MeetingCategory.COMPANY_WIDE]
+    assert rules[MeetingCategory.DEPARTMENT] == ["sprint planning", "update", "on-call"]
+    with pytest.raises(ValueError):
+        load_rules(rules_path.read_text(), team="missing")
+    with pytest.raises(ValueError):
+        load_rules(json.dumps({"version": 2, "categories": {}}))
+    with pytest.raises(ValueError):
+        load_rules(json.dumps({"version": 1, "categories": {"Sales": ["deal"]}}))
+
+def test_compiled_artifact_is_reused(rules_path, tmp_path, monkeypatch):
+    text = rules_path.read_text()
+    matcher, digest = compile_rules(text, artifact_dir=tmp_path / "artifacts")
+    assert (tmp_path / "artifacts" / f"{digest}.pkl").exists()
+    assert compile_rules(text, "platform", tmp_path / "artifacts")[1] != digest
+
+    def fail(*args):
+        raise AssertionError("recompiled")
+    monkeypatch.setattr(KeywordMatcher, "__init__", fail)
+    loaded, loaded_digest = compile_rules(text, artifact_dir=tmp_path / "artifacts")
+    assert loaded_digest == digest
+    assert loaded.match_counts("daily standup") == matcher.match_counts("daily standup")
+
+def test_hot_reload(rules_path, tmp_path):
+    rules = RuleSet(rules_path, artifact_dir=tmp_path, check_interval=0)
+    assert not rules.reload()
+    assert categorize(rules, "Retro") == MeetingCategory.UNCATEGORIZED
+
+    CONFIG_V2 = dict(CONFIG, categories={**CONFIG["categories"], "Department": ["retro"]})
+    rules_path.write_text(json.dumps(CONFIG_V2))
+    assert categorize(rules, "Retro") == MeetingCategory.DEPARTMENT
+
+    rules_path.write_text("{ not json")
+    assert not rules.reload(force=True)
+    assert categorize(rules, "Retro") == MeetingCategory.DEPARTMENT
+
+def test_default_rules_are_shared():
+    first, second = CategorizationService(), CategorizationService()
+    assert first.rules is second.rules
+    assert first.rules.path == RULES_PATH
+    assert first.categorize_meeting(meeting("Weekly 1:1", "Smith, Bob")) == MeetingCategory.STAFF_TEAM
+    assert first.categorize_meeting(meeting("Company all hands", "CEO, The")) == MeetingCategory.COMPANY_WIDE
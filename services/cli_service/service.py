@@ -1,25 +1,61 @@
 # services/cli_service/service.py
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from pathlib import Path
 from prompt_toolkit import prompt
 from prompt_toolkit.completion import WordCompleter
-from services.outlook_service.service import OutlookService
+from services.outlook_service.service import OutlookService, format_restriction_date
+from services.outlook_service.com import dispatch_outlook
 from services.outlook_service.models import Meeting
-from services.categorization_service.services import CategorizationService, MeetingCategory
+from services.outlook_service.attendees import AttendeeCache
+from services.outlook_service.enumeration import iter_pages
+from services.outlook_service.projection import ANALYTICS_FIELDS, SEARCH_FIELDS, SUMMARY_FIELDS, LazyMeeting
+from services.summary_service.service import SummaryService, WEEKDAYS
+from services.summary_service.cache import MeetingCache
+from services.summary_service.clustering import SubjectClusterer, series_keys
+from services.summary_service.heatmap import MeetingHeatmap
+from services.summary_service.heavy_hitters import MeetingHeavyHitters
+from services.summary_service.rollup import DailyRollup
+from services.summary_service.snapshot import SNAPSHOT_DIR, SNAPSHOT_FIELDS, CalendarSnapshot, diff_snapshots, format_change
+from services.summary_service.search import (
+    MeetingIndex, parse_query, search_meetings, search_result
+)
+from services.agent_service.service import AgentClient
+from services.report_service.service import WRITERS, ReportPager, categorized, render_report, report_rows, run_pager
 from shared.logger import logger
-import win32com.client
+from shared.metrics import metrics
+from shared.timezones import epoch_minutes, get_normalizer, wall_clock_minutes
 import pythoncom
 from collections import defaultdict
-import pytz
-from typing import List, Dict
+import time
+from typing import List, Dict, Iterable, Optional
+
+import numpy as np
+
+COLLECT_PAGE_SIZE = 1_000  # Calendar items read and normalized together
 
 class CLIService:
     def __init__(self):
         self.outlook = None
+        self.meeting_cache = MeetingCache()
+        self.rollup = DailyRollup()
+        self.meeting_cache.add_listener(self.rollup)
+        self.index = MeetingIndex()
+        self.index.attach(self.meeting_cache)
+        self.agent = AgentClient()
+        self.timezone = get_normalizer()
+        self.attendees = AttendeeCache()
+        self.clusterer = SubjectClusterer()
         self.choices = {
             '1': ('Check this week\'s meetings', self.check_current_week),
             '2': ('Check next week\'s meetings', self.check_next_week),
             '3': ('Check last week\'s meetings', self.check_last_week),
             '4': ('Generate meeting report', self.generate_report),
+            '5': ('Show 52-week category trends', self.show_category_trends),
+            '6': ('Search meetings', self.search_calendar),
+            '7': ('Show top organizers and recurring series', self.show_top_meetings),
+            '8': ('Show what changed since the last run', self.show_calendar_changes),
+            '9': ('Show meeting cost in person-hours', self.show_meeting_cost),
+            '10': ('Show when meetings happen (weekday x half-hour heatmap)', self.show_meeting_heatmap),
             'q': ('Quit', self.quit_program)
         }
 
@@ -64,13 +100,32 @@ class CLIService:
 
     def check_meetings(self, week_offset: int, week_name: str):
         """Check meetings for a specific week offset."""
+        started = time.perf_counter()
+        
+        # Target week's wall-clock range in the configured time zone
+        start_naive, end_naive = self.timezone.week_bounds(week_offset)
+        
+        # Format dates for logging
+        start_date = start_naive.strftime('%m/%d/%Y')
+        end_date = end_naive.strftime('%m/%d/%Y')
+        
+        # Answer from the warm agent when it is running
+        response = self._ask_agent({'op': 'summary', 'start': start_naive, 'end': end_naive})
+        if response is not None:
+            if response['data']['count']:
+                self._display_summary(response['data'])
+            else:
+                logger.info(f"No meetings found for {week_name} ({start_date} to {end_date})")
+            self._log_answer_path(started, response)
+            return
+        
         try:
             # Initialize COM
             pythoncom.CoInitialize()
             
             # Connect to Outlook
             logger.info("Connecting to Outlook...", "start")
-            outlook = win32com.client.Dispatch('Outlook.Application')
+            outlook = dispatch_outlook()
             namespace = outlook.GetNamespace('MAPI')
             
             # Log Outlook version
@@ -84,50 +139,18 @@ class CLIService:
                 logger.warn("No calendar items found.")
                 return
             
-            # Get target week's date range with timezone awareness
-            local_tz = pytz.timezone('America/Chicago')  # Adjust timezone if needed
-            today = datetime.now(local_tz)
-            start_of_week = (today - timedelta(days=today.weekday()) + timedelta(weeks=week_offset))
-            end_of_week = start_of_week + timedelta(days=6)
-            
-            # Format dates for logging
-            start_date = start_of_week.strftime('%m/%d/%Y')
-            end_date = end_of_week.strftime('%m/%d/%Y')
-            
             logger.info(f"Looking for meetings between {start_date} and {end_date}")
             
-            # Include recurrences and sort
-            items.IncludeRecurrences = True
-            items.Sort("[Start]")
-            weekly_meetings = []
-            
-            # Create naive datetime objects for comparison
-            start_naive = start_of_week.replace(tzinfo=None, hour=0, minute=0, second=0, microsecond=0)
-            end_naive = end_of_week.replace(tzinfo=None, hour=23, minute=59, second=59, microsecond=999999)
-            
-            for item in items:
-                try:
-                    meeting_start = item.Start
-                    if isinstance(meeting_start, str):
-                        meeting_start = datetime.strptime(meeting_start, '%Y-%m-%d %H:%M')
-                    elif hasattr(meeting_start, 'tzinfo') and meeting_start.tzinfo:
-                        meeting_start = meeting_start.replace(tzinfo=None)
-                    
-                    if start_naive <= meeting_start <= end_naive:
-                        weekly_meetings.append(item)
-                except Exception as e:
-                    logger.error(f"Error processing meeting: {str(e)}")
-                    continue
-
-            if not weekly_meetings:
+            meetings = self._collect_meetings(items, start_naive, end_naive)
+            self.meeting_cache.refresh(meetings, start_naive, end_naive)
+
+            if not meetings:
                 logger.info(f"No meetings found for {week_name} ({start_date} to {end_date})")
                 return
-
-            # Convert to Meeting objects
-            meetings = [Meeting.from_outlook_item(m) for m in weekly_meetings]
             
             # Display daily summary
             self.display_daily_summary(meetings)
+            self._log_answer_path(started)
             
             # Offer to adjust meetings
             # Future feature implementation
@@ -140,6 +163,65 @@ class CLIService:
         finally:
             pythoncom.CoUninitialize()
 
+    def _ask_agent(self, request: Dict) -> Optional[Dict]:
+        """
+        Send a request to the warm agent.
+        Returns None when the agent is not running or fails, so callers fall back to the cold path.
+        """
+        response = self.agent.request(request)
+        if response is None:
+            return None
+        if not response['ok']:
+            logger.warn(f"Agent could not answer ({response['error']}), falling back to in-process")
+            return None
+        return response
+
+    def _log_answer_path(self, started: float, response: Optional[Dict] = None):
+        """Report whether an answer came from the warm agent or the in-process cold path."""
+        elapsed = time.perf_counter() - started
+        if response is None:
+            com_calls = sum(metrics.counters("com.calls.").values())
+            logger.info(f"Answered in-process (cold path) in {elapsed:.2f}s ({com_calls} COM calls this session)")
+        else:
+            logger.info(f"Answered by warm agent from its {response['source']} in {elapsed:.2f}s")
+
+    def _collect_meetings(self, items, start_naive: datetime, end_naive: datetime,
+                          fields: Iterable[str] = SEARCH_FIELDS, record_type=LazyMeeting) -> List[Meeting]:
+        """
+        Read calendar items starting within [start_naive, end_naive] into meetings
+        detached from Outlook; only `fields` (which must include start_time) are read,
+        by `record_type` (see `iter_records`).
+        """
+        # Labels are read too when the categorizer learns from them
+        fields = tuple(fields) + self.meeting_cache.categorization.label_fields
+        # Include recurrences and sort, then narrow the walk to the window
+        items.IncludeRecurrences = True
+        items.Sort("[Start]")
+        items = items.Restrict(
+            f"[Start] >= '{format_restriction_date(start_naive)}' AND "
+            f"[Start] <= '{format_restriction_date(end_naive)}'"
+        )
+        meetings = []
+        skipped = 0
+        
+        def skip(error: Exception):
+            nonlocal skipped
+            logger.error(f"Error processing meeting: {str(error)}")
+            metrics.increment("outlook.items_skipped")
+            skipped += 1
+        
+        # Items are released as soon as they are read; start times (wall clock, maybe strings)
+        # are compared a page at a time
+        first, last = epoch_minutes(start_naive), epoch_minutes(end_naive)
+        for page in iter_pages(items, fields, COLLECT_PAGE_SIZE, record_type, on_error=skip):
+            local = wall_clock_minutes(meeting.start_time for meeting in page)
+            meetings.extend(page[index] for index in np.flatnonzero((local >= first) & (local <= last)))
+        
+        if skipped:
+            logger.warn(f"{skipped} calendar items could not be read and are missing from the results")
+        self.meeting_cache.learn(meetings)
+        return meetings
+
     def check_current_week(self):
         """Check current week's meetings."""
         self.check_meetings(0, "this week")
@@ -152,10 +234,292 @@ class CLIService:
         """Check last week's meetings."""
         self.check_meetings(-1, "last week")
 
-    def generate_report(self):
-        """Generate a meeting report."""
-        logger.info("Report generation coming soon!")
-        input("\nPress Enter to continue...")
+    def show_category_trends(self, weeks: int = 52):
+        """Show weekly hours per category with a rolling 4-week average."""
+        logger.start_section(f"{weeks}-Week Category Trends")
+        started = time.perf_counter()
+        
+        today = self.timezone.today()
+        start_of_week = today - timedelta(days=today.weekday(), weeks=weeks - 1)
+        end_of_week = today - timedelta(days=today.weekday()) + timedelta(days=6)
+        
+        response = self._ask_agent({'op': 'category_trends', 'start_of_week': start_of_week, 'weeks': weeks})
+        if response is not None:
+            self._display_trends(response['data'])
+            self._log_answer_path(started, response)
+            logger.end_section(f"{weeks}-Week Category Trends")
+            return
+        
+        try:
+            pythoncom.CoInitialize()
+            
+            outlook = dispatch_outlook()
+            namespace = outlook.GetNamespace('MAPI')
+            calendar = namespace.GetDefaultFolder(9)
+            
+            # Fetch three extra weeks so the first rolling averages are complete
+            fetch_start = datetime.combine(start_of_week - timedelta(weeks=3), datetime.min.time())
+            fetch_end = datetime.combine(end_of_week, datetime.max.time())
+            meetings = self._collect_meetings(calendar.Items, fetch_start, fetch_end)
+            self.meeting_cache.refresh(meetings, fetch_start, fetch_end)
+            
+            self._display_trends(self.rollup.weekly_trends(start_of_week, weeks))
+            self._log_answer_path(started)
+            
+        except Exception as e:
+            logger.error(f"Error generating trends: {str(e)}")
+        finally:
+            pythoncom.CoUninitialize()
+            logger.end_section(f"{weeks}-Week Category Trends")
+
+    def _display_trends(self, trends: Dict):
+        """Display the output of DailyRollup.weekly_trends."""
+        if not trends['categories']:
+            logger.info("No meetings found for the trend period")
+            return
+        
+        for week_start, minutes, average in zip(trends['weeks'], trends['weekly'], trends['rolling']):
+            totals = ", ".join(
+                f"{category}: {self.format_duration(total)}"
+                for category, total in zip(trends['categories'], minutes)
+            )
+            logger.info(f"{week_start.strftime('%m/%d/%Y')}  {totals}  "
+                        f"(4-week avg: {self.format_duration(int(round(average)))})")
+
+    def search_calendar(self, months: int = 6):
+        """Search the last months of meetings by subject, organizer and location."""
+        logger.start_section("Search Meetings")
+        query = prompt('Search for (e.g. roadmap organizer:smith, "sprint planning" OR retro): ').strip()
+        try:
+            parse_query(query)
+        except ValueError as e:
+            logger.error(str(e))
+            logger.end_section("Search Meetings")
+            return
+        
+        started = time.perf_counter()
+        today = self.timezone.today()
+        start = datetime.combine(today - timedelta(days=30 * months), datetime.min.time())
+        end = datetime.combine(today, datetime.max.time())
+        
+        response = self._ask_agent({'op': 'search', 'query': query, 'start': start, 'end': end})
+        if response is not None:
+            self._display_search_results(response['data'])
+            self._log_answer_path(started, response)
+            logger.end_section("Search Meetings")
+            return
+        
+        try:
+            pythoncom.CoInitialize()
+            
+            outlook = dispatch_outlook()
+            calendar = outlook.GetNamespace('MAPI').GetDefaultFolder(9)
+            meetings = self._collect_meetings(calendar.Items, start, end)
+            self.meeting_cache.refresh(meetings, start, end)
+            
+            self._display_search_results([
+                search_result(meeting, category)
+                for meeting, category in search_meetings(self.meeting_cache, self.index, query, start, end)
+            ])
+            self._log_answer_path(started)
+            
+        except Exception as e:
+            logger.error(f"Error searching meetings: {str(e)}")
+        finally:
+            pythoncom.CoUninitialize()
+            logger.end_section("Search Meetings")
+
+    def _display_search_results(self, results: List[Dict]):
+        """Display search hits as produced by `search_result`."""
+        if not results:
+            logger.info("No matching meetings found")
+            return
+        
+        logger.success(f"Found {len(results)} matching meetings:")
+        for result in results:
+            location = f" @ {result['location']}" if result['location'] else ""
+            logger.info(f"{result['start_time'].strftime('%m/%d/%Y %H:%M')}  "
+                        f"{self.format_duration(result['duration'])}  {result['subject']} "
+                        f"({result['organizer']}){location} [{result['category']}]")
+
+    def show_top_meetings(self, weeks: int = 52, n: int = 20):
+        """Show the organizers, subjects and recurring series taking the most meeting time."""
+        logger.start_section(f"Top Meetings ({weeks} weeks)")
+        started = time.perf_counter()
+        
+        today = self.timezone.today()
+        start = datetime.combine(today - timedelta(weeks=weeks), datetime.min.time())
+        end = datetime.combine(today, datetime.max.time())
+        
+        response = self._ask_agent({'op': 'top_meetings', 'start': start, 'end': end, 'n': n})
+        if response is not None:
+            self._display_top_meetings(response['data'])
+            self._log_answer_path(started, response)
+            logger.end_section(f"Top Meetings ({weeks} weeks)")
+            return
+        
+        try:
+            pythoncom.CoInitialize()
+            
+            outlook = dispatch_outlook()
+            calendar = outlook.GetNamespace('MAPI').GetDefaultFolder(9)
+            meetings = self._collect_meetings(calendar.Items, start, end, ANALYTICS_FIELDS)
+            self.meeting_cache.refresh(meetings, start, end)
+            
+            heavy_hitters = MeetingHeavyHitters(clusterer=self.clusterer)
+            heavy_hitters.consume(meetings)
+            self._display_top_meetings(heavy_hitters.report(n))
+            self._log_answer_path(started)
+            
+        except Exception as e:
+            logger.error(f"Error computing top meetings: {str(e)}")
+        finally:
+            pythoncom.CoUninitialize()
+            logger.end_section(f"Top Meetings ({weeks} weeks)")
+
+    def show_calendar_changes(self, weeks: int = 2):
+        """Show meetings added, cancelled, moved or resized since the last run, and the hours they shift."""
+        logger.start_section("Calendar Changes")
+        
+        start, _ = self.timezone.week_bounds(0)
+        end = start + timedelta(weeks=weeks)
+        
+        try:
+            pythoncom.CoInitialize()
+            
+            outlook = dispatch_outlook()
+            calendar = outlook.GetNamespace('MAPI').GetDefaultFolder(9)
+            meetings = self._collect_meetings(calendar.Items, start, end - timedelta(microseconds=1), SNAPSHOT_FIELDS)
+            self.meeting_cache.refresh(meetings, start, end)
+            current = CalendarSnapshot.build(
+                meetings, self.meeting_cache.categorization.categorize_batch(meetings), start, end
+            )
+            
+            path = SNAPSHOT_DIR / "calendar.pkl"
+            previous = CalendarSnapshot.load(path)
+            current.save(path)
+            if previous is None:
+                logger.info(f"Saved a snapshot of {len(current)} meetings; changes are shown from the next run")
+                return
+            
+            diff = diff_snapshots(previous, current)
+            logger.info(f"Changes since {previous.taken_at.strftime('%m/%d/%Y %H:%M')}")
+            if not len(diff):
+                logger.info("Nothing changed")
+                return
+            for kind, changes in diff.by_kind().items():
+                if changes:
+                    logger.list(f"{kind.capitalize()} ({len(changes)})",
+                                [format_change(diff, change) for change in changes])
+            deltas = diff.category_deltas()
+            if deltas:
+                logger.list("Change in meeting time", [
+                    f"{category.value}: {'+' if minutes > 0 else '-'}{self.format_duration(abs(minutes))}"
+                    for category, minutes in deltas.items()
+                ])
+            
+        except Exception as e:
+            logger.error(f"Error comparing calendar snapshots: {str(e)}")
+        finally:
+            pythoncom.CoUninitialize()
+            logger.end_section("Calendar Changes")
+
+    def show_meeting_cost(self, weeks: int = 4):
+        """Show person-hours (duration x attendees) per category over the last few weeks."""
+        logger.start_section(f"Meeting Cost ({weeks} weeks)")
+        started = time.perf_counter()
+        
+        start, _ = self.timezone.week_bounds(1 - weeks)
+        _, end = self.timezone.week_bounds(0)
+        
+        try:
+            pythoncom.CoInitialize()
+            
+            outlook = dispatch_outlook()
+            calendar = outlook.GetNamespace('MAPI').GetDefaultFolder(9)
+            # Recipients are read once per series; later occurrences reuse them
+            hits = metrics.counter("outlook.attendees.cache_hits")
+            meetings = self._collect_meetings(calendar.Items, start, end, SUMMARY_FIELDS, self.attendees.read)
+            hits = metrics.counter("outlook.attendees.cache_hits") - hits
+            if not meetings:
+                logger.info("No meetings found for the period")
+                return
+            
+            summary = SummaryService(self.meeting_cache.categorization)
+            frame = summary.build_frame(meetings, attendees=[meeting.attendees for meeting in meetings])
+            costs = summary.get_category_person_hours(frame)
+            for category, hours in sorted(costs.items(), key=lambda entry: -entry[1]['people']):
+                logger.info(f"{category.value}: {hours['people']:.1f} person-hours "
+                            f"(required {hours['required']:.1f}, optional {hours['optional']:.1f}, "
+                            f"accepted {hours['accepted']:.1f})")
+            total = sum(hours['people'] for hours in costs.values())
+            logger.success(f"Total: {total:.1f} person-hours in {len(meetings)} meetings")
+            logger.info(f"Attendees of {hits} of {len(meetings)} meetings came from their series' first occurrence")
+            self._log_answer_path(started)
+            
+        except Exception as e:
+            logger.error(f"Error computing meeting cost: {str(e)}")
+        finally:
+            pythoncom.CoUninitialize()
+            logger.end_section(f"Meeting Cost ({weeks} weeks)")
+
+    def show_meeting_heatmap(self, weeks: int = 13):
+        """Show meeting time per weekday and half hour over the last quarter, optionally saved as CSV."""
+        logger.start_section(f"Meeting Heatmap ({weeks} weeks)")
+        started = time.perf_counter()
+        
+        start, _ = self.timezone.week_bounds(1 - weeks)
+        _, end = self.timezone.week_bounds(0)
+        
+        try:
+            pythoncom.CoInitialize()
+            
+            outlook = dispatch_outlook()
+            calendar = outlook.GetNamespace('MAPI').GetDefaultFolder(9)
+            meetings = self._collect_meetings(calendar.Items, start, end, SUMMARY_FIELDS)
+            if not meetings:
+                logger.info("No meetings found for the period")
+                return
+            
+            heatmap = MeetingHeatmap()
+            heatmap.add(meetings, self.meeting_cache.categorization.categorize_batch(meetings))
+            for line in heatmap.render():
+                logger.info(line)
+            logger.list("Busiest half hours", [
+                f"{weekday} {slot}: {self.format_duration(round(minutes))}"
+                for weekday, slot, minutes in heatmap.busiest()
+            ])
+            self._log_answer_path(started)
+            
+            answer = prompt("Save as CSV to (empty to skip): ").strip()
+            if answer:
+                with open(Path(answer), 'w', newline='', encoding='utf-8') as stream:
+                    rows = heatmap.write_csv(stream)
+                logger.success(f"Wrote {rows} rows to {answer}")
+            
+        except Exception as e:
+            logger.error(f"Error computing the meeting heatmap: {str(e)}")
+        finally:
+            pythoncom.CoUninitialize()
+            logger.end_section(f"Meeting Heatmap ({weeks} weeks)")
+
+    def _display_top_meetings(self, report: Dict):
+        """Display the output of MeetingHeavyHitters.report."""
+        if not report['organizers']:
+            logger.info("No meetings found for the period")
+            return
+        
+        sections = [
+            ("Organizers by meeting time", report['organizers']),
+            ("Subjects by meeting time", report['subjects']),
+            ("Recurring series by attendee time (duration x attendees)", report['series']),
+        ]
+        for title, entries in sections:
+            logger.success(f"\n{title}:")
+            for rank, (key, minutes, error) in enumerate(entries, 1):
+                # Sketch estimates are upper bounds; show how much they may be overstated
+                margin = f" (up to {self.format_duration(error)} less)" if error else ""
+                logger.info(f"{rank:>2}. {key}: {self.format_duration(minutes)}{margin}")
 
     def quit_program(self):
         """Exit the program."""
@@ -224,28 +588,34 @@ class CLIService:
             return False
 
     def adjust_recurring_series(self, meetings: List[Meeting]) -> bool:
-        """Adjust all instances of a recurring meeting series."""
-        # Get unique meeting subjects
-        series = set(meeting.subject for meeting in meetings if meeting.is_recurring)
+        """Adjust all instances of a recurring meeting series, including meetings recreated under similar subjects."""
+        # Group by series id, or by subject cluster for meetings recreated instead of recurring
+        series: Dict[str, List[Meeting]] = defaultdict(list)
+        for meeting, key in zip(meetings, series_keys(meetings, self.clusterer)):
+            if key is not None:
+                series[key].append(meeting)
         
         if not series:
             logger.warn("No recurring meeting series found")
             return False
 
-        for i, subject in enumerate(series, 1):
-            logger.info(f"{i}. {subject}")
+        names = list(series)
+        for i, key in enumerate(names, 1):
+            subjects = sorted({meeting.subject for meeting in series[key]})
+            more = f" / +{len(subjects) - 3} more" if len(subjects) > 3 else ""
+            logger.info(f"{i}. {' / '.join(subjects[:3])}{more} ({len(series[key])} meetings)")
 
         try:
             idx = int(prompt("\nSelect series number: ")) - 1
-            if 0 <= idx < len(series):
-                series_name = list(series)[idx]
+            if 0 <= idx < len(names):
+                series_name = names[idx]
                 factor = float(prompt("Enter scaling factor (e.g., 1.25 for 25% increase): "))
                 
-                for meeting in meetings:
-                    if meeting.subject == series_name:
-                        meeting.duration = int(meeting.duration * factor)
+                for meeting in series[series_name]:
+                    meeting.duration = int(meeting.duration * factor)
                 
-                logger.success(f"Scaled all instances of '{series_name}' by {factor}x")
+                logger.success(f"Scaled all {len(series[series_name])} instances of "
+                               f"'{series[series_name][0].subject}' by {factor}x")
                 return True
             return False
         except ValueError:
@@ -254,24 +624,19 @@ class CLIService:
 
     def display_daily_summary(self, meetings: List[Meeting]):
         """Display summary of meetings grouped by day and category."""
-        categorization = CategorizationService()
-        daily_meetings = self.get_daily_summary(meetings)
+        summary = SummaryService(self.meeting_cache.categorization)
+        self._display_summary(summary.summarize(summary.build_frame(meetings)))
+
+    def _display_summary(self, summary: Dict):
+        """Display the output of SummaryService.summarize."""
+        daily_totals = summary['daily']
         
         logger.success("\nDaily Summary:")
         
-        for day in ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']:
-            if day in daily_meetings:
-                day_meetings = daily_meetings[day]
-                
-                # Get categories for this day's meetings
-                day_categorized = categorization.categorize_meetings(day_meetings)
-                
-                # Calculate totals by category
-                category_totals = {
-                    str(cat.value): sum(m.rounded_duration for m in cat_meetings)  # Use string value of category
-                    for cat, cat_meetings in day_categorized.items()
-                    if cat_meetings  # Only include categories with meetings
-                }
+        for day in WEEKDAYS[:5]:
+            if day in daily_totals:
+                # Totals by category (only categories with meetings)
+                category_totals = daily_totals[day]
                 
                 # Display day totals by category
                 logger.info(f"\n{day}:")
@@ -283,73 +648,69 @@ class CLIService:
                 total_minutes = sum(category_totals.values())
                 logger.info(f"  Total: {self.format_duration(total_minutes)}")
                 
-        # Calculate and display week totals by category
-        categorized_meetings = categorization.categorize_meetings(meetings)
+        # Display week totals by category
         logger.success("\nWeek Totals by Category:")
-        for category, cat_meetings in categorized_meetings.items():
-            if cat_meetings:  # Only show categories with meetings
-                total_minutes = sum(m.rounded_duration for m in cat_meetings)
-                logger.info(f"  {category.value}: {self.format_duration(total_minutes)}")  # Use category.value
+        for category, total_minutes in summary['week'].items():
+            logger.info(f"  {category}: {self.format_duration(total_minutes)}")
         
         # Week total
-        week_total = sum(m.rounded_duration for m in meetings)
-        logger.info(f"  Total: {self.format_duration(week_total)}")
+        logger.info(f"  Total: {self.format_duration(summary['total'])}")
+
+    def _prompt_date(self, label: str, default: date) -> date:
+        """Ask for a date, accepting an empty answer as the default."""
+        answer = prompt(f"{label} (MM/DD/YYYY) [{default.strftime('%m/%d/%Y')}]: ").strip()
+        return datetime.strptime(answer, '%m/%d/%Y').date() if answer else default
 
     def generate_report(self):
-        """Generate a detailed report showing how meetings were categorized."""
+        """Report every meeting in a date range with its category, on screen or as CSV/HTML."""
         logger.start_section("Detailed Meeting Report")
         
+        today = self.timezone.today()
+        start_of_week = today - timedelta(days=today.weekday())
+        try:
+            first_day = self._prompt_date("Start date", start_of_week)
+            last_day = self._prompt_date("End date", max(first_day, start_of_week + timedelta(days=6)))
+        except ValueError:
+            logger.error("Dates must be in MM/DD/YYYY format")
+            logger.end_section("Detailed Meeting Report")
+            return
+        if last_day < first_day:
+            logger.error("The end date is before the start date")
+            logger.end_section("Detailed Meeting Report")
+            return
+        
+        output = prompt("Show on screen or save as csv/html? [screen]: ",
+                        completer=WordCompleter(['screen', *WRITERS])).lower().strip() or 'screen'
+        if output != 'screen' and output not in WRITERS:
+            logger.error(f"Unknown output: {output}")
+            logger.end_section("Detailed Meeting Report")
+            return
+        
+        start = datetime.combine(first_day, datetime.min.time())
+        end = datetime.combine(last_day + timedelta(days=1), datetime.min.time())
+        title = f"Meetings {first_day.strftime('%m/%d/%Y')} - {last_day.strftime('%m/%d/%Y')}"
+        
         try:
             pythoncom.CoInitialize()
             
-            # Get current week's meetings
-            outlook = win32com.client.Dispatch('Outlook.Application')
-            namespace = outlook.GetNamespace('MAPI')
-            calendar = namespace.GetDefaultFolder(9)
-            items = calendar.Items
+            # Meetings arrive sorted by start time and are categorized and written a chunk at a time
+            outlook = OutlookService()
+            meetings = (
+                meeting for meeting in outlook.iter_meetings(start, end, SUMMARY_FIELDS, detached=True)
+                if meeting.start_time.replace(tzinfo=None) >= start
+            )
+            rows = report_rows(categorized(meetings, self.meeting_cache.categorization))
             
-            if not items:
-                logger.warn("No meetings found")
-                return
-                
-            items.IncludeRecurrences = True
-            items.Sort("[Start]")
-            
-            today = datetime.now()
-            start_of_week = today - timedelta(days=today.weekday())
-            end_of_week = start_of_week + timedelta(days=6)
-            
-            start_naive = start_of_week.replace(hour=0, minute=0, second=0, microsecond=0)
-            end_naive = end_of_week.replace(hour=23, minute=59, second=59, microsecond=999999)
-            
-            meetings = []
-            for item in items:
-                meeting_start = item.Start
-                if isinstance(meeting_start, str):
-                    meeting_start = datetime.strptime(meeting_start, '%Y-%m-%d %H:%M')
-                if hasattr(meeting_start, 'tzinfo'):
-                    meeting_start = meeting_start.replace(tzinfo=None)
-                
-                if start_naive <= meeting_start <= end_naive:
-                    meetings.append(Meeting.from_outlook_item(item))
-            
-            # Show detailed categorization
-            categorization = CategorizationService()
-            categorized_meetings = categorization.categorize_meetings(meetings)
-            
-            logger.info("\nDetailed Meeting Categorization:")
-            for category, cat_meetings in categorized_meetings.items():
-                if cat_meetings:
-                    logger.info(f"\n{category}:")
-                    for meeting in sorted(cat_meetings, key=lambda m: m.start_time):
-                        logger.list(f"{meeting.start_time.strftime('%A %H:%M')}", [{
-                            "subject": meeting.subject,
-                            "duration": self.format_duration(meeting.rounded_duration),
-                            "organizer": meeting.organizer.split(',')[0]
-                        }])
+            if output == 'screen':
+                run_pager(ReportPager(rows), title)
+            else:
+                path = Path(prompt(f"Save to [meeting_report.{output}]: ").strip() or f"meeting_report.{output}")
+                with open(path, 'w', newline='', encoding='utf-8') as stream:
+                    totals = render_report(rows, WRITERS[output](stream, title))
+                logger.success(f"Wrote {totals.count} meetings ({self.format_duration(totals.total)}) to {path}")
             
         except Exception as e:
             logger.error(f"Error generating report: {str(e)}")
         finally:
             pythoncom.CoUninitialize()
-            input("\nPress Enter to continue...")
\ No newline at end of file
+            logger.end_section("Detailed Meeting Report")
\ No newline at end of file
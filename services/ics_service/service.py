@@ -0,0 +1,397 @@
+# services/ics_service/service.py
+"""
+iCalendar (.ics) calendar source.
+
+Reads calendar exports without Outlook (e.g. on Linux), producing the same
+`Meeting` records as `OutlookService`, so the categorization, summary,
+report and archive code works on them unchanged.
+
+Files are parsed line by line; only the event being read is held in memory.
+Recurring events (RRULE/RDATE minus EXDATE) are expanded only within the
+requested window, and occurrences moved or cancelled by a RECURRENCE-ID
+override are replaced by the override. Times are converted to wall-clock
+times in the configured time zone (see `shared/timezones.py`), matching
+what Outlook reports.
+"""
+import io
+import re
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, tzinfo
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, TextIO, Tuple
+from zoneinfo import ZoneInfo
+
+import click
+from dateutil import tz
+from dateutil.rrule import rruleset, rrulestr
+
+from services.outlook_service.models import Meeting
+from services.outlook_service.projection import SUMMARY_FIELDS
+from services.categorization_service.services import configured_categorizer
+from services.report_service.service import WRITERS, categorized, render_report, report_rows
+from services.summary_service.heatmap import MeetingHeatmap
+from services.summary_service.service import SummaryService
+from shared.logger import logger
+from shared.timezones import TimeZoneNormalizer, get_normalizer
+
+DURATION = re.compile(r'([+-])?P(?:(\d+)W)?(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?$')
+ESCAPES = {'n': '\n', 'N': '\n', ',': ',', ';': ';', '\\': '\\'}
+
+@dataclass
+class Property:
+    """One content line: NAME;PARAM=value:VALUE"""
+    name: str
+    value: str
+    params: Dict[str, str] = field(default_factory=dict)
+
+def unfold(lines: Iterable[str]) -> Iterator[str]:
+    """Join folded content lines (continuations start with a space or tab)."""
+    current = None
+    for line in lines:
+        line = line.rstrip('\r\n')
+        if line[:1] in (' ', '\t'):
+            if current is not None:
+                current += line[1:]
+            continue
+        if current is not None:
+            yield current
+        current = line
+    if current:
+        yield current
+
+def parse_line(line: str) -> Property:
+    """
+    Split a content line into name, parameters and value.
+
+    Raises:
+        ValueError: If the line has no value separator
+    """
+    parts, start, quoted = [], 0, False
+    for index, char in enumerate(line):
+        if char == '"':
+            quoted = not quoted
+        elif not quoted and char in ';:':
+            parts.append(line[start:index])
+            start = index + 1
+            if char == ':':
+                break
+    else:
+        raise ValueError(f"Not an iCalendar content line: {line[:80]}")
+    params = {}
+    for part in parts[1:]:
+        key, _, value = part.partition('=')
+        params[key.upper()] = value.strip('"')
+    return Property(parts[0].upper(), line[start:], params)
+
+def unescape(value: str) -> str:
+    return re.sub(r'\\(.)', lambda match: ESCAPES.get(match.group(1), match.group(1)), value)
+
+def parse_duration(value: str) -> timedelta:
+    """
+    Raises:
+        ValueError: If the value is not an iCalendar duration
+    """
+    match = DURATION.match(value.strip())
+    if not match:
+        raise ValueError(f"Invalid duration: {value}")
+    sign, weeks, days, hours, minutes, seconds = match.groups()
+    duration = timedelta(weeks=int(weeks or 0), days=int(days or 0), hours=int(hours or 0),
+                         minutes=int(minutes or 0), seconds=int(seconds or 0))
+    return -duration if sign == '-' else duration
+
+class IcsCalendarSource:
+    """
+    Meetings from an .ics file, with the `get_meetings`/`iter_meetings`
+    interface of `OutlookService`.
+    """
+
+    def __init__(self, path: Path, normalizer: Optional[TimeZoneNormalizer] = None):
+        """
+        Args:
+            path: The .ics file
+            normalizer: Zone meeting times are reported in (the configured zone by default)
+        """
+        self.path = Path(path)
+        self.zone = ZoneInfo((normalizer or get_normalizer()).key)
+        self._timezones: Dict[str, tzinfo] = {}
+        self.skipped = 0
+
+    def _open(self) -> TextIO:
+        return open(self.path, encoding='utf-8-sig', errors='replace', newline='')
+
+    def _events(self) -> Iterator[List[Property]]:
+        """Properties of each VEVENT, registering VTIMEZONE definitions on the way."""
+        with self._open() as stream:
+            stack: List[str] = []
+            properties: List[Property] = []
+            timezone_lines: List[str] = []
+            for line in unfold(stream):
+                if not line.strip():
+                    continue
+                try:
+                    prop = parse_line(line)
+                except ValueError as e:
+                    logger.warn(f"Skipping line in {self.path.name}: {str(e)}")
+                    continue
+                if 'VTIMEZONE' in stack:
+                    timezone_lines.append(line)
+                if prop.name == 'BEGIN':
+                    stack.append(prop.value.upper())
+                    if stack[-1] == 'VTIMEZONE':
+                        timezone_lines = [line]
+                    elif stack[-1] == 'VEVENT':
+                        properties = []
+                elif prop.name == 'END':
+                    if not stack:
+                        continue
+                    component = stack.pop()
+                    if component == 'VTIMEZONE':
+                        self._add_timezone(timezone_lines)
+                    elif component == 'VEVENT':
+                        yield properties
+                elif stack and stack[-1] == 'VEVENT':
+                    properties.append(prop)
+
+    def _add_timezone(self, lines: List[str]) -> None:
+        try:
+            definitions = tz.tzical(io.StringIO("\r\n".join(lines)))
+            for key in definitions.keys():
+                self._timezones[key] = definitions.get(key)
+        except Exception as e:
+            logger.warn(f"Ignoring time zone definition in {self.path.name}: {str(e)}")
+
+    def _timezone(self, tzid: str) -> Optional[tzinfo]:
+        if tzid not in self._timezones:
+            try:
+                self._timezones[tzid] = ZoneInfo(tzid)
+            except Exception:
+                logger.warn(f"Unknown time zone {tzid}, reading its times as local")
+                self._timezones[tzid] = None
+        return self._timezones[tzid]
+
+    def _datetime(self, value: str, params: Dict[str, str]) -> datetime:
+        """A DATE or DATE-TIME value: aware when it names a zone or UTC, naive (local) otherwise."""
+        value = value.strip()
+        if params.get('VALUE') == 'DATE' or len(value) == 8:
+            return datetime.strptime(value[:8], '%Y%m%d')
+        if value.endswith('Z'):
+            return datetime.strptime(value[:-1], '%Y%m%dT%H%M%S').replace(tzinfo=tz.UTC)
+        parsed = datetime.strptime(value, '%Y%m%dT%H%M%S')
+        zone = self._timezone(params['TZID']) if 'TZID' in params else None
+        return parsed.replace(tzinfo=zone) if zone else parsed
+
+    def _wall_clock(self, value: datetime) -> datetime:
+        """Naive wall-clock time in the configured zone, as Outlook reports it."""
+        if value.tzinfo is None:
+            return value
+        return value.astimezone(self.zone).replace(tzinfo=None)
+
+    def _overrides(self) -> Set[Tuple[str, datetime]]:
+        """(UID, original start) of every occurrence replaced by a RECURRENCE-ID event."""
+        overrides = set()
+        for properties in self._events():
+            values = {prop.name: prop for prop in properties}
+            if 'RECURRENCE-ID' in values and 'UID' in values:
+                recurrence_id = values['RECURRENCE-ID']
+                overrides.add((values['UID'].value,
+                               self._wall_clock(self._datetime(recurrence_id.value, recurrence_id.params))))
+        return overrides
+
+    def _occurrences(self, values: Dict[str, Property], properties: List[Property], dtstart: datetime,
+                     length: timedelta, start_date: datetime, end_date: datetime) -> Iterator[datetime]:
+        """Starts of the occurrences of an event that overlap the window."""
+        window_zone = self.zone if dtstart.tzinfo is not None else None
+        window_start = start_date.replace(tzinfo=window_zone)
+        window_end = end_date.replace(tzinfo=window_zone)
+        if 'RRULE' not in values and 'RDATE' not in values:
+            candidates = [dtstart]
+        else:
+            occurrences = rruleset()
+            occurrences.rdate(dtstart)
+            for prop in properties:
+                if prop.name == 'RRULE':
+                    occurrences.rrule(self._rrule(prop.value, dtstart))
+                elif prop.name in ('RDATE', 'EXDATE'):
+                    for value in prop.value.split(','):
+                        moment = self._matching(self._datetime(value, prop.params), dtstart)
+                        (occurrences.rdate if prop.name == 'RDATE' else occurrences.exdate)(moment)
+            candidates = occurrences.between(window_start - length, window_end, inc=True)
+        for start in candidates:
+            if start < window_end and start + length > window_start:
+                yield start
+
+    def _matching(self, value: datetime, dtstart: datetime) -> datetime:
+        """A datetime comparable with DTSTART (aware or naive like it)."""
+        if dtstart.tzinfo is None and value.tzinfo is not None:
+            return self._wall_clock(value)
+        if dtstart.tzinfo is not None and value.tzinfo is None:
+            return value.replace(tzinfo=dtstart.tzinfo)
+        return value
+
+    def _rrule(self, value: str, dtstart: datetime):
+        # UNTIL must be UTC for zoned events and floating for floating ones
+        def until(match: re.Match) -> str:
+            moment = self._datetime(match.group(1), {})
+            if len(match.group(1)) == 8:
+                moment += timedelta(days=1, seconds=-1)  # A date includes that whole day
+            if dtstart.tzinfo is not None:
+                moment = moment.replace(tzinfo=dtstart.tzinfo) if moment.tzinfo is None else moment
+                return f"UNTIL={moment.astimezone(tz.UTC):%Y%m%dT%H%M%SZ}"
+            return f"UNTIL={self._wall_clock(moment):%Y%m%dT%H%M%S}"
+        return rrulestr(re.sub(r'UNTIL=([0-9TZ]+)', until, value, flags=re.IGNORECASE), dtstart=dtstart)
+
+    def _meetings(self, properties: List[Property], overrides: Set[Tuple[str, datetime]],
+                  start_date: datetime, end_date: datetime) -> Iterator[Meeting]:
+        values = {prop.name: prop for prop in properties}
+        if 'DTSTART' not in values or values.get('STATUS', Property('', '')).value.upper() == 'CANCELLED':
+            return
+        dtstart = self._datetime(values['DTSTART'].value, values['DTSTART'].params)
+        if 'DTEND' in values:
+            length = self._matching(self._datetime(values['DTEND'].value, values['DTEND'].params), dtstart) - dtstart
+        elif 'DURATION' in values:
+            length = parse_duration(values['DURATION'].value)
+        else:
+            all_day = values['DTSTART'].params.get('VALUE') == 'DATE' or len(values['DTSTART'].value) == 8
+            length = timedelta(days=1) if all_day else timedelta(0)
+
+        uid = values['UID'].value if 'UID' in values else None
+        organizer = values.get('ORGANIZER')
+        attendees = sum(prop.name == 'ATTENDEE' for prop in properties)
+        categories = [unescape(c).strip() for prop in properties if prop.name == 'CATEGORIES'
+                      for c in re.split(r'(?<!\\),', prop.value) if c.strip()]
+        recurring = any(name in values for name in ('RRULE', 'RDATE', 'RECURRENCE-ID'))
+        is_override = 'RECURRENCE-ID' in values
+
+        for start in self._occurrences(values, properties, dtstart, length, start_date, end_date):
+            start_time = self._wall_clock(start)
+            if not is_override and uid is not None and (uid, start_time) in overrides:
+                continue
+            end_time = self._wall_clock(start + length)
+            yield Meeting(
+                subject=unescape(values['SUMMARY'].value) if 'SUMMARY' in values else '',
+                start_time=start_time,
+                end_time=end_time,
+                duration=int((end_time - start_time).total_seconds()) // 60,
+                organizer=(organizer.params.get('CN') or re.sub(r'^mailto:', '', organizer.value, flags=re.I)
+                           if organizer else ''),
+                is_recurring=recurring,
+                series_id=uid or 'N/A',
+                location=unescape(values['LOCATION'].value) if 'LOCATION' in values else None,
+                categories=categories,
+                attendee_count=max(attendees, 1),
+                global_id=uid,
+            )
+
+    def iter_meetings(self, start_date: datetime, end_date: datetime,
+                      fields: Iterable[str] = SUMMARY_FIELDS, ordered: bool = True) -> Iterator[Meeting]:
+        """
+        Meetings overlapping [start_date, end_date).
+
+        Args:
+            start_date: Start of the range (inclusive, wall-clock time in the configured zone)
+            end_date: End of the range (exclusive)
+            fields: Accepted for compatibility with `OutlookService`; every field is always read
+            ordered: Sort by start time, like Outlook. This keeps the meetings of the
+                window (not the file) in memory; without it they stream in file order
+        """
+        overrides = self._overrides()
+        self.skipped = 0
+        meetings = self._iter_events(overrides, start_date, end_date)
+        if ordered:
+            meetings = iter(sorted(meetings, key=lambda meeting: meeting.start_time))
+        yield from meetings
+        if self.skipped:
+            logger.warn(f"{self.skipped} events in {self.path.name} could not be read and are missing from the results")
+
+    def _iter_events(self, overrides: Set[Tuple[str, datetime]],
+                     start_date: datetime, end_date: datetime) -> Iterator[Meeting]:
+        for properties in self._events():
+            try:
+                yield from self._meetings(properties, overrides, start_date, end_date)
+            except (ValueError, TypeError, KeyError) as e:
+                logger.error(f"Error processing event: {str(e)}")
+                self.skipped += 1
+
+    def get_meetings(self, start_date: datetime, end_date: datetime,
+                     fields: Iterable[str] = SUMMARY_FIELDS) -> List[Meeting]:
+        """Meetings overlapping [start_date, end_date), sorted by start time."""
+        return list(self.iter_meetings(start_date, end_date, fields))
+
+def _window(start: datetime, end: datetime) -> Tuple[datetime, datetime]:
+    return start, end + timedelta(days=1)
+
+@click.group()
+def main():
+    """Summaries and reports from .ics calendar exports, without Outlook."""
+
+@main.command()
+@click.argument('path', type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option('--start', type=click.DateTime(['%Y-%m-%d']), required=True, help="First day to include")
+@click.option('--end', type=click.DateTime(['%Y-%m-%d']), required=True, help="Last day to include")
+def summary(path: Path, start: datetime, end: datetime):
+    """Print meeting hours per weekday and category."""
+    meetings = IcsCalendarSource(path).get_meetings(*_window(start, end))
+    if not meetings:
+        logger.warn("No meetings in this range")
+        return
+    summary_service = SummaryService()
+    totals = summary_service.summarize(summary_service.build_frame(meetings))
+    logger.start_section(f"Meetings {start:%Y-%m-%d} to {end:%Y-%m-%d}")
+    for weekday, categories in totals['daily'].items():
+        logger.list(weekday, [f"{category}: {minutes / 60:.1f} hours" for category, minutes in categories.items()])
+    logger.list("Total", [f"{category}: {minutes / 60:.1f} hours" for category, minutes in totals['week'].items()])
+    logger.info(f"Total: {totals['total'] / 60:.1f} hours over {totals['count']} meetings")
+    logger.end_section(f"Meetings {start:%Y-%m-%d} to {end:%Y-%m-%d}")
+
+@main.command()
+@click.argument('path', type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option('--start', type=click.DateTime(['%Y-%m-%d']), required=True, help="First day to include")
+@click.option('--end', type=click.DateTime(['%Y-%m-%d']), required=True, help="Last day to include")
+@click.option('--format', 'output_format', type=click.Choice(list(WRITERS)), default='csv', show_default=True)
+@click.option('--output', type=click.Path(dir_okay=False, path_type=Path), default=None,
+              help="File to write (standard output by default)")
+def report(path: Path, start: datetime, end: datetime, output_format: str, output: Optional[Path]):
+    """Write every meeting with its category as CSV or HTML."""
+    meetings = IcsCalendarSource(path).iter_meetings(*_window(start, end))
+    title = f"Meetings {start:%m/%d/%Y} - {end:%m/%d/%Y}"
+    stream = open(output, 'w', newline='', encoding='utf-8') if output else sys.stdout
+    try:
+        totals = render_report(report_rows(categorized(meetings)), WRITERS[output_format](stream, title))
+    finally:
+        if output:
+            stream.close()
+    if output:
+        logger.success(f"Wrote {totals.count} meetings ({totals.total / 60:.1f} hours) to {output}")
+
+@main.command()
+@click.argument('paths', nargs=-1, required=True, type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option('--start', type=click.DateTime(['%Y-%m-%d']), required=True, help="First day to include")
+@click.option('--end', type=click.DateTime(['%Y-%m-%d']), required=True, help="Last day to include")
+@click.option('--output', type=click.Path(dir_okay=False, path_type=Path), default=None,
+              help="CSV file to write the slot minutes to")
+def heatmap(paths: Tuple[Path, ...], start: datetime, end: datetime, output: Optional[Path]):
+    """Print when meetings happen (weekday x half hour) across one or more calendars."""
+    meeting_heatmap = MeetingHeatmap()
+    categorization = configured_categorizer()
+    window_start, window_end = _window(start, end)
+    for path in paths:
+        meetings = [m for m in IcsCalendarSource(path).iter_meetings(window_start, window_end)
+                    if m.start_time.replace(tzinfo=None) >= window_start]
+        meeting_heatmap.add(meetings, categorization.categorize_batch(meetings))
+    if not meeting_heatmap.meetings:
+        logger.warn("No meetings in this range")
+        return
+    title = f"Meeting heatmap {start:%Y-%m-%d} to {end:%Y-%m-%d}"
+    logger.start_section(title)
+    for line in meeting_heatmap.render():
+        logger.info(line)
+    logger.list("Busiest half hours", [
+        f"{weekday} {slot}: {minutes / 60:.1f} hours" for weekday, slot, minutes in meeting_heatmap.busiest()
+    ])
+    logger.info(f"{meeting_heatmap.meetings} meetings in {meeting_heatmap.calendars} calendars")
+    logger.end_section(title)
+    if output:
+        with open(output, 'w', newline='', encoding='utf-8') as stream:
+            rows = meeting_heatmap.write_csv(stream)
+        logger.success(f"Wrote {rows} rows to {output}")
@@ -0,0 +1,78 @@
+import pytest
+from pathlib import Path
+
+# An Outlook-style export: a Windows zone name defined by VTIMEZONE, a weekly series with an
+# excluded and a moved occurrence, a UTC meeting, an all-day event and a cancelled meeting
+CALENDAR = """BEGIN:VCALENDAR
+PRODID:-//Microsoft Corporation//Outlook 16.0 MIMEDIR//EN
+VERSION:2.0
+BEGIN:VTIMEZONE
+TZID:Central Standard Time
+BEGIN:STANDARD
+DTSTART:16011104T020000
+RRULE:FREQ=YEARLY;BYDAY=1SU;BYMONTH=11
+TZOFFSETFROM:-0500
+TZOFFSETTO:-0600
+END:STANDARD
+BEGIN:DAYLIGHT
+DTSTART:16010311T020000
+RRULE:FREQ=YEARLY;BYDAY=2SU;BYMONTH=3
+TZOFFSETFROM:-0600
+TZOFFSETTO:-0500
+END:DAYLIGHT
+END:VTIMEZONE
+BEGIN:VEVENT
+UID:standup-series
+SUMMARY:Team standup
+ORGANIZER;CN="Doe, Jane":mailto:jane.doe@example.com
+ATTENDEE;CN=Bob:mailto:bob@example.com
+ATTENDEE;CN=Ann:mailto:ann@example.com
+DTSTART;TZID=Central Standard Time:20250303T090000
+DTEND;TZID=Central Standard Time:20250303T091500
+RRULE:FREQ=WEEKLY;BYDAY=MO,WE;UNTIL=20250331
+EXDATE;TZID=Central Standard Time:20250305T090000
+LOCATION:Room 1
+CATEGORIES:Team/Staff
+BEGIN:VALARM
+TRIGGER:-PT15M
+ACTION:DISPLAY
+DESCRIPTION:Reminder
+END:VALARM
+END:VEVENT
+BEGIN:VEVENT
+UID:standup-series
+RECURRENCE-ID;TZID=Central Standard Time:20250310T090000
+SUMMARY:Team standup (moved)
+ORGANIZER;CN="Doe, Jane":mailto:jane.doe@example.com
+DTSTART;TZID=Central Standard Time:20250310T130000
+DTEND;TZID=Central Standard Time:20250310T133000
+END:VEVENT
+BEGIN:VEVENT
+UID:all-hands
+SUMMARY:All Hands: Q1 results\\, plans and
+  wins
+ORGANIZER:mailto:ceo@example.com
+DTSTART:20250306T210000Z
+DURATION:PT1H
+END:VEVENT
+BEGIN:VEVENT
+UID:offsite
+SUMMARY:Offsite
+DTSTART;VALUE=DATE:20250307
+END:VEVENT
+BEGIN:VEVENT
+UID:cancelled
+SUMMARY:Cancelled sync
+STATUS:CANCELLED
+DTSTART:20250304T150000Z
+DTEND:20250304T160000Z
+END:VEVENT
+END:VCALENDAR
+"""
+
+@pytest.fixture
+def calendar_file(tmp_path) -> Path:
+    """Fixture for an .ics export with CRLF line endings"""
+    path = tmp_path / "calendar.ics"
+    path.write_bytes(CALENDAR.replace("\n", "\r\n").encode())
+    return path
@@ -0,0 +1,112 @@
+import io
+from datetime import datetime
+
+from click.testing import CliRunner
+
+from services.categorization_service.services import MeetingCategory
+from services.ics_service.service import IcsCalendarSource, main, parse_duration, parse_line, unfold
+from services.report_service.service import CsvReportWriter, categorized, render_report, report_rows
+from services.summary_service.service import SummaryService
+from shared.timezones import TimeZoneNormalizer
+
+def source(path, zone="America/Chicago"):
+    return IcsCalendarSource(path, TimeZoneNormalizer(zone))
+
+def test_meetings_in_window(calendar_file):
+    """Test recurrence expansion, exclusions, overrides and time zones for one week"""
+    meetings = source(calendar_file).get_meetings(datetime(2025, 3, 3), datetime(2025, 3, 10))
+    assert [(m.subject, m.start_time) for m in meetings] == [
+        ("Team standup", datetime(2025, 3, 3, 9, 0)),
+        ("All Hands: Q1 results, plans and wins", datetime(2025, 3, 6, 15, 0)),
+        ("Offsite", datetime(2025, 3, 7, 0, 0)),
+    ]
+    standup = meetings[0]
+    assert standup.end_time == datetime(2025, 3, 3, 9, 15)
+    assert standup.duration == 15
+    assert standup.organizer == "Doe, Jane"
+    assert standup.is_recurring and standup.series_id == "standup-series"
+    assert standup.global_id == "standup-series"
+    assert standup.location == "Room 1"
+    assert standup.categories == ["Team/Staff"]
+    assert standup.attendee_count == 2
+
+    all_hands = meetings[1]
+    assert all_hands.duration == 60 and not all_hands.is_recurring
+    assert all_hands.organizer == "ceo@example.com"
+    assert meetings[2].duration == 24 * 60
+
+def test_override_replaces_occurrence(calendar_file):
+    meetings = source(calendar_file).get_meetings(datetime(2025, 3, 10), datetime(2025, 3, 13))
+    assert [(m.subject, m.start_time) for m in meetings] == [
+        ("Team standup (moved)", datetime(2025, 3, 10, 13, 0)),
+        ("Team standup", datetime(2025, 3, 12, 9, 0)),
+    ]
+
+def test_series_keeps_wall_clock_time_across_dst(calendar_file):
+    """Test the series stays at 9:00 in Chicago after DST starts and ends with UNTIL's day"""
+    meetings = source(calendar_file).get_meetings(datetime(2025, 3, 1), datetime(2025, 5, 1))
+    standups = [m.start_time for m in meetings if m.series_id == "standup-series"]
+    assert standups[-1] == datetime(2025, 3, 31, 9, 0)
+    assert all(start.hour in (9, 13) for start in standups)
+    assert len(standups) == 8  # 9 Mondays and Wednesdays, one excluded
+
+def test_times_in_another_zone(calendar_file):
+    meetings = source(calendar_file, "Europe/London").get_meetings(datetime(2025, 3, 3), datetime(2025, 3, 4))
+    assert [m.start_time for m in meetings] == [datetime(2025, 3, 3, 15, 0)]
+
+def test_window_includes_overlapping_meetings(calendar_file):
+    meetings = source(calendar_file).get_meetings(datetime(2025, 3, 3, 9, 10), datetime(2025, 3, 3, 9, 11))
+    assert [m.subject for m in meetings] == ["Team standup"]
+    assert source(calendar_file).get_meetings(datetime(2025, 3, 3, 9, 15), datetime(2025, 3, 3, 10)) == []
+
+def test_unordered_streams_in_file_order(calendar_file):
+    meetings = source(calendar_file).iter_meetings(datetime(2025, 3, 3), datetime(2025, 3, 10), ordered=False)
+    assert [m.subject for m in meetings][:2] == ["Team standup", "All Hands: Q1 results, plans and wins"]
+
+def test_plugs_into_summary_and_reports(calendar_file):
+    meetings = source(calendar_file).get_meetings(datetime(2025, 3, 3), datetime(2025, 3, 10))
+    summary_service = SummaryService()
+    totals = summary_service.summarize(summary_service.build_frame(meetings))
+    assert totals["count"] == 3
+    assert totals["week"][MeetingCategory.STAFF_TEAM.value] == 30
+
+    stream = io.StringIO()
+    report = render_report(report_rows(categorized(meetings)), CsvReportWriter(stream))
+    assert report.count == 3
+    assert "Company-Wide" in stream.getvalue()
+
+def test_unreadable_event_is_skipped(tmp_path):
+    path = tmp_path / "broken.ics"
+    path.write_text("BEGIN:VCALENDAR\nBEGIN:VEVENT\nSUMMARY:Bad\nDTSTART:not a date\nEND:VEVENT\n"
+                    "BEGIN:VEVENT\nSUMMARY:Good\nDTSTART:20250303T090000\nDTEND:20250303T100000\nEND:VEVENT\n"
+                    "END:VCALENDAR\n")
+    calendar = source(path)
+    assert [m.subject for m in calendar.get_meetings(datetime(2025, 3, 3), datetime(2025, 3, 4))] == ["Good"]
+    assert calendar.skipped == 1
+
+def test_content_lines():
+    assert list(unfold(["SUMMARY:a\r\n", " b\r\n", "\tc\r\n", "UID:1\r\n"])) == ["SUMMARY:abc", "UID:1"]
+    prop = parse_line('ATTENDEE;CN="Doe, Jane";ROLE=REQ-PARTICIPANT:mailto:jane@example.com')
+    assert (prop.name, prop.params, prop.value) == (
+        "ATTENDEE", {"CN": "Doe, Jane", "ROLE": "REQ-PARTICIPANT"}, "mailto:jane@example.com")
+    assert parse_duration("P1DT2H30M").total_seconds() == (24 + 2.5) * 3600
+    assert parse_duration("-PT15M").total_seconds() == -900
+
+def test_report_command(calendar_file):
+    result = CliRunner().invoke(main, ['report', str(calendar_file), '--start', '2025-03-03', '--end', '2025-03-09'])
+    assert result.exit_code == 0, result.output
+    lines = result.output.splitlines()
+    assert lines[0].startswith("date,start,end,category")
+    assert len(lines) == 4
+
+def test_heatmap_command_across_calendars(calendar_file, tmp_path):
+    output = tmp_path / "heatmap.csv"
+    result = CliRunner().invoke(main, ['heatmap', str(calendar_file), str(calendar_file),
+                                       '--start', '2025-03-03', '--end', '2025-03-09', '--output', str(output)])
+    assert result.exit_code == 0, result.output
+    assert "6 meetings in 2 calendars" in result.output
+    rows = output.read_text().splitlines()
+    assert rows[0].startswith("category,weekday,00:00,00:30")
+    totals = [row.split(",")[2:] for row in rows if row.startswith("Total,")]
+    assert len(totals) == 7
+    assert sum(float(value) for row in totals for value in row) == 2 * (15 + 60 + 1440)  # Standup, all hands, offsite
@@ -0,0 +1,109 @@
+# services/outlook_service/async_service.py
+import asyncio
+from concurrent.futures import Future
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional
+
+from services.outlook_service.executor import ComExecutor
+from services.outlook_service.projection import SUMMARY_FIELDS
+from services.outlook_service.service import CalendarEvent, OutlookService
+from shared.timezones import get_normalizer
+
+def _events(service: OutlookService, start_date: datetime, end_date: datetime,
+            fields: Iterable[str]) -> List[CalendarEvent]:
+    # Results leave the worker's apartment, so they must not keep COM items alive
+    return [event.detach() for event in service.get_calendar_events(start_date, end_date, fields)]
+
+class _InflightRequest:
+    """A queued or running COM request shared by every caller asking for the same thing."""
+
+    def __init__(self, job: Future):
+        self.job = job
+        self.future = asyncio.wrap_future(job)
+        self.waiters = 0
+
+class AsyncOutlookService:
+    """
+    Asyncio facade over OutlookService.
+
+    All COM work runs on a ComExecutor, so the event loop is never blocked and
+    COM objects never cross apartments. Concurrent requests for the same
+    range are coalesced into a single COM call. A caller that times out or is
+    cancelled only stops waiting; the underlying request is cancelled once no
+    caller is waiting for it and it has not started yet.
+    """
+
+    def __init__(self, executor: Optional[ComExecutor] = None, workers: int = 1,
+                 timeout: Optional[float] = None):
+        self.executor = executor or ComExecutor(workers=workers)
+        self.timeout = timeout
+        self._inflight: Dict[Hashable, _InflightRequest] = {}
+
+    async def run(self, key: Optional[Hashable], fn: Callable[..., Any], *args,
+                  timeout: Optional[float] = None) -> Any:
+        """
+        Run `fn(service, *args)` on a COM worker.
+
+        Args:
+            key: Requests with the same key are coalesced while in flight; None disables coalescing
+            fn: Callable receiving the worker's OutlookService
+            timeout: Seconds to wait for the result (defaults to the service timeout)
+
+        Raises:
+            asyncio.TimeoutError: If the result is not available in time
+        """
+        request = self._inflight.get(key) if key is not None else None
+        if request is None:
+            request = _InflightRequest(self.executor.submit(fn, *args))
+            if key is not None:
+                self._inflight[key] = request
+                request.future.add_done_callback(lambda _: self._forget(key, request))
+
+        request.waiters += 1
+        try:
+            return await asyncio.wait_for(asyncio.shield(request.future),
+                                          timeout if timeout is not None else self.timeout)
+        finally:
+            request.waiters -= 1
+            if request.waiters == 0 and not request.future.done():
+                # Cancels the queued job right away; a job already running is left to finish
+                request.job.cancel()
+                request.future.cancel()
+                self._forget(key, request)
+
+    def _forget(self, key: Optional[Hashable], request: _InflightRequest) -> None:
+        if key is not None and self._inflight.get(key) is request:
+            del self._inflight[key]
+
+    async def get_calendar_events(self, start_date: datetime, end_date: datetime,
+                                  fields: Iterable[str] = SUMMARY_FIELDS,
+                                  timeout: Optional[float] = None) -> List[CalendarEvent]:
+        """
+        Asynchronously retrieve calendar events for the specified date range.
+        Events are detached from Outlook, so `fields` must list every field the caller needs.
+        """
+        fields = tuple(fields)
+        return await self.run(("events", start_date, end_date, fields), _events,
+                              start_date, end_date, fields, timeout=timeout)
+
+    async def get_previous_week_events(self, fields: Iterable[str] = SUMMARY_FIELDS,
+                                       timeout: Optional[float] = None) -> List[CalendarEvent]:
+        """Asynchronously get all calendar events from the previous week."""
+        start_date, _ = get_normalizer().week_bounds(-1)
+        return await self.get_calendar_events(start_date, start_date + timedelta(days=7), fields, timeout)
+
+    async def get_current_week_events(self, fields: Iterable[str] = SUMMARY_FIELDS,
+                                      timeout: Optional[float] = None) -> List[CalendarEvent]:
+        """Asynchronously get all calendar events for the current week."""
+        start_date, _ = get_normalizer().week_bounds(0)
+        return await self.get_calendar_events(start_date, start_date + timedelta(days=7), fields, timeout)
+
+    def close(self) -> None:
+        """Stop the COM workers, cancelling requests that have not started."""
+        self.executor.shutdown(cancel_pending=True)
+
+    async def __aenter__(self) -> 'AsyncOutlookService':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
@@ -0,0 +1,298 @@
+# services/outlook_service/com.py
+"""
+Guarded access to Outlook COM objects.
+
+`ComProxy` wraps a COM object and every object reached through it
+(namespace, folders, item collections, items). Each property read and
+method call is counted and timed under `com.calls.<Type>.<Member>` /
+`com.latency.<Type>.<Member>` in the shared metrics, transient failures
+(Outlook busy, call rejected) are retried with jittered exponential backoff
+within a per-call deadline, and repeated failures trip a circuit breaker
+shared by the whole connection.
+
+`dispatch_outlook` records the session to the trace named by
+`OUTLOOK_AUTOMATION_RECORD`, or connects to a recorded trace named by
+`OUTLOOK_AUTOMATION_REPLAY` instead of Outlook (see `replay.py`).
+"""
+import inspect
+import os
+import random
+import threading
+import time
+from collections import deque
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Deque, Optional
+
+from shared.metrics import metrics
+
+try:
+    import win32com.client
+except ImportError:  # pywin32 is only available on Windows
+    win32com = None
+
+def _signed(hresult: int) -> int:
+    """HRESULTs are reported by pywin32 as signed 32-bit integers."""
+    return hresult - (1 << 32) if hresult & 0x80000000 else hresult
+
+RPC_E_CALL_REJECTED = _signed(0x80010001)
+RPC_E_SERVERCALL_RETRYLATER = _signed(0x8001010A)
+RPC_S_SERVER_UNAVAILABLE = _signed(0x800706BA)
+RPC_S_SERVER_TOO_BUSY = _signed(0x800706BB)
+
+TRANSIENT_HRESULTS = frozenset({
+    RPC_E_CALL_REJECTED,
+    RPC_E_SERVERCALL_RETRYLATER,
+    RPC_S_SERVER_UNAVAILABLE,
+    RPC_S_SERVER_TOO_BUSY,
+})
+
+RECORD_ENV = "OUTLOOK_AUTOMATION_RECORD"
+REPLAY_ENV = "OUTLOOK_AUTOMATION_REPLAY"
+
+# Values returned as-is instead of being wrapped in a proxy
+PLAIN_TYPES = (str, bytes, int, float, bool, datetime, date, timedelta, type(None))
+
+# Name given to the object returned by a member, for metric labels
+RESULT_TYPES = {
+    'GetNamespace': 'Namespace',
+    'GetDefaultFolder': 'Folder',
+    'Items': 'Items',
+    'Restrict': 'Items',
+    'Item': 'Item',
+    'GetFirst': 'Item',
+    'GetNext': 'Item',
+}
+
+class CircuitOpenError(ConnectionError):
+    """Raised instead of calling Outlook while the circuit breaker is open."""
+
+class ComDeadlineError(TimeoutError):
+    """Raised when a COM call could not succeed within its deadline."""
+
+def hresult_of(error: BaseException) -> Optional[int]:
+    """The HRESULT carried by a pywintypes.com_error (or the scode of the inner exception)."""
+    hresult = getattr(error, 'hresult', None)
+    if hresult is None and error.args and isinstance(error.args[0], int):
+        hresult = error.args[0]
+    excepinfo = getattr(error, 'excepinfo', None) or (error.args[2] if len(error.args) > 2 else None)
+    if isinstance(excepinfo, tuple) and len(excepinfo) > 5 and excepinfo[5] in TRANSIENT_HRESULTS:
+        return excepinfo[5]
+    return hresult
+
+def is_transient(error: BaseException) -> bool:
+    """Whether a COM error is worth retrying (Outlook busy or temporarily unreachable)."""
+    return hresult_of(error) in TRANSIENT_HRESULTS
+
+class CircuitBreaker:
+    """
+    Stops calling Outlook after `failure_threshold` failures within `window`
+    seconds. After `reset_timeout` seconds a trial call is let through
+    (half-open); a success closes the circuit, a failure re-opens it.
+    """
+
+    def __init__(self, failure_threshold: int = 5, window: float = 60.0, reset_timeout: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.window = window
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.failures: Deque[float] = deque()
+        self.opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return 'closed'
+        if self.clock() - self.opened_at >= self.reset_timeout:
+            return 'half_open'
+        return 'open'
+
+    def check(self) -> None:
+        """Raise CircuitOpenError if calls are currently not allowed."""
+        if self.state == 'open':
+            metrics.increment("com.circuit.rejected")
+            raise CircuitOpenError(
+                f"Outlook circuit breaker is open after {len(self.failures)} failures; "
+                f"retrying in {self.reset_timeout - (self.clock() - self.opened_at):.0f}s"
+            )
+
+    def record_success(self) -> None:
+        if self.opened_at is None:
+            return
+        with self._lock:
+            self.failures.clear()
+            self.opened_at = None
+        metrics.set_gauge("com.circuit.open", 0)
+
+    def record_failure(self) -> None:
+        now = self.clock()
+        with self._lock:
+            self.failures.append(now)
+            while self.failures and now - self.failures[0] > self.window:
+                self.failures.popleft()
+            if self.opened_at is None and len(self.failures) < self.failure_threshold:
+                return
+            if self.opened_at is None:
+                metrics.increment("com.circuit.tripped")
+            self.opened_at = now
+        metrics.set_gauge("com.circuit.open", 1)
+
+class ComGuard:
+    """Retry, deadline and circuit-breaker policy shared by all proxies of one Outlook connection."""
+
+    def __init__(self, attempts: int = 5, base_delay: float = 0.1, max_delay: float = 2.0,
+                 deadline: float = 30.0, breaker: Optional[CircuitBreaker] = None,
+                 sleep: Callable[[float], None] = time.sleep, clock: Callable[[], float] = time.monotonic):
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.breaker = breaker or CircuitBreaker(clock=clock)
+        self.sleep = sleep
+        self.clock = clock
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff before retry number `attempt` (1-based)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+    def call(self, label: str, fn: Callable[..., Any], *args, retry: bool = True,
+             relabel: Optional[Callable[[Any], str]] = None) -> Any:
+        """
+        Call `fn(*args)` under the guard.
+
+        COM calls cannot be pre-empted from Python, so the deadline bounds the
+        time spent retrying; a call that returns after its deadline is counted
+        as a failure for the circuit breaker. `relabel` names a successful call
+        from its result, e.g. to count method lookups apart from the calls.
+
+        Raises:
+            CircuitOpenError: If the circuit breaker is open
+            ComDeadlineError: If transient failures persist past the deadline
+        """
+        self.breaker.check()
+        started = self.clock()
+        attempt = 0
+        while True:
+            attempt += 1
+            call_started = time.perf_counter()
+            try:
+                result = fn(*args)
+            except AttributeError:
+                # Missing optional properties are part of normal use (getattr defaults)
+                metrics.increment(f"com.calls.{label}")
+                raise
+            except Exception as e:
+                metrics.increment(f"com.calls.{label}")
+                metrics.observe(f"com.latency.{label}", time.perf_counter() - call_started)
+                metrics.increment(f"com.errors.{label}")
+                if not (retry and is_transient(e)):
+                    raise
+                delay = self.backoff(attempt)
+                if attempt >= self.attempts or self.clock() - started + delay > self.deadline:
+                    self.breaker.record_failure()
+                    raise ComDeadlineError(f"{label} failed after {attempt} attempts: {str(e)}") from e
+                metrics.increment(f"com.retries.{label}")
+                self.sleep(delay)
+                continue
+            if relabel is not None:
+                label = relabel(result)
+            metrics.increment(f"com.calls.{label}")
+            metrics.observe(f"com.latency.{label}", time.perf_counter() - call_started)
+            if self.clock() - started > self.deadline:
+                metrics.increment(f"com.deadline_exceeded.{label}")
+                self.breaker.record_failure()
+            else:
+                self.breaker.record_success()
+            return result
+
+_END = object()  # Returned by next() at the end of an enumeration
+
+def _is_method(value: Any) -> bool:
+    return inspect.ismethod(value) or inspect.isfunction(value) or inspect.isbuiltin(value)
+
+class ComProxy:
+    """Wraps a COM object so every member access goes through a ComGuard."""
+
+    def __init__(self, target: Any, name: str, guard: ComGuard):
+        object.__setattr__(self, '_com_target', target)
+        object.__setattr__(self, '_com_name', name)
+        object.__setattr__(self, '_com_guard', guard)
+
+    def _wrap(self, value: Any, name: str) -> Any:
+        if isinstance(value, PLAIN_TYPES) or isinstance(value, ComProxy):
+            return value
+        return ComProxy(value, name, self._com_guard)
+
+    def __getattr__(self, member: str) -> Any:
+        label = f"{self._com_name}.{member}"
+        # Looking up a method is counted under <Type>.<Method>.get, so the call itself is counted once
+        value = self._com_guard.call(label, getattr, self._com_target, member,
+                                     relabel=lambda value: f"{label}.get" if _is_method(value) else label)
+        result_type = RESULT_TYPES.get(member, member)
+        if _is_method(value):
+            def method(*args):
+                return self._wrap(self._com_guard.call(label, value, *args), result_type)
+            return method
+        return self._wrap(value, result_type)
+
+    def __setattr__(self, member: str, value: Any) -> None:
+        self._com_guard.call(f"{self._com_name}.{member}", setattr, self._com_target, member, value)
+
+    def __call__(self, *args) -> Any:
+        # Mocks and CDispatch default members are invoked by calling the object itself
+        return self._wrap(self._com_guard.call(f"{self._com_name}()", self._com_target, *args), self._com_name)
+
+    def __iter__(self):
+        iterator = iter(self._com_target)
+        while True:
+            # Enumerators can't be rewound, so advancing is counted but never retried. The end is
+            # signalled with a sentinel rather than StopIteration, which the guard would count as an error
+            item = self._com_guard.call(f"{self._com_name}.next", next, iterator, _END, retry=False)
+            if item is _END:
+                return
+            yield self._wrap(item, 'Item')
+
+    def __len__(self) -> int:
+        return len(self._com_target)
+
+    def __bool__(self) -> bool:
+        return bool(self._com_target)
+
+    def __eq__(self, other: Any) -> bool:
+        return unwrap(self) == unwrap(other)
+
+    def __hash__(self) -> int:
+        return hash(self._com_target)
+
+    def __repr__(self) -> str:
+        return f"ComProxy({self._com_name}, {self._com_target!r})"
+
+def unwrap(value: Any) -> Any:
+    """The raw COM object behind a proxy."""
+    return value._com_target if isinstance(value, ComProxy) else value
+
+def guard_application(application: Any, guard: Optional[ComGuard] = None) -> ComProxy:
+    """Wrap an Outlook.Application object (real or emulated) in a ComProxy."""
+    return ComProxy(unwrap(application), 'Application', guard or ComGuard())
+
+def dispatch_outlook(guard: Optional[ComGuard] = None) -> ComProxy:
+    """
+    Dispatch Outlook.Application and wrap it in a ComProxy.
+
+    With OUTLOOK_AUTOMATION_REPLAY set, the next connection of that recorded
+    trace is returned instead (no Outlook or pywin32 needed); with
+    OUTLOOK_AUTOMATION_RECORD set, the session is recorded to that trace.
+    """
+    replay_path = os.environ.get(REPLAY_ENV)
+    if replay_path:
+        from services.outlook_service.replay import replay_application
+        return guard_application(replay_application(replay_path), guard)
+    if win32com is None:
+        raise ImportError("pywin32 is not installed")
+    application = win32com.client.Dispatch('Outlook.Application')
+    record_path = os.environ.get(RECORD_ENV)
+    if record_path:
+        from services.outlook_service.replay import record_application
+        application = record_application(application, record_path)
+    return guard_application(application, guard)
@@ -0,0 +1,282 @@
+# services/outlook_service/emulator.py
+"""
+In-process emulation of the subset of the Outlook object model used by this
+project (Application -> Namespace -> calendar Folder -> Items -> AppointmentItem).
+
+Used by tests and benchmarks on machines without Outlook. Latency can be
+injected per collection call and per property read to model a busy COM
+server, and calls can be made to fail with COM errors such as
+RPC_E_CALL_REJECTED. Items handed out by collections are counted while they
+are alive, like COM proxies (`live_proxies`, `peak_live_proxies`).
+"""
+import re
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from services.outlook_service.com import RPC_E_CALL_REJECTED
+from services.outlook_service.projection import OL_OPTIONAL, OL_REQUIRED, OL_RESPONSE_ORGANIZED
+
+RESTRICTION_TERM = re.compile(r"\[(\w+)\]\s*(>=|<=|<>|>|<|=)\s*'([^']*)'")
+RESTRICTION_DATE_FORMATS = ('%m/%d/%Y %I:%M %p', '%m/%d/%Y %H:%M', '%m/%d/%Y')
+
+OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    '>=': lambda a, b: a >= b,
+    '<=': lambda a, b: a <= b,
+    '>': lambda a, b: a > b,
+    '<': lambda a, b: a < b,
+    '=': lambda a, b: a == b,
+    '<>': lambda a, b: a != b,
+}
+
+def parse_restriction_value(value: str) -> Any:
+    """Parse a literal from a Restrict filter, trying the date formats Outlook accepts."""
+    for fmt in RESTRICTION_DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return value
+
+@dataclass
+class FakeLatency:
+    """Delays (in seconds) applied by the emulator."""
+    call: float = 0.0           # Restrict / Sort / GetDefaultFolder ...
+    property_read: float = 0.0  # every appointment property read
+
+    def on_call(self) -> None:
+        if self.call:
+            time.sleep(self.call)
+
+    def on_property_read(self) -> None:
+        if self.property_read:
+            time.sleep(self.property_read)
+
+class FakeComError(Exception):
+    """Stand-in for pywintypes.com_error: args are (hresult, message, excepinfo, argerror)."""
+
+    def __init__(self, hresult: int, message: str = "Call was rejected by callee."):
+        super().__init__(hresult, message, None, None)
+        self.hresult = hresult
+
+class FakeAppointment:
+    """Emulated AppointmentItem. Every property read is counted and delayed."""
+
+    def __init__(self, application: 'FakeOutlookApplication', **properties):
+        self._application = application
+        self._properties = properties
+
+    def __getattr__(self, name: str) -> Any:
+        properties = self.__dict__.get('_properties', {})
+        if name not in properties:
+            raise AttributeError(name)
+        self._application.record_property_read(name)
+        if name == 'Recipients':
+            return FakeRecipients(self._application, properties[name])
+        return properties[name]
+
+    def __repr__(self) -> str:
+        return f"FakeAppointment({self._properties.get('Subject')!r}, {self._properties.get('Start')})"
+
+class FakeRecipient(FakeAppointment):
+    """Emulated Recipient (Name, Type, MeetingResponseStatus); reads are counted like an item's."""
+
+    def __repr__(self) -> str:
+        return f"FakeRecipient({self._properties.get('Name')!r})"
+
+class FakeRecipients:
+    """Emulated Recipients collection; Count and every Item call are COM calls."""
+
+    def __init__(self, application: 'FakeOutlookApplication', recipients: List[Dict[str, Any]]):
+        self._application = application
+        self._recipients = recipients
+
+    @property
+    def Count(self) -> int:
+        self._application.on_call()
+        return len(self._recipients)
+
+    def Item(self, index: int) -> FakeRecipient:
+        self._application.on_call()
+        return FakeRecipient(self._application, **self._recipients[index - 1])
+
+class FakeItemProxy(FakeAppointment):
+    """
+    An appointment as handed out by an Items collection. Like a COM proxy,
+    each one counts as an open item until it is garbage collected.
+    """
+
+    def __init__(self, appointment: FakeAppointment):
+        super().__init__(appointment._application)
+        self._properties = appointment._properties
+        self._application.proxy_opened()
+
+    def __del__(self):
+        self._application.proxy_released()
+
+class FakeItems:
+    """Emulated Items collection supporting Sort, Restrict, Count and iteration."""
+
+    def __init__(self, application: 'FakeOutlookApplication', appointments: List[FakeAppointment]):
+        self._application = application
+        self._appointments = appointments
+        self._position = 0
+        self.IncludeRecurrences = False
+
+    @property
+    def Count(self) -> int:
+        return len(self._appointments)
+
+    def Item(self, index: int) -> FakeAppointment:
+        return FakeItemProxy(self._appointments[index - 1])  # COM collections are 1-based
+
+    def GetFirst(self) -> Optional[FakeAppointment]:
+        self._position = 0
+        return self.GetNext()
+
+    def GetNext(self) -> Optional[FakeAppointment]:
+        self._application.on_call()
+        if self._position >= len(self._appointments):
+            return None
+        self._position += 1
+        return FakeItemProxy(self._appointments[self._position - 1])
+
+    def Sort(self, key: str, descending: bool = False) -> None:
+        self._application.on_call()
+        field = key.strip('[]')
+        self._appointments = sorted(self._appointments, key=lambda a: a._properties[field], reverse=descending)
+
+    def Restrict(self, restriction: str) -> 'FakeItems':
+        self._application.on_call()
+        terms = [
+            (field, OPERATORS[op], parse_restriction_value(value))
+            for field, op, value in RESTRICTION_TERM.findall(restriction)
+        ]
+        matched = [
+            a for a in self._appointments
+            if all(op(a._properties[field], value) for field, op, value in terms)
+        ]
+        restricted = FakeItems(self._application, matched)
+        restricted.IncludeRecurrences = self.IncludeRecurrences
+        return restricted
+
+    def __iter__(self) -> Iterator[FakeAppointment]:
+        return (FakeItemProxy(appointment) for appointment in list(self._appointments))
+
+class FakeFolder:
+    """Emulated calendar folder; each Items access returns a fresh collection, as in COM."""
+
+    def __init__(self, application: 'FakeOutlookApplication'):
+        self._application = application
+
+    @property
+    def Items(self) -> FakeItems:
+        return FakeItems(self._application, list(self._application.appointments))
+
+class FakeNamespace:
+    def __init__(self, application: 'FakeOutlookApplication'):
+        self._application = application
+
+    def GetDefaultFolder(self, folder_type: int) -> FakeFolder:
+        if folder_type != 9:
+            raise ValueError(f"Emulator only provides the calendar folder (9), not {folder_type}")
+        self._application.on_call()
+        return FakeFolder(self._application)
+
+class FakeOutlookApplication:
+    """
+    Emulated Outlook.Application.
+
+    Pass it to `OutlookService(application=...)`. Appointments are plain
+    property dictionaries (Subject, Start, End, Duration, Organizer, ...);
+    recurring series should be supplied as their expanded occurrences.
+    """
+    Version = "16.0 (emulated)"
+
+    def __init__(self, appointments: Optional[List[Dict[str, Any]]] = None,
+                 latency: Optional[FakeLatency] = None):
+        self.latency = latency or FakeLatency()
+        self.appointments: List[FakeAppointment] = [
+            FakeAppointment(self, **properties) for properties in appointments or []
+        ]
+        self.property_reads: Dict[str, int] = {}
+        self.calls = 0
+        self.live_proxies = 0
+        self.peak_live_proxies = 0
+        self._faults: List[int] = []
+        self._lock = threading.Lock()
+
+    def fail_next(self, count: int = 1, hresult: int = RPC_E_CALL_REJECTED) -> None:
+        """Make the next `count` calls or property reads raise a COM error."""
+        with self._lock:
+            self._faults.extend([hresult] * count)
+
+    def _maybe_fail(self) -> None:
+        with self._lock:
+            hresult = self._faults.pop(0) if self._faults else None
+        if hresult is not None:
+            raise FakeComError(hresult)
+
+    def on_call(self) -> None:
+        with self._lock:
+            self.calls += 1
+        self._maybe_fail()
+        self.latency.on_call()
+
+    def record_property_read(self, name: str) -> None:
+        self._maybe_fail()
+        with self._lock:
+            self.property_reads[name] = self.property_reads.get(name, 0) + 1
+        self.latency.on_property_read()
+
+    def proxy_opened(self) -> None:
+        with self._lock:
+            self.live_proxies += 1
+            self.peak_live_proxies = max(self.peak_live_proxies, self.live_proxies)
+
+    def proxy_released(self) -> None:
+        with self._lock:
+            self.live_proxies -= 1
+
+    def reset_proxy_peak(self) -> None:
+        """Start measuring the peak number of live item proxies from now."""
+        with self._lock:
+            self.peak_live_proxies = self.live_proxies
+
+    def GetNamespace(self, name: str) -> FakeNamespace:
+        return FakeNamespace(self)
+
+def make_recipient(name: str, kind: int = OL_REQUIRED, response: int = 0) -> Dict[str, Any]:
+    """Build the property dictionary for an emulated meeting recipient (response 0: none yet)."""
+    return {'Name': name, 'Type': kind, 'MeetingResponseStatus': response}
+
+def make_appointment(subject: str, start: datetime, duration: int, organizer: str = "Doe, Jane",
+                     **properties) -> Dict[str, Any]:
+    """
+    Build the property dictionary for an emulated appointment. Unless given,
+    Recipients are derived from RequiredAttendees/OptionalAttendees, with the
+    organizer's response set to "organized".
+    """
+    appointment = {
+        'Subject': subject,
+        'Start': start,
+        'End': start + timedelta(minutes=duration),
+        'Duration': duration,
+        'Organizer': organizer,
+        'RequiredAttendees': organizer,
+        'OptionalAttendees': '',
+        'RecurrenceState': 0,
+        'ConversationID': '',
+        'Location': '',
+        'Categories': '',
+        'Body': '',
+        **properties,
+    }
+    appointment.setdefault('Recipients', [
+        make_recipient(name.strip(), kind, OL_RESPONSE_ORGANIZED if name.strip() == organizer else 0)
+        for kind, field in ((OL_REQUIRED, 'RequiredAttendees'), (OL_OPTIONAL, 'OptionalAttendees'))
+        for name in appointment[field].split(';') if name.strip()
+    ])
+    return appointment
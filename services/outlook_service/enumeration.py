@@ -0,0 +1,68 @@
+# services/outlook_service/enumeration.py
+"""
+Bounded enumeration of Outlook item collections.
+
+Every item reached through `for item in items` is a COM proxy that keeps
+the item open in Outlook for as long as Python holds it; holding a page of
+them (or a list of lazily read records) runs into Exchange's per-session
+limit on open items and grows Outlook's memory on large calendars.
+
+Here collections are walked with `GetFirst`/`GetNext`. Each item is read
+into a record detached from COM (see `LazyRecord.detach`) and its proxy is
+dropped before the next one is requested, so at most one item proxy is
+alive at a time. Records are handed out in pages of bounded size.
+"""
+import itertools
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+
+from services.outlook_service.com import CircuitOpenError
+from services.outlook_service.projection import LazyMeeting, LazyRecord, SUMMARY_FIELDS
+from shared.metrics import metrics
+
+DEFAULT_PAGE_SIZE = 500
+
+def iter_records(items: Any, fields: Iterable[str] = SUMMARY_FIELDS, record_type: Callable[..., LazyRecord] = LazyMeeting,
+                 on_error: Optional[Callable[[Exception], None]] = None) -> Iterator[LazyRecord]:
+    """
+    Read every item of a collection into a detached record, one proxy at a time.
+
+    Args:
+        items: An Items collection (sorted and restricted as needed)
+        fields: Fields to read; no other field is available on the records
+        record_type: LazyRecord subclass to read items into, or a callable with its
+            signature (e.g. `AttendeeCache.read`)
+        on_error: Called with the error when an item can't be read, after which
+            the item is skipped; without it the error is raised
+
+    Raises:
+        CircuitOpenError: If Outlook stops answering (never passed to `on_error`)
+    """
+    fields = tuple(fields)
+    item = items.GetFirst()
+    while item is not None:
+        record = None
+        try:
+            record = record_type(item, fields).detach()
+        except CircuitOpenError:
+            raise
+        except Exception as e:
+            if on_error is None:
+                raise
+            # The traceback's frames (and an AttributeError's `obj`) still reference the item
+            if isinstance(e, AttributeError):
+                e.obj = None
+            on_error(e.with_traceback(None))
+        finally:
+            item = None  # Release the proxy before the next one is fetched
+        metrics.increment("outlook.items_enumerated")
+        if record is not None:
+            yield record
+        item = items.GetNext()
+
+def iter_pages(items: Any, fields: Iterable[str] = SUMMARY_FIELDS, page_size: int = DEFAULT_PAGE_SIZE,
+               record_type: Callable[..., LazyRecord] = LazyMeeting,
+               on_error: Optional[Callable[[Exception], None]] = None) -> Iterator[List[LazyRecord]]:
+    """Detached records of a collection in pages of at most `page_size` (see `iter_records`)."""
+    records = iter_records(items, fields, record_type, on_error)
+    while page := list(itertools.islice(records, page_size)):
+        yield page
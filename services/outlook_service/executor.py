@@ -0,0 +1,108 @@
+# services/outlook_service/executor.py
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, List
+
+try:
+    import pythoncom
+except ImportError:  # pywin32 is only available on Windows
+    pythoncom = None
+
+from services.outlook_service.service import OutlookService
+
+class ComExecutor:
+    """
+    Runs COM work on dedicated single-threaded apartment (STA) worker threads.
+
+    COM proxies are bound to the apartment that created them, so each worker
+    calls `CoInitialize` exactly once, creates its own service instance on
+    first use and keeps it for its whole lifetime. Jobs are queued and picked
+    up by the next idle worker; callables receive that worker's service as
+    their first argument.
+
+    Jobs that have not started yet can be cancelled through their future. A
+    job that is already running a COM call cannot be interrupted.
+    """
+
+    def __init__(self, service_factory: Callable[[], Any] = OutlookService, workers: int = 1,
+                 name: str = "outlook-sta"):
+        if workers < 1:
+            raise ValueError("ComExecutor needs at least one worker")
+        self.service_factory = service_factory
+        self._queue: queue.Queue = queue.Queue()
+        self._shutdown = False
+        self._lock = threading.Lock()
+        self._threads: List[threading.Thread] = [
+            threading.Thread(target=self._worker, name=f"{name}-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of jobs waiting for a worker."""
+        return self._queue.qsize()
+
+    def _worker(self) -> None:
+        if pythoncom is not None:
+            pythoncom.CoInitialize()
+        service = None
+        try:
+            while True:
+                job = self._queue.get()
+                if job is None:
+                    break
+                future, fn, args, kwargs = job
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    if service is None:
+                        service = self.service_factory()
+                    future.set_result(fn(service, *args, **kwargs))
+                except BaseException as e:
+                    future.set_exception(e)
+        finally:
+            # Drop COM references before leaving the apartment
+            service = None
+            if pythoncom is not None:
+                pythoncom.CoUninitialize()
+
+    def submit(self, fn: Callable[..., Any], *args, **kwargs) -> Future:
+        """Queue `fn(service, *args, **kwargs)` for execution on a worker."""
+        future: Future = Future()
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("Cannot submit to a ComExecutor after shutdown")
+            self._queue.put((future, fn, args, kwargs))
+        return future
+
+    def shutdown(self, wait: bool = True, cancel_pending: bool = False) -> None:
+        """Stop the workers once the queued jobs have run."""
+        with self._lock:
+            if self._shutdown:
+                return
+            self._shutdown = True
+            if cancel_pending:
+                self._cancel_pending()
+            for _ in self._threads:
+                self._queue.put(None)
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def _cancel_pending(self) -> None:
+        while True:
+            try:
+                job = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if job is not None:
+                job[0].cancel()
+
+    def __enter__(self) -> 'ComExecutor':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
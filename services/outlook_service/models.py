@@ -3,6 +3,19 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Optional
 
+@dataclass(frozen=True)
+class AttendeeCounts:
+    """A meeting's invitees by role, and how many of them accepted (the organizer included)."""
+    required: int = 0
+    optional: int = 0
+    resources: int = 0  # Rooms and equipment; never counted as people
+    accepted: int = 0
+
+    @property
+    def people(self) -> int:
+        """People invited (required and optional), at least the organizer."""
+        return max(self.required + self.optional, 1)
+
 @dataclass
 class Meeting:
     """Represents a calendar meeting with all its properties."""
@@ -15,6 +28,9 @@ class Meeting:
     series_id: str
     location: Optional[str] = None
     categories: list[str] = None
+    attendee_count: Optional[int] = None
+    global_id: Optional[str] = None
+    attendees: Optional[AttendeeCounts] = None
 
     @property
     def display_dict(self) -> dict:
@@ -37,15 +53,11 @@ class Meeting:
 
     @classmethod
     def from_outlook_item(cls, item) -> 'Meeting':
-        """Create a Meeting instance from an Outlook appointment item."""
-        return cls(
-            subject=item.Subject,
-            start_time=item.Start,
-            end_time=item.End,
-            duration=item.Duration,
-            organizer=item.Organizer,
-            is_recurring=bool(getattr(item, 'RecurrenceState', 0)),
-            series_id=str(getattr(item, 'ConversationID', 'N/A')),
-            location=getattr(item, 'Location', None),
-            categories=list(item.Categories.split(',')) if getattr(item, 'Categories', None) else []
-        )
\ No newline at end of file
+        """
+        Create a Meeting instance from an Outlook appointment item, reading every
+        field except the on-demand ones (attendees; see `attendees.AttendeeCache`).
+        """
+        from services.outlook_service.projection import MEETING_READERS, ON_DEMAND_FIELDS
+        return cls(**{
+            name: read(item) for name, read in MEETING_READERS.items() if name not in ON_DEMAND_FIELDS
+        })
\ No newline at end of file
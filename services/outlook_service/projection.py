@@ -0,0 +1,178 @@
+# services/outlook_service/projection.py
+"""
+Field projection for Outlook items.
+
+Callers declare which fields they need; those are read from the COM item up
+front and every other field is read on first access and memoized. Every
+property read goes through `read_property`, which counts it under the
+`outlook.property_reads.<Property>` metrics counters.
+"""
+from typing import Any, Callable, Dict, FrozenSet, Iterable
+
+from services.outlook_service.models import AttendeeCounts, Meeting
+from shared.metrics import metrics
+
+# Fields used by the summary and categorization paths
+SUMMARY_FIELDS = ('subject', 'organizer', 'start_time', 'end_time', 'duration')
+
+# Summary fields plus those indexed for search
+SEARCH_FIELDS = SUMMARY_FIELDS + ('location',)
+
+# Search fields plus those used by organizer/series analytics
+ANALYTICS_FIELDS = SEARCH_FIELDS + ('is_recurring', 'series_id', 'attendee_count')
+
+# Fields read only when asked for: never by materialize(), pickling or
+# Meeting.from_outlook_item unless already loaded (attendees cost 1 + 2N COM calls)
+ON_DEMAND_FIELDS = frozenset({'attendees'})
+
+# Recipient.Type of meeting recipients (OlMeetingRecipientType)
+OL_REQUIRED, OL_OPTIONAL, OL_RESOURCE = 1, 2, 3
+
+# Recipient.MeetingResponseStatus values counted as attending (OlResponseStatus)
+OL_RESPONSE_ORGANIZED, OL_RESPONSE_ACCEPTED = 1, 3
+
+_MISSING = object()
+
+def read_property(item: Any, name: str, default: Any = _MISSING) -> Any:
+    """Read a property from an Outlook item, counting the read."""
+    metrics.increment(f"outlook.property_reads.{name}")
+    if default is _MISSING:
+        return getattr(item, name)
+    return getattr(item, name, default)
+
+def _categories(item: Any) -> list:
+    categories = read_property(item, 'Categories', None)
+    return list(categories.split(',')) if categories else []
+
+def _attendee_count(item: Any) -> int:
+    names = [
+        name
+        for prop in ('RequiredAttendees', 'OptionalAttendees')
+        for name in (read_property(item, prop, None) or '').split(';')
+        if name.strip()
+    ]
+    return max(len(names), 1)
+
+def _attendees(item: Any) -> AttendeeCounts:
+    """
+    Count an item's recipients by role and response. Costs one COM call per
+    recipient plus two reads each; see `attendees.AttendeeCache` to read a
+    series only once. Items without recipients count as no attendees.
+    """
+    counts = {OL_REQUIRED: 0, OL_OPTIONAL: 0, OL_RESOURCE: 0}
+    accepted = 0
+    recipients = read_property(item, 'Recipients', None)
+    if recipients is None:
+        return AttendeeCounts()
+    for index in range(1, recipients.Count + 1):  # COM collections are 1-based
+        recipient = recipients.Item(index)
+        kind = read_property(recipient, 'Type')
+        counts[kind] = counts.get(kind, 0) + 1
+        if kind != OL_RESOURCE and read_property(recipient, 'MeetingResponseStatus') in (
+                OL_RESPONSE_ORGANIZED, OL_RESPONSE_ACCEPTED):
+            accepted += 1
+    return AttendeeCounts(required=counts[OL_REQUIRED], optional=counts[OL_OPTIONAL],
+                          resources=counts[OL_RESOURCE], accepted=accepted)
+
+MEETING_READERS: Dict[str, Callable[[Any], Any]] = {
+    'subject': lambda item: read_property(item, 'Subject'),
+    'start_time': lambda item: read_property(item, 'Start'),
+    'end_time': lambda item: read_property(item, 'End'),
+    'duration': lambda item: read_property(item, 'Duration'),
+    'organizer': lambda item: read_property(item, 'Organizer'),
+    'is_recurring': lambda item: bool(read_property(item, 'RecurrenceState', 0)),
+    'series_id': lambda item: str(read_property(item, 'ConversationID', 'N/A')),
+    'location': lambda item: read_property(item, 'Location', None),
+    'categories': _categories,
+    'attendee_count': _attendee_count,
+    'global_id': lambda item: read_property(item, 'GlobalAppointmentID', None) or None,
+    'attendees': _attendees,
+}
+
+class LazyField:
+    """Descriptor loading a field from the record's Outlook item on first access."""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, record: Any, owner: type = None) -> Any:
+        if record is None:
+            return self
+        values = record.__dict__
+        if self.name not in values:
+            if values['_item'] is None and self.name in record._on_demand:
+                return getattr(record._record_type, self.name, None)  # Never read: the plain record's default
+            if values['_item'] is None:
+                raise AttributeError(f"'{self.name}' was not loaded before the record was detached from Outlook")
+            values[self.name] = record._readers[self.name](values['_item'])
+        return values[self.name]
+
+    def __set__(self, record: Any, value: Any) -> None:
+        record.__dict__[self.name] = value
+
+def _rebuild(record_type: type, values: Dict[str, Any]) -> Any:
+    return record_type(None, fields=(), **values)
+
+class LazyRecord:
+    """
+    Mixin for dataclass records backed by an Outlook item.
+
+    Subclasses set `_record_type` (the plain dataclass) and `_readers`
+    (field name -> reader); each reader field becomes a LazyField.
+    """
+    _record_type: type
+    _readers: Dict[str, Callable[[Any], Any]]
+    _on_demand: FrozenSet[str] = frozenset()  # Readers skipped by full reads unless loaded
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name in cls._readers:
+            field = LazyField()
+            field.__set_name__(cls, name)
+            setattr(cls, name, field)
+
+    def __init__(self, item: Any, fields: Iterable[str] = SUMMARY_FIELDS, **values):
+        """
+        Args:
+            item: Outlook item to read from
+            fields: Fields to read immediately
+            **values: Field values already known to the caller (not read again)
+        """
+        self.__dict__['_item'] = item
+        self.__dict__.update(values)
+        for name in fields:
+            getattr(self, name)
+
+    @property
+    def loaded_fields(self) -> set:
+        """Fields that have been read so far."""
+        return {name for name in self._readers if name in self.__dict__}
+
+    def detach(self) -> 'LazyRecord':
+        """
+        Drop the reference to the Outlook item, keeping only the fields loaded so far.
+        Required before handing the record to another thread, as COM items are
+        bound to the apartment that created them.
+        """
+        self.__dict__['_item'] = None
+        return self
+
+    def _full_read_fields(self) -> list:
+        loaded = self.loaded_fields
+        return [name for name in self._readers if name not in self._on_demand or name in loaded]
+
+    def materialize(self) -> Any:
+        """Read every remaining field (on-demand ones only if loaded) and return a plain record detached from COM."""
+        return self._record_type(**{name: getattr(self, name) for name in self._full_read_fields()})
+
+    def __reduce__(self):
+        # COM items can't be pickled: pickle the field values as a detached record,
+        # reading any remaining fields first if the item is still attached
+        names = self._full_read_fields() if self._item is not None else self.loaded_fields
+        return (_rebuild, (type(self), {name: getattr(self, name) for name in names}))
+
+class LazyMeeting(LazyRecord, Meeting):
+    """Meeting whose fields are read from the Outlook item on first access."""
+    _record_type = Meeting
+    _readers = MEETING_READERS
+    _on_demand = ON_DEMAND_FIELDS
@@ -0,0 +1,486 @@
+# services/outlook_service/replay.py
+"""
+Record and replay of Outlook COM sessions.
+
+Synthetic calendars don't have the odd shapes of production mailboxes
+(huge bodies, series with thousands of exceptions, `Start` values that come
+back as strings), so `SessionRecorder` captures a real run instead. It wraps
+the raw Outlook.Application under the `ComProxy`, so retries and metrics
+still happen above it, and writes every member access to a gzipped JSON
+lines trace:
+
+    [handle, kind, member, args, result, microseconds]
+
+`handle` numbers the COM object the access was made on (objects returned by
+Outlook get the next free number), `kind` is one of get / call / set / iter /
+next / len / bool / invoke, and `result` is the returned value, a handle, a
+method marker or the raised exception (including its HRESULT).
+
+Strings returned by Outlook are anonymized word by word with a keyed HMAC
+(`Anonymizer`): a word becomes a pseudonym of the same length and case
+pattern, the same word always gets the same pseudonym within a trace, and
+digits and punctuation are kept. Category keywords, month and weekday names,
+AM/PM and subject prefixes (RE:, FW:) are kept as they are, so keyword categorization, subject
+clustering and dates returned as strings behave as they did on the real
+mailbox. Arguments are written as given; they come from this program
+(Restrict filters, indexes), not from the mailbox.
+
+`SessionReplay` serves a trace back through the same object model, on any
+platform: each access returns the next recorded result for the same object,
+member and arguments, after sleeping the recorded latency (scaled by
+`speed`; 0 replays as fast as possible). When the arguments differ from the
+recording (e.g. a run over other dates) the next result for the member is
+used anyway and counted under `replay.arg_mismatches`; accesses that were
+never recorded raise `ReplayMissError`.
+
+Set `OUTLOOK_AUTOMATION_RECORD=<path>` to record every Outlook connection of
+a run, and `OUTLOOK_AUTOMATION_REPLAY=<path>` to connect to a trace instead
+of Outlook (see `dispatch_outlook`).
+"""
+import atexit
+import base64
+import gzip
+import hashlib
+import hmac
+import json
+import re
+import secrets
+import threading
+import time
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple, Union
+
+from services.outlook_service.com import _is_method, hresult_of
+from shared.metrics import metrics
+
+TRACE_FORMAT = "outlook-com-trace"
+TRACE_VERSION = 1
+
+ROOT = -1          # Pseudo-handle of the connection events that hand out applications
+METHOD = {"m": 1}  # Result of reading a member that is a method
+
+# Kept in anonymized text so dates written as strings still parse
+DATE_WORDS = frozenset({
+    'am', 'pm', 'jan', 'january', 'feb', 'february', 'mar', 'march', 'apr', 'april', 'may', 'jun',
+    'june', 'jul', 'july', 'aug', 'august', 'sep', 'sept', 'september', 'oct', 'october', 'nov',
+    'november', 'dec', 'december', 'mon', 'monday', 'tue', 'tues', 'tuesday', 'wed', 'wednesday',
+    'thu', 'thur', 'thurs', 'thursday', 'fri', 'friday', 'sat', 'saturday', 'sun', 'sunday',
+})
+# Subject prefixes and week/quarter markers removed by subject clustering
+CLUSTERING_WORDS = frozenset({'re', 'fw', 'fwd', 'updated', 'canceled', 'cancelled', 'accepted', 'tentative',
+                              'declined', 'copy', 'week', 'wk', 'q', 'st', 'nd', 'rd', 'th'})
+
+WORD = re.compile(r'[^\W\d_]+')
+LETTERS = 'abcdefghijklmnopqrstuvwxyz'
+
+class ReplayMissError(LookupError):
+    """Raised when a replayed session is asked for something that was never recorded."""
+
+class ReplayedComError(Exception):
+    """A COM error raised during recording; args and `hresult` are as pywintypes.com_error's."""
+
+    def __init__(self, *args, hresult: Optional[int] = None):
+        super().__init__(*args)
+        self.hresult = hresult
+
+def category_keywords() -> FrozenSet[str]:
+    """Words of the configured category keywords, which anonymization keeps."""
+    from services.categorization_service.rules import DEFAULT_TEAM, RULES_PATH, load_rules, tokenize
+    rules = load_rules(Path(RULES_PATH).read_text(encoding='utf-8'), DEFAULT_TEAM)
+    return frozenset(token for keywords in rules.values() for keyword in keywords
+                     for token in tokenize(keyword) if WORD.fullmatch(token))
+
+class Anonymizer:
+    """
+    Replaces every word of a string with a keyed pseudonym of the same length
+    and case pattern, keeping digits, punctuation and the words in `keep`.
+    The key is random unless given, so traces can't be reversed by hashing
+    guessed names.
+    """
+
+    def __init__(self, keep: Optional[Iterable[str]] = None, key: Optional[bytes] = None):
+        """
+        Args:
+            keep: Words kept as they are (case-insensitive); category keywords,
+                date words and the words subject clustering removes by default
+            key: HMAC key of the pseudonyms
+        """
+        if keep is None:
+            keep = category_keywords() | DATE_WORDS | CLUSTERING_WORDS
+        self.keep = frozenset(word.casefold() for word in keep)
+        self.key = key or secrets.token_bytes(32)
+        self._pseudonyms: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def pseudonym(self, word: str) -> str:
+        """The lower-case pseudonym of a word (computed on its case-folded form)."""
+        folded = word.casefold()
+        with self._lock:
+            cached = self._pseudonyms.get(folded)
+        if cached is not None and len(cached) == len(word):
+            return cached
+        counter = 0
+        while True:
+            digest = hmac.new(self.key, f"{counter}:{folded}".encode(), hashlib.sha256).digest()
+            while len(digest) < len(word):
+                digest += hashlib.sha256(digest).digest()
+            result = "".join(LETTERS[byte % len(LETTERS)] for byte in digest[:len(word)])
+            if result not in self.keep:  # A pseudonym must not turn into a keyword
+                break
+            counter += 1
+        with self._lock:
+            self._pseudonyms[folded] = result
+        return result
+
+    def _replace(self, match: re.Match) -> str:
+        word = match.group()
+        if word.casefold() in self.keep:
+            return word
+        return "".join(c.upper() if o.isupper() else c for c, o in zip(self.pseudonym(word), word))
+
+    def __call__(self, text: str) -> str:
+        return WORD.sub(self._replace, text)
+
+def _encode(value: Any, text=None) -> Any:
+    """JSON form of a value; `text` transforms strings (anonymization)."""
+    if isinstance(value, str):
+        return text(value) if text else value
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, timedelta):
+        return {"td": value.total_seconds()}
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return {"b": base64.b64encode(bytes(value)).decode('ascii')}
+    if isinstance(value, (tuple, list)):
+        return [_encode(item, text) for item in value]
+    if isinstance(value, (RecordingProxy, ReplayObject)):
+        return {"h": value._handle}
+    return {"o": type(value).__name__}
+
+def _decode(value: Any) -> Any:
+    if isinstance(value, list):
+        return tuple(_decode(item) for item in value)
+    if not isinstance(value, dict):
+        return value
+    if "dt" in value:
+        return datetime.fromisoformat(value["dt"])
+    if "d" in value:
+        return date.fromisoformat(value["d"])
+    if "td" in value:
+        return timedelta(seconds=value["td"])
+    if "b" in value:
+        return base64.b64decode(value["b"])
+    return value
+
+def _args_key(args: Any) -> str:
+    return json.dumps(args, separators=(',', ':'))
+
+class SessionRecorder:
+    """Writes a trace of every access made through the objects it wraps (see module docstring)."""
+
+    def __init__(self, path: Union[str, Path], anonymizer: Optional[Anonymizer] = None, anonymize: bool = True):
+        """
+        Args:
+            path: Trace file to write (gzipped JSON lines)
+            anonymizer: Anonymizer for returned strings (a fresh one by default)
+            anonymize: Record strings as returned instead (only for synthetic data)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.anonymize = (anonymizer or Anonymizer()) if anonymize else None
+        self.events = 0
+        self._handles = 0
+        self._lock = threading.Lock()
+        self._file = gzip.open(self.path, 'wt', encoding='utf-8')
+        self._write({"format": TRACE_FORMAT, "version": TRACE_VERSION, "anonymized": anonymize,
+                      "recorded": datetime.now().isoformat(timespec='seconds')})
+
+    def _write(self, entry: Any) -> None:
+        line = json.dumps(entry, separators=(',', ':'))
+        with self._lock:
+            if self._file is None:
+                return  # Late accesses after close (e.g. from finalizers) are dropped
+            self._file.write(line + "\n")
+
+    def _new_handle(self, target: Any) -> 'RecordingProxy':
+        with self._lock:
+            handle = self._handles
+            self._handles += 1
+        return RecordingProxy(target, handle, self)
+
+    def record(self, handle: int, kind: str, member: str, args: tuple, result: Any, seconds: float) -> None:
+        with self._lock:
+            self.events += 1
+        self._write([handle, kind, member, _encode(args), result, round(seconds * 1e6)])
+
+    def wrap(self, application: Any) -> 'RecordingProxy':
+        """Start recording a connection to an Outlook.Application object."""
+        proxy = self._new_handle(application)
+        self.record(ROOT, 'connect', '', (), {"h": proxy._handle}, 0.0)
+        return proxy
+
+    def result(self, value: Any) -> Tuple[Any, Any]:
+        """(value to return to the caller, its JSON form), wrapping COM objects in recording proxies."""
+        if isinstance(value, RecordingProxy):
+            return value, {"h": value._handle}
+        if isinstance(value, (str, bytes, int, float, bool, datetime, date, timedelta, tuple, list, type(None))):
+            return value, _encode(value, self.anonymize)
+        proxy = self._new_handle(value)
+        return proxy, {"h": proxy._handle}
+
+    def error(self, error: BaseException) -> Dict[str, Any]:
+        """JSON form of an exception raised by Outlook."""
+        return {"e": type(error).__name__, "a": _encode(error.args, self.anonymize), "hr": hresult_of(error)}
+
+    def access(self, handle: int, kind: str, member: str, args: tuple, fn, *fn_args) -> Any:
+        """Perform one access (`fn(*fn_args)`), record it with `args` and return its (wrapped) result."""
+        started = time.perf_counter()
+        try:
+            value = fn(*fn_args)
+        except BaseException as e:
+            self.record(handle, kind, member, args, self.error(e), time.perf_counter() - started)
+            raise
+        seconds = time.perf_counter() - started
+        if kind == 'get' and _is_method(value):
+            self.record(handle, kind, member, args, METHOD, seconds)
+            return value
+        returned, encoded = self.result(value)
+        self.record(handle, kind, member, args, encoded, seconds)
+        return returned
+
+    def close(self) -> None:
+        with self._lock:
+            file, self._file = self._file, None
+        if file is not None:
+            file.close()
+
+    def __enter__(self) -> 'SessionRecorder':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+class RecordingProxy:
+    """A COM object whose accesses are written to a SessionRecorder."""
+
+    def __init__(self, target: Any, handle: int, recorder: SessionRecorder):
+        object.__setattr__(self, '_target', target)
+        object.__setattr__(self, '_handle', handle)
+        object.__setattr__(self, '_recorder', recorder)
+
+    def __getattr__(self, member: str) -> Any:
+        if member.startswith('__'):
+            raise AttributeError(member)
+        recorder, handle = self._recorder, self._handle
+        value = recorder.access(handle, 'get', member, (), getattr, self._target, member)
+        if not _is_method(value):
+            return value
+
+        def method(*args):
+            return recorder.access(handle, 'call', member, args, value, *args)
+        return method
+
+    def __setattr__(self, member: str, value: Any) -> None:
+        self._recorder.access(self._handle, 'set', member, (value,), setattr, self._target, member, value)
+
+    def __call__(self, *args) -> Any:
+        return self._recorder.access(self._handle, 'invoke', '', args, self._target, *args)
+
+    def __iter__(self):
+        recorder = self._recorder
+        iterator = recorder.access(self._handle, 'iter', '', (), iter, self._target)
+        while True:
+            try:
+                yield recorder.access(iterator._handle, 'next', '', (), next, iterator._target)
+            except StopIteration:
+                return
+
+    def __len__(self) -> int:
+        return self._recorder.access(self._handle, 'len', '', (), len, self._target)
+
+    def __bool__(self) -> bool:
+        return self._recorder.access(self._handle, 'bool', '', (), bool, self._target)
+
+    def __repr__(self) -> str:
+        return f"RecordingProxy({self._handle}, {self._target!r})"
+
+class _Events:
+    """The recorded results of one (handle, kind, member), served in order."""
+
+    def __init__(self):
+        self.entries: List[Tuple[str, Any, int]] = []  # (args key, result, microseconds)
+        self.used: List[bool] = []
+        self.cursor = 0
+
+    def take(self, key: str) -> Tuple[Any, int]:
+        # The next unused entry with the same arguments; usually the one at the cursor
+        for index in range(self.cursor, len(self.entries)):
+            if not self.used[index] and self.entries[index][0] == key:
+                return self._use(index)
+        if self.cursor < len(self.entries):
+            metrics.increment("replay.arg_mismatches")
+            return self._use(self.cursor)
+        metrics.increment("replay.repeats")
+        return self.entries[-1][1:]
+
+    def _use(self, index: int) -> Tuple[Any, int]:
+        self.used[index] = True
+        while self.cursor < len(self.entries) and self.used[self.cursor]:
+            self.cursor += 1
+        return self.entries[index][1:]
+
+class SessionReplay:
+    """Serves a recorded trace back through the Outlook object model (see module docstring)."""
+
+    def __init__(self, entries: Iterable[list], speed: Optional[float] = 1.0):
+        """
+        Args:
+            entries: Trace events, as written by SessionRecorder
+            speed: Replay latency divided by this (2.0: twice as fast); None or 0
+                replays without sleeping
+        """
+        self.speed = speed
+        self.events = 0
+        self.recorded_seconds = 0.0
+        self._events: Dict[Tuple[int, str, str], _Events] = defaultdict(_Events)
+        for handle, kind, member, args, result, micros in entries:
+            events = self._events[(handle, kind, member)]
+            events.entries.append((_args_key(args), result, micros))
+            events.used.append(False)
+            self.events += 1
+            self.recorded_seconds += micros / 1e6
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @classmethod
+    def load(cls, path: Union[str, Path], speed: Optional[float] = 1.0) -> 'SessionReplay':
+        """
+        Read a trace file. A trace cut short (the recording process was killed)
+        is replayed up to its last complete event.
+
+        Raises:
+            ValueError: If the file is not a trace of a supported version
+        """
+        entries = []
+        with gzip.open(path, 'rt', encoding='utf-8') as stream:
+            try:
+                header = json.loads(stream.readline() or 'null')
+                if not isinstance(header, dict) or header.get("format") != TRACE_FORMAT:
+                    raise ValueError(f"Not an Outlook session trace: {path}")
+                if header.get("version") != TRACE_VERSION:
+                    raise ValueError(f"Unsupported trace version: {header.get('version')} (expected {TRACE_VERSION})")
+                for line in stream:
+                    entries.append(json.loads(line))
+            except (EOFError, json.JSONDecodeError):
+                if not entries:
+                    raise ValueError(f"Not an Outlook session trace: {path}") from None
+        return cls(entries, speed)
+
+    def application(self) -> 'ReplayObject':
+        """The next Outlook.Application connection of the recording."""
+        return self.access(ROOT, 'connect', '', ())
+
+    def _wait(self, micros: int) -> None:
+        if not self.speed or not micros:
+            return
+        # Latency is owed per thread and slept in whole milliseconds, so the many
+        # microsecond-scale property reads add up to their recorded total
+        owed = getattr(self._local, 'owed', 0.0) + micros / 1e6 / self.speed
+        if owed >= 0.001:
+            started = time.perf_counter()
+            time.sleep(owed)
+            owed -= time.perf_counter() - started
+        self._local.owed = owed
+
+    def access(self, handle: int, kind: str, member: str, args: tuple) -> Any:
+        """The recorded result of an access, raising it if it was an error."""
+        with self._lock:
+            events = self._events.get((handle, kind, member))
+            if events is None:
+                metrics.increment("replay.misses")
+                raise ReplayMissError(f"No {kind} of {member or 'object'} on handle {handle} in the trace")
+            result, micros = events.take(_args_key(_encode(args)))
+        self._wait(micros)
+        if isinstance(result, dict) and "e" in result:
+            raise self._error(result)
+        if isinstance(result, dict) and "h" in result:
+            return ReplayObject(self, result["h"])
+        return _decode(result)
+
+    @staticmethod
+    def _error(result: Dict[str, Any]) -> BaseException:
+        args = _decode(result["a"])
+        if result["e"] == 'StopIteration':
+            return StopIteration()
+        if result["e"] == 'AttributeError':
+            return AttributeError(*args)
+        return ReplayedComError(*args, hresult=result.get("hr"))
+
+class ReplayObject:
+    """A recorded COM object; member accesses return what they returned during recording."""
+
+    def __init__(self, replay: SessionReplay, handle: int):
+        object.__setattr__(self, '_replay', replay)
+        object.__setattr__(self, '_handle', handle)
+
+    def __getattr__(self, member: str) -> Any:
+        if member.startswith('__'):
+            raise AttributeError(member)
+        replay, handle = self._replay, self._handle
+        value = replay.access(handle, 'get', member, ())
+        if value != METHOD:
+            return value
+
+        def method(*args):
+            return replay.access(handle, 'call', member, args)
+        return method
+
+    def __setattr__(self, member: str, value: Any) -> None:
+        self._replay.access(self._handle, 'set', member, (value,))
+
+    def __call__(self, *args) -> Any:
+        return self._replay.access(self._handle, 'invoke', '', args)
+
+    def __iter__(self):
+        iterator = self._replay.access(self._handle, 'iter', '', ())
+        while True:
+            try:
+                yield self._replay.access(iterator._handle, 'next', '', ())
+            except StopIteration:
+                return
+
+    def __len__(self) -> int:
+        return self._replay.access(self._handle, 'len', '', ())
+
+    def __bool__(self) -> bool:
+        return self._replay.access(self._handle, 'bool', '', ())
+
+    def __repr__(self) -> str:
+        return f"ReplayObject({self._handle})"
+
+_recorders: Dict[str, SessionRecorder] = {}
+_replays: Dict[str, SessionReplay] = {}
+_sessions_lock = threading.Lock()
+
+def record_application(application: Any, path: Union[str, Path]) -> RecordingProxy:
+    """Record a connection into the trace at `path`, shared by every connection of the process."""
+    with _sessions_lock:
+        recorder = _recorders.get(str(path))
+        if recorder is None:
+            recorder = _recorders[str(path)] = SessionRecorder(path)
+            atexit.register(recorder.close)
+    return recorder.wrap(application)
+
+def replay_application(path: Union[str, Path], speed: Optional[float] = 1.0) -> ReplayObject:
+    """The next recorded connection of the trace at `path`, which is loaded once per process."""
+    with _sessions_lock:
+        replay = _replays.get(str(path))
+        if replay is None:
+            replay = _replays[str(path)] = SessionReplay.load(path, speed)
+    return replay.application()
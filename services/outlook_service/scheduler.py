@@ -0,0 +1,285 @@
+# services/outlook_service/scheduler.py
+"""
+Priority scheduling of Outlook jobs.
+
+A mailbox's Outlook session is effectively one serialized resource: while a
+bulk job (a year-long rollup, an archive export) walks the calendar, a
+"this week" request queued behind it on a plain `ComExecutor` waits for
+the whole job. `FetchScheduler` sits in front of per-mailbox COM workers
+and decides which job runs next:
+
+- priority classes: INTERACTIVE jobs run before NORMAL ones, and NORMAL
+  before BULK, whenever a worker of the mailbox frees up;
+- per-mailbox limits: each mailbox has its own workers, and at most its
+  limit of jobs run against it at once;
+- fairness: within a class, users with queued jobs take turns, one step
+  each;
+- preemption at page boundaries: a paged job (`submit_paged`) runs one
+  page per step and goes back in line after each, so an interactive job
+  waits for at most one page. Jobs split into shards (`ShardedFetcher`
+  over a `client`) get the same effect, one shard per job.
+
+A step that is running a COM call is never interrupted.
+
+Metrics: `scheduler.queue_depth.<class>` gauges, `scheduler.wait.<class>`
+timings (from submission to the first step starting) and the
+`scheduler.preemptions` counter (pages after which a higher class ran first).
+"""
+import threading
+import time
+from collections import deque
+from concurrent.futures import CancelledError, Future
+from typing import Any, Callable, Deque, Dict, Hashable, Iterable, Iterator, List, Optional
+
+from services.outlook_service.executor import ComExecutor
+from services.outlook_service.service import OutlookService
+from shared.metrics import metrics
+
+INTERACTIVE, NORMAL, BULK = 0, 1, 2
+PRIORITY_NAMES = ('interactive', 'normal', 'bulk')
+DEFAULT_MAILBOX = ''  # The profile's default mailbox
+
+Step = Callable[[Any], Any]
+
+def default_service(mailbox: str) -> OutlookService:
+    if mailbox != DEFAULT_MAILBOX:
+        raise ValueError(f"No service factory for mailbox {mailbox!r}; only the default mailbox is supported")
+    return OutlookService()
+
+class _Job:
+    """A queued job: its steps, the results so far and where it queues."""
+
+    def __init__(self, steps: Iterator[Step], priority: int, user: Hashable, paged: bool):
+        self.future: Future = Future()
+        self.steps = steps
+        self.step: Optional[Step] = next(steps, None)
+        self.priority = priority
+        self.user = user
+        self.paged = paged
+        self.results: List[Any] = []
+        self.submitted = time.monotonic()
+        self.started = False
+
+class _Mailbox:
+    """Per-class, per-user queues and the COM workers of one mailbox."""
+
+    def __init__(self, executor: ComExecutor, limit: int):
+        self.executor = executor
+        self.limit = limit
+        self.running = 0
+        self.queues: List[Dict[Hashable, Deque[_Job]]] = [{} for _ in PRIORITY_NAMES]
+        self.turns: List[Deque[Hashable]] = [deque() for _ in PRIORITY_NAMES]  # Users in turn order
+
+    def push(self, job: _Job, front: bool = False) -> None:
+        """Queue a job; `front` puts it ahead of its user's other jobs (a paged job continuing)."""
+        jobs = self.queues[job.priority].get(job.user)
+        if jobs is None:
+            jobs = self.queues[job.priority][job.user] = deque()
+            self.turns[job.priority].append(job.user)
+        if front:
+            jobs.appendleft(job)
+        else:
+            jobs.append(job)
+
+    def pop(self) -> Optional[_Job]:
+        """The next job: highest class first, then the user whose turn it is."""
+        for priority, turns in enumerate(self.turns):
+            if turns:
+                user = turns.popleft()
+                jobs = self.queues[priority][user]
+                job = jobs.popleft()
+                if jobs:
+                    turns.append(user)
+                else:
+                    del self.queues[priority][user]
+                return job
+        return None
+
+    def waiting(self, priority: Optional[int] = None) -> int:
+        classes = self.queues if priority is None else [self.queues[priority]]
+        return sum(len(jobs) for queue in classes for jobs in queue.values())
+
+    def waiting_before(self, priority: int) -> bool:
+        """Whether a job of a higher class than `priority` is queued."""
+        return any(self.turns[higher] for higher in range(priority))
+
+class ScheduledClient:
+    """
+    Submits jobs with fixed scheduling options. Has the `submit` of a
+    ComExecutor, so it can be handed to `ShardedFetcher` and the like.
+    """
+
+    def __init__(self, scheduler: 'FetchScheduler', priority: int, user: Hashable, mailbox: str):
+        self.scheduler = scheduler
+        self.priority = priority
+        self.user = user
+        self.mailbox = mailbox
+
+    def submit(self, fn: Callable[..., Any], *args, **kwargs) -> Future:
+        """Queue `fn(service, *args, **kwargs)`; the future holds its result."""
+        return self.scheduler._enqueue(self.mailbox, iter([lambda service: fn(service, *args, **kwargs)]),
+                                       self.priority, self.user, paged=False)
+
+    def submit_paged(self, pages: Iterable[Step]) -> Future:
+        """
+        Queue a job of pages, each called with the service, one per step; the
+        job yields to higher classes and other users between pages.
+        The future holds the list of page results.
+        """
+        return self.scheduler._enqueue(self.mailbox, iter(pages), self.priority, self.user, paged=True)
+
+class FetchScheduler:
+    """Priority, per-mailbox and per-user fair scheduling of Outlook jobs (see module docstring)."""
+
+    def __init__(self, service_factory: Callable[[str], Any] = default_service, limit: int = 1,
+                 limits: Optional[Dict[str, int]] = None, priority: int = NORMAL):
+        """
+        Args:
+            service_factory: Creates the service a worker uses for a mailbox
+            limit: Jobs running at once per mailbox (its number of COM workers)
+            limits: Limits for specific mailboxes
+            priority: Class of jobs queued with `submit`
+        """
+        self.service_factory = service_factory
+        self.limit = limit
+        self.limits = dict(limits or {})
+        self.priority = priority
+        self._mailboxes: Dict[str, _Mailbox] = {}
+        # Reentrant: a step that is already done runs its callback inside `_dispatch`
+        self._lock = threading.RLock()
+        self._idle = threading.Condition(self._lock)
+        self._shutdown = False
+        self._stop_when_idle = False
+
+    def client(self, priority: int = NORMAL, user: Hashable = None,
+               mailbox: str = DEFAULT_MAILBOX) -> ScheduledClient:
+        """A client queuing jobs in one class, for one user and mailbox."""
+        if priority not in range(len(PRIORITY_NAMES)):
+            raise ValueError(f"Unknown priority class: {priority}")
+        return ScheduledClient(self, priority, user, mailbox)
+
+    def submit(self, fn: Callable[..., Any], *args, **kwargs) -> Future:
+        """Queue `fn(service, *args, **kwargs)` on the default mailbox in the default class."""
+        return self.client(self.priority).submit(fn, *args, **kwargs)
+
+    def submit_paged(self, pages: Iterable[Step], priority: int = BULK, user: Hashable = None,
+                     mailbox: str = DEFAULT_MAILBOX) -> Future:
+        """Queue a paged job (see `ScheduledClient.submit_paged`), by default as bulk work."""
+        return self.client(priority, user, mailbox).submit_paged(pages)
+
+    def queue_depth(self, priority: Optional[int] = None) -> int:
+        """Jobs waiting to run their next step, in one class or all of them."""
+        with self._lock:
+            return sum(box.waiting(priority) for box in self._mailboxes.values())
+
+    def _mailbox(self, mailbox: str) -> _Mailbox:
+        box = self._mailboxes.get(mailbox)
+        if box is None:
+            limit = self.limits.get(mailbox, self.limit)
+            executor = ComExecutor(service_factory=lambda: self.service_factory(mailbox), workers=limit,
+                                   name=f"outlook-sta-{mailbox or 'default'}")
+            box = self._mailboxes[mailbox] = _Mailbox(executor, limit)
+        return box
+
+    def _enqueue(self, mailbox: str, steps: Iterator[Step], priority: int, user: Hashable, paged: bool) -> Future:
+        job = _Job(steps, priority, user, paged)
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("Cannot submit to a FetchScheduler after shutdown")
+            box = self._mailbox(mailbox)
+            box.push(job)
+            metrics.increment(f"scheduler.jobs.{PRIORITY_NAMES[priority]}")
+            self._dispatch(box)
+        return job.future
+
+    def _dispatch(self, box: _Mailbox) -> None:
+        """Start jobs while the mailbox has free workers. Called with the lock held."""
+        while box.running < box.limit:
+            job = box.pop()
+            if job is None:
+                break
+            if not job.started:
+                if not job.future.set_running_or_notify_cancel():
+                    continue
+                job.started = True
+                metrics.observe(f"scheduler.wait.{PRIORITY_NAMES[job.priority]}", time.monotonic() - job.submitted)
+            if job.step is None:  # A paged job without pages
+                job.future.set_result(job.results)
+                continue
+            box.running += 1
+            step, job.step = job.step, None
+            box.executor.submit(step).add_done_callback(lambda done, job=job: self._step_done(box, job, done))
+        self._update_gauges()
+        if box.running == 0 and not box.waiting():
+            self._idle.notify_all()
+            if self._stop_when_idle:
+                box.executor.shutdown(wait=False)
+
+    def _step_done(self, box: _Mailbox, job: _Job, done: Future) -> None:
+        error = done.exception() if not done.cancelled() else CancelledError()
+        if error is None:
+            job.results.append(done.result())
+            if job.paged:
+                # A page source that fails must fail the job, not the callback, or the
+                # mailbox's worker slot would never be given back
+                try:
+                    job.step = next(job.steps, None)
+                except Exception as e:
+                    error = e
+        with self._lock:
+            box.running -= 1
+            if error is not None:
+                job.future.set_exception(error)
+            elif job.step is not None:
+                if box.waiting_before(job.priority):
+                    metrics.increment("scheduler.preemptions")
+                box.push(job, front=True)
+            else:
+                job.future.set_result(job.results if job.paged else job.results[0])
+            self._dispatch(box)
+
+    def _update_gauges(self) -> None:
+        for priority, name in enumerate(PRIORITY_NAMES):
+            metrics.set_gauge(f"scheduler.queue_depth.{name}",
+                              sum(box.waiting(priority) for box in self._mailboxes.values()))
+
+    def shutdown(self, wait: bool = True, cancel_pending: bool = False) -> None:
+        """
+        Stop accepting jobs and stop the workers once the queued jobs have run.
+
+        Args:
+            wait: Block until then
+            cancel_pending: Cancel the queued jobs instead (started paged jobs
+                fail with CancelledError instead of running their next page)
+        """
+        with self._lock:
+            if self._shutdown:
+                return
+            self._shutdown = True
+            if cancel_pending:
+                for box in self._mailboxes.values():
+                    while (job := box.pop()) is not None:
+                        if job.started:
+                            job.future.set_exception(CancelledError())
+                        else:
+                            job.future.cancel()
+                self._update_gauges()
+            if wait:
+                self._idle.wait_for(lambda: all(
+                    box.running == 0 and not box.waiting() for box in self._mailboxes.values()
+                ))
+            else:
+                # Busy mailboxes are stopped by `_dispatch` once they run out of work
+                self._stop_when_idle = True
+                for box in self._mailboxes.values():
+                    if box.running == 0 and not box.waiting():
+                        box.executor.shutdown(wait=False)
+        if wait:
+            for box in self._mailboxes.values():
+                box.executor.shutdown()
+
+    def __enter__(self) -> 'FetchScheduler':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
@@ -1,9 +1,20 @@
 # services/outlook_service/outlook_service.py
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Any
-import win32com.client
+from typing import List, Dict, Optional, Any, Callable, Iterable, Iterator
 from dataclasses import dataclass
 
+from services.outlook_service.com import ComGuard, dispatch_outlook, guard_application
+from services.outlook_service.enumeration import iter_records
+from services.outlook_service.models import Meeting
+from services.outlook_service.projection import (
+    LazyMeeting, LazyRecord, MEETING_READERS, SUMMARY_FIELDS, read_property
+)
+from shared.timezones import get_normalizer
+
+def format_restriction_date(value: datetime) -> str:
+    """Format a datetime for use in an Items.Restrict filter."""
+    return value.strftime('%m/%d/%Y %I:%M %p')
+
 @dataclass
 class CalendarEvent:
     """Data class representing a calendar event."""
@@ -15,19 +26,45 @@ class CalendarEvent:
     body: str
     organizer: str
 
+EVENT_READERS: Dict[str, Callable[[Any], Any]] = {
+    'subject': MEETING_READERS['subject'],
+    'start_time': MEETING_READERS['start_time'],
+    'end_time': MEETING_READERS['end_time'],
+    'duration': MEETING_READERS['duration'],
+    'categories': MEETING_READERS['categories'],
+    'body': lambda item: read_property(item, 'Body'),
+    'organizer': MEETING_READERS['organizer'],
+}
+
+class LazyCalendarEvent(LazyRecord, CalendarEvent):
+    """CalendarEvent whose fields (notably `body`) are read from the Outlook item on first access."""
+    _record_type = CalendarEvent
+    _readers = EVENT_READERS
+
 class OutlookService:
     """Service for interacting with Outlook calendar."""
     
-    def __init__(self):
-        """Initialize the Outlook service."""
-        self.outlook = None
+    def __init__(self, application: Any = None, guard: Optional[ComGuard] = None):
+        """
+        Initialize the Outlook service.
+
+        Args:
+            application: Outlook.Application object to use instead of dispatching
+                one (e.g. the emulator in `outlook_service.emulator`)
+            guard: Retry and circuit-breaker policy for COM calls
+        """
+        self.guard = guard or ComGuard()
+        self.outlook = application
         self.namespace = None
         self._connect_to_outlook()
 
     def _connect_to_outlook(self) -> None:
         """Establish connection to Outlook application."""
         try:
-            self.outlook = win32com.client.Dispatch('Outlook.Application')
+            if self.outlook is None:
+                self.outlook = dispatch_outlook(self.guard)
+            else:
+                self.outlook = guard_application(self.outlook, self.guard)
             self.namespace = self.outlook.GetNamespace('MAPI')
         except Exception as e:
             raise ConnectionError(f"Failed to connect to Outlook: {str(e)}")
@@ -39,13 +76,16 @@ class OutlookService:
         except Exception as e:
             raise ValueError(f"Failed to access calendar: {str(e)}")
 
-    def get_calendar_events(self, start_date: datetime, end_date: datetime) -> List[CalendarEvent]:
+    def get_calendar_events(self, start_date: datetime, end_date: datetime,
+                            fields: Iterable[str] = SUMMARY_FIELDS) -> List[CalendarEvent]:
         """
         Retrieve calendar events for the specified date range.
         
         Args:
             start_date: Start date for the range
             end_date: End date for the range
+            fields: Fields to read up front; any other field (e.g. the potentially
+                large `body`) is read from Outlook on first access
             
         Returns:
             List of CalendarEvent objects
@@ -61,39 +101,59 @@ class OutlookService:
         appointments = calendar.Items.Restrict(restriction)
         appointments.Sort("[Start]")
         
-        events = []
-        for appt in appointments:
-            event = CalendarEvent(
-                subject=appt.Subject,
-                start_time=appt.Start,
-                end_time=appt.End,
-                duration=appt.Duration,
-                categories=list(appt.Categories.split(',')) if appt.Categories else [],
-                body=appt.Body,
-                organizer=appt.Organizer
-            )
-            events.append(event)
-            
-        return events
+        return [LazyCalendarEvent(appt, fields) for appt in appointments]
+
+    def restrict_window(self, start_date: datetime, end_date: datetime) -> Any:
+        """
+        Calendar items (including recurrence occurrences) overlapping [start_date, end_date),
+        sorted by start time.
+        """
+        items = self.get_calendar().Items
+        items.Sort("[Start]")
+        items.IncludeRecurrences = True
+        restriction = (
+            f"[Start] < '{format_restriction_date(end_date)}' AND "
+            f"[End] > '{format_restriction_date(start_date)}'"
+        )
+        return items.Restrict(restriction)
+
+    def get_meetings(self, start_date: datetime, end_date: datetime,
+                     fields: Iterable[str] = SUMMARY_FIELDS, detached: bool = False) -> List[Meeting]:
+        """
+        Retrieve meetings overlapping the specified date range.
+
+        Args:
+            start_date: Start of the range (inclusive)
+            end_date: End of the range (exclusive)
+            fields: Fields to read up front; other fields are read on first access
+            detached: Read only `fields` and release each Outlook item at once (see
+                `enumeration.py`) instead of keeping every item open for later reads
+
+        Returns:
+            List of Meeting objects sorted by start time
+        """
+        return list(self.iter_meetings(start_date, end_date, fields, detached))
+
+    def iter_meetings(self, start_date: datetime, end_date: datetime,
+                      fields: Iterable[str] = SUMMARY_FIELDS, detached: bool = False) -> Iterator[Meeting]:
+        """Like `get_meetings`, but yields meetings one at a time as Outlook returns them."""
+        items = self.restrict_window(start_date, end_date)
+        if detached:
+            yield from iter_records(items, fields)
+            return
+        for item in items:
+            yield LazyMeeting(item, fields)
 
     def get_previous_week_events(self) -> List[CalendarEvent]:
         """Get all calendar events from the previous week."""
-        today = datetime.now()
-        start_of_previous_week = today - timedelta(days=today.weekday() + 7)
-        start_date = datetime(start_of_previous_week.year, 
-                            start_of_previous_week.month,
-                            start_of_previous_week.day)
+        start_date, _ = get_normalizer().week_bounds(-1)
         end_date = start_date + timedelta(days=7)
         
         return self.get_calendar_events(start_date, end_date)
 
     def get_current_week_events(self) -> List[CalendarEvent]:
         """Get all calendar events for the current week, including future meetings."""
-        today = datetime.now()
-        start_of_week = today - timedelta(days=today.weekday())
-        start_date = datetime(start_of_week.year, 
-                            start_of_week.month,
-                            start_of_week.day)
+        start_date, _ = get_normalizer().week_bounds(0)
         end_date = start_date + timedelta(days=7)
         
         return self.get_calendar_events(start_date, end_date)
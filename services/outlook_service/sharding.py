@@ -0,0 +1,95 @@
+# services/outlook_service/sharding.py
+from datetime import datetime, timedelta
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+from services.outlook_service.executor import ComExecutor
+from services.outlook_service.models import Meeting
+from services.outlook_service.projection import SUMMARY_FIELDS
+from services.outlook_service.service import OutlookService
+
+Shard = Tuple[datetime, datetime]
+
+def shard_range(start: datetime, end: datetime, shard: Union[str, timedelta] = 'month') -> List[Shard]:
+    """
+    Split [start, end) into consecutive shards.
+
+    Args:
+        start: Start of the range
+        end: End of the range (exclusive)
+        shard: 'week' (Monday boundaries), 'month' (calendar months) or a fixed timedelta
+
+    Returns:
+        List of (shard_start, shard_end) tuples covering the range exactly
+    """
+    if end <= start:
+        return []
+
+    def next_boundary(current: datetime) -> datetime:
+        if isinstance(shard, timedelta):
+            return current + shard
+        day = current.replace(hour=0, minute=0, second=0, microsecond=0)
+        if shard == 'week':
+            return day + timedelta(days=7 - day.weekday())
+        if shard == 'month':
+            return (day.replace(day=1) + timedelta(days=32)).replace(day=1)
+        raise ValueError(f"Unknown shard size: {shard}")
+
+    shards = []
+    current = start
+    while current < end:
+        boundary = min(next_boundary(current), end)
+        shards.append((current, boundary))
+        current = boundary
+    return shards
+
+def _fetch_shard(service: OutlookService, start: datetime, end: datetime,
+                 fields: Iterable[str]) -> List[Meeting]:
+    # Results leave the worker's apartment, so they must not keep COM items alive
+    return service.get_meetings(start, end, fields, detached=True)
+
+class ShardedFetcher:
+    """
+    Fetches large date ranges as independent time shards on a pool of COM workers.
+
+    Each shard is a separate `Restrict` window, so one slow shard does not
+    hold up the others. Shard results are sorted by start time and shards are
+    disjoint in start time, so the merged stream is produced by yielding
+    shards in order as soon as each one (and every shard before it) is done.
+
+    A meeting that straddles a shard boundary is returned by every shard it
+    overlaps; it is only kept by the shard containing its start, except for
+    the first shard, which keeps meetings that began before the range.
+
+    Only the projected `fields` are read on the workers; returned meetings are
+    detached from Outlook.
+    """
+
+    def __init__(self, executor: ComExecutor, shard: Union[str, timedelta] = 'month',
+                 shard_timeout: Optional[float] = None, fields: Iterable[str] = SUMMARY_FIELDS):
+        self.executor = executor
+        self.shard = shard
+        self.shard_timeout = shard_timeout
+        self.fields = tuple(fields)
+
+    def iter_meetings(self, start: datetime, end: datetime) -> Iterator[Meeting]:
+        """
+        Stream meetings overlapping [start, end) in start-time order.
+
+        Raises:
+            concurrent.futures.TimeoutError: If a shard takes longer than shard_timeout
+        """
+        shards = shard_range(start, end, self.shard)
+        futures = [self.executor.submit(_fetch_shard, s, e, self.fields) for s, e in shards]
+        try:
+            for index, ((shard_start, _), future) in enumerate(zip(shards, futures)):
+                for meeting in future.result(timeout=self.shard_timeout):
+                    if index == 0 or meeting.start_time.replace(tzinfo=None) >= shard_start:
+                        yield meeting
+        finally:
+            # Abandoned or failed iteration: don't keep workers busy with unused shards
+            for future in futures:
+                future.cancel()
+
+    def fetch_meetings(self, start: datetime, end: datetime) -> List[Meeting]:
+        """Fetch meetings overlapping [start, end) as a list sorted by start time."""
+        return list(self.iter_meetings(start, end))
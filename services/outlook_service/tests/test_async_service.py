@@ -0,0 +1,103 @@
+import asyncio
+import threading
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from services.outlook_service import executor
+from services.outlook_service.executor import ComExecutor
+from services.outlook_service.async_service import AsyncOutlookService
+
+class FakeService:
+    """Stands in for OutlookService on the STA worker."""
+
+    def __init__(self, release: threading.Event):
+        self.release = release
+        self.thread = threading.current_thread().name
+        self.calls = []
+
+    def get_calendar_events(self, start_date, end_date):
+        self.calls.append((start_date, end_date))
+        self.release.wait(5)
+        return [f"{start_date:%m/%d}-{end_date:%m/%d}"]
+
+@pytest.fixture
+def com_calls():
+    with patch.object(executor, 'pythoncom') as pythoncom:
+        yield {'init': pythoncom.CoInitialize, 'uninit': pythoncom.CoUninitialize}
+
+@pytest.fixture
+def release():
+    event = threading.Event()
+    yield event
+    event.set()
+
+@pytest.fixture
+def services():
+    return []
+
+@pytest.fixture
+def async_service(com_calls, release, services):
+    def factory():
+        service = FakeService(release)
+        services.append(service)
+        return service
+
+    service = AsyncOutlookService(ComExecutor(service_factory=factory, workers=2))
+    yield service
+    release.set()
+    service.close()
+
+def get_events(service, start, end, **kwargs):
+    return service.run(("events", start, end), FakeService.get_calendar_events, start, end, **kwargs)
+
+def test_workers_initialize_com_once(async_service, com_calls, release, services):
+    release.set()
+    start = datetime(2025, 3, 3)
+
+    async def main():
+        for day in range(4):
+            await get_events(async_service, start + timedelta(days=day), start + timedelta(days=day + 1))
+
+    asyncio.run(main())
+    async_service.close()
+    assert com_calls['init'].call_count == 2
+    assert com_calls['uninit'].call_count == 2
+    assert all(s.thread.startswith("outlook-sta") for s in services)
+    assert sum(len(s.calls) for s in services) == 4
+
+def test_concurrent_requests_are_coalesced(async_service, release, services):
+    start, end = datetime(2025, 3, 3), datetime(2025, 3, 10)
+
+    async def main():
+        tasks = [asyncio.create_task(get_events(async_service, start, end)) for _ in range(5)]
+        await asyncio.sleep(0.05)
+        release.set()
+        return await asyncio.gather(*tasks)
+
+    results = asyncio.run(main())
+    assert results == [["03/03-03/10"]] * 5
+    assert sum(len(s.calls) for s in services) == 1
+
+def test_timeout_and_cancellation_of_queued_request(com_calls, release, services):
+    def factory():
+        service = FakeService(release)
+        services.append(service)
+        return service
+
+    service = AsyncOutlookService(ComExecutor(service_factory=factory, workers=1))
+    start = datetime(2025, 3, 3)
+
+    async def main():
+        # Occupies the only worker until released
+        busy = asyncio.create_task(get_events(service, start, start + timedelta(days=1)))
+        await asyncio.sleep(0.05)
+        with pytest.raises(asyncio.TimeoutError):
+            await get_events(service, start, start + timedelta(days=2), timeout=0.05)
+        release.set()
+        await busy
+
+    asyncio.run(main())
+    service.close()
+    # The timed-out request was still queued, so it never reached COM
+    assert services[0].calls == [(start, start + timedelta(days=1))]
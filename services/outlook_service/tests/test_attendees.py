@@ -0,0 +1,101 @@
+import pickle
+import pytest
+from datetime import datetime, timedelta
+
+from services.outlook_service.attendees import AttendeeCache, attendee_key
+from services.outlook_service.emulator import FakeOutlookApplication, make_appointment, make_recipient
+from services.outlook_service.enumeration import iter_records
+from services.outlook_service.models import AttendeeCounts, Meeting
+from services.outlook_service.projection import (
+    LazyMeeting, OL_OPTIONAL, OL_RESOURCE, OL_RESPONSE_ACCEPTED, OL_RESPONSE_ORGANIZED
+)
+from services.summary_service.service import SummaryService
+from services.categorization_service.services import MeetingCategory
+
+START = datetime(2025, 3, 3, 9, 0)
+
+RECIPIENTS = [
+    make_recipient("Doe, Jane", response=OL_RESPONSE_ORGANIZED),
+    make_recipient("Roe, Rick", response=OL_RESPONSE_ACCEPTED),
+    make_recipient("Poe, Pat"),
+    make_recipient("Loe, Lou", OL_OPTIONAL, OL_RESPONSE_ACCEPTED),
+    make_recipient("Room 1", OL_RESOURCE, OL_RESPONSE_ACCEPTED),
+]
+
+@pytest.fixture
+def application():
+    weekly = [
+        make_appointment("Team sync", START + timedelta(weeks=week), 60, RecurrenceState=3,
+                         ConversationID="series-1", GlobalAppointmentID="gid-1", Recipients=RECIPIENTS)
+        for week in range(10)
+    ]
+    single = make_appointment("Design review", START + timedelta(hours=3), 30, GlobalAppointmentID="gid-2",
+                              RequiredAttendees="Doe, Jane; Roe, Rick")
+    return FakeOutlookApplication(weekly + [single])
+
+def calendar_items(application):
+    items = application.GetNamespace('MAPI').GetDefaultFolder(9).Items
+    items.Sort("[Start]")
+    return items
+
+def test_recipients_are_counted_by_role_and_response(application):
+    meeting = LazyMeeting(application.appointments[0], fields=('attendees',))
+    assert meeting.attendees == AttendeeCounts(required=3, optional=1, resources=1, accepted=3)
+    assert meeting.attendees.people == 4
+
+def test_recipients_default_to_attendee_strings(application):
+    meeting = LazyMeeting(application.appointments[-1], fields=('attendees',))
+    assert meeting.attendees == AttendeeCounts(required=2, accepted=1)
+
+def test_full_reads_skip_recipients_unless_loaded(application):
+    item = application.appointments[0]
+    assert Meeting.from_outlook_item(item).attendees is None
+    assert LazyMeeting(item).materialize().attendees is None
+    assert pickle.loads(pickle.dumps(LazyMeeting(item))).attendees is None
+    assert 'Recipients' not in application.property_reads
+
+    loaded = LazyMeeting(item, fields=('attendees',))
+    assert pickle.loads(pickle.dumps(loaded)).attendees == loaded.materialize().attendees == loaded.attendees
+    assert application.property_reads['Recipients'] == 1
+
+def test_items_without_recipients_have_no_attendees():
+    appointment = make_appointment("Hold", START, 30)
+    del appointment['Recipients']
+    meeting = LazyMeeting(FakeOutlookApplication([appointment]).appointments[0], fields=('attendees',))
+    assert meeting.attendees == AttendeeCounts()
+
+def test_series_recipients_are_read_once(application):
+    cache = AttendeeCache()
+    meetings = list(iter_records(calendar_items(application), record_type=cache.read))
+
+    assert [m.attendees.people for m in meetings] == [4, 2] + [4] * 9
+    assert application.property_reads['Recipients'] == 2
+    assert len(cache) == 2
+
+    # A second pass is answered from the cache entirely
+    list(iter_records(calendar_items(application), record_type=cache.read))
+    assert application.property_reads['Recipients'] == 2
+
+def test_meetings_without_ids_are_not_cached():
+    application = FakeOutlookApplication([make_appointment("Ad hoc", START, 30)] * 3)
+    cache = AttendeeCache()
+    meetings = list(iter_records(calendar_items(application), record_type=cache.read))
+
+    assert attendee_key(meetings[0]) is None
+    assert application.property_reads['Recipients'] == 3
+    assert len(cache) == 0
+
+def test_category_person_hours(application):
+    meetings = list(iter_records(calendar_items(application), record_type=AttendeeCache().read))
+    categories = [
+        MeetingCategory.STAFF_TEAM if m.subject == "Team sync" else MeetingCategory.UNCATEGORIZED for m in meetings
+    ]
+    summary = SummaryService()
+    frame = summary.build_frame(meetings, categories, attendees=[m.attendees for m in meetings])
+
+    costs = summary.get_category_person_hours(frame)
+
+    assert costs[MeetingCategory.STAFF_TEAM] == {'people': 40.0, 'required': 30.0, 'optional': 10.0, 'accepted': 30.0}
+    assert costs[MeetingCategory.UNCATEGORIZED] == {'people': 1.0, 'required': 1.0, 'optional': 0.0, 'accepted': 0.5}
+    with pytest.raises(ValueError):
+        summary.get_category_person_hours(summary.build_frame(meetings, categories))
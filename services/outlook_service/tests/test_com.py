@@ -0,0 +1,124 @@
+import pytest
+from datetime import datetime, timedelta
+
+from shared.metrics import metrics
+from services.outlook_service.com import (
+    CircuitBreaker, CircuitOpenError, ComDeadlineError, ComGuard, ComProxy,
+    RPC_E_SERVERCALL_RETRYLATER, is_transient
+)
+from services.outlook_service.emulator import FakeComError, FakeOutlookApplication, make_appointment
+from services.outlook_service.service import OutlookService
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    metrics.reset("com.")
+    yield
+    metrics.reset("com.")
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+@pytest.fixture
+def guard(clock):
+    return ComGuard(attempts=4, base_delay=0.1, deadline=5.0, sleep=clock.sleep, clock=clock,
+                    breaker=CircuitBreaker(failure_threshold=2, reset_timeout=30.0, clock=clock))
+
+@pytest.fixture
+def application():
+    start = datetime(2025, 3, 3, 9, 0)
+    return FakeOutlookApplication([
+        make_appointment(f"Team sync {i}", start + timedelta(days=i), 30) for i in range(3)
+    ])
+
+def test_transient_errors_are_recognized():
+    assert is_transient(FakeComError(RPC_E_SERVERCALL_RETRYLATER))
+    assert not is_transient(FakeComError(-2147352567))
+    assert not is_transient(ValueError("not a COM error"))
+
+def test_calls_are_counted_and_timed_per_member(application, guard):
+    service = OutlookService(application=application, guard=guard)
+    meetings = service.get_meetings(datetime(2025, 3, 3), datetime(2025, 3, 10))
+
+    assert [m.subject for m in meetings] == ["Team sync 0", "Team sync 1", "Team sync 2"]
+    assert metrics.counter("com.calls.Application.GetNamespace") == 1
+    assert metrics.counter("com.calls.Items.Restrict") == 1
+    # The method lookup is counted and timed apart from the call
+    assert metrics.counter("com.calls.Application.GetNamespace.get") == 1
+    timings = metrics.snapshot("com.latency.Application.GetNamespace")["timings"]
+    assert timings["com.latency.Application.GetNamespace"]["count"] == 1
+    assert metrics.counter("com.calls.Item.Subject") == 3
+    assert metrics.snapshot("com.latency.Item.Subject")["timings"]["com.latency.Item.Subject"]["count"] == 3
+
+def test_rejected_calls_are_retried(application, guard):
+    service = OutlookService(application=application, guard=guard)
+    application.fail_next(2)
+
+    meetings = service.get_meetings(datetime(2025, 3, 3), datetime(2025, 3, 10))
+
+    assert len(meetings) == 3
+    assert sum(metrics.counters("com.retries.").values()) == 2
+    assert guard.breaker.state == 'closed'
+
+def test_persistent_failures_hit_the_deadline_and_trip_the_breaker(application, guard, clock):
+    service = OutlookService(application=application, guard=guard)
+    items = service.get_calendar().Items
+
+    application.fail_next(8)  # Two calls, four attempts each
+    with pytest.raises(ComDeadlineError):
+        items.Restrict("[Start] >= '03/03/2025'")
+    with pytest.raises(ComDeadlineError):
+        items.Restrict("[Start] >= '03/03/2025'")
+    assert guard.breaker.state == 'open'
+
+    calls = application.calls
+    with pytest.raises(CircuitOpenError):
+        items.Restrict("[Start] >= '03/03/2025'")
+    assert application.calls == calls  # Outlook is not called while the circuit is open
+
+    # After the reset timeout a trial call is let through and closes the circuit again
+    clock.now += 30
+    assert guard.breaker.state == 'half_open'
+    assert items.Restrict("[Start] >= '03/03/2025'").Count == 3
+    assert guard.breaker.state == 'closed'
+
+def test_other_errors_are_not_retried(guard):
+    calls = []
+
+    def fail():
+        calls.append(1)
+        raise FakeComError(-2147352567, "Exception occurred.")
+
+    with pytest.raises(FakeComError):
+        guard.call("Item.Save", fail)
+    assert len(calls) == 1
+    assert not guard.breaker.failures
+
+def test_missing_properties_raise_attribute_error(application, guard):
+    item = ComProxy(application.appointments[0], 'Item', guard)
+    assert getattr(item, 'GlobalAppointmentID', None) is None
+    assert not hasattr(item, 'GlobalAppointmentID')
+    assert metrics.counter("com.errors.Item.GlobalAppointmentID") == 0
+
+def test_property_assignment_goes_through_the_proxy(application, guard):
+    items = ComProxy(application, 'Application', guard).GetNamespace('MAPI').GetDefaultFolder(9).Items
+    items.IncludeRecurrences = True
+    assert items.IncludeRecurrences is True
+    assert metrics.counter("com.calls.Items.IncludeRecurrences") == 2
+
+def test_end_of_enumeration_is_not_an_error(application, guard):
+    items = ComProxy(application, 'Application', guard).GetNamespace('MAPI').GetDefaultFolder(9).Items
+    assert [item.Subject for item in items] == ["Team sync 0", "Team sync 1", "Team sync 2"]
+    assert metrics.counter("com.calls.Items.next") == 4
+    assert metrics.counter("com.errors.Items.next") == 0
+    assert metrics.snapshot("com.latency.Items.next")["timings"]["com.latency.Items.next"]["count"] == 4
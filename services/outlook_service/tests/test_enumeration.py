@@ -0,0 +1,98 @@
+import gc
+import pytest
+from datetime import datetime, timedelta
+
+from services.outlook_service.com import CircuitOpenError
+from services.outlook_service.emulator import FakeOutlookApplication, make_appointment
+from services.outlook_service.enumeration import iter_pages, iter_records
+from services.outlook_service.projection import SUMMARY_FIELDS
+from services.outlook_service.service import OutlookService
+from shared.metrics import metrics
+
+START = datetime(2025, 3, 3, 9, 0)
+
+@pytest.fixture
+def application():
+    return FakeOutlookApplication([
+        make_appointment(f"Meeting {i}", START + timedelta(hours=i), 30, Location=f"Room {i % 3}")
+        for i in range(250)
+    ])
+
+def calendar_items(application):
+    items = application.GetNamespace('MAPI').GetDefaultFolder(9).Items
+    items.Sort("[Start]")
+    return items
+
+def test_records_hold_no_proxies(application):
+    items = calendar_items(application)
+    application.reset_proxy_peak()
+
+    records = list(iter_records(items))
+
+    assert [r.subject for r in records] == [f"Meeting {i}" for i in range(250)]
+    assert application.peak_live_proxies == 1
+    assert application.live_proxies == 0
+
+def test_iterating_items_keeps_every_proxy_alive(application):
+    items = calendar_items(application)
+    application.reset_proxy_peak()
+
+    held = [item for item in items]
+
+    assert application.peak_live_proxies == 250
+    del held
+    gc.collect()
+    assert application.live_proxies == 0
+
+def test_detached_records_read_only_requested_fields(application):
+    record = next(iter_records(calendar_items(application), SUMMARY_FIELDS))
+    assert set(application.property_reads) == {'Subject', 'Organizer', 'Start', 'End', 'Duration'}
+    with pytest.raises(AttributeError):
+        record.location
+
+def test_pages_are_bounded(application):
+    application.reset_proxy_peak()
+    pages = list(iter_pages(calendar_items(application), page_size=100))
+
+    assert [len(page) for page in pages] == [100, 100, 50]
+    assert application.peak_live_proxies == 1
+
+def test_unreadable_items_are_skipped_or_raised():
+    broken = make_appointment("Broken", START, 30)
+    del broken['Organizer']
+    application = FakeOutlookApplication([make_appointment("Fine", START, 30), broken])
+    skipped = []
+
+    records = list(iter_records(calendar_items(application), on_error=skipped.append))
+
+    assert [r.subject for r in records] == ["Fine"]
+    assert len(skipped) == 1
+    assert application.live_proxies == 0
+    with pytest.raises(AttributeError):
+        list(iter_records(calendar_items(application)))
+
+def test_circuit_open_is_never_skipped(application):
+    def fail(item, fields):
+        raise CircuitOpenError("Outlook is not responding")
+
+    with pytest.raises(CircuitOpenError):
+        list(iter_records(calendar_items(application), record_type=fail, on_error=lambda e: None))
+
+def test_items_enumerated_metric(application):
+    before = metrics.counter("outlook.items_enumerated")
+    list(iter_records(calendar_items(application)))
+    assert metrics.counter("outlook.items_enumerated") - before == 250
+
+def test_detached_get_meetings_matches_lazy(application):
+    service = OutlookService(application=application)
+    start, end = datetime(2025, 3, 4), datetime(2025, 3, 8)
+    lazy = service.get_meetings(start, end)
+    expected = [(m.subject, m.start_time, m.duration) for m in lazy]
+    del lazy
+    gc.collect()
+    application.reset_proxy_peak()
+
+    detached = service.get_meetings(start, end, detached=True)
+
+    assert [(m.subject, m.start_time, m.duration) for m in detached] == expected
+    assert application.peak_live_proxies <= 1
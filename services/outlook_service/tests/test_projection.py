@@ -0,0 +1,71 @@
+import pickle
+import pytest
+from datetime import datetime, timedelta
+
+from services.categorization_service.services import CategorizationService
+from services.summary_service.service import SummaryService
+from shared.metrics import metrics
+from services.outlook_service.emulator import FakeOutlookApplication, make_appointment
+from services.outlook_service.models import Meeting
+from services.outlook_service.projection import LazyMeeting
+from services.outlook_service.service import OutlookService, CalendarEvent
+
+SUMMARY_PROPERTIES = {'Subject', 'Organizer', 'Start', 'End', 'Duration'}
+
+@pytest.fixture
+def application():
+    start = datetime(2025, 3, 3, 9, 0)
+    return FakeOutlookApplication([
+        make_appointment(f"Team sync {i}", start + timedelta(hours=i), 30,
+                         Body="<html>" + "x" * 10_000 + "</html>", Location="Room 1",
+                         Categories="Blue,Green")
+        for i in range(5)
+    ])
+
+@pytest.fixture
+def outlook_service(application):
+    return OutlookService(application=application)
+
+def test_calendar_events_never_read_body_by_default(outlook_service, application):
+    events = outlook_service.get_calendar_events(datetime(2025, 3, 3), datetime(2025, 3, 4))
+    assert len(events) == 5
+    assert isinstance(events[0], CalendarEvent)
+    assert set(application.property_reads) == SUMMARY_PROPERTIES
+
+    # Other fields are fetched on first access and memoized
+    assert events[0].body.startswith("<html>")
+    assert events[0].body.startswith("<html>")
+    assert events[0].categories == ["Blue", "Green"]
+    assert application.property_reads['Body'] == 1
+    assert application.property_reads['Categories'] == 1
+
+def test_summary_and_categorization_touch_only_projected_fields(outlook_service, application):
+    metrics.reset("outlook.property_reads.")
+    meetings = outlook_service.get_meetings(datetime(2025, 3, 3), datetime(2025, 3, 4))
+    CategorizationService().categorize_meetings(meetings)
+    summary = SummaryService()
+    summary.get_week_category_totals(summary.build_frame(meetings))
+
+    assert set(application.property_reads) == SUMMARY_PROPERTIES
+    assert all(count == 5 for count in application.property_reads.values())
+    assert metrics.counters("outlook.property_reads.") == {
+        f"outlook.property_reads.{name}": 5 for name in SUMMARY_PROPERTIES
+    }
+
+def test_detach_and_materialize(outlook_service):
+    meeting = outlook_service.get_meetings(datetime(2025, 3, 3), datetime(2025, 3, 4))[0]
+    plain = outlook_service.get_meetings(datetime(2025, 3, 3), datetime(2025, 3, 4))[0].materialize()
+    assert type(plain) is Meeting
+    assert plain.location == "Room 1"
+
+    meeting.detach()
+    assert meeting.subject == "Team sync 0"
+    with pytest.raises(AttributeError):
+        meeting.location
+
+def test_pickle_reads_remaining_fields(outlook_service):
+    meeting = outlook_service.get_meetings(datetime(2025, 3, 3), datetime(2025, 3, 4))[0]
+    restored = pickle.loads(pickle.dumps(meeting))
+    assert isinstance(restored, LazyMeeting)
+    assert restored.loaded_fields == set(meeting.loaded_fields)
+    assert restored.categories == ["Blue", "Green"]
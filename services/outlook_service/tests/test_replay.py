@@ -0,0 +1,123 @@
+import gzip
+import time
+import pytest
+from datetime import datetime, timedelta
+
+from shared.metrics import metrics
+from services.outlook_service.com import RPC_E_CALL_REJECTED, ComGuard
+from services.outlook_service.emulator import FakeLatency, FakeOutlookApplication, make_appointment
+from services.outlook_service.replay import Anonymizer, ReplayMissError, SessionRecorder, SessionReplay
+from services.outlook_service.service import OutlookService
+
+START, END = datetime(2025, 3, 3), datetime(2025, 3, 8)
+
+def fields(meetings):
+    return [(m.subject, m.start_time, m.end_time, m.duration, m.organizer) for m in meetings]
+
+@pytest.fixture
+def application():
+    start = datetime(2025, 3, 3, 9, 0)
+    return FakeOutlookApplication([
+        make_appointment("Platform standup", start, 15, RequiredAttendees="Doe, Jane; Roe, Rick"),
+        make_appointment("RE: Q3 planning - Mar 4", start + timedelta(days=1, hours=2), 60, organizer="Roe, Rick"),
+        make_appointment("Lunch with Jane Doe", start + timedelta(days=2, hours=3), 45, organizer="Roe, Rick"),
+        make_appointment("Offsite", start + timedelta(days=3), 1440, AllDayEvent=True),
+    ])
+
+def record(application, path, **kwargs):
+    with SessionRecorder(path, **kwargs) as recorder:
+        service = OutlookService(application=recorder.wrap(application), guard=ComGuard(sleep=lambda s: None))
+        return service.get_meetings(START, END, detached=True)
+
+def replay(path, **kwargs):
+    return OutlookService(application=SessionReplay.load(path, **kwargs).application(),
+                          guard=ComGuard(sleep=lambda s: None))
+
+def test_replay_returns_the_recorded_meetings(application, tmp_path):
+    path = tmp_path / "session.trace.gz"
+    recorded = record(application, path, anonymize=False)
+
+    replayed = replay(path, speed=0).get_meetings(START, END, detached=True)
+    assert fields(replayed) == fields(recorded)
+    assert len(recorded) == 4
+
+def test_recorded_strings_are_anonymized(application, tmp_path):
+    path = tmp_path / "session.trace.gz"
+    recorded = record(application, path)
+    replayed = replay(path, speed=0).get_meetings(START, END, detached=True)
+
+    assert "Jane" not in gzip.open(path, 'rt').read()
+    by_start = {m.start_time: m for m in replayed}
+    for meeting in recorded:
+        subject = by_start[meeting.start_time].subject
+        assert len(subject) == len(meeting.subject)
+        assert [c.isupper() for c in subject] == [c.isupper() for c in meeting.subject]
+    standup, planning = by_start[datetime(2025, 3, 3, 9, 0)], by_start[datetime(2025, 3, 4, 11, 0)]
+    # Category keywords, prefixes, dates and digits survive; the same name gets the same pseudonym
+    assert standup.subject.endswith(" standup") and standup.subject != "Platform standup"
+    assert planning.subject == "RE: Q3 planning - Mar 4"
+    lunch = by_start[datetime(2025, 3, 5, 12, 0)]
+    assert planning.organizer == lunch.organizer != "Roe, Rick"
+
+def test_pseudonyms_are_consistent_and_keyed():
+    anonymize = Anonymizer(keep=["sync"], key=b"k" * 32)
+    assert anonymize("Eng Sync 10/3") == anonymize("Eng") + " Sync 10/3"
+    assert anonymize("ENG") == anonymize("eng").upper() and anonymize("Eng").lower() == anonymize("eng")
+    assert Anonymizer(keep=[], key=b"x" * 32)("eng") != Anonymizer(keep=[], key=b"y" * 32)("eng")
+
+def test_recorded_latency_is_replayed(tmp_path):
+    start = datetime(2025, 3, 3, 9, 0)
+    application = FakeOutlookApplication([make_appointment(f"Meeting {n}", start + timedelta(hours=n), 30)
+                                          for n in range(5)], latency=FakeLatency(call=0.02, property_read=0.002))
+    path = tmp_path / "session.trace.gz"
+    started = time.perf_counter()
+    record(application, path, anonymize=False)
+    recorded_seconds = time.perf_counter() - started
+
+    session = SessionReplay.load(path)
+    started = time.perf_counter()
+    OutlookService(application=session.application()).get_meetings(START, END, detached=True)
+    replayed_seconds = time.perf_counter() - started
+    assert session.recorded_seconds <= recorded_seconds
+    assert replayed_seconds == pytest.approx(session.recorded_seconds, rel=0.5)
+
+    started = time.perf_counter()
+    replay(path, speed=0).get_meetings(START, END, detached=True)
+    assert time.perf_counter() - started < session.recorded_seconds / 2
+
+def test_recorded_com_errors_are_replayed_and_retried(application, tmp_path):
+    path = tmp_path / "session.trace.gz"
+    application.fail_next(2, RPC_E_CALL_REJECTED)
+    recorded = record(application, path, anonymize=False)
+
+    retries = metrics.counters("com.retries")
+    replayed = replay(path, speed=0).get_meetings(START, END, detached=True)
+    assert fields(replayed) == fields(recorded)
+    assert sum(metrics.counters("com.retries").values()) - sum(retries.values()) == 2
+
+def test_other_arguments_and_unrecorded_members(application, tmp_path):
+    path = tmp_path / "session.trace.gz"
+    recorded = record(application, path, anonymize=False)
+    service = replay(path, speed=0)
+
+    mismatches = metrics.counter("replay.arg_mismatches")
+    replayed = service.get_meetings(START, END + timedelta(days=1), detached=True)
+    assert fields(replayed) == fields(recorded)
+    assert metrics.counter("replay.arg_mismatches") > mismatches
+    with pytest.raises(ReplayMissError):
+        service.outlook.Session
+
+def test_truncated_traces_and_environment(application, tmp_path, monkeypatch):
+    path = tmp_path / "session.trace.gz"
+    recorded = record(application, path, anonymize=False)
+    monkeypatch.setenv("OUTLOOK_AUTOMATION_REPLAY", str(path))
+    assert fields(OutlookService().get_meetings(START, END, detached=True)) == fields(recorded)
+
+    data = gzip.decompress(path.read_bytes())
+    truncated = tmp_path / "truncated.trace.gz"
+    truncated.write_bytes(gzip.compress(data)[:-12])
+    assert SessionReplay.load(truncated).events > 0
+    other = tmp_path / "other.gz"
+    other.write_bytes(gzip.compress(b'{"format": "something else"}\n'))
+    with pytest.raises(ValueError):
+        SessionReplay.load(other)
@@ -0,0 +1,142 @@
+import threading
+import pytest
+from concurrent.futures import CancelledError
+from datetime import datetime, timedelta
+
+from services.outlook_service.emulator import FakeOutlookApplication, make_appointment
+from services.outlook_service.scheduler import BULK, INTERACTIVE, NORMAL, FetchScheduler
+from services.outlook_service.service import OutlookService
+from services.outlook_service.sharding import ShardedFetcher
+from shared.metrics import metrics
+
+@pytest.fixture
+def scheduler():
+    scheduler = FetchScheduler(service_factory=lambda mailbox: mailbox or "default", limits={'shared': 2})
+    yield scheduler
+    scheduler.shutdown(wait=False, cancel_pending=True)
+
+def blocker(scheduler, mailbox=''):
+    """Occupy one worker of a mailbox until the returned event is set."""
+    started, release = threading.Event(), threading.Event()
+
+    def block(service):
+        started.set()
+        release.wait(10)
+
+    scheduler.client(INTERACTIVE, mailbox=mailbox).submit(block)
+    assert started.wait(10)
+    return release
+
+def recorder(order):
+    return lambda service, name: order.append(name) or name
+
+def test_higher_classes_run_first(scheduler):
+    order = []
+    release = blocker(scheduler)
+    futures = [
+        scheduler.client(priority).submit(recorder(order), name)
+        for priority, name in [(BULK, "bulk"), (NORMAL, "normal"), (INTERACTIVE, "interactive")]
+    ]
+    assert scheduler.queue_depth() == 3 and scheduler.queue_depth(BULK) == 1
+    assert metrics.snapshot("scheduler.queue_depth")["gauges"]["scheduler.queue_depth.bulk"] == 1
+
+    release.set()
+    assert [future.result(10) for future in futures] == ["bulk", "normal", "interactive"]
+    assert order == ["interactive", "normal", "bulk"]
+    assert metrics.snapshot("scheduler.wait")["timings"]["scheduler.wait.bulk"]["count"] >= 1
+
+def test_users_take_turns_within_a_class(scheduler):
+    order = []
+    release = blocker(scheduler)
+    jobs = [("ann", 1), ("ann", 2), ("ann", 3), ("bob", 1), ("cat", 1)]
+    futures = [scheduler.client(NORMAL, user).submit(recorder(order), f"{user}{n}") for user, n in jobs]
+
+    release.set()
+    for future in futures:
+        future.result(10)
+    assert order == ["ann1", "bob1", "cat1", "ann2", "ann3"]
+
+def test_paged_jobs_yield_to_interactive_work_between_pages(scheduler):
+    order = []
+    first_page, release = threading.Event(), threading.Event()
+
+    def page(number):
+        def run(service):
+            if number == 1:
+                first_page.set()
+                release.wait(10)
+            order.append(f"page{number}")
+            return number
+        return run
+
+    preemptions = metrics.counter("scheduler.preemptions")
+    paged = scheduler.submit_paged(page(number) for number in range(1, 4))
+    assert first_page.wait(10)
+    interactive = scheduler.client(INTERACTIVE).submit(recorder(order), "interactive")
+
+    release.set()
+    assert paged.result(10) == [1, 2, 3]
+    assert interactive.result(10) == "interactive"
+    assert order == ["page1", "interactive", "page2", "page3"]
+    assert metrics.counter("scheduler.preemptions") == preemptions + 1
+
+def test_mailboxes_have_their_own_workers_and_limits(scheduler):
+    releases = [blocker(scheduler, 'shared'), blocker(scheduler, 'shared')]  # Both run at once (limit 2)
+    waiting = scheduler.client(NORMAL, mailbox='shared').submit(lambda service: service)
+    # The default mailbox is not held up by the busy shared one
+    assert scheduler.submit(lambda service: service).result(10) == "default"
+    assert not waiting.done()
+
+    for release in releases:
+        release.set()
+    assert waiting.result(10) == "shared"
+
+def test_errors_and_cancellation(scheduler):
+    def fail(service):
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        scheduler.submit(fail).result(10)
+    with pytest.raises(ValueError):
+        scheduler.submit_paged([lambda service: 1, fail, lambda service: 3]).result(10)
+
+    release = blocker(scheduler)
+    queued = scheduler.submit(lambda service: "never")
+    assert queued.cancel()
+    release.set()
+    assert scheduler.submit(lambda service: "after").result(10) == "after"
+
+def test_failing_page_source_fails_the_job_and_frees_the_mailbox(scheduler):
+    def pages():
+        yield lambda service: 1
+        raise ValueError("page source broke")
+
+    paged = scheduler.submit_paged(pages())
+    with pytest.raises(ValueError):
+        paged.result(10)
+    assert scheduler.submit(lambda service: "after").result(10) == "after"
+    assert all(box.running == 0 for box in scheduler._mailboxes.values())
+
+def test_shutdown_cancels_pending_jobs():
+    scheduler = FetchScheduler(service_factory=lambda mailbox: None)
+    release = blocker(scheduler)
+    queued = scheduler.submit(lambda service: "never")
+    scheduler.shutdown(wait=False, cancel_pending=True)
+    release.set()
+
+    with pytest.raises(CancelledError):
+        queued.result(10)
+    with pytest.raises(RuntimeError):
+        scheduler.submit(lambda service: None)
+
+def test_sharded_fetch_through_a_bulk_client():
+    start = datetime(2025, 1, 6, 9, 0)
+    application = FakeOutlookApplication([
+        make_appointment(f"Meeting {day}", start + timedelta(days=day), 30) for day in range(0, 60, 3)
+    ])
+    expected = OutlookService(application=application).get_meetings(datetime(2025, 1, 6), datetime(2025, 3, 6))
+    with FetchScheduler(service_factory=lambda mailbox: OutlookService(application=application)) as scheduler:
+        fetcher = ShardedFetcher(scheduler.client(BULK, user="rollup"), shard='week')
+        meetings = fetcher.fetch_meetings(datetime(2025, 1, 6), datetime(2025, 3, 6))
+
+    assert [(m.subject, m.start_time) for m in meetings] == [(m.subject, m.start_time) for m in expected]
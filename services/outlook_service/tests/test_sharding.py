@@ -0,0 +1,57 @@
+import pytest
+from datetime import datetime, timedelta
+
+from services.outlook_service.emulator import FakeOutlookApplication, make_appointment
+from services.outlook_service.executor import ComExecutor
+from services.outlook_service.projection import MEETING_READERS
+from services.outlook_service.service import OutlookService
+from services.outlook_service.sharding import ShardedFetcher, shard_range
+
+@pytest.fixture
+def application():
+    start = datetime(2025, 1, 1, 9, 0)
+    appointments = [
+        make_appointment(f"Meeting {day}", start + timedelta(days=day), 60)
+        for day in range(0, 120, 2)
+    ]
+    # Multi-day offsite straddling the January/February boundary
+    appointments.append(make_appointment("Offsite", datetime(2025, 1, 30, 9, 0), 3 * 24 * 60))
+    return FakeOutlookApplication(appointments)
+
+@pytest.fixture
+def executor(application):
+    executor = ComExecutor(service_factory=lambda: OutlookService(application=application), workers=3)
+    yield executor
+    executor.shutdown()
+
+def test_shard_range_months():
+    shards = shard_range(datetime(2025, 1, 15), datetime(2025, 4, 1))
+    assert shards == [
+        (datetime(2025, 1, 15), datetime(2025, 2, 1)),
+        (datetime(2025, 2, 1), datetime(2025, 3, 1)),
+        (datetime(2025, 3, 1), datetime(2025, 4, 1)),
+    ]
+
+def test_shard_range_weeks_and_timedelta():
+    weeks = shard_range(datetime(2025, 3, 5), datetime(2025, 3, 20), 'week')
+    assert [s for s, _ in weeks] == [datetime(2025, 3, 5), datetime(2025, 3, 10), datetime(2025, 3, 17)]
+    assert weeks[-1][1] == datetime(2025, 3, 20)
+    assert len(shard_range(datetime(2025, 3, 1), datetime(2025, 3, 2), timedelta(hours=6))) == 4
+    assert shard_range(datetime(2025, 3, 2), datetime(2025, 3, 1)) == []
+    with pytest.raises(ValueError):
+        shard_range(datetime(2025, 3, 1), datetime(2025, 3, 2), 'fortnight')
+
+@pytest.mark.parametrize("shard", ['week', 'month', timedelta(days=3)])
+def test_sharded_fetch_matches_single_restrict(application, executor, shard):
+    start, end = datetime(2025, 1, 10), datetime(2025, 4, 20)
+    fields = tuple(MEETING_READERS)
+    expected = OutlookService(application=application).get_meetings(start, end, fields)
+    meetings = ShardedFetcher(executor, shard=shard, fields=fields).fetch_meetings(start, end)
+
+    assert meetings == expected
+    assert [m.subject for m in meetings].count("Offsite") == 1
+    assert [m.start_time for m in meetings] == sorted(m.start_time for m in meetings)
+
+def test_meeting_started_before_range_is_kept(application, executor):
+    meetings = ShardedFetcher(executor, shard='week').fetch_meetings(datetime(2025, 2, 1), datetime(2025, 2, 10))
+    assert meetings[0].subject == "Offsite"
@@ -0,0 +1,212 @@
+# services/report_service/service.py
+"""
+Streaming meeting reports.
+
+Meetings flow from a start-time ordered source (Outlook's sorted, restricted
+items, the meeting cache or the archive) through chunked categorization into
+report rows, and from there into a writer or the terminal pager one row at a
+time. Writers keep only running totals, so memory stays constant however long
+the date range; the pager pulls rows only as far as the page being shown.
+"""
+import csv
+import html
+import itertools
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from prompt_toolkit.application import Application
+from prompt_toolkit.key_binding import KeyBindings
+from prompt_toolkit.layout import FormattedTextControl, Layout, Window
+
+from services.outlook_service.models import Meeting
+from services.categorization_service.services import CategorizationService, MeetingCategory, configured_categorizer
+
+REPORT_COLUMNS = ('date', 'start', 'end', 'category', 'subject', 'organizer', 'duration', 'rounded_duration')
+
+ReportRow = Tuple[str, str, str, str, str, str, int, int]
+
+def categorized(meetings: Iterable[Meeting], categorization: Optional[CategorizationService] = None,
+                batch_size: int = 1_000) -> Iterator[Tuple[Meeting, MeetingCategory]]:
+    """
+    Pair meetings with their categories, categorizing a chunk at a time so
+    batched categorizers stay vectorized without holding the whole range.
+    """
+    categorization = categorization or configured_categorizer()
+    meetings = iter(meetings)
+    while True:
+        batch = list(itertools.islice(meetings, batch_size))
+        if not batch:
+            return
+        yield from zip(batch, categorization.categorize_batch(batch))
+
+def report_rows(pairs: Iterable[Tuple[Meeting, MeetingCategory]]) -> Iterator[ReportRow]:
+    """One plain row per (meeting, category), in the order given."""
+    for meeting, category in pairs:
+        yield (
+            meeting.start_time.strftime('%Y-%m-%d'),
+            meeting.start_time.strftime('%H:%M'),
+            meeting.end_time.strftime('%H:%M'),
+            category.value,
+            meeting.subject,
+            meeting.organizer,
+            meeting.duration,
+            meeting.rounded_duration,
+        )
+
+class ReportTotals:
+    """Running totals of a report (rounded minutes per category)."""
+
+    def __init__(self):
+        self.count = 0
+        self.minutes: Dict[str, int] = {category.value: 0 for category in MeetingCategory}
+
+    def add(self, row: ReportRow) -> None:
+        self.count += 1
+        self.minutes[row[3]] += row[7]
+
+    @property
+    def total(self) -> int:
+        return sum(self.minutes.values())
+
+class ReportWriter:
+    """Writes report rows to a text stream as they arrive."""
+
+    def __init__(self, stream: IO[str], title: str = "Meeting Report"):
+        self.stream = stream
+        self.title = title
+
+    def write_header(self) -> None: ...
+
+    def write_row(self, row: ReportRow) -> None: ...
+
+    def write_footer(self, totals: ReportTotals) -> None: ...
+
+class CsvReportWriter(ReportWriter):
+    """One CSV line per meeting; totals are left to the spreadsheet."""
+
+    def __init__(self, stream: IO[str], title: str = "Meeting Report"):
+        super().__init__(stream, title)
+        self.writer = csv.writer(stream)
+
+    def write_header(self) -> None:
+        self.writer.writerow(REPORT_COLUMNS)
+
+    def write_row(self, row: ReportRow) -> None:
+        self.writer.writerow(row)
+
+class HtmlReportWriter(ReportWriter):
+    """A standalone HTML page with one table row per meeting and a totals table."""
+
+    def write_header(self) -> None:
+        title = html.escape(self.title)
+        headings = "".join(f"<th>{html.escape(column)}</th>" for column in REPORT_COLUMNS)
+        self.stream.write(
+            f"<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\"><title>{title}</title></head>\n"
+            f"<body><h1>{title}</h1>\n<table>\n<tr>{headings}</tr>\n"
+        )
+
+    def write_row(self, row: ReportRow) -> None:
+        cells = "".join(f"<td>{html.escape(str(value))}</td>" for value in row)
+        self.stream.write(f"<tr>{cells}</tr>\n")
+
+    def write_footer(self, totals: ReportTotals) -> None:
+        rows = "".join(
+            f"<tr><td>{html.escape(category)}</td><td>{minutes / 60:.1f}</td></tr>\n"
+            for category, minutes in totals.minutes.items() if minutes
+        )
+        self.stream.write(
+            f"</table>\n<h2>Totals ({totals.count} meetings)</h2>\n"
+            f"<table>\n<tr><th>category</th><th>hours</th></tr>\n{rows}"
+            f"<tr><td>Total</td><td>{totals.total / 60:.1f}</td></tr>\n</table>\n</body></html>\n"
+        )
+
+WRITERS = {'csv': CsvReportWriter, 'html': HtmlReportWriter}
+
+def render_report(rows: Iterable[ReportRow], writer: ReportWriter) -> ReportTotals:
+    """Stream rows into a writer and return the totals."""
+    totals = ReportTotals()
+    writer.write_header()
+    for row in rows:
+        writer.write_row(row)
+        totals.add(row)
+    writer.write_footer(totals)
+    return totals
+
+def format_row(row: ReportRow) -> str:
+    date, start, end, category, subject, organizer, _, rounded = row
+    return f"{date} {start}-{end}  {category:<13} {rounded:>4}m  {subject} ({organizer.split(',')[0]})"
+
+class ReportPager:
+    """
+    Pages over a row stream. Rows are pulled from the source only up to the
+    end of the page being shown; rows already pulled are kept as compact
+    tuples so earlier pages can be revisited.
+    """
+
+    def __init__(self, rows: Iterable[ReportRow]):
+        self._source = iter(rows)
+        self.rows: List[ReportRow] = []
+        self.exhausted = False
+        self.offset = 0
+
+    def _fill(self, count: int) -> None:
+        missing = count - len(self.rows)
+        if missing > 0 and not self.exhausted:
+            self.rows.extend(itertools.islice(self._source, missing))
+            self.exhausted = len(self.rows) < count
+
+    def page(self, size: int) -> List[ReportRow]:
+        """Rows of the current page (at most `size`)."""
+        self._fill(self.offset + size + 1)  # One ahead, to know whether there is a next page
+        return self.rows[self.offset:self.offset + size]
+
+    def has_next(self, size: int) -> bool:
+        self._fill(self.offset + size + 1)
+        return len(self.rows) > self.offset + size
+
+    def next_page(self, size: int) -> None:
+        if self.has_next(size):
+            self.offset += size
+
+    def previous_page(self, size: int) -> None:
+        self.offset = max(self.offset - size, 0)
+
+    def render(self, size: int, title: str = "") -> str:
+        """The text of the current page, with a status line."""
+        rows = self.page(size)
+        lines = [format_row(row) for row in rows] or ["No meetings in this range"]
+        position = f"rows {self.offset + 1}-{self.offset + len(rows)}" if rows else "rows 0-0"
+        count = f"of {len(self.rows)}" if self.exhausted else "of more"
+        status = f"{title}  {position} {count}"
+        return "\n".join(lines + ["", f"{status}  [n/space: next, p/b: previous, q: quit]"])
+
+def run_pager(pager: ReportPager, title: str = "Meeting Report", **application_options) -> None:
+    """Show a report in a full-screen terminal pager until the user quits."""
+    bindings = KeyBindings()
+    application: Application = None
+
+    def page_size() -> int:
+        return max(application.output.get_size().rows - 2, 1)
+
+    @bindings.add('n')
+    @bindings.add(' ')
+    @bindings.add('pagedown')
+    @bindings.add('down')
+    def _(event):
+        pager.next_page(page_size())
+
+    @bindings.add('p')
+    @bindings.add('b')
+    @bindings.add('pageup')
+    @bindings.add('up')
+    def _(event):
+        pager.previous_page(page_size())
+
+    @bindings.add('q')
+    @bindings.add('c-c')
+    def _(event):
+        event.app.exit()
+
+    control = FormattedTextControl(lambda: pager.render(page_size(), title))
+    application = Application(layout=Layout(Window(control)), key_bindings=bindings,
+                              full_screen=True, **application_options)
+    application.run()
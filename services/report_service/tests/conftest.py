@@ -0,0 +1,24 @@
+from datetime import datetime, timedelta
+import pytest
+from typing import List
+
+from services.outlook_service.models import Meeting
+
+@pytest.fixture
+def meetings() -> List[Meeting]:
+    """Fixture for a week of standups and a company meeting, in start order"""
+    meetings = []
+    for day in range(5):
+        start = datetime(2025, 3, 3 + day, 9, 0)
+        meetings.append(Meeting(
+            subject="Team standup", organizer="Doe, Jane",
+            start_time=start, end_time=start + timedelta(minutes=15), duration=15,
+            is_recurring=True, series_id="standup",
+        ))
+    start = datetime(2025, 3, 7, 15, 0)
+    meetings.append(Meeting(
+        subject="All Hands <Q1> & wins", organizer="CEO, The",
+        start_time=start, end_time=start + timedelta(minutes=60), duration=60,
+        is_recurring=False, series_id="N/A",
+    ))
+    return meetings
@@ -0,0 +1,97 @@
+import csv
+import io
+import itertools
+
+from prompt_toolkit.input import create_pipe_input
+from prompt_toolkit.output import DummyOutput
+
+from services.categorization_service.services import MeetingCategory
+from services.report_service.service import (
+    REPORT_COLUMNS, CsvReportWriter, HtmlReportWriter, ReportPager, categorized,
+    render_report, report_rows, run_pager
+)
+
+def test_categorized_keeps_order_across_batches(meetings):
+    pairs = list(categorized(meetings, batch_size=4))
+    assert [meeting for meeting, _ in pairs] == meetings
+    assert [category for _, category in pairs] == [MeetingCategory.STAFF_TEAM] * 5 + [MeetingCategory.COMPANY_WIDE]
+
+def test_categorized_is_lazy(meetings):
+    pulled = []
+    def source():
+        for meeting in meetings:
+            pulled.append(meeting)
+            yield meeting
+    first = next(categorized(source(), batch_size=2))
+    assert first[0] is meetings[0]
+    assert len(pulled) == 2
+
+def test_csv_report(meetings):
+    stream = io.StringIO()
+    totals = render_report(report_rows(categorized(meetings)), CsvReportWriter(stream))
+    lines = list(csv.reader(io.StringIO(stream.getvalue())))
+    assert tuple(lines[0]) == REPORT_COLUMNS
+    assert lines[1] == ['2025-03-03', '09:00', '09:15', 'Team/Staff', 'Team standup', 'Doe, Jane', '15', '30']
+    assert len(lines) == 7
+    assert totals.count == 6
+    assert totals.minutes[MeetingCategory.STAFF_TEAM.value] == 150
+    assert totals.minutes[MeetingCategory.COMPANY_WIDE.value] == 60
+    assert totals.total == 210
+
+def test_html_report_escapes_text(meetings):
+    stream = io.StringIO()
+    render_report(report_rows(categorized(meetings)), HtmlReportWriter(stream, "March <week>"))
+    page = stream.getvalue()
+    assert "<title>March &lt;week&gt;</title>" in page
+    assert "All Hands &lt;Q1&gt; &amp; wins" in page
+    assert page.count("<tr><td>2025-03-") == 6
+    assert "<tr><td>Total</td><td>3.5</td></tr>" in page
+    assert page.rstrip().endswith("</html>")
+
+def test_pager_pulls_rows_only_up_to_the_page(meetings):
+    rows = report_rows(categorized(meetings, batch_size=1))
+    pulled = []
+    def source():
+        for row in rows:
+            pulled.append(row)
+            yield row
+    pager = ReportPager(source())
+    assert len(pager.page(2)) == 2
+    assert len(pulled) == 3  # The page and one row ahead
+    assert pager.has_next(2)
+
+    pager.next_page(2)
+    pager.next_page(2)
+    assert [row[0] for row in pager.page(2)] == ['2025-03-07', '2025-03-07']
+    assert not pager.has_next(2)
+    pager.next_page(2)
+    assert pager.offset == 4
+    assert "rows 5-6 of 6" in pager.render(2)
+
+    pager.previous_page(2)
+    pager.previous_page(10)
+    assert pager.offset == 0
+
+def test_pager_on_an_empty_report():
+    pager = ReportPager(iter(()))
+    assert pager.page(10) == []
+    assert not pager.has_next(10)
+    assert "No meetings in this range" in pager.render(10)
+
+def test_pager_with_a_long_report():
+    rows = itertools.repeat(('2025-03-03', '09:00', '09:30', 'Team/Staff', 'Sync', 'Doe, Jane', 30, 30))
+    pager = ReportPager(rows)  # An endless source: only the pages visited are read
+    for _ in range(3):
+        pager.next_page(50)
+    assert pager.offset == 150
+    assert "rows 151-200 of more" in pager.render(50)
+    assert len(pager.rows) == 201
+
+def test_run_pager_pages_and_quits(meetings):
+    pager = ReportPager(report_rows(categorized(meetings * 20)))
+    with create_pipe_input() as pipe:
+        pipe.send_text("nnpq")
+        run_pager(pager, input=pipe, output=DummyOutput())
+    page_size = DummyOutput().get_size().rows - 2
+    assert pager.offset == page_size
+    assert len(pager.rows) < 120  # Pages beyond the ones visited were never read
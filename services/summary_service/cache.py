@@ -0,0 +1,186 @@
+# services/summary_service/cache.py
+import os
+import pickle
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Protocol, Tuple
+
+from services.outlook_service.models import Meeting
+from services.outlook_service.projection import SEARCH_FIELDS
+from services.categorization_service.services import CategorizationService, MeetingCategory, configured_categorizer
+
+MeetingKey = Tuple[str, str, datetime]
+
+DATA_DIR = Path.home() / ".outlook_automation"
+CACHE_PATH = DATA_DIR / "meeting_cache.pkl"
+
+def write_pickle(path: Path, value: Any) -> None:
+    """Pickle a value to a file, replacing it atomically so readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(path.name + ".tmp")
+    with open(temporary, 'wb') as f:
+        pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temporary, path)
+
+def meeting_key(meeting: Meeting) -> MeetingKey:
+    """Key identifying a single meeting occurrence."""
+    return (meeting.organizer, meeting.subject, meeting.start_time.replace(tzinfo=None))
+
+# Fields whose changes reach derived views; Outlook categories are labels a
+# learning categorizer (see `CategorizationService.learn`) trains on
+SIGNATURE_FIELDS = SEARCH_FIELDS + ('categories',)
+
+def meeting_signature(meeting: Meeting) -> tuple:
+    """The projected summary, search and label fields; derived views only change when these do."""
+    # Meetings fetched for summaries only may not have a location or categories loaded
+    return tuple(getattr(meeting, name, None) for name in SIGNATURE_FIELDS)
+
+class MeetingListener(Protocol):
+    """A derived view kept in sync with the meeting cache."""
+
+    def meeting_added(self, meeting: Meeting, category: MeetingCategory) -> None: ...
+
+    def meeting_removed(self, meeting: Meeting, category: MeetingCategory) -> None: ...
+
+class MeetingCache:
+    """
+    In-memory store of fetched meetings and their categories.
+
+    Listeners (rollups, indexes, ...) are notified of every addition and
+    removal, so they can be updated incrementally instead of being rebuilt
+    from the full meeting list.
+    """
+
+    def __init__(self, categorization: Optional[CategorizationService] = None):
+        self.categorization = categorization or configured_categorizer()
+        self.entries: Dict[MeetingKey, Tuple[Meeting, MeetingCategory]] = {}
+        self.listeners: List[MeetingListener] = []
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def add_listener(self, listener: MeetingListener) -> None:
+        """Register a listener and replay the meetings already cached."""
+        self.listeners.append(listener)
+        for meeting, category in self.entries.values():
+            listener.meeting_added(meeting, category)
+
+    def upsert(self, meeting: Meeting, category: Optional[MeetingCategory] = None) -> bool:
+        """
+        Add or replace a meeting.
+        Returns True if the cache changed.
+        """
+        key = meeting_key(meeting)
+        existing = self.entries.get(key)
+        if existing is not None and meeting_signature(existing[0]) == meeting_signature(meeting):
+            return False
+        if existing is not None:
+            self._remove(key)
+
+        self._add(key, meeting, category or self.categorization.categorize_meeting(meeting))
+        return True
+
+    def _add(self, key: MeetingKey, meeting: Meeting, category: MeetingCategory) -> None:
+        self.entries[key] = (meeting, category)
+        for listener in self.listeners:
+            listener.meeting_added(meeting, category)
+
+    def remove(self, meeting: Meeting) -> bool:
+        """
+        Remove a meeting.
+        Returns True if the meeting was cached.
+        """
+        key = meeting_key(meeting)
+        if key not in self.entries:
+            return False
+        self._remove(key)
+        return True
+
+    def _remove(self, key: MeetingKey) -> None:
+        meeting, category = self.entries.pop(key)
+        for listener in self.listeners:
+            listener.meeting_removed(meeting, category)
+
+    def recategorize(self) -> int:
+        """
+        Categorize every cached meeting again, e.g. after the categorization
+        rules changed. Listeners see each meeting whose category changed as
+        removed and added again.
+
+        Returns:
+            Number of meetings whose category changed
+        """
+        keys = list(self.entries)
+        categories = self.categorization.categorize_batch([self.entries[key][0] for key in keys])
+        changed = 0
+        for key, category in zip(keys, categories):
+            meeting, previous = self.entries[key]
+            if category != previous:
+                self._remove(key)
+                self._add(key, meeting, category)
+                changed += 1
+        return changed
+
+    def learn(self, meetings: Iterable[Meeting] = ()) -> int:
+        """
+        Let the categorizer learn from the cached meetings and `meetings` (e.g.
+        ones about to be cached), see `CategorizationService.learn`, and
+        recategorize the cache if it changed.
+
+        Returns:
+            Number of cached meetings whose category changed
+        """
+        examples = {key: meeting for key, (meeting, _) in self.entries.items()}
+        examples.update((meeting_key(meeting), meeting) for meeting in meetings)
+        if not self.categorization.learn(list(examples.values())):
+            return 0
+        return self.recategorize()
+
+    def refresh(self, meetings: Iterable[Meeting], start: datetime, end: datetime) -> int:
+        """
+        Replace the cached meetings starting within [start, end] with a freshly fetched list.
+        Only meetings that were added, changed or removed are passed to listeners.
+
+        Returns:
+            Number of cache changes
+        """
+        start, end = start.replace(tzinfo=None), end.replace(tzinfo=None)
+        fresh = {meeting_key(m): m for m in meetings}
+        stale = [
+            key for key in self.entries
+            if start <= key[2] <= end and key not in fresh
+        ]
+        for key in stale:
+            self._remove(key)
+        return len(stale) + sum(self.upsert(m) for m in fresh.values())
+
+    def items(self, start: Optional[datetime] = None,
+              end: Optional[datetime] = None) -> List[Tuple[Meeting, MeetingCategory]]:
+        """Cached (meeting, category) pairs starting within [start, end], sorted by start time."""
+        selected = [
+            (key[2], entry) for key, entry in self.entries.items()
+            if (start is None or key[2] >= start.replace(tzinfo=None))
+            and (end is None or key[2] <= end.replace(tzinfo=None))
+        ]
+        return [entry for _, entry in sorted(selected, key=lambda pair: pair[0])]
+
+    def meetings(self, start: Optional[datetime] = None, end: Optional[datetime] = None) -> List[Meeting]:
+        """Cached meetings starting within [start, end], sorted by start time."""
+        return [meeting for meeting, _ in self.items(start, end)]
+
+    def save(self, path: Path = CACHE_PATH) -> None:
+        """
+        Persist the cached meetings and categories.
+        Meetings still attached to Outlook have their remaining fields read first.
+        """
+        write_pickle(path, self.entries)
+
+    @classmethod
+    def load(cls, path: Path = CACHE_PATH,
+             categorization: Optional[CategorizationService] = None) -> 'MeetingCache':
+        """Load a cache saved with `save`; an empty cache if there is none."""
+        cache = cls(categorization)
+        if Path(path).exists():
+            with open(path, 'rb') as f:
+                cache.entries = pickle.load(f)
+        return cache
@@ -0,0 +1,213 @@
+# services/summary_service/clustering.py
+"""
+Near-duplicate subject clustering.
+
+Many meetings are recreated every week instead of being set up as a
+recurring series ("Eng Sync 10/3", "Eng sync - Oct 10"), so they have no
+ConversationID in common and no `is_recurring` flag. `SubjectClusterer`
+groups such meetings by subject:
+
+1. Subjects are normalized: lower-cased, reply/forward prefixes, dates,
+   times, weekday names and numbers removed, punctuation collapsed.
+2. Each distinct normalized subject gets a MinHash signature over its
+   character trigrams, computed for all subjects at once with NumPy.
+3. Signatures are cut into bands and each band is hashed; subjects sharing
+   a band hash (and the organizer) land in the same bucket. Each subject is
+   compared with the first subject of its buckets, and pairs whose
+   signatures agree on at least `threshold` of their values are merged
+   with union-find.
+
+Buckets are formed with `np.unique` per band and only bucket-mates are
+compared, so the cost is roughly linear in the number of distinct subjects
+rather than quadratic.
+
+Cluster ids are the cluster's smallest normalized subject and the organizer,
+e.g. "eng sync (Doe, Jane)", so they are stable across runs and readable in
+reports. `series_keys` turns them into series keys that can be used wherever
+a ConversationID-based series id is.
+"""
+import re
+import zlib
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from services.outlook_service.models import Meeting
+
+SHINGLE = 3
+MERSENNE = (1 << 31) - 1
+
+_PREFIXES = re.compile(r'^\s*((re|fw|fwd|updated|canceled|cancelled|accepted|tentative|declined|copy)\s*:\s*)+')
+_MONTHS = (r'(jan(uary)?|feb(ruary)?|mar(ch)?|apr(il)?|may|june?|july?|aug(ust)?|sept?(ember)?'
+           r'|oct(ober)?|nov(ember)?|dec(ember)?)\.?')
+_NOISE = re.compile('|'.join([
+    r'\b\d{1,4}[/.-]\d{1,2}([/.-]\d{2,4})?\b',                         # 10/3, 2025-10-03, 3.10.25
+    rf'\b{_MONTHS}(\s+\d{{1,2}}(st|nd|rd|th)?)?(,?\s+\d{{4}})?\b',     # Oct 10, October 10th, 2025
+    r'\b\d{1,2}(:\d{2})?\s*(am|pm)\b|\b\d{1,2}:\d{2}\b',               # 10am, 9:30
+    r'\b(mon(day)?|tue(s(day)?)?|wed(nesday)?|thu(r(s(day)?)?)?|fri(day)?|sat(urday)?|sun(day)?)\b',
+    r'\b(week|wk|q)\s*\d+\b',                                          # week 41, Q3
+    r'\b\d+(st|nd|rd|th)?\b',
+]))
+_PUNCTUATION = re.compile(r'[\W_]+')
+
+def normalize_subject(subject: str) -> str:
+    """The part of a subject that stays the same between occurrences of a recreated meeting."""
+    text = _PREFIXES.sub('', (subject or '').lower())
+    normalized = _PUNCTUATION.sub(' ', _NOISE.sub(' ', text)).strip()
+    # A subject that is nothing but a date still has to match only itself
+    return normalized or _PUNCTUATION.sub(' ', text).strip()
+
+def shingles(text: str) -> Set[str]:
+    """A text's character trigrams (padded, so short words count)."""
+    padded = f" {text} "
+    return {padded[i:i + SHINGLE] for i in range(max(len(padded) - SHINGLE + 1, 1))}
+
+class _UnionFind:
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, index: int) -> int:
+        root = index
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[index] != root:
+            self.parent[index], index = root, self.parent[index]
+        return root
+
+    def union(self, a: int, b: int) -> None:
+        a, b = self.find(a), self.find(b)
+        if a != b:
+            self.parent[max(a, b)] = min(a, b)
+
+class SubjectClusterer:
+    """MinHash/LSH clustering of meeting subjects (see module docstring)."""
+
+    def __init__(self, num_perm: int = 64, bands: int = 16, threshold: float = 0.5,
+                 by_organizer: bool = True, seed: int = 1):
+        """
+        Args:
+            num_perm: MinHash values per signature
+            bands: LSH bands (num_perm must divide into them); with 16 bands of 4
+                rows, subjects of Jaccard similarity 0.5 share a band ~65% of the
+                time and of 0.8 over 99% of the time
+            threshold: Fraction of equal signature values needed to merge candidates
+            by_organizer: Only cluster subjects of the same organizer
+            seed: Seed of the MinHash permutations
+        """
+        if num_perm % bands:
+            raise ValueError(f"{num_perm} MinHash values cannot be split into {bands} bands")
+        self.bands = bands
+        self.threshold = threshold
+        self.by_organizer = by_organizer
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, MERSENNE, num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, MERSENNE, num_perm, dtype=np.uint64)
+        self._mix = rng.integers(1, 1 << 63, num_perm // bands + 1, dtype=np.uint64) | np.uint64(1)
+        self._signatures: Dict[str, np.ndarray] = {}
+        self._shingle_hashes: Dict[str, int] = {}  # Subjects share most of their trigrams
+
+    def signatures(self, texts: Sequence[str], chunk: int = 16_384) -> np.ndarray:
+        """MinHash signatures of normalized subjects, as (len(texts), num_perm) uint64."""
+        missing = [text for text in dict.fromkeys(texts) if text not in self._signatures]
+        hashed = [[self._shingle_hash(gram) for gram in shingles(text)] for text in missing]
+        start = 0
+        while start < len(missing):
+            # Enough subjects for about `chunk` shingles, to bound the (num_perm, shingles) array
+            end, count = start, 0
+            while end < len(missing) and (end == start or count + len(hashed[end]) <= chunk):
+                count += len(hashed[end])
+                end += 1
+            values = np.fromiter((h for hashes in hashed[start:end] for h in hashes), dtype=np.uint64, count=count)
+            offsets = np.cumsum([0] + [len(hashes) for hashes in hashed[start:end - 1]])
+            permuted = (self._a[:, np.newaxis] * values + self._b[:, np.newaxis]) % MERSENNE
+            for text, signature in zip(missing[start:end], np.minimum.reduceat(permuted, offsets, axis=1).T):
+                self._signatures[text] = signature
+            start = end
+        return np.array([self._signatures[text] for text in texts], dtype=np.uint64).reshape(len(texts), len(self._a))
+
+    def _shingle_hash(self, gram: str) -> int:
+        value = self._shingle_hashes.get(gram)
+        if value is None:
+            value = self._shingle_hashes[gram] = zlib.crc32(gram.encode())
+        return value
+
+    def _candidates(self, signatures: np.ndarray, owners: Sequence[str]) -> List[Tuple[int, int]]:
+        """
+        Pairs of rows sharing an LSH bucket (a band and an owner) whose signatures
+        agree on at least `threshold` of their values. Each row is paired with the
+        first row of its bucket.
+        """
+        count = len(signatures)
+        if count == 0:
+            return []
+        _, owner_codes = np.unique(np.array(owners, dtype=object), return_inverse=True)
+        # One 64-bit bucket key per band: a wrapping multiply-add of its rows and the owner
+        bands = signatures.reshape(count, self.bands, -1)
+        keys = (bands * self._mix[1:]).sum(axis=2) + owner_codes.reshape(-1, 1).astype(np.uint64) * self._mix[0]
+        rows = np.arange(count)
+        pairs = []
+        for band in range(self.bands):
+            _, first, inverse = np.unique(keys[:, band], return_index=True, return_inverse=True)
+            firsts = first[inverse]
+            pairs.append(np.stack([firsts[firsts != rows], rows[firsts != rows]], axis=1))
+        pairs = np.unique(np.concatenate(pairs), axis=0)
+        agreement = (signatures[pairs[:, 0]] == signatures[pairs[:, 1]]).mean(axis=1)
+        return [(int(a), int(b)) for a, b in pairs[agreement >= self.threshold]]
+
+    def cluster(self, subjects: Iterable[str], organizers: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        Cluster ids of subjects, in the order given.
+
+        Args:
+            subjects: Meeting subjects
+            organizers: The organizer of each subject (ignored unless by_organizer)
+        """
+        normalized = [normalize_subject(subject) for subject in subjects]
+        owners = list(organizers) if organizers is not None and self.by_organizer else [''] * len(normalized)
+        # Distinct (organizer, subject) pairs, sorted so the result doesn't depend on input order
+        distinct = sorted(set(zip(owners, normalized)))
+        index = {pair: number for number, pair in enumerate(distinct)}
+        signatures = self.signatures([text for _, text in distinct])
+
+        groups = _UnionFind(len(distinct))
+        for first, member in self._candidates(signatures, [owner for owner, _ in distinct]):
+            groups.union(first, member)
+
+        # Roots are the smallest member, i.e. the first in sorted order
+        def cluster_id(number: int) -> str:
+            owner, text = distinct[groups.find(number)]
+            return f"{text} ({owner})" if owner else text
+
+        return [cluster_id(index[pair]) for pair in zip(owners, normalized)]
+
+    def cluster_meetings(self, meetings: Sequence[Meeting]) -> List[str]:
+        """Cluster ids of meetings' subjects."""
+        return self.cluster([m.subject for m in meetings], [m.organizer for m in meetings])
+
+def series_key(meeting: Meeting) -> Optional[str]:
+    """Key of a recurring meeting's series, or None for single meetings."""
+    if not getattr(meeting, 'is_recurring', False):
+        return None
+    series_id = getattr(meeting, 'series_id', None)
+    return series_id if series_id and series_id != 'N/A' else meeting.subject
+
+def series_keys(meetings: Sequence[Meeting], clusterer: Optional[SubjectClusterer] = None) -> List[Optional[str]]:
+    """
+    The series each meeting belongs to, or None for one-off meetings.
+
+    Recurring meetings are keyed by their series id (their subject when Outlook
+    reported none). Other meetings are keyed by their subject cluster when the
+    cluster has meetings on at least two different days, i.e. the meeting was
+    recreated rather than set up as a recurring series.
+    """
+    clusters = (clusterer or SubjectClusterer()).cluster_meetings(meetings)
+    days = defaultdict(set)
+    for meeting, cluster in zip(meetings, clusters):
+        days[cluster].add(meeting.start_time.date())
+
+    return [
+        series_key(meeting) if getattr(meeting, 'is_recurring', False)
+        else cluster if len(days[cluster]) > 1 else None
+        for meeting, cluster in zip(meetings, clusters)
+    ]
@@ -0,0 +1,127 @@
+# services/summary_service/dedup.py
+"""
+Cross-calendar deduplication of meetings.
+
+When several mailboxes or shared calendars are aggregated, a meeting shows
+up once per attendee whose calendar was read. Each copy is reduced to a
+64-bit fingerprint:
+
+- of its GlobalAppointmentID (Outlook's name for the MAPI GlobalObjectID),
+  which every attendee's copy shares, plus the occurrence start, since all
+  occurrences of a recurring series share the ID;
+- otherwise of its organizer, start time and subject.
+
+Duplicates collapse in a single O(n) pass over a dict of integer
+fingerprints; no string keys are kept. The number of copies seen for each
+meeting is kept alongside, so both meeting-hours (each meeting once) and
+person-hours (once per attendee) can be reported.
+"""
+import hashlib
+from array import array
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Dict, Hashable, Iterable, List, Optional
+
+from services.outlook_service.models import Meeting
+
+def _instant(value: datetime) -> str:
+    # Aware times are compared in UTC, so copies read in different time zones match
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.isoformat(timespec='minutes')
+
+def meeting_fingerprint(meeting: Meeting) -> int:
+    """64-bit fingerprint shared by every attendee's copy of a meeting occurrence."""
+    global_id = getattr(meeting, 'global_id', None)
+    if global_id:
+        parts = ('id', global_id, _instant(meeting.start_time))
+    else:
+        parts = ('fields', meeting.organizer.strip().casefold(), _instant(meeting.start_time),
+                 meeting.subject.strip().casefold())
+    digest = hashlib.blake2b('\x1f'.join(parts).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, 'little')
+
+class MeetingDeduplicator:
+    """
+    Collapses copies of the same meeting seen in several calendars.
+
+    The first copy of each meeting is kept; later copies only raise its
+    attendee count (and the per-attendee totals when the calendar owner is
+    given).
+    """
+
+    def __init__(self):
+        self.slots: Dict[int, int] = {}      # fingerprint -> position in meetings
+        self.meetings: List[Meeting] = []
+        self.copies = array('I')             # copies seen per unique meeting
+        self.attendee_minutes: Counter = Counter()
+        self.seen = 0
+
+    def __len__(self) -> int:
+        return len(self.meetings)
+
+    def add(self, meeting: Meeting, attendee: Optional[Hashable] = None) -> bool:
+        """
+        Add one calendar's copy of a meeting.
+
+        Args:
+            meeting: The meeting as read from one calendar
+            attendee: Owner of that calendar, to keep per-attendee totals
+
+        Returns:
+            True if this is the first copy of the meeting
+        """
+        self.seen += 1
+        if attendee is not None:
+            self.attendee_minutes[attendee] += meeting.duration
+        fingerprint = meeting_fingerprint(meeting)
+        slot = self.slots.get(fingerprint)
+        if slot is not None:
+            self.copies[slot] += 1
+            return False
+        self.slots[fingerprint] = len(self.meetings)
+        self.meetings.append(meeting)
+        self.copies.append(1)
+        return True
+
+    def consume(self, meetings: Iterable[Meeting], attendee: Optional[Hashable] = None) -> None:
+        """Add every meeting of one calendar."""
+        for meeting in meetings:
+            self.add(meeting, attendee)
+
+    def attendees(self, meeting: Meeting) -> int:
+        """Number of calendars a meeting was seen in (0 if never added)."""
+        slot = self.slots.get(meeting_fingerprint(meeting))
+        return 0 if slot is None else self.copies[slot]
+
+    @property
+    def meeting_minutes(self) -> int:
+        """Total minutes counting each meeting once."""
+        return sum(meeting.duration for meeting in self.meetings)
+
+    @property
+    def person_minutes(self) -> int:
+        """Total minutes counting each meeting once per attendee calendar it was seen in."""
+        return sum(meeting.duration * copies for meeting, copies in zip(self.meetings, self.copies))
+
+    def summary(self) -> Dict:
+        """
+        Totals using only plain types.
+
+        Returns:
+            Dictionary with copies seen, unique meetings, duplicates removed,
+            meeting_hours and person_hours
+        """
+        return {
+            "copies": self.seen,
+            "unique": len(self.meetings),
+            "duplicates": self.seen - len(self.meetings),
+            "meeting_hours": self.meeting_minutes / 60,
+            "person_hours": self.person_minutes / 60,
+        }
+
+def deduplicate(meetings: Iterable[Meeting]) -> List[Meeting]:
+    """The first copy of each distinct meeting, in input order."""
+    deduplicator = MeetingDeduplicator()
+    deduplicator.consume(meetings)
+    return deduplicator.meetings
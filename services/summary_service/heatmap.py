@@ -0,0 +1,152 @@
+# services/summary_service/heatmap.py
+"""
+Weekday x half-hour heatmaps of meeting time.
+
+Every meeting is turned into two events on a minute-of-week axis, +1 where
+it starts and -1 where it ends, and the events of all meetings (and all
+categories) are accumulated with one `np.bincount`. A cumulative sum along
+the axis then gives the number of meetings in progress at every minute of
+the week, which is summed into 7 x 48 half-hour slots. The cost is linear in
+the number of meetings plus a fixed 10,080 minutes per category, however
+long the meetings or the date range.
+
+Meetings crossing Sunday midnight wrap around to Monday, and the whole weeks
+of meetings lasting a week or more are added to every slot.
+"""
+import csv
+from typing import IO, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from services.outlook_service.models import Meeting
+from services.categorization_service.services import MeetingCategory
+from services.summary_service.service import CATEGORIES, CATEGORY_CODES, WEEKDAYS
+from shared.timezones import epoch_minutes
+
+SLOT_MINUTES = 30
+SLOTS_PER_DAY = 1440 // SLOT_MINUTES
+WEEK_MINUTES = 7 * 1440
+SLOT_LABELS = [f"{slot * SLOT_MINUTES // 60:02d}:{slot * SLOT_MINUTES % 60:02d}" for slot in range(SLOTS_PER_DAY)]
+SHADES = " ░▒▓█"
+
+def slot_minutes(minutes: np.ndarray, durations: np.ndarray, codes: np.ndarray,
+                 weights: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Meeting minutes falling in each weekday and half-hour slot, per category.
+
+    Args:
+        minutes: Wall-clock start times in minutes since the epoch
+        durations: Durations in minutes (negative ones count as 0)
+        codes: Category codes (indices into CATEGORIES)
+        weights: Weight of each meeting, e.g. its attendee count for person-minutes
+            (1 by default)
+
+    Returns:
+        float64 array of shape (categories, 7, SLOTS_PER_DAY), Monday first
+    """
+    codes = np.asarray(codes, dtype=np.int64)
+    weights = np.ones(len(codes)) if weights is None else np.asarray(weights, dtype=np.float64)
+    weeks, rest = np.divmod(np.clip(durations, 0, None).astype(np.int64), WEEK_MINUTES)
+    start = (np.asarray(minutes, dtype=np.int64) + 3 * 1440) % WEEK_MINUTES  # 1970-01-01 was a Thursday
+
+    # Two weeks of axis so a meeting running past Sunday ends inside it; folded back below
+    span = 2 * WEEK_MINUTES + 1
+    events = np.bincount(
+        np.concatenate([codes * span + start, codes * span + start + rest]),
+        weights=np.concatenate([weights, -weights]),
+        minlength=len(CATEGORIES) * span,
+    ).reshape(len(CATEGORIES), span)
+    in_progress = np.cumsum(events, axis=1)[:, :2 * WEEK_MINUTES]
+    in_progress = in_progress[:, :WEEK_MINUTES] + in_progress[:, WEEK_MINUTES:]
+    in_progress += np.bincount(codes, weights=weeks * weights, minlength=len(CATEGORIES))[:, np.newaxis]
+    return in_progress.reshape(len(CATEGORIES), 7, SLOTS_PER_DAY, SLOT_MINUTES).sum(axis=3)
+
+class MeetingHeatmap:
+    """
+    Accumulated weekday x half-hour meeting minutes per category, over one
+    or many calendars. Calendars are kept as columns until the heatmap is
+    read, then accumulated together with a single `slot_minutes` pass.
+    """
+
+    def __init__(self):
+        self._minutes = np.zeros((len(CATEGORIES), 7, SLOTS_PER_DAY))
+        # Columns of calendars added since the last read, accumulated together in one pass
+        self._pending: List[Tuple[np.ndarray, ...]] = []
+        self.calendars = 0
+        self.meetings = 0
+
+    def add_arrays(self, minutes: np.ndarray, durations: np.ndarray, codes: np.ndarray,
+                   weights: Optional[np.ndarray] = None) -> None:
+        """Add one calendar's meetings as columns (see `slot_minutes`)."""
+        weights = np.ones(len(codes)) if weights is None else weights
+        self._pending.append((np.asarray(minutes), np.asarray(durations), np.asarray(codes), np.asarray(weights)))
+        self.calendars += 1
+        self.meetings += len(codes)
+
+    @property
+    def minutes(self) -> np.ndarray:
+        """Meeting minutes as (categories, 7, SLOTS_PER_DAY), Monday first."""
+        if self._pending:
+            columns = [np.concatenate(column) for column in zip(*self._pending)]
+            self._pending = []
+            self._minutes += slot_minutes(*columns)
+        return self._minutes
+
+    def add(self, meetings: Sequence[Meeting], categories: Sequence[MeetingCategory]) -> None:
+        """Add one calendar's meetings with their categories."""
+        count = len(meetings)
+        self.add_arrays(
+            np.fromiter((epoch_minutes(m.start_time) for m in meetings), dtype=np.int64, count=count),
+            np.fromiter((m.duration for m in meetings), dtype=np.int64, count=count),
+            np.fromiter((CATEGORY_CODES[c] for c in categories), dtype=np.int64, count=count),
+        )
+
+    def grid(self, category: Optional[MeetingCategory] = None) -> np.ndarray:
+        """The (7, SLOTS_PER_DAY) minutes of one category, or of all of them."""
+        if category is None:
+            return self.minutes.sum(axis=0)
+        return self.minutes[CATEGORY_CODES[category]]
+
+    def busiest(self, n: int = 5, category: Optional[MeetingCategory] = None) -> List[tuple]:
+        """The n slots with the most meeting minutes, as (weekday, slot label, minutes)."""
+        grid = self.grid(category)
+        order = np.argsort(-grid, axis=None, kind='stable')[:n]  # Earlier slots first among ties
+        return [
+            (WEEKDAYS[index // SLOTS_PER_DAY], SLOT_LABELS[index % SLOTS_PER_DAY], float(grid.flat[index]))
+            for index in order if grid.flat[index] > 0
+        ]
+
+    def render(self, category: Optional[MeetingCategory] = None, first_slot: int = 0,
+               last_slot: int = SLOTS_PER_DAY) -> List[str]:
+        """
+        Text heatmap lines: one row per weekday, one character per half hour,
+        shaded relative to the busiest slot shown.
+        """
+        grid = self.grid(category)[:, first_slot:last_slot]
+        peak = grid.max()
+        levels = np.zeros(grid.shape, dtype=np.int64) if peak <= 0 else np.ceil(grid / peak * (len(SHADES) - 1))
+        # Every other hour labelled, one character per slot: "08  10  12"
+        hours = "".join(
+            SLOT_LABELS[slot - slot % 4][slot % 4] if slot % 4 < 2 else " "
+            for slot in range(first_slot, last_slot)
+        )
+        lines = [f"     {hours}"]
+        for weekday, row in zip(WEEKDAYS, levels.astype(np.int64)):
+            lines.append(f"{weekday[:3]}  " + "".join(SHADES[level] for level in row))
+        return lines
+
+    def write_csv(self, stream: IO[str], categories: Optional[Iterable[MeetingCategory]] = None) -> int:
+        """
+        Write one row per category and weekday with the minutes of every slot,
+        followed by the totals over all categories. Returns the rows written.
+        """
+        writer = csv.writer(stream)
+        writer.writerow(['category', 'weekday', *SLOT_LABELS])
+        rows = 0
+        selected = [c for c in (categories or CATEGORIES) if self.grid(c).any()] + [None]
+        for category in selected:
+            for weekday, row in zip(WEEKDAYS, self.grid(category)):
+                writer.writerow([category.value if category else 'Total', weekday,
+                                 *(f"{minutes:.12g}" for minutes in row)])
+                rows += 1
+        return rows
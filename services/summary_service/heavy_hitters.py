@@ -0,0 +1,257 @@
+# services/summary_service/heavy_hitters.py
+"""
+Bounded-memory top-k analytics over meeting streams.
+
+`HeavyHitters` tracks the heaviest keys of a weighted stream with the
+Space-Saving algorithm, backed by a Count-Min sketch that tightens the
+estimates. Memory is fixed by `capacity` and the sketch size, no matter how
+many rows or distinct keys are seen:
+
+- while at most `capacity` distinct keys have been seen, results are exact;
+- afterwards every reported weight overestimates the true weight by at
+  most `error` (itself at most total weight / capacity), and any key whose
+  true weight exceeds total weight / capacity is guaranteed to be reported.
+"""
+import hashlib
+import heapq
+import itertools
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from services.outlook_service.models import Meeting
+from services.categorization_service.services import MeetingCategory
+from services.summary_service.clustering import SubjectClusterer, series_key, series_keys
+
+@lru_cache(maxsize=65536)
+def _key_digest(key: Hashable, depth: int) -> bytes:
+    # Stable across processes (unlike hash()), so sketches can be compared and merged
+    return hashlib.blake2b(repr(key).encode(), digest_size=8 * depth).digest()
+
+class CountMinSketch:
+    """
+    Count-Min sketch of non-negative weights. Estimates never undercount and
+    overcount by at most e / width of the total weight with probability
+    1 - exp(-depth).
+    """
+
+    def __init__(self, width: int = 2048, depth: int = 4):
+        self.width = width
+        self.depth = depth
+        self.table = np.zeros((depth, width), dtype=np.int64)
+        self._rows = np.arange(depth)
+
+    def _columns(self, keys: Sequence[Hashable]) -> np.ndarray:
+        """Column of each key in each row, shape (depth, len(keys))."""
+        digests = b"".join(_key_digest(key, self.depth) for key in keys)
+        hashes = np.frombuffer(digests, dtype=np.uint64).reshape(len(keys), self.depth)
+        return (hashes % np.uint64(self.width)).astype(np.int64).T
+
+    def add(self, key: Hashable, weight: int = 1) -> None:
+        """Add weight to a key (negative weight removes previously added weight)."""
+        self.table[self._rows, self._columns([key])[:, 0]] += weight
+
+    def add_many(self, keys: Sequence[Hashable], weights: Sequence[int]) -> None:
+        """Add weights to many keys in one vectorized update."""
+        if not keys:
+            return
+        np.add.at(self.table, (self._rows[:, None], self._columns(keys)), np.asarray(weights, dtype=np.int64))
+
+    def estimate(self, key: Hashable) -> int:
+        return int(self.table[self._rows, self._columns([key])[:, 0]].min())
+
+class SpaceSaving:
+    """
+    Weighted Space-Saving summary tracking at most `capacity` keys.
+
+    When a new key arrives and the summary is full, the key with the smallest
+    count is replaced and the newcomer inherits that count as its error.
+    """
+
+    def __init__(self, capacity: int = 256):
+        self.capacity = capacity
+        self.counts: Dict[Hashable, int] = {}
+        self.errors: Dict[Hashable, int] = {}
+        self.evictions = 0
+        self._heap: List[Tuple[int, int, Hashable]] = []  # (count, tiebreak, key), may be stale
+        self._order = itertools.count()
+
+    def _push(self, key: Hashable) -> None:
+        heapq.heappush(self._heap, (self.counts[key], next(self._order), key))
+        if len(self._heap) > 4 * self.capacity + 64:
+            # Drop stale entries
+            self._heap = [(count, next(self._order), key) for key, count in self.counts.items()]
+            heapq.heapify(self._heap)
+
+    def _pop_min(self) -> Hashable:
+        while True:
+            count, _, key = heapq.heappop(self._heap)
+            if self.counts.get(key) == count:
+                return key
+
+    def add(self, key: Hashable, weight: int = 1) -> None:
+        if key in self.counts:
+            self.counts[key] += weight
+        elif len(self.counts) < self.capacity:
+            self.counts[key] = weight
+            self.errors[key] = 0
+        else:
+            evicted = self._pop_min()
+            floor = self.counts.pop(evicted)
+            del self.errors[evicted]
+            self.evictions += 1
+            self.counts[key] = floor + weight
+            self.errors[key] = floor
+        self._push(key)
+
+    def add_counts(self, totals: Dict[Hashable, int]) -> None:
+        """
+        Add exact per-key totals of a batch by merging it into the summary.
+
+        Keys already tracked gain their exact batch weight; new keys start from
+        the current minimum count (the most an untracked key can have weighed
+        so far), which becomes their error. The heaviest `capacity` keys are
+        kept, so the summary's guarantees are the same as adding row by row.
+        """
+        floor = min(self.counts.values()) if len(self.counts) >= self.capacity else 0
+        for key, weight in totals.items():
+            if key in self.counts:
+                self.counts[key] += weight
+            else:
+                self.counts[key] = floor + weight
+                self.errors[key] = floor
+        if len(self.counts) > self.capacity:
+            kept = heapq.nlargest(self.capacity, self.counts.items(), key=lambda item: item[1])
+            self.evictions += len(self.counts) - self.capacity
+            self.counts = dict(kept)
+            self.errors = {key: self.errors[key] for key in self.counts}
+        self._heap = [(count, next(self._order), key) for key, count in self.counts.items()]
+        heapq.heapify(self._heap)
+
+    def remove(self, key: Hashable, weight: int = 1) -> None:
+        """Remove previously added weight from a tracked key."""
+        if key in self.counts:
+            self.counts[key] -= weight
+            self._push(key)
+
+    def top(self, n: int) -> List[Tuple[Hashable, int, int]]:
+        """The n largest (key, count, error) entries."""
+        return heapq.nlargest(n, ((key, count, self.errors[key]) for key, count in self.counts.items()),
+                              key=lambda entry: entry[1])
+
+@dataclass
+class HeavyHitter:
+    """A reported key; its true weight lies within [weight - error, weight]."""
+    key: Hashable
+    weight: int
+    error: int
+
+class HeavyHitters:
+    """Space-Saving candidates with Count-Min estimates."""
+
+    def __init__(self, capacity: int = 256, width: int = 2048, depth: int = 4):
+        self.candidates = SpaceSaving(capacity)
+        self.sketch = CountMinSketch(width, depth)
+        self.total = 0
+
+    @property
+    def exact(self) -> bool:
+        """Whether every reported weight is exact (no key has been evicted yet)."""
+        return self.candidates.evictions == 0
+
+    @property
+    def error_bound(self) -> float:
+        """Upper bound on the overestimate of any reported weight."""
+        return 0.0 if self.exact else self.total / self.candidates.capacity
+
+    def add(self, key: Hashable, weight: int = 1) -> None:
+        self.candidates.add(key, weight)
+        self.sketch.add(key, weight)
+        self.total += weight
+
+    def add_batch(self, keys: Sequence[Hashable], weights: Optional[Sequence[int]] = None) -> None:
+        """
+        Add many rows at once. Rows are aggregated per key first, so memory is
+        bounded by the batch's distinct keys and each key is processed once.
+        """
+        totals: Dict[Hashable, int] = defaultdict(int)
+        for key, weight in zip(keys, itertools.repeat(1) if weights is None else weights):
+            totals[key] += weight
+        totals = {key: int(weight) for key, weight in totals.items()}
+        self.candidates.add_counts(totals)
+        self.sketch.add_many(list(totals), list(totals.values()))
+        self.total += sum(totals.values())
+
+    def remove(self, key: Hashable, weight: int = 1) -> None:
+        self.candidates.remove(key, weight)
+        self.sketch.add(key, -weight)
+        self.total -= weight
+
+    def top(self, n: int) -> List[HeavyHitter]:
+        """The n heaviest keys, heaviest first."""
+        hitters = []
+        for key, count, error in self.candidates.top(self.candidates.capacity):
+            weight = min(count, self.sketch.estimate(key)) if error else count
+            hitters.append(HeavyHitter(key, weight, max(weight - (count - error), 0)))
+        hitters.sort(key=lambda hitter: hitter.weight, reverse=True)
+        return hitters[:n]
+
+class MeetingHeavyHitters:
+    """
+    Top organizers and subjects by meeting minutes, and most expensive
+    recurring series by attendee minutes (duration x attendees, summed over
+    occurrences).
+
+    Feed it with `consume` or register it on a `MeetingCache` to follow the
+    cached meetings. With a `SubjectClusterer`, `consume` also counts meetings
+    recreated under near-identical subjects as series (see `series_keys`);
+    cache updates only see Outlook's own series.
+    """
+
+    def __init__(self, capacity: int = 256, width: int = 2048, depth: int = 4,
+                 clusterer: Optional[SubjectClusterer] = None):
+        self.organizers = HeavyHitters(capacity, width, depth)
+        self.subjects = HeavyHitters(capacity, width, depth)
+        self.series = HeavyHitters(capacity, width, depth)
+        self.clusterer = clusterer
+
+    def _update(self, meeting: Meeting, sign: int, series: Optional[str]) -> None:
+        update = HeavyHitters.add if sign > 0 else HeavyHitters.remove
+        update(self.organizers, meeting.organizer, meeting.duration)
+        update(self.subjects, meeting.subject, meeting.duration)
+        if series is not None:
+            attendees = getattr(meeting, 'attendee_count', None) or 1
+            update(self.series, series, meeting.duration * attendees)
+
+    def meeting_added(self, meeting: Meeting, category: Optional[MeetingCategory] = None) -> None:
+        self._update(meeting, 1, series_key(meeting))
+
+    def meeting_removed(self, meeting: Meeting, category: Optional[MeetingCategory] = None) -> None:
+        self._update(meeting, -1, series_key(meeting))
+
+    def consume(self, meetings: Iterable[Meeting]) -> None:
+        if self.clusterer is None:
+            for meeting in meetings:
+                self._update(meeting, 1, series_key(meeting))
+            return
+        meetings = list(meetings)
+        for meeting, series in zip(meetings, series_keys(meetings, self.clusterer)):
+            self._update(meeting, 1, series)
+
+    def report(self, n: int = 20) -> Dict:
+        """
+        Top entries per dimension using only plain types.
+
+        Returns:
+            Dictionary with organizers, subjects (minutes) and series (attendee
+            minutes), each a list of (key, weight, error) tuples, and `exact`
+        """
+        return {
+            "organizers": [(h.key, h.weight, h.error) for h in self.organizers.top(n)],
+            "subjects": [(h.key, h.weight, h.error) for h in self.subjects.top(n)],
+            "series": [(h.key, h.weight, h.error) for h in self.series.top(n)],
+            "exact": self.organizers.exact and self.subjects.exact and self.series.exact,
+        }
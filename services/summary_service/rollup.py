@@ -0,0 +1,142 @@
+# services/summary_service/rollup.py
+from datetime import date, timedelta
+from typing import Dict, Optional
+
+import numpy as np
+
+from services.outlook_service.models import Meeting
+from services.categorization_service.services import MeetingCategory
+from services.summary_service.service import CATEGORIES, CATEGORY_CODES
+
+class DailyRollup:
+    """
+    Materialized per-day x per-category table of rounded meeting minutes.
+
+    Cumulative prefix sums over the day axis are maintained lazily: updates
+    only touch one cell and mark the prefix as dirty from that day onwards,
+    and the next query recomputes the dirty suffix. Any date-range total is
+    then the difference of two prefix rows, i.e. O(1) per window.
+
+    Register it on a `MeetingCache` with `cache.add_listener(rollup)` to keep
+    it in sync with fetched meetings.
+    """
+
+    def __init__(self, origin: Optional[date] = None, days: int = 0):
+        self.origin = origin
+        self.table = np.zeros((days, len(CATEGORIES)), dtype=np.int64)
+        self._prefix = np.zeros((days + 1, len(CATEGORIES)), dtype=np.int64)
+        self._dirty_from: Optional[int] = None
+
+    @property
+    def days(self) -> int:
+        return self.table.shape[0]
+
+    def _ensure_day(self, day: date) -> int:
+        """Grow the table to cover a day and return its row index."""
+        if self.origin is None:
+            self.origin = day
+        index = (day - self.origin).days
+        if index < 0:
+            grow = max(-index, self.days, 1)
+            self.table = np.vstack([np.zeros((grow, len(CATEGORIES)), dtype=np.int64), self.table])
+            self.origin -= timedelta(days=grow)
+            self._dirty_from = 0
+            index += grow
+        elif index >= self.days:
+            grow = max(index - self.days + 1, self.days)
+            self.table = np.vstack([self.table, np.zeros((grow, len(CATEGORIES)), dtype=np.int64)])
+            self._mark_dirty(self.days - grow)
+        return index
+
+    def _mark_dirty(self, index: int) -> None:
+        if self._dirty_from is None or index < self._dirty_from:
+            self._dirty_from = index
+
+    def add(self, day: date, category: MeetingCategory, minutes: int) -> None:
+        """Add minutes to a day/category cell (negative minutes subtract)."""
+        index = self._ensure_day(day)
+        self.table[index, CATEGORY_CODES[category]] += minutes
+        self._mark_dirty(index)
+
+    def meeting_added(self, meeting: Meeting, category: MeetingCategory) -> None:
+        self.add(meeting.start_time.date(), category, meeting.rounded_duration)
+
+    def meeting_removed(self, meeting: Meeting, category: MeetingCategory) -> None:
+        self.add(meeting.start_time.date(), category, -meeting.rounded_duration)
+
+    @property
+    def prefix(self) -> np.ndarray:
+        """Cumulative minutes; row i holds the totals for all days before day i."""
+        if self._dirty_from is not None:
+            start = self._dirty_from
+            if self._prefix.shape[0] != self.days + 1:
+                self._prefix = np.zeros((self.days + 1, len(CATEGORIES)), dtype=np.int64)
+                start = 0
+            np.cumsum(self.table[start:], axis=0, out=self._prefix[start + 1:])
+            self._prefix[start + 1:] += self._prefix[start]
+            self._dirty_from = None
+        return self._prefix
+
+    def _indices(self, days: np.ndarray) -> np.ndarray:
+        """Convert day offsets from the origin into clipped prefix row indices."""
+        return np.clip(days, 0, self.days)
+
+    def range_total(self, start: date, end: date) -> Dict[MeetingCategory, int]:
+        """Total minutes per category for days in [start, end)."""
+        if self.origin is None:
+            return {category: 0 for category in CATEGORIES}
+        lo, hi = self._indices(np.array([(start - self.origin).days, (end - self.origin).days]))
+        totals = self.prefix[hi] - self.prefix[lo]
+        return {category: int(totals[code]) for code, category in enumerate(CATEGORIES)}
+
+    def window_totals(self, start: date, count: int, window_days: int = 7,
+                      step_days: Optional[int] = None) -> np.ndarray:
+        """
+        Totals for a series of windows.
+
+        Args:
+            start: First day of the first window
+            count: Number of windows
+            window_days: Length of each window in days
+            step_days: Distance between window starts (defaults to window_days)
+
+        Returns:
+            Array of shape (count, categories) with minutes per window and category
+        """
+        if self.origin is None:
+            return np.zeros((count, len(CATEGORIES)), dtype=np.int64)
+        step_days = step_days or window_days
+        starts = (start - self.origin).days + step_days * np.arange(count)
+        prefix = self.prefix
+        return prefix[self._indices(starts + window_days)] - prefix[self._indices(starts)]
+
+    def rolling_average(self, start: date, count: int, window_days: int = 28,
+                        step_days: int = 7) -> np.ndarray:
+        """
+        Trailing rolling average per step for a series of steps.
+        With the defaults this is the rolling 4-week average of weekly minutes.
+        Row i covers the window ending on the last day of step i.
+        """
+        trailing_start = start - timedelta(days=window_days - step_days)
+        totals = self.window_totals(trailing_start, count, window_days, step_days)
+        return totals / (window_days / step_days)
+
+    def weekly_trends(self, start_of_week: date, weeks: int) -> Dict:
+        """
+        Weekly minutes per category with a rolling 4-week average of the weekly total,
+        using only plain types so the result can be sent between processes.
+
+        Returns:
+            Dictionary with weeks (week start dates), categories (category values
+            with any minutes), weekly (minutes per week, one column per category)
+            and rolling (4-week average of total minutes per week)
+        """
+        weekly = self.window_totals(start_of_week, weeks)
+        rolling = self.rolling_average(start_of_week, weeks)
+        codes = [code for code in range(len(CATEGORIES)) if weekly[:, code].any()]
+        return {
+            "weeks": [start_of_week + timedelta(weeks=week) for week in range(weeks)],
+            "categories": [CATEGORIES[code].value for code in codes],
+            "weekly": [[int(weekly[week, code]) for code in codes] for week in range(weeks)],
+            "rolling": [float(rolling[week].sum()) for week in range(weeks)],
+        }
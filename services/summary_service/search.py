@@ -0,0 +1,287 @@
+# services/summary_service/search.py
+"""
+Inverted full-text index over cached meetings.
+
+Meetings are tokenized from the text categorization matches keywords
+against (subject and organizer, see `categorization_service.meeting_text`)
+plus the location, case-insensitively and on word boundaries, as the
+keyword patterns do.
+
+Query syntax:
+    roadmap review               both words (AND)
+    roadmap OR backlog           either clause; AND binds tighter than OR
+    "sprint planning"            phrase (consecutive words within one field)
+    organizer:smith              word or phrase within a single field
+    location:"room 4"
+
+Register the index on a `MeetingCache` with `index.attach(cache)` to keep it
+in sync; it can be saved and loaded next to the cache.
+"""
+import pickle
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from services.outlook_service.models import Meeting
+from services.categorization_service.services import MeetingCategory, TEXT_FIELDS
+from services.summary_service.cache import DATA_DIR, MeetingCache, MeetingKey, meeting_key, write_pickle
+
+INDEX_PATH = DATA_DIR / "search_index.pkl"
+
+INDEX_FIELDS = TEXT_FIELDS + ('location',)
+
+WORD = re.compile(r'\w+')
+QUERY_TERM = re.compile(r'(?:(\w+):)?(?:"([^"]*)"|(\S+))')
+
+DocTokens = Tuple[Tuple[str, ...], ...]  # Tokens of each INDEX_FIELDS field
+
+def tokenize(text: Optional[str]) -> Tuple[str, ...]:
+    """Lower-cased words of a text."""
+    return tuple(WORD.findall(text.casefold())) if text else ()
+
+def document_tokens(meeting: Meeting) -> DocTokens:
+    # Detached meetings fetched without a location simply aren't searchable by it
+    return tuple(tokenize(getattr(meeting, name, None)) for name in INDEX_FIELDS)
+
+def contains_phrase(tokens: Sequence[str], phrase: Sequence[str]) -> bool:
+    """Whether `phrase` occurs as consecutive tokens."""
+    first, length = phrase[0], len(phrase)
+    return any(
+        tokens[i] == first and tuple(tokens[i:i + length]) == tuple(phrase)
+        for i in range(len(tokens) - length + 1)
+    )
+
+class PostingList:
+    """
+    Sorted document ids, stored as variable-length encoded gaps.
+    Ids are assigned in increasing order, so appending never re-encodes.
+    """
+    __slots__ = ('data', 'last', 'count')
+
+    def __init__(self):
+        self.data = bytearray()
+        self.last = -1
+        self.count = 0
+
+    def append(self, doc_id: int) -> None:
+        gap = doc_id - self.last
+        while gap >= 0x80:
+            self.data.append((gap & 0x7F) | 0x80)
+            gap >>= 7
+        self.data.append(gap)
+        self.last = doc_id
+        self.count += 1
+
+    def __iter__(self) -> Iterator[int]:
+        doc_id, gap, shift = -1, 0, 0
+        for byte in self.data:
+            gap |= (byte & 0x7F) << shift
+            if byte & 0x80:
+                shift += 7
+                continue
+            doc_id += gap
+            yield doc_id
+            gap, shift = 0, 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def to_array(self) -> np.ndarray:
+        return np.fromiter(self, dtype=np.int64, count=self.count)
+
+class Term:
+    """A query word or phrase, optionally restricted to one field."""
+
+    def __init__(self, tokens: Tuple[str, ...], field: Optional[str] = None):
+        self.tokens = tokens
+        self.field = field
+
+    @property
+    def needs_check(self) -> bool:
+        """Postings alone only prove that every word occurs somewhere in the document."""
+        return len(self.tokens) > 1 or self.field is not None
+
+    def matches(self, doc: DocTokens) -> bool:
+        fields = [doc[INDEX_FIELDS.index(self.field)]] if self.field else doc
+        return any(contains_phrase(tokens, self.tokens) for tokens in fields)
+
+def parse_query(query: str) -> List[List[Term]]:
+    """
+    Parse a query into OR-ed clauses of AND-ed terms.
+
+    Raises:
+        ValueError: If the query contains no searchable words
+    """
+    clauses: List[List[Term]] = [[]]
+    for field, phrase, word in QUERY_TERM.findall(query):
+        if word == 'OR' and not field:
+            clauses.append([])
+            continue
+        if field and field.lower() not in INDEX_FIELDS:
+            # Not a field, e.g. "1:1"
+            word, phrase, field = f"{field}:{word or phrase}", "", ""
+        tokens = tokenize(phrase or word)
+        if tokens:
+            clauses[-1].append(Term(tokens, field.lower() or None))
+    clauses = [clause for clause in clauses if clause]
+    if not clauses:
+        raise ValueError(f"Nothing to search for in {query!r}")
+    return clauses
+
+class MeetingIndex:
+    """
+    Inverted index from words to the cached meetings containing them.
+
+    Each indexed meeting gets a document id; ids grow monotonically, so
+    posting lists stay sorted and compressible. A changed meeting is
+    re-added under a new id and its old id is left as a tombstone until
+    more than half the ids are dead, when the index is compacted.
+
+    Start times are kept in an array indexed by document id, so date-range
+    filters and ordering of the results are vectorized.
+    """
+
+    def __init__(self):
+        self.postings: Dict[str, PostingList] = {}
+        self.doc_ids: Dict[MeetingKey, int] = {}
+        self.keys: List[Optional[MeetingKey]] = []
+        self.docs: List[Optional[DocTokens]] = []
+        self.starts = np.zeros(0, dtype='datetime64[m]')
+        self.live = np.zeros(0, dtype=bool)
+
+    def __len__(self) -> int:
+        return len(self.doc_ids)
+
+    def attach(self, cache: MeetingCache) -> None:
+        """
+        Keep the index in sync with a cache. Documents for meetings no longer
+        in the cache are dropped; cached meetings already indexed with the same
+        text are not re-indexed.
+        """
+        for key in [k for k in self.doc_ids if k not in cache.entries]:
+            self._remove(key)
+        cache.add_listener(self)
+
+    def meeting_added(self, meeting: Meeting, category: MeetingCategory) -> None:
+        key = meeting_key(meeting)
+        doc = document_tokens(meeting)
+        existing = self.doc_ids.get(key)
+        if existing is not None:
+            if self.docs[existing] == doc:
+                return
+            self._remove(key)
+        self._add(key, doc)
+
+    def meeting_removed(self, meeting: Meeting, category: MeetingCategory) -> None:
+        key = meeting_key(meeting)
+        if key in self.doc_ids:
+            self._remove(key)
+
+    def _add(self, key: MeetingKey, doc: DocTokens) -> None:
+        doc_id = len(self.keys)
+        if doc_id == len(self.starts):
+            capacity = max(16, 2 * doc_id)
+            self.starts = np.concatenate([self.starts, np.zeros(capacity - doc_id, dtype=self.starts.dtype)])
+            self.live = np.concatenate([self.live, np.zeros(capacity - doc_id, dtype=bool)])
+        self.keys.append(key)
+        self.docs.append(doc)
+        self.doc_ids[key] = doc_id
+        self.starts[doc_id] = np.datetime64(key[2], 'm')
+        self.live[doc_id] = True
+        for token in sorted({token for tokens in doc for token in tokens}):
+            postings = self.postings.get(token)
+            if postings is None:
+                postings = self.postings[token] = PostingList()
+            postings.append(doc_id)
+
+    def _remove(self, key: MeetingKey) -> None:
+        doc_id = self.doc_ids.pop(key)
+        self.keys[doc_id] = None
+        self.docs[doc_id] = None
+        self.live[doc_id] = False
+        if len(self.keys) > 64 and len(self.doc_ids) < len(self.keys) // 2:
+            self.compact()
+
+    def compact(self) -> None:
+        """Re-number the live documents, dropping tombstones from every posting list."""
+        compacted = MeetingIndex()
+        for key, doc in zip(self.keys, self.docs):
+            if key is not None:
+                compacted._add(key, doc)
+        self.__dict__.update(compacted.__dict__)
+
+    def _candidates(self, clause: List[Term]) -> np.ndarray:
+        """Document ids containing every word of the clause, rarest word first."""
+        tokens = {token for term in clause for token in term.tokens}
+        if any(token not in self.postings for token in tokens):
+            return np.zeros(0, dtype=np.int64)
+        result = None
+        for token in sorted(tokens, key=lambda t: len(self.postings[t])):
+            ids = self.postings[token].to_array()
+            result = ids if result is None else np.intersect1d(result, ids, assume_unique=True)
+            if not len(result):
+                break
+        return result
+
+    def search(self, query: str, start: Optional[datetime] = None,
+               end: Optional[datetime] = None) -> List[MeetingKey]:
+        """
+        Keys of the meetings matching a query and starting within [start, end],
+        sorted by start time.
+
+        Raises:
+            ValueError: If the query contains no searchable words
+        """
+        matches = np.zeros(0, dtype=np.int64)
+        for clause in parse_query(query):
+            ids = self._candidates(clause)
+            ids = ids[self.live[ids]]
+            checks = [term for term in clause if term.needs_check]
+            if checks:
+                ids = np.array(
+                    [i for i in ids if all(term.matches(self.docs[i]) for term in checks)],
+                    dtype=np.int64,
+                )
+            matches = np.union1d(matches, ids)
+
+        starts = self.starts[matches]
+        mask = np.ones(len(matches), dtype=bool)
+        if start is not None:
+            mask &= starts >= np.datetime64(start.replace(tzinfo=None), 'm')
+        if end is not None:
+            mask &= starts <= np.datetime64(end.replace(tzinfo=None), 'm')
+        matches = matches[mask]
+        order = np.argsort(starts[mask], kind='stable')
+        return [self.keys[i] for i in matches[order]]
+
+    def save(self, path: Path = INDEX_PATH) -> None:
+        """Persist the index (typically next to the meeting cache)."""
+        write_pickle(path, self)
+
+    @classmethod
+    def load(cls, path: Path = INDEX_PATH) -> 'MeetingIndex':
+        """Load an index saved with `save`; an empty index if there is none."""
+        if not Path(path).exists():
+            return cls()
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+
+def search_meetings(cache: MeetingCache, index: MeetingIndex, query: str,
+                    start: Optional[datetime] = None,
+                    end: Optional[datetime] = None) -> List[Tuple[Meeting, MeetingCategory]]:
+    """Cached (meeting, category) pairs matching a query, sorted by start time."""
+    return [cache.entries[key] for key in index.search(query, start, end)]
+
+def search_result(meeting: Meeting, category: MeetingCategory) -> Dict:
+    """A search hit as plain values, so it can be sent between processes."""
+    return {
+        "subject": meeting.subject,
+        "organizer": meeting.organizer,
+        "location": getattr(meeting, 'location', None),
+        "start_time": meeting.start_time.replace(tzinfo=None),
+        "duration": meeting.duration,
+        "category": category.value,
+    }
@@ -0,0 +1,187 @@
+# services/summary_service/service.py
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from services.outlook_service.models import AttendeeCounts, Meeting
+from services.categorization_service.services import CategorizationService, MeetingCategory, configured_categorizer
+from shared.timezones import epoch_minutes
+
+WEEKDAYS = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+CATEGORIES: List[MeetingCategory] = list(MeetingCategory)
+CATEGORY_CODES: Dict[MeetingCategory, int] = {category: code for code, category in enumerate(CATEGORIES)}
+def round_durations(durations: np.ndarray) -> np.ndarray:
+    """Round an array of durations (in minutes) up to the nearest 30m interval."""
+    return ((durations + 29) // 30) * 30
+
+# Attendee columns of a frame built with attendees, in the order of `attendee_arrays`
+ATTENDEE_COLUMNS = ('required', 'optional', 'accepted')
+
+def attendee_arrays(attendees: Sequence[AttendeeCounts]) -> np.ndarray:
+    """Required, optional and accepted attendee counts as an (n, 3) int32 array."""
+    return np.array([(a.required, a.optional, a.accepted) for a in attendees], dtype=np.int32).reshape(-1, 3)
+
+def frame_from_arrays(minutes: np.ndarray, durations: np.ndarray, codes: np.ndarray,
+                      attendees: Optional[np.ndarray] = None) -> pd.DataFrame:
+    """
+    Build a summary frame from columns.
+
+    Args:
+        minutes: Wall-clock start times in minutes since the epoch
+        durations: Durations in minutes
+        codes: Category codes (indices into CATEGORIES)
+        attendees: Attendee counts (see `attendee_arrays`), added as the
+            ATTENDEE_COLUMNS columns
+    """
+    columns = {
+        'start': minutes.astype('datetime64[m]').astype('datetime64[ns]'),
+        'weekday': ((minutes // 1440 + 3) % 7).astype(np.int8),  # 1970-01-01 was a Thursday
+        'duration': durations,
+        'rounded_duration': round_durations(durations),
+        'category': pd.Categorical.from_codes(codes, categories=[c.value for c in CATEGORIES]),
+    }
+    if attendees is not None:
+        columns.update(zip(ATTENDEE_COLUMNS, attendees.T))
+    return pd.DataFrame(columns)
+
+class SummaryService:
+    """
+    Columnar summarization of meetings.
+
+    Meetings are converted into a DataFrame once; durations, weekday buckets
+    and category totals are then computed with vectorized operations instead
+    of per-meeting Python loops.
+    """
+
+    def __init__(self, categorization: Optional[CategorizationService] = None):
+        self.categorization = categorization or configured_categorizer()
+
+    def build_frame(self, meetings: Sequence[Meeting],
+                    categories: Optional[Sequence[MeetingCategory]] = None,
+                    attendees: Optional[Sequence[AttendeeCounts]] = None) -> pd.DataFrame:
+        """
+        Convert meetings into a DataFrame with one row per meeting.
+
+        Args:
+            meetings: Meetings to convert
+            categories: Pre-computed category for each meeting; when omitted the
+                meetings are categorized with the categorization service
+            attendees: Attendee counts for each meeting (e.g. from
+                `AttendeeCache`), to compute person-hours from
+
+        Returns:
+            DataFrame with start, weekday, duration, rounded_duration and category
+            columns, plus required, optional and accepted when attendees are given
+        """
+        if categories is None:
+            categories = self.categorization.categorize_batch(meetings)
+
+        count = len(meetings)
+        minutes = np.fromiter((epoch_minutes(m.start_time) for m in meetings), dtype=np.int64, count=count)
+        durations = np.fromiter((m.duration for m in meetings), dtype=np.int64, count=count)
+        codes = np.fromiter((CATEGORY_CODES[c] for c in categories), dtype=np.int8, count=count)
+        return frame_from_arrays(minutes, durations, codes,
+                                 None if attendees is None else attendee_arrays(attendees))
+
+    def build_frame_from_categorized(self, categorized_meetings: Dict[MeetingCategory, List[Meeting]]) -> pd.DataFrame:
+        """Convert the output of `CategorizationService.categorize_meetings` into a DataFrame."""
+        meetings = [m for cat_meetings in categorized_meetings.values() for m in cat_meetings]
+        categories = [cat for cat, cat_meetings in categorized_meetings.items() for _ in cat_meetings]
+        return self.build_frame(meetings, categories)
+
+    def get_category_summary(self, categorized_meetings: Dict[MeetingCategory, List[Meeting]]) -> Dict[MeetingCategory, float]:
+        """
+        Vectorized equivalent of `CategorizationService.get_category_summary`.
+        Returns a dictionary mapping categories to total hours.
+        """
+        frame = self.build_frame_from_categorized(categorized_meetings)
+        totals = frame.groupby('category', observed=False)['rounded_duration'].sum()
+        return {
+            category: int(totals[category.value]) / 60  # Convert to hours
+            for category in categorized_meetings
+        }
+
+    def get_daily_category_totals(self, frame: pd.DataFrame) -> Dict[str, Dict[str, int]]:
+        """
+        Total rounded minutes per weekday and category.
+        Only categories with at least one meeting on a day are included.
+        """
+        totals = frame.groupby(['weekday', 'category'], observed=True)['rounded_duration'].sum()
+        daily: Dict[str, Dict[str, int]] = {}
+        for (weekday, category), minutes in totals.items():
+            daily.setdefault(WEEKDAYS[weekday], {})[category] = int(minutes)
+        return daily
+
+    def get_week_category_totals(self, frame: pd.DataFrame) -> Dict[MeetingCategory, int]:
+        """Total rounded minutes per category, for categories with at least one meeting."""
+        totals = frame.groupby('category', observed=True)['rounded_duration'].sum()
+        return {MeetingCategory(category): int(minutes) for category, minutes in totals.items()}
+
+    def get_yearly_category_totals(self, frame: pd.DataFrame) -> Dict[int, Dict[str, int]]:
+        """Rounded minutes per year and category, for multi-year reports."""
+        totals = frame.groupby([frame['start'].dt.year, 'category'], observed=True)['rounded_duration'].sum()
+        yearly: Dict[int, Dict[str, int]] = {}
+        for (year, category), minutes in totals.items():
+            yearly.setdefault(int(year), {})[category] = int(minutes)
+        return yearly
+
+    def get_category_person_hours(self, frame: pd.DataFrame) -> Dict[MeetingCategory, Dict[str, float]]:
+        """
+        Person-hours (actual duration x attendees) per category, for categories
+        with at least one meeting in a frame built with attendees.
+
+        Returns:
+            {category: {"people", "required", "optional", "accepted": hours}},
+            where "people" counts every invitee (at least the organizer)
+
+        Raises:
+            ValueError: If the frame was built without attendees
+        """
+        if not set(ATTENDEE_COLUMNS) <= set(frame.columns):
+            raise ValueError("Frame was built without attendee counts")
+        durations = frame['duration'].to_numpy()
+        counts = frame[list(ATTENDEE_COLUMNS)].to_numpy(dtype=np.int64)
+        people = np.maximum(counts[:, 0] + counts[:, 1], 1)
+        minutes = pd.DataFrame(
+            np.column_stack([people, counts]) * durations[:, None],
+            columns=('people',) + ATTENDEE_COLUMNS,
+        )
+        totals = minutes.groupby(frame['category'].to_numpy(), sort=False).sum()
+        return {
+            MeetingCategory(category): {name: int(value) / 60 for name, value in row.items()}
+            for category, row in totals.iterrows()
+        }
+
+    def get_total_minutes(self, frame: pd.DataFrame) -> int:
+        """Total rounded minutes across all meetings in the frame."""
+        return int(frame['rounded_duration'].to_numpy().sum())
+
+    def summarize(self, frame: pd.DataFrame) -> Dict:
+        """
+        Daily and week totals for a frame, using only plain types so the result
+        can be sent between processes.
+
+        Returns:
+            Dictionary with daily ({weekday: {category: minutes}}), week
+            ({category: minutes}), total (minutes) and count
+        """
+        return {
+            "daily": self.get_daily_category_totals(frame),
+            "week": {category.value: minutes for category, minutes in self.get_week_category_totals(frame).items()},
+            "total": self.get_total_minutes(frame),
+            "count": len(frame),
+        }
+
+    def calculate_total_meeting_hours(self, events: Sequence) -> float:
+        """
+        Vectorized equivalent of `OutlookService.calculate_total_meeting_hours`.
+
+        Args:
+            events: List of CalendarEvent objects
+
+        Returns:
+            Total hours as float
+        """
+        durations = np.fromiter((event.duration for event in events), dtype=np.int64, count=len(events))
+        return int(durations.sum()) / 60.0  # Convert to hours
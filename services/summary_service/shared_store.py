@@ -0,0 +1,246 @@
+# services/summary_service/shared_store.py
+"""
+Day x category x user meeting minutes shared between processes.
+
+One refresher (the agent) keeps the aggregates up to date and publishes
+them into a memory-mapped file; any number of reader processes (API
+workers, CLI invocations) map the same file and read the arrays in place,
+without a copy per process and without touching Outlook.
+
+File layout (all integers little-endian int64):
+
+    header   magic, generation, origin day, days, categories, user capacity,
+             user count, day capacity
+    users    user capacity x NAME_BYTES of UTF-8 names, NUL padded
+    minutes  day capacity x categories x user capacity
+
+Writes are guarded by a seqlock: the writer makes the generation odd, writes,
+then makes it even again. A reader runs its computation over the mapped
+arrays and keeps the result only if the generation was even before and
+unchanged after; otherwise it retries. There must be a single writer.
+"""
+import mmap
+import os
+import time
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, TypeVar
+
+import numpy as np
+
+from services.categorization_service.services import MeetingCategory
+from services.summary_service.cache import DATA_DIR
+from services.summary_service.service import CATEGORIES
+from shared.timezones import EPOCH_ORDINAL, day_start
+
+AGGREGATE_PATH = DATA_DIR / "aggregates.bin"
+
+MAGIC = 0x31474741414F  # "OAAGG1"
+NAME_BYTES = 64
+DEFAULT_DAYS = 3 * 366
+DEFAULT_USERS = 16
+
+# Header slots
+_MAGIC, _GENERATION, _ORIGIN, _DAYS, _CATEGORIES, _USER_CAPACITY, _USER_COUNT, _DAY_CAPACITY = range(8)
+HEADER_BYTES = 8 * 8
+
+T = TypeVar('T')
+
+@dataclass
+class AggregateView:
+    """
+    The published aggregates as views into the shared file. Only valid inside
+    the callable passed to `SharedAggregateStore.read`.
+    """
+    generation: int
+    origin: Optional[date]  # First day of `minutes` (None until something is published)
+    users: List[str]
+    minutes: np.ndarray     # int64 (days, categories, users), rounded minutes
+
+    def day_range(self, start: date, end: date) -> slice:
+        """Rows of `minutes` for the days in [start, end) that were published."""
+        if self.origin is None:
+            return slice(0, 0)
+        days = len(self.minutes)
+        lo = min(max((start - self.origin).days, 0), days)
+        hi = min(max((end - self.origin).days, lo), days)
+        return slice(lo, hi)
+
+def _layout_size(days: int, users: int) -> int:
+    return HEADER_BYTES + users * NAME_BYTES + days * len(CATEGORIES) * users * 8
+
+class SharedAggregateStore:
+    """Memory-mapped aggregate file: one writer (`create`), any number of readers (`open`)."""
+
+    def __init__(self, path: Path, writable: bool):
+        self.path = Path(path)
+        self.writable = writable
+        with open(self.path, 'r+b' if writable else 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ)
+        self._header = np.frombuffer(self._mmap, dtype=np.int64, count=8)
+        if self._header[_MAGIC] != MAGIC or self._header[_CATEGORIES] != len(CATEGORIES):
+            self.close()
+            raise ValueError(f"{self.path} is not an aggregate store for {len(CATEGORIES)} categories")
+        self.day_capacity = int(self._header[_DAY_CAPACITY])
+        self.user_capacity = int(self._header[_USER_CAPACITY])
+        self._names = np.frombuffer(self._mmap, dtype=f'S{NAME_BYTES}', count=self.user_capacity,
+                                    offset=HEADER_BYTES)
+        self._minutes = np.frombuffer(
+            self._mmap, dtype=np.int64, count=self.day_capacity * len(CATEGORIES) * self.user_capacity,
+            offset=HEADER_BYTES + self.user_capacity * NAME_BYTES,
+        ).reshape(self.day_capacity, len(CATEGORIES), self.user_capacity)
+
+    @classmethod
+    def create(cls, path: Path = AGGREGATE_PATH, days: int = DEFAULT_DAYS,
+               users: int = DEFAULT_USERS) -> 'SharedAggregateStore':
+        """
+        Open a store for writing, creating the file unless one with the same
+        capacity exists (readers may have it mapped, so it is reused in place).
+
+        Args:
+            path: File to map
+            days: Days kept; publishing more keeps the most recent ones
+            users: Maximum number of users
+        """
+        path = Path(path)
+        if not (path.exists() and path.stat().st_size == _layout_size(days, users)):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            header = np.zeros(8, dtype=np.int64)
+            header[[_MAGIC, _CATEGORIES, _USER_CAPACITY, _DAY_CAPACITY]] = MAGIC, len(CATEGORIES), users, days
+            temporary = path.with_name(path.name + ".tmp")
+            with open(temporary, 'wb') as f:
+                f.write(header.tobytes())
+                f.truncate(_layout_size(days, users))
+            os.replace(temporary, path)
+        store = cls(path, writable=True)
+        if (store.day_capacity, store.user_capacity) != (days, users):
+            store.close()
+            raise ValueError(f"{path} has a different capacity")
+        return store
+
+    @classmethod
+    def open(cls, path: Path = AGGREGATE_PATH) -> Optional['SharedAggregateStore']:
+        """Map a store read-only, or None if no refresher has created it."""
+        try:
+            return cls(path, writable=False)
+        except (OSError, ValueError):
+            return None
+
+    @property
+    def generation(self) -> int:
+        """Incremented twice per publish; odd while a publish is in progress."""
+        return int(self._header[_GENERATION])
+
+    def publish(self, origin: date, minutes: np.ndarray, users: Sequence[str]) -> int:
+        """
+        Replace the published aggregates.
+
+        Args:
+            origin: Day of the first row of `minutes`
+            minutes: Rounded minutes as (days, categories, users), or (days,
+                categories) for a single user
+            users: Name of each user column
+
+        Returns:
+            The new generation
+
+        Raises:
+            ValueError: If the shape doesn't match the store's categories or users
+        """
+        if not self.writable:
+            raise ValueError("Store was opened read-only")
+        if minutes.ndim == 2:
+            minutes = minutes[:, :, np.newaxis]
+        days, categories, count = minutes.shape
+        if categories != len(CATEGORIES) or count != len(users) or count > self.user_capacity:
+            raise ValueError(f"Cannot publish {minutes.shape} minutes for {len(users)} users "
+                             f"into a store of {len(CATEGORIES)} categories and {self.user_capacity} users")
+        if days > self.day_capacity:
+            origin = day_start(origin.toordinal() - EPOCH_ORDINAL + days - self.day_capacity)
+            minutes = minutes[-self.day_capacity:]
+            days = self.day_capacity
+
+        generation = self.generation + 1
+        self._header[_GENERATION] = generation  # Odd: readers retry until the publish is done
+        self._header[_ORIGIN] = origin.toordinal() - EPOCH_ORDINAL
+        self._header[_DAYS] = days
+        self._header[_USER_COUNT] = count
+        self._names[:count] = [user.encode()[:NAME_BYTES] for user in users]
+        self._minutes[:days, :, :count] = minutes
+        self._header[_GENERATION] = generation + 1
+        return generation + 1
+
+    def read(self, reader: Callable[[AggregateView], T], timeout: float = 1.0) -> T:
+        """
+        Run `reader` over a consistent view of the published aggregates.
+
+        The view is not copied; `reader` may be run again if a publish
+        overlapped it, so it should only compute from the view (and must not
+        keep references to its arrays).
+
+        Raises:
+            TimeoutError: If no consistent view was seen within `timeout` seconds
+                (e.g. the refresher died mid-publish)
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            generation = self.generation
+            if generation % 2 == 0:
+                try:
+                    result = reader(self._view(generation))
+                except Exception:
+                    if self.generation == generation:
+                        raise
+                else:
+                    if self.generation == generation:
+                        return result
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"No consistent read of {self.path} within {timeout:.1f}s")
+            time.sleep(0)
+
+    def _view(self, generation: int) -> AggregateView:
+        # Clamped, since a torn header may be read while a publish is in progress
+        days = min(max(int(self._header[_DAYS]), 0), self.day_capacity)
+        count = min(max(int(self._header[_USER_COUNT]), 0), self.user_capacity)
+        return AggregateView(
+            generation=generation,
+            origin=day_start(int(self._header[_ORIGIN])) if generation else None,
+            users=[name.decode(errors='replace') for name in self._names[:count]],
+            minutes=self._minutes[:days, :, :count],
+        )
+
+    def range_total(self, start: date, end: date, user: Optional[str] = None) -> Dict[MeetingCategory, int]:
+        """Total minutes per category for days in [start, end), for one user or all of them."""
+        def total(view: AggregateView) -> np.ndarray:
+            minutes = view.minutes[view.day_range(start, end)]
+            if user is not None:
+                if user not in view.users:
+                    return np.zeros(len(CATEGORIES), dtype=np.int64)
+                minutes = minutes[:, :, view.users.index(user)]
+            else:
+                minutes = minutes.sum(axis=2)
+            return minutes.sum(axis=0)
+
+        totals = self.read(total)
+        return {category: int(totals[code]) for code, category in enumerate(CATEGORIES)}
+
+    def daily_totals(self, start: date, end: date) -> Dict[date, Dict[MeetingCategory, int]]:
+        """Minutes per day and category (all users) for days in [start, end) with any meetings."""
+        def daily(view: AggregateView) -> Dict[date, Dict[MeetingCategory, int]]:
+            rows = view.day_range(start, end)
+            minutes = view.minutes[rows].sum(axis=2)
+            first = view.origin.toordinal() + rows.start if view.origin else 0
+            return {
+                date.fromordinal(first + index): {
+                    CATEGORIES[code]: int(row[code]) for code in np.flatnonzero(row)
+                }
+                for index, row in enumerate(minutes) if row.any()
+            }
+
+        return self.read(daily)
+
+    def close(self) -> None:
+        # Views must be released before the map can be closed
+        self._header = self._names = self._minutes = None
+        self._mmap.close()
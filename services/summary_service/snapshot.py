@@ -0,0 +1,209 @@
+# services/summary_service/snapshot.py
+"""
+Calendar snapshots and the diff between two of them.
+
+A snapshot keeps, per meeting, a 64-bit stable id, a 64-bit content hash
+and the few columns a digest needs (start, duration, category, subject),
+in NumPy arrays. The stable id survives a meeting being moved or resized:
+
+- a meeting's GlobalAppointmentID, shared by every copy of it;
+- for occurrences of a series, which share that ID, the ID plus the day of
+  the occurrence (so an occurrence moved to another day shows as one
+  cancelled and one added);
+- without an ID, organizer and subject plus the day.
+
+Two snapshots are diffed in one pass over a dict of ids. Category hour
+deltas come from the changed meetings only: each contributes minus its old
+minutes to its old category and plus its new minutes to its new one.
+"""
+import hashlib
+import pickle
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from services.outlook_service.models import Meeting
+from services.outlook_service.projection import SEARCH_FIELDS
+from services.categorization_service.services import MeetingCategory
+from services.summary_service.cache import DATA_DIR, write_pickle
+from services.summary_service.service import CATEGORIES, CATEGORY_CODES, round_durations
+from shared.timezones import epoch_minutes
+
+SNAPSHOT_DIR = DATA_DIR / "snapshots"
+
+# Meeting fields a snapshot reads
+SNAPSHOT_FIELDS = SEARCH_FIELDS + ('is_recurring', 'global_id')
+
+# Kinds of change, in the order a digest lists them
+ADDED, CANCELLED, MOVED, RESIZED, UPDATED, RECATEGORIZED = (
+    'added', 'cancelled', 'moved', 'resized', 'updated', 'recategorized'
+)
+CHANGE_KINDS = (ADDED, CANCELLED, MOVED, RESIZED, UPDATED, RECATEGORIZED)
+
+def _hash64(*parts: object) -> int:
+    text = "\0".join("" if part is None else str(part) for part in parts)
+    return int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest(), 'little')
+
+def stable_key(meeting: Meeting) -> Tuple[str, ...]:
+    """Identity of a meeting that does not change when it is moved within its day or resized."""
+    day = meeting.start_time.strftime('%Y-%m-%d')
+    global_id = getattr(meeting, 'global_id', None)
+    if global_id:
+        return ('id', global_id, day) if meeting.is_recurring else ('id', global_id)
+    return ('fields', meeting.organizer.strip().casefold(), meeting.subject.strip().casefold(), day)
+
+def content_hash(meeting: Meeting) -> int:
+    """64-bit hash of the fields a digest reports changes of."""
+    return _hash64(meeting.subject, meeting.organizer, meeting.start_time.replace(tzinfo=None).isoformat(),
+                   meeting.end_time.replace(tzinfo=None).isoformat(), getattr(meeting, 'location', None))
+
+@dataclass
+class MeetingChange:
+    """One changed meeting; `before`/`after` index into the old/new snapshot (-1: none)."""
+    kind: str
+    before: int
+    after: int
+
+class CalendarSnapshot:
+    """Compact state of a calendar range at one point in time."""
+
+    def __init__(self, taken_at: datetime, start: datetime, end: datetime, ids: np.ndarray, hashes: np.ndarray,
+                 starts: np.ndarray, durations: np.ndarray, codes: np.ndarray, subjects: List[str]):
+        self.taken_at = taken_at
+        self.start = start
+        self.end = end
+        self.ids = ids              # uint64 stable ids
+        self.hashes = hashes        # uint64 content hashes
+        self.starts = starts        # int64 wall-clock start minutes since the epoch
+        self.durations = durations  # int64 durations in minutes
+        self.codes = codes          # int8 category codes
+        self.subjects = subjects
+
+    @classmethod
+    def build(cls, meetings: Sequence[Meeting], categories: Sequence[MeetingCategory],
+              start: datetime, end: datetime, taken_at: Optional[datetime] = None) -> 'CalendarSnapshot':
+        """
+        Snapshot meetings of [start, end) with their categories.
+
+        Meetings sharing a stable id (e.g. two occurrences of a series on one
+        day) are told apart by their order of appearance.
+        """
+        seen: Dict[Tuple[str, ...], int] = {}
+        ids = np.empty(len(meetings), dtype=np.uint64)
+        for index, meeting in enumerate(meetings):
+            key = stable_key(meeting)
+            ordinal = seen[key] = seen.get(key, -1) + 1
+            ids[index] = _hash64(*key, ordinal) if ordinal else _hash64(*key)
+        count = len(meetings)
+        return cls(
+            taken_at=taken_at or datetime.now(),
+            start=start,
+            end=end,
+            ids=ids,
+            hashes=np.fromiter((content_hash(m) for m in meetings), dtype=np.uint64, count=count),
+            starts=np.fromiter((epoch_minutes(m.start_time) for m in meetings), dtype=np.int64, count=count),
+            durations=np.fromiter((m.duration for m in meetings), dtype=np.int64, count=count),
+            codes=np.fromiter((CATEGORY_CODES[c] for c in categories), dtype=np.int8, count=count),
+            subjects=[m.subject for m in meetings],
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def start_time(self, index: int) -> datetime:
+        return self.starts[index].astype('datetime64[m]').astype(datetime)
+
+    def within(self, start: datetime, end: datetime) -> 'CalendarSnapshot':
+        """The meetings of this snapshot starting within [start, end)."""
+        mask = (self.starts >= epoch_minutes(start)) & (self.starts < epoch_minutes(end))
+        return CalendarSnapshot(self.taken_at, max(start, self.start), min(end, self.end), self.ids[mask],
+                                self.hashes[mask], self.starts[mask], self.durations[mask], self.codes[mask],
+                                [subject for subject, kept in zip(self.subjects, mask.tolist()) if kept])
+
+    def save(self, path: Path) -> None:
+        write_pickle(path, self)
+
+    @classmethod
+    def load(cls, path: Path) -> Optional['CalendarSnapshot']:
+        """The snapshot saved at a path, or None if there is none (or it is unreadable)."""
+        try:
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            return None
+
+class SnapshotDiff:
+    """Changes between two snapshots of the same range."""
+
+    def __init__(self, before: CalendarSnapshot, after: CalendarSnapshot, changes: List[MeetingChange]):
+        self.before = before
+        self.after = after
+        self.changes = changes
+
+    def __len__(self) -> int:
+        return len(self.changes)
+
+    def by_kind(self) -> Dict[str, List[MeetingChange]]:
+        grouped: Dict[str, List[MeetingChange]] = {kind: [] for kind in CHANGE_KINDS}
+        for change in self.changes:
+            grouped[change.kind].append(change)
+        return grouped
+
+    def category_deltas(self) -> Dict[MeetingCategory, int]:
+        """Change in rounded minutes per category, for categories that changed."""
+        before = np.array([change.before for change in self.changes if change.before >= 0], dtype=np.int64)
+        after = np.array([change.after for change in self.changes if change.after >= 0], dtype=np.int64)
+        deltas = np.zeros(len(CATEGORIES), dtype=np.int64)
+        np.subtract.at(deltas, self.before.codes[before], round_durations(self.before.durations[before]))
+        np.add.at(deltas, self.after.codes[after], round_durations(self.after.durations[after]))
+        return {CATEGORIES[code]: int(deltas[code]) for code in np.flatnonzero(deltas)}
+
+def diff_snapshots(before: CalendarSnapshot, after: CalendarSnapshot) -> SnapshotDiff:
+    """
+    Added, cancelled, moved, resized, otherwise updated and recategorized
+    meetings between two snapshots, in O(n + m). Snapshots of different
+    ranges are compared over the range they share.
+    """
+    if (before.start, before.end) != (after.start, after.end):
+        start, end = max(before.start, after.start), min(before.end, after.end)
+        before, after = before.within(start, end), after.within(start, end)
+    changes: List[MeetingChange] = []
+    positions = {meeting_id: index for index, meeting_id in enumerate(before.ids.tolist())}
+    old_hashes, new_hashes = before.hashes.tolist(), after.hashes.tolist()
+    matched = np.zeros(len(before), dtype=bool)
+    for index, meeting_id in enumerate(after.ids.tolist()):
+        old = positions.get(meeting_id)
+        if old is None:
+            changes.append(MeetingChange(ADDED, -1, index))
+            continue
+        matched[old] = True
+        if old_hashes[old] != new_hashes[index]:
+            if before.starts[old] != after.starts[index]:
+                kind = MOVED
+            elif before.durations[old] != after.durations[index]:
+                kind = RESIZED
+            else:
+                kind = UPDATED
+        elif before.codes[old] != after.codes[index]:
+            kind = RECATEGORIZED
+        else:
+            continue
+        changes.append(MeetingChange(kind, old, index))
+    changes.extend(MeetingChange(CANCELLED, int(old), -1) for old in np.flatnonzero(~matched))
+    return SnapshotDiff(before, after, changes)
+
+def format_change(diff: SnapshotDiff, change: MeetingChange) -> str:
+    """One digest line for a change."""
+    def describe(snapshot: CalendarSnapshot, index: int) -> str:
+        start = snapshot.start_time(index)
+        return f"{start:%a %m/%d %H:%M} ({snapshot.durations[index]}m, {CATEGORIES[snapshot.codes[index]].value})"
+
+    if change.kind == ADDED:
+        return f"{diff.after.subjects[change.after]}: {describe(diff.after, change.after)}"
+    if change.kind == CANCELLED:
+        return f"{diff.before.subjects[change.before]}: {describe(diff.before, change.before)}"
+    return (f"{diff.after.subjects[change.after]}: {describe(diff.before, change.before)}"
+            f" -> {describe(diff.after, change.after)}")
@@ -0,0 +1,33 @@
+from datetime import datetime, timedelta
+import pytest
+from typing import List
+
+from services.outlook_service.models import Meeting
+
+@pytest.fixture
+def sample_meetings() -> List[Meeting]:
+    """Fixture for a week of meetings spanning several categories"""
+    monday = datetime(2025, 3, 3, 9, 0)
+    specs = [
+        (0, "Team standup", "Doe, Jane", 15),
+        (0, "Engineering sprint planning", "Smith, Bob", 60),
+        (1, "Company all hands", "CEO, The", 45),
+        (1, "New hire orientation", "HR, Team", 90),
+        (2, "Lunch", "Doe, Jane", 0),
+        (3, "Weekly 1:1", "Smith, Bob", 30),
+        (4, "Product roadmap review", "Lee, Ann", 50),
+        (5, "Weekend deploy", "Lee, Ann", 120),
+        (6, "Random chat", "Doe, Jane", 20),
+    ]
+    return [
+        Meeting(
+            subject=subject,
+            start_time=monday + timedelta(days=day),
+            end_time=monday + timedelta(days=day, minutes=duration),
+            duration=duration,
+            organizer=organizer,
+            is_recurring=False,
+            series_id="N/A",
+        )
+        for day, subject, organizer, duration in specs
+    ]
@@ -0,0 +1,77 @@
+import random
+from dataclasses import replace
+from datetime import timedelta
+
+import numpy as np
+
+from services.summary_service.clustering import SubjectClusterer, normalize_subject, series_keys, shingles
+from services.summary_service.heavy_hitters import MeetingHeavyHitters
+
+def test_normalize_subject_drops_what_changes_between_occurrences():
+    assert normalize_subject("Eng Sync 10/3") == "eng sync"
+    assert normalize_subject("RE: Eng sync - Oct 10") == "eng sync"
+    assert normalize_subject("Updated: Eng Sync (October 17th, 2025) 9:30am") == "eng sync"
+    assert normalize_subject("Tuesday design review, week 41") == "design review"
+    assert normalize_subject("Marketing sync") == "marketing sync"  # Not a month
+    assert normalize_subject("10/3") == "10 3"
+
+def test_minhash_agreement_estimates_jaccard_similarity():
+    clusterer = SubjectClusterer(num_perm=256, bands=64)
+    first, second = "quarterly roadmap review", "quarterly roadmap sync"
+    jaccard = len(shingles(first) & shingles(second)) / len(shingles(first) | shingles(second))
+    signatures = clusterer.signatures([first, second])
+    assert abs(np.mean(signatures[0] == signatures[1]) - jaccard) < 0.1
+    assert np.array_equal(clusterer.signatures([first])[0], signatures[0])
+
+def test_near_duplicates_share_a_cluster():
+    subjects = ["Eng Sync 10/3", "Eng sync - Oct 10", "Eng Sync (weekly)", "Design review",
+                "Design Review: week 41", "Marketing offsite", "Eng Sync 10/3"]
+    clusters = SubjectClusterer().cluster(subjects, ["Doe, Jane"] * len(subjects))
+    assert clusters == ["eng sync (Doe, Jane)"] * 3 + ["design review (Doe, Jane)"] * 2 + \
+        ["marketing offsite (Doe, Jane)", "eng sync (Doe, Jane)"]
+    # Independent of order, and per organizer unless asked otherwise
+    assert SubjectClusterer().cluster(subjects[::-1], ["Doe, Jane"] * len(subjects)) == clusters[::-1]
+    assert SubjectClusterer().cluster(["Eng sync", "Eng sync"], ["Doe, Jane", "Lee, Ann"]) == \
+        ["eng sync (Doe, Jane)", "eng sync (Lee, Ann)"]
+    assert SubjectClusterer(by_organizer=False).cluster(["Eng sync", "Eng sync"], ["Doe, Jane", "Lee, Ann"]) == \
+        ["eng sync", "eng sync"]
+    assert SubjectClusterer().cluster([]) == []
+
+def test_only_bucket_mates_are_compared():
+    rng = random.Random(3)
+    words = [f"topic{number}" for number in range(5000)]
+    subjects = [" ".join(rng.sample(words, 3)) for _ in range(3000)]
+    clusterer = SubjectClusterer()
+    signatures = clusterer.signatures(subjects)
+    candidates = clusterer._candidates(signatures, [''] * len(subjects))
+    assert len(candidates) < len(subjects) // 10
+    assert len(set(clusterer.cluster(subjects))) > len(subjects) * 0.95
+
+def test_series_keys_cover_recreated_meetings(sample_meetings):
+    planning = sample_meetings[1]
+    recreated = [
+        replace(planning, subject=f"Engineering sprint planning {day}/3", start_time=planning.start_time + timedelta(days=day))
+        for day in (0, 7, 14)
+    ]
+    recurring = replace(sample_meetings[0], is_recurring=True, series_id="standup-series")
+    one_off = sample_meetings[6]
+    meetings = recreated + [recurring, one_off]
+
+    assert series_keys(meetings) == ["engineering sprint planning (Smith, Bob)"] * 3 + ["standup-series", None]
+    # A single occurrence isn't a series
+    assert series_keys(recreated[:1]) == [None]
+
+def test_heavy_hitters_count_recreated_series(sample_meetings):
+    planning = replace(sample_meetings[1], attendee_count=4)
+    recreated = [
+        replace(planning, subject=f"Engineering sprint planning - week {week}",
+                start_time=planning.start_time + timedelta(weeks=week))
+        for week in range(3)
+    ]
+    plain = MeetingHeavyHitters()
+    plain.consume(recreated)
+    assert plain.report()['series'] == []
+
+    clustered = MeetingHeavyHitters(clusterer=SubjectClusterer())
+    clustered.consume(recreated)
+    assert clustered.report()['series'] == [("engineering sprint planning (Smith, Bob)", 3 * 60 * 4, 0)]
@@ -0,0 +1,55 @@
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+
+from services.outlook_service.emulator import FakeAppointment, FakeOutlookApplication, make_appointment
+from services.outlook_service.projection import LazyMeeting, SUMMARY_FIELDS
+from services.summary_service.dedup import MeetingDeduplicator, deduplicate, meeting_fingerprint
+
+def test_copies_collapse_across_calendars(sample_meetings):
+    # Each attendee's calendar holds its own copy of the shared meetings
+    calendars = {
+        "doe": sample_meetings,
+        "smith": [replace(m) for m in sample_meetings[:3]],
+        "lee": [replace(m) for m in sample_meetings[1:2]],
+    }
+    deduplicator = MeetingDeduplicator()
+    for attendee, meetings in calendars.items():
+        deduplicator.consume(meetings, attendee)
+
+    assert deduplicator.meetings == sample_meetings
+    assert deduplicator.attendees(sample_meetings[1]) == 3
+    assert deduplicator.attendees(sample_meetings[5]) == 1
+    summary = deduplicator.summary()
+    assert (summary["copies"], summary["unique"], summary["duplicates"]) == (13, 9, 4)
+    assert deduplicator.person_minutes - deduplicator.meeting_minutes == (15 + 60 + 45) + 60
+    assert deduplicator.attendee_minutes["lee"] == 60
+
+def test_global_id_identifies_occurrences(sample_meetings):
+    standup = replace(sample_meetings[0], global_id="040000008200E000")
+    renamed = replace(standup, subject="Standup (moved)", organizer="Smith, Bob")
+    next_day = replace(standup, start_time=standup.start_time + timedelta(days=1))
+    assert meeting_fingerprint(renamed) == meeting_fingerprint(standup)
+    assert meeting_fingerprint(next_day) != meeting_fingerprint(standup)
+    assert deduplicate([standup, renamed, next_day]) == [standup, next_day]
+
+def test_fallback_fingerprint(sample_meetings):
+    meeting = sample_meetings[0]
+    assert meeting_fingerprint(replace(meeting, subject=" team STANDUP")) == meeting_fingerprint(meeting)
+    assert meeting_fingerprint(replace(meeting, organizer="Smith, Bob")) != meeting_fingerprint(meeting)
+
+    # The same instant read in two time zones
+    utc = replace(meeting, start_time=datetime(2025, 3, 3, 15, 0, tzinfo=timezone.utc))
+    chicago = replace(meeting, start_time=datetime(2025, 3, 3, 9, 0, tzinfo=timezone(timedelta(hours=-6))))
+    assert meeting_fingerprint(utc) == meeting_fingerprint(chicago)
+
+def test_reads_global_id_from_outlook():
+    application = FakeOutlookApplication([])
+    start = datetime(2025, 3, 3, 9, 0)
+    copies = [
+        FakeAppointment(application, **make_appointment("Sync", start, 30, GlobalAppointmentID="0400AB")),
+        FakeAppointment(application, **make_appointment("Sync (fwd)", start, 30, GlobalAppointmentID="0400AB")),
+        FakeAppointment(application, **make_appointment("Sync", start, 30)),
+    ]
+    meetings = [LazyMeeting(item, fields=SUMMARY_FIELDS + ('global_id',)) for item in copies]
+    assert meetings[2].global_id is None
+    assert len(deduplicate(meetings)) == 2
@@ -0,0 +1,72 @@
+import csv
+import io
+import numpy as np
+from datetime import datetime
+
+from services.categorization_service.services import MeetingCategory
+from services.summary_service.heatmap import (
+    SLOT_MINUTES, SLOTS_PER_DAY, WEEK_MINUTES, MeetingHeatmap, slot_minutes
+)
+from services.summary_service.service import CATEGORIES, CATEGORY_CODES
+from shared.timezones import epoch_minutes
+
+def brute_force(minutes, durations, codes, weights):
+    """Walk every minute of every meeting."""
+    grid = np.zeros((len(CATEGORIES), 7, SLOTS_PER_DAY))
+    for start, duration, code, weight in zip(minutes, durations, codes, weights):
+        for minute in range(start, start + max(duration, 0)):
+            of_week = (minute + 3 * 1440) % WEEK_MINUTES
+            grid[code, of_week // 1440, of_week % 1440 // SLOT_MINUTES] += weight
+    return grid
+
+def test_matches_a_per_minute_walk():
+    rng = np.random.default_rng(7)
+    count = 300
+    minutes = epoch_minutes(datetime(2025, 1, 1)) + rng.integers(0, 365 * 1440, count)
+    durations = rng.choice([-5, 0, 15, 30, 45, 60, 90, 600, 1440, WEEK_MINUTES + 75], count)
+    codes = rng.integers(0, len(CATEGORIES), count)
+    weights = rng.integers(1, 12, count).astype(float)
+
+    assert np.array_equal(slot_minutes(minutes, durations, codes, weights),
+                          brute_force(minutes, durations, codes, weights))
+    assert slot_minutes(minutes, durations, codes).sum() == np.clip(durations, 0, None).sum()
+
+def test_meetings_are_split_across_slots_and_wrap_past_sunday():
+    staff, company = MeetingCategory.STAFF_TEAM, MeetingCategory.COMPANY_WIDE
+    minutes = np.array([epoch_minutes(datetime(2025, 3, 3, 9, 10)),      # Monday 09:10-10:00
+                        epoch_minutes(datetime(2025, 3, 9, 23, 45))])    # Sunday 23:45-Monday 00:45
+    heatmap = MeetingHeatmap()
+    heatmap.add_arrays(minutes, np.array([50, 60]), np.array([CATEGORY_CODES[staff], CATEGORY_CODES[company]]))
+
+    assert heatmap.grid(staff)[0, 18:20].tolist() == [20, 30]
+    assert heatmap.grid(company)[6, 47] == 15
+    assert heatmap.grid(company)[0, :2].tolist() == [30, 15]
+    assert heatmap.grid().sum() == 110
+    assert heatmap.busiest(2) == [('Monday', '00:00', 30.0), ('Monday', '09:30', 30.0)]
+
+def test_calendars_accumulate(sample_meetings):
+    categories = [MeetingCategory.STAFF_TEAM] * len(sample_meetings)
+    heatmap = MeetingHeatmap()
+    heatmap.add(sample_meetings, categories)
+    heatmap.add(sample_meetings, categories)
+    assert (heatmap.calendars, heatmap.meetings) == (2, 2 * len(sample_meetings))
+    assert heatmap.grid(MeetingCategory.STAFF_TEAM).sum() == 2 * sum(m.duration for m in sample_meetings)
+    assert heatmap.grid(MeetingCategory.COMPANY_WIDE).sum() == 0
+
+def test_render_and_csv(sample_meetings):
+    heatmap = MeetingHeatmap()
+    heatmap.add(sample_meetings, [MeetingCategory.STAFF_TEAM] * len(sample_meetings))
+    lines = heatmap.render(first_slot=16, last_slot=24)
+    assert lines[0] == "     08  10  "
+    assert [line[:3] for line in lines[1:]] == ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+    # Shaded against the busiest slot, Tuesday 09:00 (60 minutes)
+    assert lines[1] == "Mon    ▓▒    "  # 45 and 30 minutes
+    assert lines[2] == "Tue    █▓▒   "  # 60, 45 and 30 minutes
+
+    stream = io.StringIO()
+    assert heatmap.write_csv(stream) == 14
+    rows = list(csv.reader(io.StringIO(stream.getvalue())))
+    assert rows[0][:4] == ['category', 'weekday', '00:00', '00:30']
+    assert rows[1][:2] == [MeetingCategory.STAFF_TEAM.value, 'Monday']
+    assert rows[1][2 + 18] == '45' and rows[8][:2] == ['Total', 'Monday']
+    assert sum(float(value) for row in rows[8:] for value in row[2:]) == sum(m.duration for m in sample_meetings)
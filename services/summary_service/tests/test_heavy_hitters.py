@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+from collections import Counter
+from dataclasses import replace
+
+from services.summary_service.cache import MeetingCache
+from services.summary_service.heavy_hitters import HeavyHitters, MeetingHeavyHitters
+
+@pytest.fixture
+def zipf_stream():
+    """200k rows over 20k keys with a Zipf-like weight distribution"""
+    rng = np.random.default_rng(0)
+    keys = rng.zipf(1.3, size=200_000) % 20_000
+    weights = rng.choice([15, 30, 45, 60, 90], size=len(keys))
+    return [f"organizer-{k}" for k in keys], weights
+
+def exact_totals(keys, weights):
+    totals = Counter()
+    for key, weight in zip(keys, weights):
+        totals[key] += int(weight)
+    return totals
+
+def test_exact_while_keys_fit():
+    hitters = HeavyHitters(capacity=8)
+    stream = [("a", 30), ("b", 60), ("a", 45), ("c", 15), ("b", 30)]
+    for key, weight in stream:
+        hitters.add(key, weight)
+    assert hitters.exact
+    assert [(h.key, h.weight, h.error) for h in hitters.top(2)] == [("b", 90, 0), ("a", 75, 0)]
+
+def test_error_bound_on_large_streams(zipf_stream):
+    keys, weights = zipf_stream
+    hitters = HeavyHitters(capacity=256)
+    for key, weight in zip(keys, weights):
+        hitters.add(key, int(weight))
+
+    truth = exact_totals(keys, weights)
+    assert not hitters.exact
+    top = hitters.top(20)
+    assert {h.key for h in top} == {key for key, _ in truth.most_common(20)}
+    for hitter in top:
+        assert hitter.weight - hitter.error <= truth[hitter.key] <= hitter.weight
+        assert hitter.error <= hitters.error_bound
+
+def test_batches_match_row_by_row(zipf_stream):
+    keys, weights = zipf_stream
+    batched = HeavyHitters(capacity=256)
+    for chunk in range(0, len(keys), 50_000):
+        batched.add_batch(keys[chunk:chunk + 50_000], weights[chunk:chunk + 50_000])
+
+    truth = exact_totals(keys, weights)
+    assert batched.total == sum(truth.values())
+    assert [h.key for h in batched.top(10)] == [key for key, _ in truth.most_common(10)]
+
+def test_meeting_dimensions_follow_the_cache(sample_meetings):
+    standup = replace(sample_meetings[0], is_recurring=True, series_id="standup-series", attendee_count=6)
+    series = [replace(standup, start_time=standup.start_time.replace(day=day)) for day in (3, 4, 5)]
+
+    cache = MeetingCache()
+    heavy_hitters = MeetingHeavyHitters()
+    cache.add_listener(heavy_hitters)
+    for meeting in sample_meetings[1:] + series:
+        cache.upsert(meeting)
+
+    report = heavy_hitters.report(3)
+    assert report['exact']
+    assert report['series'] == [("standup-series", 15 * 6 * 3, 0)]
+    assert report['organizers'][0] == ("Lee, Ann", 50 + 120, 0)
+    assert report['subjects'][0] == ("Weekend deploy", 120, 0)
+
+    cache.remove(series[0])
+    assert heavy_hitters.report(1)['series'] == [("standup-series", 15 * 6 * 2, 0)]
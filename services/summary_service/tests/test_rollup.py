@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+from dataclasses import replace
+from datetime import date, datetime, timedelta
+
+from services.categorization_service.services import MeetingCategory
+from services.summary_service.cache import MeetingCache
+from services.summary_service.rollup import DailyRollup
+from services.summary_service.service import CATEGORY_CODES
+
+@pytest.fixture
+def cache_and_rollup(sample_meetings):
+    cache = MeetingCache()
+    rollup = DailyRollup()
+    cache.add_listener(rollup)
+    cache.refresh(sample_meetings, datetime(2025, 3, 3), datetime(2025, 3, 9, 23, 59))
+    return cache, rollup
+
+def brute_force_total(cache, start: date, end: date):
+    totals = {category: 0 for category in MeetingCategory}
+    for meeting, category in cache.entries.values():
+        if start <= meeting.start_time.date() < end:
+            totals[category] += meeting.rounded_duration
+    return totals
+
+def test_range_total_matches_brute_force(cache_and_rollup):
+    cache, rollup = cache_and_rollup
+    for start_day in range(0, 7):
+        for length in range(0, 9):
+            start = date(2025, 3, 3) + timedelta(days=start_day)
+            end = start + timedelta(days=length)
+            assert rollup.range_total(start, end) == brute_force_total(cache, start, end)
+
+def test_range_outside_table_is_zero(cache_and_rollup):
+    _, rollup = cache_and_rollup
+    assert sum(rollup.range_total(date(2020, 1, 1), date(2021, 1, 1)).values()) == 0
+    assert DailyRollup().range_total(date(2020, 1, 1), date(2021, 1, 1))[MeetingCategory.STAFF_TEAM] == 0
+
+def test_refresh_updates_incrementally(cache_and_rollup, sample_meetings):
+    cache, rollup = cache_and_rollup
+    moved = replace(sample_meetings[0], start_time=datetime(2025, 4, 1, 9, 0), duration=120)
+    resized = replace(sample_meetings[1], duration=200)
+
+    assert cache.refresh([moved], datetime(2025, 4, 1), datetime(2025, 4, 1, 23, 59)) == 1
+    assert cache.refresh(
+        [resized] + sample_meetings[2:], datetime(2025, 3, 3), datetime(2025, 3, 9, 23, 59)
+    ) == 2  # original standup removed, planning resized
+
+    week = date(2025, 3, 3), date(2025, 3, 10)
+    assert rollup.range_total(*week) == brute_force_total(cache, *week)
+    assert rollup.range_total(date(2025, 4, 1), date(2025, 4, 2))[MeetingCategory.STAFF_TEAM] == 120
+    # Growing the table backwards keeps earlier totals intact
+    rollup.add(date(2024, 1, 1), MeetingCategory.ONBOARDING, 30)
+    assert rollup.range_total(*week) == brute_force_total(cache, *week)
+
+def test_window_totals_and_rolling_average(cache_and_rollup):
+    cache, rollup = cache_and_rollup
+    start = date(2025, 2, 10)
+    weekly = rollup.window_totals(start, 8)
+    for week in range(8):
+        week_start = start + timedelta(weeks=week)
+        expected = brute_force_total(cache, week_start, week_start + timedelta(days=7))
+        assert [int(v) for v in weekly[week]] == [expected[c] for c in CATEGORY_CODES]
+
+    rolling = rollup.rolling_average(start, 8)
+    for week in range(8):
+        # Weeks before the requested start are empty in this fixture
+        trailing = weekly[max(0, week - 3):week + 1].sum(axis=0)
+        assert np.allclose(rolling[week], trailing / 4)
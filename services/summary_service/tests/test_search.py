@@ -0,0 +1,82 @@
+import pytest
+from dataclasses import replace
+from datetime import datetime
+
+from services.summary_service.cache import MeetingCache, meeting_key
+from services.summary_service.search import MeetingIndex, PostingList, parse_query, search_meetings
+
+@pytest.fixture
+def cache(sample_meetings):
+    cache = MeetingCache()
+    for meeting in sample_meetings:
+        cache.upsert(meeting)
+    return cache
+
+@pytest.fixture
+def index(cache):
+    index = MeetingIndex()
+    index.attach(cache)
+    return index
+
+def subjects(cache, index, query, start=None, end=None):
+    return [meeting.subject for meeting, _ in search_meetings(cache, index, query, start, end)]
+
+def test_posting_list_round_trips_gaps():
+    postings = PostingList()
+    ids = [0, 1, 5, 127, 128, 300, 70_000, 2**40]
+    for doc_id in ids:
+        postings.append(doc_id)
+    assert list(postings) == ids
+    assert len(postings.data) < 8 * len(ids)
+
+def test_and_or_queries(cache, index):
+    assert subjects(cache, index, "planning") == ["Engineering sprint planning"]
+    assert subjects(cache, index, "ROADMAP lee") == ["Product roadmap review"]
+    assert subjects(cache, index, "roadmap smith") == []
+    assert subjects(cache, index, "standup OR orientation") == ["Team standup", "New hire orientation"]
+
+def test_phrase_and_field_queries(cache, index):
+    assert subjects(cache, index, '"sprint planning"') == ["Engineering sprint planning"]
+    assert subjects(cache, index, '"planning sprint"') == []
+    assert subjects(cache, index, "organizer:smith") == ["Engineering sprint planning", "Weekly 1:1"]
+    assert subjects(cache, index, "subject:doe") == []
+    assert subjects(cache, index, "1:1") == ["Weekly 1:1"]
+    with pytest.raises(ValueError):
+        parse_query(" OR ")
+
+def test_date_range_filter(cache, index):
+    start = datetime(2025, 3, 5)
+    assert subjects(cache, index, "doe", start) == ["Lunch", "Random chat"]
+    assert subjects(cache, index, "doe", start, datetime(2025, 3, 6)) == ["Lunch"]
+
+def test_index_follows_cache_updates(cache, index, sample_meetings):
+    cache.upsert(replace(sample_meetings[0], location="Room 4"))
+    assert subjects(cache, index, 'location:"room 4"') == ["Team standup"]
+    assert subjects(cache, index, "standup") == ["Team standup"]
+
+    cache.remove(sample_meetings[1])
+    assert subjects(cache, index, "planning") == []
+    assert len(index) == len(cache)
+
+def test_compaction_keeps_results(cache, index, sample_meetings):
+    for i in range(100):
+        cache.upsert(replace(sample_meetings[6], location=f"Room {i}"))
+    assert len(index.keys) < 2 * len(cache) + 64
+    assert subjects(cache, index, "roadmap") == ["Product roadmap review"]
+    assert subjects(cache, index, "location:99") == ["Product roadmap review"]
+    assert subjects(cache, index, "location:98") == []
+
+def test_persisted_index_is_reused(cache, index, tmp_path, sample_meetings):
+    cache.save(tmp_path / "cache.pkl")
+    index.save(tmp_path / "index.pkl")
+
+    loaded_cache = MeetingCache.load(tmp_path / "cache.pkl")
+    loaded_cache.remove(sample_meetings[2])  # Changed after the index was saved
+    loaded_index = MeetingIndex.load(tmp_path / "index.pkl")
+    documents = len(loaded_index.keys)
+    loaded_index.attach(loaded_cache)
+
+    assert len(loaded_index.keys) == documents  # Nothing re-indexed
+    assert meeting_key(sample_meetings[2]) not in loaded_index.doc_ids
+    assert subjects(loaded_cache, loaded_index, "orientation") == ["New hire orientation"]
+    assert subjects(loaded_cache, loaded_index, "hands") == []
@@ -0,0 +1,61 @@
+import pytest
+from collections import defaultdict
+
+from services.categorization_service.services import CategorizationService
+from services.summary_service.service import SummaryService, WEEKDAYS, round_durations
+
+@pytest.fixture
+def summary_service():
+    return SummaryService()
+
+def test_round_durations_matches_meeting(sample_meetings):
+    import numpy as np
+    durations = np.array([m.duration for m in sample_meetings])
+    assert list(round_durations(durations)) == [m.rounded_duration for m in sample_meetings]
+
+def test_build_frame(summary_service, sample_meetings):
+    frame = summary_service.build_frame(sample_meetings)
+    assert len(frame) == len(sample_meetings)
+    assert [WEEKDAYS[d] for d in frame['weekday']] == [m.weekday for m in sample_meetings]
+    assert list(frame['rounded_duration']) == [m.rounded_duration for m in sample_meetings]
+
+def test_build_frame_empty(summary_service):
+    frame = summary_service.build_frame([])
+    assert summary_service.get_total_minutes(frame) == 0
+    assert summary_service.get_daily_category_totals(frame) == {}
+    assert summary_service.get_week_category_totals(frame) == {}
+
+def test_get_category_summary_matches_loop(summary_service, sample_meetings):
+    categorization = CategorizationService()
+    categorized = categorization.categorize_meetings(sample_meetings)
+    assert summary_service.get_category_summary(categorized) == categorization.get_category_summary(categorized)
+
+def test_daily_and_week_totals_match_loop(summary_service, sample_meetings):
+    categorization = CategorizationService()
+    frame = summary_service.build_frame(sample_meetings)
+
+    expected_daily = {}
+    by_day = defaultdict(list)
+    for meeting in sample_meetings:
+        by_day[meeting.weekday].append(meeting)
+    for day, day_meetings in by_day.items():
+        expected_daily[day] = {
+            str(cat.value): sum(m.rounded_duration for m in cat_meetings)
+            for cat, cat_meetings in categorization.categorize_meetings(day_meetings).items()
+            if cat_meetings
+        }
+    assert summary_service.get_daily_category_totals(frame) == expected_daily
+
+    expected_week = {
+        cat: sum(m.rounded_duration for m in cat_meetings)
+        for cat, cat_meetings in categorization.categorize_meetings(sample_meetings).items()
+        if cat_meetings
+    }
+    assert summary_service.get_week_category_totals(frame) == expected_week
+    # Order follows MeetingCategory, as in the loop-based summary
+    assert list(summary_service.get_week_category_totals(frame)) == list(expected_week)
+    assert summary_service.get_total_minutes(frame) == sum(m.rounded_duration for m in sample_meetings)
+
+def test_calculate_total_meeting_hours(summary_service, sample_meetings):
+    assert summary_service.calculate_total_meeting_hours(sample_meetings) == \
+        sum(m.duration for m in sample_meetings) / 60.0
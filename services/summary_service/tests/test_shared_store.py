@@ -0,0 +1,123 @@
+import multiprocessing
+import time
+import pytest
+from datetime import date
+
+import numpy as np
+
+from services.categorization_service.services import MeetingCategory
+from services.summary_service.service import CATEGORIES, CATEGORY_CODES
+from services.summary_service.shared_store import SharedAggregateStore
+
+ORIGIN = date(2025, 3, 3)
+
+@pytest.fixture
+def store(tmp_path):
+    store = SharedAggregateStore.create(tmp_path / "aggregates.bin", days=400, users=4)
+    yield store
+    store.close()
+
+def filled(days: int, users: int, value: int) -> np.ndarray:
+    return np.full((days, len(CATEGORIES), users), value, dtype=np.int64)
+
+def test_readers_see_published_aggregates(store, tmp_path):
+    minutes = np.zeros((7, len(CATEGORIES), 2), dtype=np.int64)
+    minutes[0, CATEGORY_CODES[MeetingCategory.STAFF_TEAM], 0] = 30
+    minutes[1, CATEGORY_CODES[MeetingCategory.COMPANY_WIDE], 1] = 60
+    reader = SharedAggregateStore.open(tmp_path / "aggregates.bin")
+    assert reader.read(lambda view: view.origin) is None
+
+    assert store.publish(ORIGIN, minutes, ["jane", "bob"]) == 2
+    try:
+        totals = reader.range_total(date(2025, 3, 1), date(2025, 3, 10))
+        assert totals[MeetingCategory.STAFF_TEAM] == 30 and totals[MeetingCategory.COMPANY_WIDE] == 60
+        assert reader.range_total(ORIGIN, date(2025, 3, 10), user="bob")[MeetingCategory.STAFF_TEAM] == 0
+        assert sum(reader.range_total(ORIGIN, date(2025, 3, 10), user="nobody").values()) == 0
+        assert reader.daily_totals(ORIGIN, date(2025, 3, 10)) == {
+            date(2025, 3, 3): {MeetingCategory.STAFF_TEAM: 30},
+            date(2025, 3, 4): {MeetingCategory.COMPANY_WIDE: 60},
+        }
+        # Views are not copies of the shared memory
+        assert not reader.read(lambda view: view.minutes.flags.owndata)
+        with pytest.raises(ValueError):
+            reader.publish(ORIGIN, minutes, ["jane", "bob"])
+    finally:
+        reader.close()
+
+def test_only_the_most_recent_days_are_kept(store):
+    minutes = np.zeros((500, len(CATEGORIES)), dtype=np.int64)
+    minutes[-1, 0] = minutes[0, 0] = 15
+    store.publish(ORIGIN, minutes, ["jane"])
+    assert store.read(lambda view: (view.origin, len(view.minutes))) == (date(2025, 6, 11), 400)
+    assert store.range_total(ORIGIN, date(2026, 12, 31))[CATEGORIES[0]] == 15
+
+def test_create_reuses_a_matching_file_and_rejects_bad_shapes(store, tmp_path):
+    store.publish(ORIGIN, filled(3, 1, 5), ["jane"])
+    again = SharedAggregateStore.create(tmp_path / "aggregates.bin", days=400, users=4)
+    try:
+        assert again.generation == store.generation
+        with pytest.raises(ValueError):
+            again.publish(ORIGIN, filled(3, 5, 1), ["a", "b", "c", "d", "e"])
+        with pytest.raises(ValueError):
+            again.publish(ORIGIN, np.zeros((3, 2, 1), dtype=np.int64), ["jane"])
+    finally:
+        again.close()
+    assert SharedAggregateStore.open(tmp_path / "missing.bin") is None
+
+def test_reads_overlapping_a_publish_are_retried(store):
+    store.publish(ORIGIN, filled(10, 1, 1), ["jane"])
+    runs = []
+
+    def reader(view):
+        runs.append(view.generation)
+        if len(runs) == 1:
+            store.publish(ORIGIN, filled(20, 1, 2), ["jane"])  # Lands while this read is in progress
+        return int(view.minutes.sum())
+
+    assert store.read(reader) == 20 * len(CATEGORIES) * 2
+    assert runs == [2, 4]
+
+def test_read_times_out_while_a_publish_never_finishes(store):
+    store._header[1] += 1  # A writer that died mid-publish
+    with pytest.raises(TimeoutError):
+        store.read(lambda view: None, timeout=0.05)
+
+def read_until_stopped(path, ready, stop, results):
+    """Reader process: every consistent read must be all one published value."""
+    store = SharedAggregateStore.open(path)
+    ready.put(True)
+    reads = torn = 0
+    while not stop.is_set():
+        low, high, days = store.read(lambda view: (int(view.minutes.min()), int(view.minutes.max()),
+                                                   len(view.minutes)))
+        reads += 1
+        torn += low != high or days != 100 + low % 50
+    store.close()
+    results.put((reads, torn))
+
+def test_concurrent_readers_never_see_torn_aggregates(store, tmp_path):
+    context = multiprocessing.get_context('spawn')
+    ready, stop, results = context.Queue(), context.Event(), context.Queue()
+    store.publish(ORIGIN, filled(100, 4, 0), ["a", "b", "c", "d"])
+    readers = [
+        context.Process(target=read_until_stopped, args=(tmp_path / "aggregates.bin", ready, stop, results))
+        for _ in range(3)
+    ]
+    for process in readers:
+        process.start()
+    try:
+        for _ in readers:
+            ready.get(timeout=60)
+        deadline = time.monotonic() + 0.5
+        value = 0
+        while time.monotonic() < deadline:
+            value += 1
+            store.publish(ORIGIN, filled(100 + value % 50, 4, value), ["a", "b", "c", "d"])
+    finally:
+        stop.set()
+        outcomes = [results.get(timeout=30) for _ in readers]
+        for process in readers:
+            process.join(timeout=10)
+
+    assert all(reads > 0 for reads, _ in outcomes)
+    assert sum(torn for _, torn in outcomes) == 0
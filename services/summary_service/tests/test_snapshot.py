@@ -0,0 +1,116 @@
+from dataclasses import replace
+from datetime import datetime, timedelta
+
+from services.outlook_service.models import Meeting
+from services.categorization_service.services import CategorizationService, MeetingCategory
+from services.summary_service.service import SummaryService
+from services.summary_service.snapshot import (
+    ADDED, CANCELLED, MOVED, RECATEGORIZED, RESIZED, UPDATED, CalendarSnapshot, diff_snapshots, format_change
+)
+
+START, END = datetime(2025, 3, 3), datetime(2025, 3, 10)
+
+def meeting(subject, start, duration, organizer="Doe, Jane", global_id=None, recurring=False):
+    return Meeting(subject=subject, start_time=start, end_time=start + timedelta(minutes=duration),
+                   duration=duration, organizer=organizer, is_recurring=recurring, series_id="N/A",
+                   global_id=global_id)
+
+def week():
+    meetings = [meeting("Team standup", datetime(2025, 3, 3 + day, 9), 15, global_id="standup", recurring=True)
+                for day in range(5)]
+    meetings += [
+        meeting("All Hands", datetime(2025, 3, 4, 15), 60, organizer="CEO, The", global_id="all-hands"),
+        meeting("Department planning", datetime(2025, 3, 5, 13), 60, organizer="Eng, Director"),
+        meeting("New hire orientation", datetime(2025, 3, 6, 10), 90, organizer="HR, Team"),
+    ]
+    return meetings
+
+def snapshot(meetings, categorization=None):
+    categorization = categorization or CategorizationService()
+    return CalendarSnapshot.build(meetings, categorization.categorize_batch(meetings), START, END)
+
+def kinds(diff):
+    return {kind: [diff.after.subjects[c.after] if c.after >= 0 else diff.before.subjects[c.before]
+                   for c in changes] for kind, changes in diff.by_kind().items() if changes}
+
+def test_no_changes():
+    diff = diff_snapshots(snapshot(week()), snapshot(week()))
+    assert len(diff) == 0
+    assert diff.category_deltas() == {}
+
+def test_changes_are_classified():
+    before = week()
+    after = week()
+    after[1] = replace(after[1], start_time=after[1].start_time + timedelta(hours=2),
+                       end_time=after[1].end_time + timedelta(hours=2))                     # Moved within its day
+    after[5] = replace(after[5], start_time=datetime(2025, 3, 5, 15),
+                       end_time=datetime(2025, 3, 5, 16))                                   # Moved to another day
+    after[6] = replace(after[6], end_time=after[6].end_time + timedelta(minutes=60), duration=120)  # Resized
+    after[7] = replace(after[7], location="Room 4")                                        # Updated
+    del after[4]                                                                           # Cancelled
+    after.append(meeting("Team sync", datetime(2025, 3, 7, 11), 30))                       # Added
+
+    diff = diff_snapshots(snapshot(before), snapshot(after))
+    assert kinds(diff) == {
+        ADDED: ["Team sync"],
+        CANCELLED: ["Team standup"],
+        MOVED: ["Team standup", "All Hands"],
+        RESIZED: ["Department planning"],
+        UPDATED: ["New hire orientation"],
+    }
+    moved = diff.by_kind()[MOVED][0]
+    assert format_change(diff, moved) == (
+        "Team standup: Tue 03/04 09:00 (15m, Team/Staff) -> Tue 03/04 11:00 (15m, Team/Staff)"
+    )
+
+def test_category_deltas_match_full_summaries():
+    """Test the deltas computed from the diff against summarizing both weeks"""
+    before = week()
+    after = week()
+    after[6] = replace(after[6], end_time=after[6].end_time + timedelta(minutes=60), duration=120)
+    del after[0]
+    after.append(meeting("Company offsite", datetime(2025, 3, 7, 9), 240))
+
+    summary_service = SummaryService()
+    totals_before = summary_service.get_week_category_totals(summary_service.build_frame(before))
+    totals_after = summary_service.get_week_category_totals(summary_service.build_frame(after))
+    expected = {category: totals_after.get(category, 0) - totals_before.get(category, 0)
+                for category in MeetingCategory}
+    expected = {category: minutes for category, minutes in expected.items() if minutes}
+
+    deltas = diff_snapshots(snapshot(before), snapshot(after)).category_deltas()
+    assert deltas == expected == {
+        MeetingCategory.STAFF_TEAM: -30, MeetingCategory.DEPARTMENT: 60, MeetingCategory.COMPANY_WIDE: 240,
+    }
+
+def test_recategorized_without_content_change():
+    class Everything(CategorizationService):
+        def categorize_meeting(self, meeting):
+            return MeetingCategory.DEPARTMENT
+
+    diff = diff_snapshots(snapshot(week()), snapshot(week(), Everything()))
+    assert set(kinds(diff)) == {RECATEGORIZED}
+    assert diff.category_deltas()[MeetingCategory.DEPARTMENT] == 5 * 30 + 60 + 90
+
+def test_repeated_stable_ids_are_told_apart():
+    twice = [meeting("Team standup", datetime(2025, 3, 3, 9), 15, global_id="s", recurring=True),
+             meeting("Team standup", datetime(2025, 3, 3, 16), 15, global_id="s", recurring=True)]
+    assert len(set(snapshot(twice).ids.tolist())) == 2
+    diff = diff_snapshots(snapshot(twice), snapshot(twice[:1]))
+    assert [change.kind for change in diff.changes] == [CANCELLED]
+
+def test_snapshots_of_different_ranges_compare_their_overlap():
+    before = snapshot(week())
+    later = [meeting("Team standup", datetime(2025, 3, 10, 9), 15, global_id="standup", recurring=True)]
+    after = CalendarSnapshot.build(later, [MeetingCategory.STAFF_TEAM] * 1, datetime(2025, 3, 6), datetime(2025, 3, 13))
+    diff = diff_snapshots(before, after)
+    # Thursday and Friday of the first week are compared; the meeting of the next week is not "added"
+    assert kinds(diff) == {CANCELLED: ["Team standup", "Team standup", "New hire orientation"]}
+
+def test_save_and_load(tmp_path):
+    path = tmp_path / "calendar.pkl"
+    assert CalendarSnapshot.load(path) is None
+    snapshot(week()).save(path)
+    loaded = CalendarSnapshot.load(path)
+    assert loaded.subjects == [m.subject for m in week()]
+    assert len(diff_snapshots(loaded, snapshot(week()))) == 0
@@ -0,0 +1,87 @@
+# shared/metrics.py
+"""Process-wide instrumentation counters and timings"""
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+class Timing:
+    """Aggregated durations for one named operation."""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "max": self.max,
+        }
+
+class Metrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, int] = {}
+        self._gauges: Dict[str, float] = {}
+        self._timings: Dict[str, Timing] = {}
+
+    def increment(self, name: str, value: int = 1) -> None:
+        """Increase a counter."""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def set_gauge(self, name: str, value: float) -> None:
+        """Record the current value of a gauge."""
+        with self._lock:
+            self._gauges[name] = value
+
+    def observe(self, name: str, seconds: float) -> None:
+        """Record a duration."""
+        with self._lock:
+            self._timings.setdefault(name, Timing()).observe(seconds)
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        """Record how long the block takes."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started)
+
+    def counter(self, name: str) -> int:
+        """Current value of a counter."""
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def counters(self, prefix: str = "") -> Dict[str, int]:
+        """Counters whose name starts with prefix."""
+        with self._lock:
+            return {k: v for k, v in self._counters.items() if k.startswith(prefix)}
+
+    def snapshot(self, prefix: str = "") -> Dict[str, Dict]:
+        """All counters, gauges and timings whose name starts with prefix."""
+        with self._lock:
+            return {
+                "counters": {k: v for k, v in self._counters.items() if k.startswith(prefix)},
+                "gauges": {k: v for k, v in self._gauges.items() if k.startswith(prefix)},
+                "timings": {k: t.as_dict() for k, t in self._timings.items() if k.startswith(prefix)},
+            }
+
+    def reset(self, prefix: str = "") -> None:
+        """Clear everything whose name starts with prefix."""
+        with self._lock:
+            for store in (self._counters, self._gauges, self._timings):
+                for name in [k for k in store if k.startswith(prefix)]:
+                    del store[name]
+
+# Create singleton instance
+metrics = Metrics()
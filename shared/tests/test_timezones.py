@@ -0,0 +1,93 @@
+import random
+from datetime import date, datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pytest
+
+from shared.timezones import TimeZoneNormalizer, day_start, epoch_minutes, wall_clock_minutes, week_start
+
+@pytest.mark.parametrize("key", ["America/Chicago", "Europe/London", "Australia/Lord_Howe", "Asia/Kolkata"])
+def test_batches_match_zoneinfo(key):
+    """Test batch conversion against zoneinfo, one datetime at a time"""
+    normalizer, zone = TimeZoneNormalizer(key), ZoneInfo(key)
+    rng = random.Random(0)
+    times = [datetime(2022, 1, 1) + timedelta(minutes=rng.randrange(3 * 365 * 1440)) for _ in range(2000)]
+
+    wall_clock = normalizer.from_wall_clock(times)
+    assert wall_clock.utc.tolist() == [
+        epoch_minutes(t.replace(tzinfo=zone).astimezone(timezone.utc)) for t in times
+    ]
+
+    instants = normalizer.from_instants(t.replace(tzinfo=timezone.utc) for t in times)
+    assert instants.local.tolist() == [epoch_minutes(t.replace(tzinfo=timezone.utc).astimezone(zone)) for t in times]
+
+def test_dst_edges():
+    """Test repeated and skipped wall-clock times around Chicago's 2025 DST changes"""
+    normalizer = TimeZoneNormalizer("America/Chicago")
+    times = normalizer.from_wall_clock([
+        datetime(2025, 3, 9, 1, 59),   # CST
+        datetime(2025, 3, 9, 2, 30),   # Skipped: read with the offset before the change
+        datetime(2025, 3, 9, 3, 0),    # CDT
+        datetime(2025, 11, 2, 1, 30),  # Repeated: the earlier (CDT) one
+        datetime(2025, 11, 2, 2, 0),   # CST
+    ])
+    as_utc = [datetime(1970, 1, 1) + timedelta(minutes=int(m)) for m in times.utc]
+    assert as_utc == [
+        datetime(2025, 3, 9, 7, 59),
+        datetime(2025, 3, 9, 8, 30),
+        datetime(2025, 3, 9, 8, 0),
+        datetime(2025, 11, 2, 6, 30),
+        datetime(2025, 11, 2, 8, 0),
+    ]
+
+def test_instants_from_other_zones_and_strings():
+    """Test aware datetimes, naive UTC and Outlook's string format"""
+    normalizer = TimeZoneNormalizer("Europe/London")
+    times = normalizer.from_instants([
+        datetime(2025, 7, 1, 9, 0, tzinfo=ZoneInfo("America/New_York")),
+        datetime(2025, 7, 1, 13, 0),
+        "2025-12-01 09:00",
+    ])
+    assert normalizer.to_datetimes(times.local) == [
+        datetime(2025, 7, 1, 14, 0), datetime(2025, 7, 1, 14, 0), datetime(2025, 12, 1, 9, 0),
+    ]
+
+def test_bucket_keys():
+    """Test day and Monday-based week keys"""
+    normalizer = TimeZoneNormalizer("Asia/Tokyo")
+    times = normalizer.from_wall_clock([datetime(2025, 3, 2, 23, 59), datetime(2025, 3, 3, 0, 0),
+                                        datetime(2025, 3, 9, 23, 0)])
+    assert [day_start(d) for d in times.day] == [date(2025, 3, 2), date(2025, 3, 3), date(2025, 3, 9)]
+    assert [week_start(w) for w in times.week] == [date(2025, 2, 24), date(2025, 3, 3), date(2025, 3, 3)]
+
+    # A UTC instant late on Sunday is already Monday in Tokyo
+    late_sunday = normalizer.from_instants([datetime(2025, 3, 2, 20, 0, tzinfo=timezone.utc)])
+    assert week_start(late_sunday.week[0]) == date(2025, 3, 3)
+
+def test_table_is_reused_and_widened():
+    normalizer = TimeZoneNormalizer("America/Chicago")
+    normalizer.from_wall_clock([datetime(2025, 6, 1)])
+    table = normalizer._table
+    normalizer.from_wall_clock([datetime(2025, 9, 1)])
+    assert normalizer._table is table
+    normalizer.from_wall_clock([datetime(2020, 6, 1)])
+    assert normalizer._table.first_year <= 2020 and normalizer._table.last_year >= 2025
+
+def test_empty_batch():
+    times = TimeZoneNormalizer("UTC").from_wall_clock([])
+    assert len(times) == 0 and times.week.dtype == np.int64
+
+def test_wall_clock_minutes_accept_outlook_strings():
+    minutes = wall_clock_minutes([datetime(2025, 3, 9, 2, 30, tzinfo=timezone.utc), "2025-03-09 02:30"])
+    assert minutes.tolist() == [epoch_minutes(datetime(2025, 3, 9, 2, 30))] * 2
+
+def test_week_bounds():
+    normalizer = TimeZoneNormalizer("America/Chicago")
+    start, end = normalizer.week_bounds(-1, today=date(2025, 3, 12))
+    assert start == datetime(2025, 3, 3)
+    assert end == datetime(2025, 3, 9, 23, 59, 59, 999999)
+
+def test_unknown_zone():
+    with pytest.raises(ValueError):
+        TimeZoneNormalizer("Mars/Olympus_Mons")
@@ -0,0 +1,234 @@
+# shared/timezones.py
+"""
+Batch time zone normalization.
+
+Every part of the application works in the wall-clock time of one
+configured `zoneinfo` zone (`OUTLOOK_AUTOMATION_TIMEZONE`, America/Chicago
+by default). Outlook reports `Start`/`End` as local wall-clock times (pywin32
+tags them with a UTC tzinfo that does not mean UTC), so those are taken as
+wall-clock times; real instants (`StartUTC`, .ics feeds, other mailboxes)
+are converted into the zone.
+
+Conversions go through a `TransitionTable`: the zone's UTC offsets and the
+instants they take effect, precomputed per year and cached, so a batch of
+times is converted with two `searchsorted` calls instead of one tz lookup
+per datetime. The same pass yields day and week bucket keys.
+"""
+import os
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
+from zoneinfo import ZoneInfo
+
+import numpy as np
+
+DEFAULT_TIMEZONE = os.environ.get("OUTLOOK_AUTOMATION_TIMEZONE") or "America/Chicago"
+OUTLOOK_TIME_FORMAT = '%Y-%m-%d %H:%M'  # How Start/End read when Outlook returns strings
+
+EPOCH = datetime(1970, 1, 1)
+EPOCH_ORDINAL = EPOCH.toordinal()
+
+TimeValue = Union[datetime, str]
+
+def epoch_minutes(value: datetime) -> int:
+    """Minutes since the epoch of a datetime's fields (tzinfo is ignored)."""
+    return (value.toordinal() - EPOCH_ORDINAL) * 1440 + value.hour * 60 + value.minute
+
+def wall_clock_minutes(values: Iterable[TimeValue]) -> np.ndarray:
+    """Epoch minutes of wall-clock times (datetimes or Outlook strings), as an int64 array."""
+    return np.fromiter((epoch_minutes(parse_time(value)) for value in values), dtype=np.int64)
+
+def day_start(day: int) -> date:
+    """The date of a day bucket key."""
+    return date.fromordinal(EPOCH_ORDINAL + day)
+
+def week_start(week: int) -> date:
+    """The Monday of a week bucket key."""
+    return date.fromordinal(EPOCH_ORDINAL + week * 7 - 3)  # 1970-01-01 was a Thursday
+
+@lru_cache(maxsize=256)
+def _year_transitions(key: str, year: int) -> Tuple[Tuple[int, int], ...]:
+    """
+    (UTC minute, offset in minutes) for the offset in effect at the start of
+    a year and every change during it. Offsets are sampled daily and each
+    change is bisected to the minute.
+    """
+    zone = ZoneInfo(key)
+
+    def offset_at(minute: int) -> int:
+        instant = (EPOCH + timedelta(minutes=minute)).replace(tzinfo=timezone.utc)
+        return int(instant.astimezone(zone).utcoffset().total_seconds()) // 60
+
+    first = (date(year, 1, 1).toordinal() - EPOCH_ORDINAL) * 1440
+    last = (date(year + 1, 1, 1).toordinal() - EPOCH_ORDINAL) * 1440
+    transitions = [(first, offset_at(first))]
+    previous, offset = first, transitions[0][1]
+    for sample in range(first + 1440, last + 1440, 1440):
+        sample = min(sample, last)
+        sample_offset = offset_at(sample)
+        if sample_offset != offset:
+            low, high = previous, sample  # offset_at(low) == offset != offset_at(high)
+            while high - low > 1:
+                middle = (low + high) // 2
+                if offset_at(middle) == offset:
+                    low = middle
+                else:
+                    high = middle
+            transitions.append((high, sample_offset))
+            offset = sample_offset
+        previous = sample
+    return tuple(transitions)
+
+class TransitionTable:
+    """
+    UTC offsets of a zone over a range of years, as arrays.
+
+    `utc_starts[i]` is the UTC minute from which `offsets[i]` applies;
+    `local_starts[i]` is the same moment on the zone's wall clock.
+    """
+
+    def __init__(self, key: str, first_year: int, last_year: int):
+        transitions = [t for year in range(first_year, last_year + 1) for t in _year_transitions(key, year)]
+        # Year starts repeat the offset in effect; keep only real changes
+        kept = [transitions[0]] + [t for p, t in zip(transitions, transitions[1:]) if t[1] != p[1]]
+        self.key = key
+        self.first_year = first_year
+        self.last_year = last_year
+        self.utc_starts = np.array([minute for minute, _ in kept], dtype=np.int64)
+        self.offsets = np.array([offset for _, offset in kept], dtype=np.int64)
+        self.local_starts = self.utc_starts + self.offsets
+
+    def covers(self, first_year: int, last_year: int) -> bool:
+        return self.first_year <= first_year and last_year <= self.last_year
+
+    def to_local(self, utc_minutes: np.ndarray) -> np.ndarray:
+        """Wall-clock minutes of UTC minutes."""
+        index = np.maximum(np.searchsorted(self.utc_starts, utc_minutes, side='right') - 1, 0)
+        return utc_minutes + self.offsets[index]
+
+    def to_utc(self, local_minutes: np.ndarray) -> np.ndarray:
+        """
+        UTC minutes of wall-clock minutes. Like `datetime(..., fold=0)`,
+        repeated times (DST ends) resolve to the earlier instant and skipped
+        times (DST starts) use the offset before the change.
+        """
+        index = np.maximum(np.searchsorted(self.local_starts, local_minutes, side='right') - 1, 0)
+        # In a repeated hour the earlier offset still applies if its instant precedes the change
+        earlier = np.maximum(index - 1, 0)
+        repeated = (index > 0) & (local_minutes - self.offsets[earlier] < self.utc_starts[index])
+        index = np.where(repeated, earlier, index)
+        return local_minutes - self.offsets[index]
+
+@dataclass
+class NormalizedTimes:
+    """Times of a batch, as int64 arrays in the order given."""
+    local: np.ndarray   # Wall-clock minutes since the epoch in the zone
+    utc: np.ndarray     # UTC minutes since the epoch
+    day: np.ndarray     # Day bucket keys (days since 1970-01-01, see `day_start`)
+    week: np.ndarray    # Monday-based week bucket keys (see `week_start`)
+
+    def __len__(self) -> int:
+        return len(self.local)
+
+class TimeZoneNormalizer:
+    """
+    Converts batches of times into one zone, and answers "today" and week
+    boundaries in that zone so every view agrees on them.
+    """
+
+    def __init__(self, zone: Union[str, ZoneInfo, None] = None):
+        """
+        Args:
+            zone: IANA zone name or ZoneInfo (`DEFAULT_TIMEZONE` by default)
+
+        Raises:
+            ValueError: If the zone is unknown
+        """
+        key = str(zone) if isinstance(zone, ZoneInfo) else zone or DEFAULT_TIMEZONE
+        try:
+            self.zone = ZoneInfo(key)
+        except Exception:
+            raise ValueError(f"Unknown time zone: {key}") from None
+        self.key = key
+        self._table: Optional[TransitionTable] = None
+
+    def table(self, first_year: int, last_year: int) -> TransitionTable:
+        """The transition table covering the given years (kept and widened as needed)."""
+        if self._table is None or not self._table.covers(first_year, last_year):
+            if self._table is not None:
+                first_year = min(first_year, self._table.first_year)
+                last_year = max(last_year, self._table.last_year)
+            self._table = TransitionTable(self.key, first_year, last_year)
+        return self._table
+
+    def _table_for(self, minutes: np.ndarray) -> TransitionTable:
+        if not len(minutes):
+            return self.table(EPOCH.year, EPOCH.year)
+        # A day of margin either side covers offsets at the edges of a year
+        first = EPOCH + timedelta(minutes=int(minutes.min()) - 1440)
+        last = EPOCH + timedelta(minutes=int(minutes.max()) + 1440)
+        return self.table(first.year, last.year)
+
+    def _bucketed(self, local: np.ndarray, utc: np.ndarray) -> NormalizedTimes:
+        day = local // 1440
+        return NormalizedTimes(local=local, utc=utc, day=day, week=(day + 3) // 7)
+
+    def from_wall_clock(self, values: Iterable[TimeValue]) -> NormalizedTimes:
+        """
+        Normalize wall-clock times in the zone (Outlook's `Start`/`End`):
+        datetimes (any tzinfo is ignored) or strings in Outlook's format.
+        """
+        local = wall_clock_minutes(values)
+        return self._bucketed(local, self._table_for(local).to_utc(local))
+
+    def from_instants(self, values: Iterable[TimeValue]) -> NormalizedTimes:
+        """
+        Normalize instants: aware datetimes are converted from their own
+        offset, naive datetimes and strings are taken as UTC.
+        """
+        utc = np.fromiter((_utc_minutes(parse_time(value)) for value in values), dtype=np.int64)
+        return self._bucketed(self._table_for(utc).to_local(utc), utc)
+
+    def now(self) -> datetime:
+        """The current time in the zone (aware)."""
+        return datetime.now(self.zone)
+
+    def today(self) -> date:
+        return self.now().date()
+
+    def week_bounds(self, week_offset: int = 0, today: Optional[date] = None) -> Tuple[datetime, datetime]:
+        """
+        First and last moment (naive wall-clock) of a Monday-based week.
+
+        Args:
+            week_offset: Weeks from the current one (-1: last week)
+            today: Day the current week is taken from (today in the zone by default)
+        """
+        today = today or self.today()
+        monday = today - timedelta(days=today.weekday()) + timedelta(weeks=week_offset)
+        start = datetime.combine(monday, datetime.min.time())
+        return start, start + timedelta(days=7) - timedelta(microseconds=1)
+
+    def to_datetimes(self, local: Sequence[int]) -> List[datetime]:
+        """Naive wall-clock datetimes of local minutes."""
+        return [EPOCH + timedelta(minutes=int(minute)) for minute in local]
+
+def parse_time(value: TimeValue) -> datetime:
+    if isinstance(value, str):
+        return datetime.strptime(value, OUTLOOK_TIME_FORMAT)
+    return value
+
+def _utc_minutes(value: datetime) -> int:
+    offset = value.utcoffset() if value.tzinfo is not None else None
+    minutes = epoch_minutes(value)
+    return minutes - int(offset.total_seconds()) // 60 if offset else minutes
+
+_normalizer: Optional[TimeZoneNormalizer] = None
+
+def get_normalizer() -> TimeZoneNormalizer:
+    """The process-wide normalizer for the configured zone."""
+    global _normalizer
+    if _normalizer is None:
+        _normalizer = TimeZoneNormalizer()
+    return _normalizer
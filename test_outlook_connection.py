@@ -1,29 +1,13 @@
 # test_outlook_connection.py
-from services.outlook_service.service import OutlookService
+from services.outlook_service.service import format_restriction_date
 from shared.logger import logger
-from datetime import datetime, timedelta
-import win32com.client
+from services.outlook_service.com import dispatch_outlook
+from services.outlook_service.enumeration import iter_records
+from services.outlook_service.projection import SUMMARY_FIELDS
+from services.summary_service.dedup import MeetingDeduplicator
 import pythoncom
 from collections import defaultdict
-import pytz
-
-def get_meeting_key(item):
-    """
-    Generate a key to identify unique meetings and their recurring instances.
-    """
-    try:
-        # For recurring meetings, use ConversationID to group instances
-        if hasattr(item, 'ConversationID') and item.ConversationID:
-            return f"{item.Subject}_{item.ConversationID}"
-        # For non-recurring meetings, use GlobalObjectID if available
-        elif hasattr(item, 'GlobalObjectID') and item.GlobalObjectID:
-            return f"{item.Subject}_{item.GlobalObjectID}"
-        # Fallback to subject only
-        else:
-            return item.Subject
-    except Exception as e:
-        logger.error(f"Error getting meeting key: {str(e)}")
-        return item.Subject
+from shared.timezones import get_normalizer, parse_time
 
 def check_outlook_meetings():
     logger.start_section("Outlook Calendar Check")
@@ -34,7 +18,7 @@ def check_outlook_meetings():
         
         # Connect to Outlook
         logger.info("Connecting to Outlook...", "start")
-        outlook = win32com.client.Dispatch('Outlook.Application')
+        outlook = dispatch_outlook()
         namespace = outlook.GetNamespace('MAPI')
         
         # Log Outlook version
@@ -48,79 +32,55 @@ def check_outlook_meetings():
             logger.warn("No calendar items found.")
             return
         
-        # Get next week's date range with timezone awareness
-        local_tz = pytz.timezone('America/Chicago')  # Adjust to your timezone
-        today = datetime.now(local_tz)
-        start_of_next_week = (today - timedelta(days=today.weekday()) + timedelta(days=7))
-        end_of_week = start_of_next_week + timedelta(days=6)
+        # Get next week's date range in the configured time zone
+        start_naive, end_naive = get_normalizer().week_bounds(1)
         
         # Format dates for logging
-        start_date = start_of_next_week.strftime('%m/%d/%Y')
-        end_date = end_of_week.strftime('%m/%d/%Y')
+        start_date = start_naive.strftime('%m/%d/%Y')
+        end_date = end_naive.strftime('%m/%d/%Y')
         
         logger.info(f"Looking for meetings between {start_date} and {end_date}")
         
-        # Include recurrences and sort
+        # Include recurrences, sort, and narrow to the week before reading anything
         items.IncludeRecurrences = True
         items.Sort("[Start]")
-        weekly_meetings = []
-        
-        # Create naive datetime objects for comparison, using start and end of day
-        start_naive = start_of_next_week.replace(tzinfo=None, hour=0, minute=0, second=0, microsecond=0)
-        end_naive = end_of_week.replace(tzinfo=None, hour=23, minute=59, second=59, microsecond=999999)
-        
-        for item in items:
-            try:
-                # Get meeting start time as naive datetime for comparison
-                meeting_start = item.Start
-                if isinstance(meeting_start, str):
-                    meeting_start = datetime.strptime(meeting_start, '%Y-%m-%d %H:%M')
-                elif hasattr(meeting_start, 'tzinfo') and meeting_start.tzinfo:
-                    meeting_start = meeting_start.replace(tzinfo=None)
-                
-                # Debug log the comparison
-                # logger.debug(f"Comparing meeting: {meeting_start} with range: {start_naive} to {end_naive}")
-                
-                # Compare naive datetimes (inclusive)
-                if start_naive <= meeting_start <= end_naive:
-                    weekly_meetings.append(item)
-            except Exception as e:
-                logger.error(f"Error processing meeting: {str(e)}")
+        items = items.Restrict(
+            f"[Start] >= '{format_restriction_date(start_naive)}' AND "
+            f"[Start] <= '{format_restriction_date(end_naive)}'"
+        )
+
+        def skip(error: Exception) -> None:
+            logger.error(f"Error processing meeting: {str(error)}")
+
+        # Collapse copies of the same meeting, then group by subject for the summary
+        deduplicator = MeetingDeduplicator()
+        series_groups = defaultdict(list)
+        fields = SUMMARY_FIELDS + ('is_recurring', 'series_id', 'global_id')
+
+        # Each item is read and released before the next one is fetched
+        for meeting in iter_records(items, fields, on_error=skip):
+            # Outlook can return Start/End as strings; parse once, compare naive datetimes (inclusive)
+            start, end = parse_time(meeting.start_time), parse_time(meeting.end_time)
+            if not start_naive <= start.replace(tzinfo=None) <= end_naive:
                 continue
-        
-        if not weekly_meetings:
+            if not deduplicator.add(meeting):
+                continue
+            meeting_info = {
+                "start": start.strftime("%Y-%m-%d %H:%M"),
+                "end": end.strftime("%Y-%m-%d %H:%M"),
+                "duration": meeting.duration,
+                "organizer": meeting.organizer,
+                "is_recurring": meeting.is_recurring,
+                "series_id": meeting.series_id
+            }
+            series_groups[meeting.subject].append(meeting_info)
+
+        if not len(deduplicator):
             logger.info(f"No meetings found for the week of {start_date} to {end_date}")
             return
         
-        # Group meetings by series/unique meeting
-        meeting_groups = defaultdict(list)
-        series_groups = defaultdict(list)
-        meeting_totals = defaultdict(int)
-        
-        for item in weekly_meetings:
-            try:
-                meeting_info = {
-                    "start": item.Start.strftime("%Y-%m-%d %H:%M") if hasattr(item.Start, 'strftime') else str(item.Start),
-                    "end": item.End.strftime("%Y-%m-%d %H:%M") if hasattr(item.End, 'strftime') else str(item.End),
-                    "duration": item.Duration,
-                    "organizer": item.Organizer,
-                    "is_recurring": bool(getattr(item, 'RecurrenceState', 0)),
-                    "series_id": getattr(item, 'ConversationID', 'N/A')
-                }
-                
-                # Group by meeting key (which includes series information)
-                meeting_key = get_meeting_key(item)
-                meeting_groups[meeting_key].append(meeting_info)
-                meeting_totals[meeting_key] += item.Duration
-                
-                # Also group by subject for summary
-                series_groups[item.Subject].append(meeting_info)
-                
-            except Exception as e:
-                logger.error(f"Error accessing meeting details: {str(e)}")
-        
         # Log meetings grouped by series
-        logger.success(f"Found {len(weekly_meetings)} total meetings next week:")
+        logger.success(f"Found {len(deduplicator)} total meetings next week:")
         
         for subject, meetings in series_groups.items():
             if len(meetings) > 1:
@@ -132,9 +92,8 @@ def check_outlook_meetings():
                 logger.list(f"📅 {subject}", meetings)
         
         # Calculate totals
-        total_minutes = sum(item.Duration for item in weekly_meetings)
-        total_hours = total_minutes / 60
-        unique_series = len(set(get_meeting_key(item) for item in weekly_meetings))
+        totals = deduplicator.summary()
+        unique_series = len({(m.subject, m.series_id) for m in deduplicator.meetings})
         unique_subjects = len(series_groups)
         
         # Log summary
@@ -142,8 +101,10 @@ def check_outlook_meetings():
         logger.list("Totals", [{
             "unique_meeting_subjects": unique_subjects,
             "unique_meeting_series": unique_series,
-            "total_meeting_instances": len(weekly_meetings),
-            "total_hours": f"{total_hours:.2f}"
+            "total_meeting_instances": totals["unique"],
+            "duplicate_copies_removed": totals["duplicates"],
+            "meeting_hours": f"{totals['meeting_hours']:.2f}",
+            "person_hours": f"{totals['person_hours']:.2f}"
         }])
 
     except Exception as e: